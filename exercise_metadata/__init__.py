@@ -14,6 +14,11 @@ Contract:
 - Resolvers fail hard when an exercise's canonical files are missing.
 """
 
+from exercise_metadata.compiled_catalogue import (
+    compile_catalogue,
+    load_compiled_catalogue,
+    write_compiled_catalogue,
+)
 from exercise_metadata.loader import load_exercise_metadata
 from exercise_metadata.registry import (
     ExerciseCatalogueEntry,
@@ -25,18 +30,32 @@ from exercise_metadata.registry import (
     get_canonical_exercise_keys,
     get_catalogue_exercise_keys,
 )
-from exercise_metadata.resolver import resolve_exercise_dir, resolve_notebook_path
+from exercise_metadata.resolver import (
+    ExerciseIndex,
+    IndexedExercise,
+    get_exercise_index,
+    resolve_exercise_dir,
+    resolve_exercise_entry,
+    resolve_notebook_path,
+)
 
 __all__ = [
     "ExerciseCatalogueEntry",
+    "ExerciseIndex",
+    "IndexedExercise",
     "RegistryEntry",
     "build_display_label",
     "build_exercise_catalogue",
     "build_exercise_registry",
+    "compile_catalogue",
     "get_all_exercise_keys",
     "get_canonical_exercise_keys",
     "get_catalogue_exercise_keys",
+    "get_exercise_index",
+    "load_compiled_catalogue",
     "load_exercise_metadata",
     "resolve_exercise_dir",
+    "resolve_exercise_entry",
     "resolve_notebook_path",
+    "write_compiled_catalogue",
 ]
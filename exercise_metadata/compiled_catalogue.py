@@ -0,0 +1,169 @@
+"""Precompiled exercise catalogue for packaged template repositories.
+
+Building the catalogue from scratch walks the exercises tree, parses every
+``exercise.json`` and validates its identity. Packaged Classroom repositories
+never change their exercise set after export, so ``TemplatePackager`` compiles
+the catalogue once at package time into ``exercise_metadata/compiled_catalogue.json``.
+
+Each compiled entry records the SHA-256 of the ``exercise.json`` it came from.
+:func:`load_compiled_catalogue` trusts the file only when every recorded
+``exercise.json`` still hashes the same and no new exercise directory has
+appeared; otherwise it returns ``None`` and callers fall back to
+:func:`exercise_metadata.registry.build_exercise_catalogue`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Final, cast
+
+from exercise_metadata.registry import ExerciseCatalogueEntry, build_exercise_catalogue
+
+COMPILED_CATALOGUE_FILENAME: Final[str] = "compiled_catalogue.json"
+COMPILED_CATALOGUE_FORMAT: Final[int] = 1
+
+_PACKAGE_DIR = Path(__file__).resolve().parent
+_EXERCISES_ROOT = _PACKAGE_DIR.parent / "exercises"
+_METADATA_FILENAME = "exercise.json"
+_ENTRY_FIELDS: Final[dict[str, type]] = {
+    "exercise_key": str,
+    "exercise_id": int,
+    "slug": str,
+    "title": str,
+    "display_label": str,
+    "construct": str,
+    "exercise_type": str,
+    "parts": int,
+}
+
+__all__ = [
+    "COMPILED_CATALOGUE_FILENAME",
+    "COMPILED_CATALOGUE_FORMAT",
+    "compile_catalogue",
+    "default_compiled_catalogue_path",
+    "load_compiled_catalogue",
+    "write_compiled_catalogue",
+]
+
+
+def default_compiled_catalogue_path() -> Path:
+    """Return where the runtime looks for the compiled catalogue."""
+    return _PACKAGE_DIR / COMPILED_CATALOGUE_FILENAME
+
+
+def _metadata_path(exercises_root: Path, entry: ExerciseCatalogueEntry) -> Path:
+    return exercises_root / entry["construct"] / entry["exercise_key"] / _METADATA_FILENAME
+
+
+def _file_digest(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def compile_catalogue(exercises_root: Path | None = None) -> dict[str, Any]:
+    """Build the catalogue for *exercises_root* and return its compiled JSON payload."""
+    root = exercises_root or _EXERCISES_ROOT
+    exercises: list[dict[str, Any]] = []
+    for entry in build_exercise_catalogue(exercises_root):
+        metadata_path = _metadata_path(root, entry)
+        exercises.append(
+            {
+                "path": metadata_path.relative_to(root).as_posix(),
+                "sha256": _file_digest(metadata_path),
+                "entry": dict(entry),
+            }
+        )
+    return {"format": COMPILED_CATALOGUE_FORMAT, "exercises": exercises}
+
+
+def write_compiled_catalogue(destination: Path, exercises_root: Path | None = None) -> Path:
+    """Compile the catalogue for *exercises_root* and write it to *destination*."""
+    payload = compile_catalogue(exercises_root)
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    destination.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    return destination
+
+
+def _parse_entry(raw: object) -> tuple[str, str, ExerciseCatalogueEntry] | None:
+    if not isinstance(raw, dict):
+        return None
+    item = cast(dict[str, Any], raw)
+    path, digest, entry = item.get("path"), item.get("sha256"), item.get("entry")
+    if not isinstance(path, str) or not isinstance(digest, str) or not isinstance(entry, dict):
+        return None
+    fields = cast(dict[str, Any], entry)
+    for name, expected_type in _ENTRY_FIELDS.items():
+        if not isinstance(fields.get(name), expected_type):
+            return None
+    return (
+        path,
+        digest,
+        cast(ExerciseCatalogueEntry, {name: fields[name] for name in _ENTRY_FIELDS}),
+    )
+
+
+def _has_unlisted_exercises(root: Path, listed_dirs: set[str]) -> bool:
+    """Return whether an exercise directory exists that the compiled file does not list."""
+    with os.scandir(root) as constructs:
+        for construct in constructs:
+            if not construct.is_dir():
+                continue
+            with os.scandir(construct.path) as exercise_dirs:
+                for exercise_dir in exercise_dirs:
+                    relative = f"{construct.name}/{exercise_dir.name}"
+                    if relative in listed_dirs or not exercise_dir.is_dir():
+                        continue
+                    if Path(exercise_dir.path, _METADATA_FILENAME).is_file():
+                        return True
+    return False
+
+
+def _read_compiled_exercises(catalogue_path: Path) -> list[object] | None:
+    try:
+        payload = json.loads(catalogue_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(payload, dict):
+        return None
+    data = cast(dict[str, Any], payload)
+    raw_exercises = data.get("exercises")
+    if data.get("format") != COMPILED_CATALOGUE_FORMAT or not isinstance(raw_exercises, list):
+        return None
+    return cast(list[object], raw_exercises)
+
+
+def _verified_entries(
+    raw_exercises: list[object],
+    root: Path,
+) -> list[ExerciseCatalogueEntry] | None:
+    """Return the compiled entries if every recorded exercise.json is unchanged."""
+    catalogue: list[ExerciseCatalogueEntry] = []
+    listed_dirs: set[str] = set()
+    for raw in raw_exercises:
+        parsed = _parse_entry(raw)
+        if parsed is None:
+            return None
+        relative_path, digest, entry = parsed
+        if _file_digest(root / relative_path) != digest:
+            return None
+        listed_dirs.add(relative_path.rpartition("/")[0])
+        catalogue.append(entry)
+    if _has_unlisted_exercises(root, listed_dirs):
+        return None
+    return catalogue
+
+
+def load_compiled_catalogue(
+    path: Path | None = None,
+    exercises_root: Path | None = None,
+) -> list[ExerciseCatalogueEntry] | None:
+    """Return the compiled catalogue, or ``None`` when it is missing, malformed or stale."""
+    raw_exercises = _read_compiled_exercises(path or default_compiled_catalogue_path())
+    if raw_exercises is None:
+        return None
+    try:
+        return _verified_entries(raw_exercises, exercises_root or _EXERCISES_ROOT)
+    except OSError:
+        return None
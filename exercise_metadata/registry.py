@@ -17,8 +17,7 @@ from __future__ import annotations
 from pathlib import Path
 from typing import TypedDict
 
-from exercise_metadata.loader import load_exercise_metadata
-from exercise_metadata.resolver import resolve_exercise_dir
+from exercise_metadata.resolver import get_exercise_index, resolve_exercise_entry
 from exercise_metadata.schema import ExerciseMetadata
 
 _EXERCISES_ROOT = Path(__file__).resolve().parents[1] / "exercises"
@@ -101,13 +100,13 @@ def _load_registry_metadata(
         Validated ``ExerciseMetadata``.
     """
     try:
-        exercise_dir = resolve_exercise_dir(exercise_key, exercises_root)
+        exercise = resolve_exercise_entry(exercise_key, exercises_root)
     except LookupError as exc:
         raise RuntimeError(f"Failed to load metadata for exercise {exercise_key!r}: {exc}") from exc
 
     try:
-        metadata = load_exercise_metadata(exercise_dir)
-        _validate_metadata_identity(exercise_key, exercise_dir, metadata)
+        metadata = get_exercise_index(exercises_root).metadata(exercise)
+        _validate_metadata_identity(exercise_key, exercise.exercise_dir, metadata)
         return metadata
     except (FileNotFoundError, ValueError) as exc:
         raise RuntimeError(f"Failed to load metadata for exercise {exercise_key!r}: {exc}") from exc
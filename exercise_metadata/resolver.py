@@ -6,14 +6,23 @@ raise TypeError and path-like strings fail fast with a clear resolver error.
 
 Legacy notebook-root override env var is deliberately ignored; this resolver targets the
 canonical exercise home convention, ``exercises/<construct>/<exercise_key>/``.
+
+Resolution goes through a process-wide :class:`ExerciseIndex` per exercises root.
+Each construct directory is listed once and re-listed only when its mtime changes,
+and parsed ``exercise.json`` metadata is memoised until the file's mtime or size
+changes, so repeated lookups cost a couple of ``stat()`` calls.
 """
 
 from __future__ import annotations
 
+import os
+import threading
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Literal
+from typing import Literal, cast
 
 from exercise_metadata.loader import load_exercise_metadata
+from exercise_metadata.schema import ExerciseMetadata
 
 _EXERCISES_ROOT = Path(__file__).resolve().parents[1] / "exercises"
 _KNOWN_CONSTRUCTS = (
@@ -33,6 +42,117 @@ _KNOWN_CONSTRUCTS = (
 Variant = Literal["student", "solution"]
 
 
+@dataclass(frozen=True)
+class IndexedExercise:
+    """Canonical locations of one exercise in an :class:`ExerciseIndex`."""
+
+    exercise_key: str
+    construct: str
+    exercise_dir: Path
+
+    @property
+    def metadata_path(self) -> Path:
+        return self.exercise_dir / "exercise.json"
+
+    @property
+    def tests_dir(self) -> Path:
+        return self.exercise_dir / "tests"
+
+    def notebook_path(self, variant: Variant) -> Path:
+        """Return the canonical notebook path for *variant* (existence not checked)."""
+        return self.exercise_dir / "notebooks" / f"{variant}.ipynb"
+
+
+class ExerciseIndex:
+    """Memoised view of one exercises root.
+
+    Construct directories are listed lazily and re-listed when their
+    ``st_mtime_ns`` changes (an exercise was added, removed or renamed).
+    Metadata is parsed once per ``exercise.json`` ``(st_mtime_ns, st_size)``.
+    """
+
+    def __init__(self, exercises_root: Path) -> None:
+        self.exercises_root = exercises_root
+        self.scan_count = 0
+        self._constructs: dict[str, tuple[int, dict[str, IndexedExercise]]] = {}
+        self._metadata: dict[Path, tuple[tuple[int, int], ExerciseMetadata]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, exercise_key: str, construct: str) -> IndexedExercise | None:
+        """Return the indexed exercise, or ``None`` when its canonical directory is absent."""
+        construct_dir = self.exercises_root / construct
+        try:
+            mtime_ns = construct_dir.stat().st_mtime_ns
+        except OSError:
+            return None
+        with self._lock:
+            listing = self._constructs.get(construct)
+        if listing is None or listing[0] != mtime_ns:
+            listing = (mtime_ns, self._scan_construct(construct, construct_dir))
+            with self._lock:
+                self._constructs[construct] = listing
+                self.scan_count += 1
+        return listing[1].get(exercise_key)
+
+    def metadata(self, exercise: IndexedExercise) -> ExerciseMetadata:
+        """Return validated metadata for *exercise*, parsing ``exercise.json`` on change.
+
+        Raises:
+            FileNotFoundError: If exercise.json is missing.
+            ValueError: If required fields are missing or schema_version is wrong.
+        """
+        json_path = exercise.metadata_path
+        try:
+            stat_result = json_path.stat()
+        except FileNotFoundError as exc:
+            raise FileNotFoundError(f"exercise.json not found at {json_path}") from exc
+        fingerprint = (stat_result.st_mtime_ns, stat_result.st_size)
+        with self._lock:
+            cached = self._metadata.get(json_path)
+        if cached is None or cached[0] != fingerprint:
+            cached = (fingerprint, load_exercise_metadata(exercise.exercise_dir))
+            with self._lock:
+                self._metadata[json_path] = cached
+        # Hand out a copy so callers cannot mutate the memoised metadata.
+        return cast(ExerciseMetadata, dict(cached[1]))
+
+    def clear(self) -> None:
+        """Drop every listing and memoised metadata, and reset the scan counter."""
+        with self._lock:
+            self._constructs.clear()
+            self._metadata.clear()
+            self.scan_count = 0
+
+    def _scan_construct(self, construct: str, construct_dir: Path) -> dict[str, IndexedExercise]:
+        try:
+            with os.scandir(construct_dir) as entries:
+                return {
+                    entry.name: IndexedExercise(
+                        exercise_key=entry.name,
+                        construct=construct,
+                        exercise_dir=construct_dir / entry.name,
+                    )
+                    for entry in entries
+                    if entry.is_dir()
+                }
+        except OSError:
+            return {}
+
+
+_INDEXES: dict[Path, ExerciseIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def get_exercise_index(exercises_root: Path | None = None) -> ExerciseIndex:
+    """Return the shared index for *exercises_root* (the repository's by default)."""
+    root = exercises_root or _EXERCISES_ROOT
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(root)
+        if index is None:
+            index = _INDEXES[root] = ExerciseIndex(root)
+        return index
+
+
 def _is_path_like_input(exercise_key: str) -> bool:
     """Return True when a string looks like a legacy path or file name."""
     return "/" in exercise_key or "\\" in exercise_key or Path(exercise_key).suffix != ""
@@ -60,6 +180,8 @@ def _derive_construct_from_exercise_key(exercise_key: str) -> str:
 def resolve_exercise_dir(exercise_key: object, exercises_root: Path | None = None) -> Path:
     """Return the canonical directory for the given exercise_key.
 
+    Equivalent to ``resolve_exercise_entry(...).exercise_dir``.
+
     The canonical exercise home is `exercises/<construct>/<exercise_key>/`.
     This function derives the canonical path directly from the exercise_key
     and rejects legacy `exercises/<construct>/<type>/<exercise_key>/` matches.
@@ -77,6 +199,17 @@ def resolve_exercise_dir(exercise_key: object, exercises_root: Path | None = Non
         LookupError: If a path-like string was passed or the canonical
             directory does not exist.
     """
+    return resolve_exercise_entry(exercise_key, exercises_root).exercise_dir
+
+
+def resolve_exercise_entry(
+    exercise_key: object,
+    exercises_root: Path | None = None,
+) -> IndexedExercise:
+    """Return the indexed canonical locations for the given exercise_key.
+
+    Raises the same errors as :func:`resolve_exercise_dir`.
+    """
     if not isinstance(exercise_key, str):
         raise TypeError(
             f"exercise_key must be a str, not {type(exercise_key).__name__!r}. "
@@ -89,10 +222,11 @@ def resolve_exercise_dir(exercise_key: object, exercises_root: Path | None = Non
         )
     root = exercises_root or _EXERCISES_ROOT
     construct = _derive_construct_from_exercise_key(exercise_key)
-    candidate = root / construct / exercise_key
-    if candidate.is_dir():
-        return candidate
+    indexed = get_exercise_index(root).get(exercise_key, construct)
+    if indexed is not None:
+        return indexed
 
+    candidate = root / construct / exercise_key
     legacy_matches = [
         path for path in root.rglob(exercise_key) if path.is_dir() and path != candidate
     ]
@@ -140,16 +274,16 @@ def resolve_notebook_path(
     if variant not in ("student", "solution"):
         raise ValueError(f"variant must be 'student' or 'solution', not {variant!r}")
 
-    exercise_dir = resolve_exercise_dir(exercise_key, exercises_root)
+    exercise = resolve_exercise_entry(exercise_key, exercises_root)
     try:
-        load_exercise_metadata(exercise_dir)
+        get_exercise_index(exercises_root).metadata(exercise)
     except (FileNotFoundError, TypeError, ValueError) as exc:
         raise LookupError(
             f"exercise {exercise_key!r} was found but its exercise.json is "
             f"missing or invalid: {exc}"
         ) from exc
 
-    notebook_path = exercise_dir / "notebooks" / f"{variant}.ipynb"
+    notebook_path = exercise.notebook_path(variant)
     if not notebook_path.exists():
         raise LookupError(
             f"exercise {exercise_key!r} was found but the expected notebook is "
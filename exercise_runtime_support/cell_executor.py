@@ -0,0 +1,813 @@
+"""Execution backends for tagged notebook cells.
+
+Cells are described by a :class:`CellJob` and executed by a :class:`CellExecutor`,
+which always returns a structured :class:`CellExecutionResult` instead of
+raising for student errors. Every execution gets its own ``print``/``input``
+through the namespace's ``__builtins__``. While any cell runs, ``sys.stdout`` is
+a router that sends each thread's writes to the buffer of the cell that thread
+is executing, so ``sys.stdout.write`` is captured per cell too.
+Three backends are provided:
+
+- :class:`InProcessExecutor` runs the cell in the grading process. This is the
+  default and keeps the original exception object for callers that inspect it.
+- :class:`ThreadedExecutor` runs batches of cells on a thread pool in the
+  grading process, which suits I/O-light cells.
+- :class:`PooledExecutor` runs cells in pre-warmed ``forkserver`` worker
+  processes with wall-clock and CPU limits, so an infinite loop in a student
+  cell fails that cell instead of hanging the whole grading run.
+
+The default backend is chosen by ``PYTUTOR_EXECUTION_BACKEND`` (``inprocess``,
+``thread`` or ``pool``) and the pooled wall-clock limit by ``PYTUTOR_CELL_TIMEOUT`` (seconds).
+Captured output can be capped with ``CellJob.max_output_bytes``; a cell that
+prints past the cap is stopped with an ``OutputLimitExceeded`` error and keeps
+the output written up to the cap.
+"""
+
+from __future__ import annotations
+
+import atexit
+import builtins
+import contextlib
+import os
+import signal
+import sys
+import threading
+import time
+import traceback
+import tracemalloc
+from collections.abc import Callable, Generator, Sequence
+from concurrent.futures import BrokenExecutor, Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as _FutureTimeoutError
+from dataclasses import dataclass, field, replace
+from io import StringIO
+from types import FrameType
+from typing import TYPE_CHECKING, Any, Literal, Protocol
+
+from exercise_runtime_support.code_cache import get_code_cache
+
+if TYPE_CHECKING:
+    # The process-pool machinery pulls in multiprocessing; only the pool
+    # backend needs it, so it is imported when a PooledExecutor is created.
+    from concurrent.futures import ProcessPoolExecutor as _ProcessPoolExecutor
+
+EXECUTION_BACKEND_ENV_VAR = "PYTUTOR_EXECUTION_BACKEND"
+CELL_TIMEOUT_ENV_VAR = "PYTUTOR_CELL_TIMEOUT"
+OUTPUT_LIMIT_ENV_VAR = "PYTUTOR_OUTPUT_LIMIT"
+DEFAULT_WALL_SECONDS = 10.0
+DEFAULT_OUTPUT_LIMIT_BYTES = 1024 * 1024
+OUTPUT_LIMIT_ERROR_TYPE = "OutputLimitExceeded"
+MISSING_INPUT_ERROR_MESSAGE = "Test expected more input values"
+
+_PARENT_GRACE_SECONDS = 5.0
+_TRACE_LOCK = threading.Lock()
+_DEFAULT_PRELOAD: tuple[str, ...] = ("exercise_runtime_support.notebook_grader",)
+
+ExecutionPhase = Literal["compile", "execute"]
+
+__all__ = [
+    "CELL_TIMEOUT_ENV_VAR",
+    "DEFAULT_OUTPUT_LIMIT_BYTES",
+    "EXECUTION_BACKEND_ENV_VAR",
+    "OUTPUT_LIMIT_ENV_VAR",
+    "OUTPUT_LIMIT_ERROR_TYPE",
+    "CellError",
+    "CellExecutionResult",
+    "CellExecutor",
+    "CellJob",
+    "DefaultInputs",
+    "ExecutionLimits",
+    "ExecutionMetrics",
+    "InProcessExecutor",
+    "PooledExecutor",
+    "ThreadedExecutor",
+    "configured_output_limit",
+    "get_default_executor",
+    "use_executor",
+]
+
+
+@dataclass(frozen=True)
+class ExecutionLimits:
+    """Resource limits applied to each cell by the pooled backend.
+
+    ``wall_seconds`` bounds elapsed time and ``cpu_seconds`` bounds CPU time.
+    ``None`` disables the corresponding limit.
+    """
+
+    wall_seconds: float | None = DEFAULT_WALL_SECONDS
+    cpu_seconds: int | None = None
+
+
+@dataclass(frozen=True)
+class DefaultInputs:
+    """Placeholder answers handed to ``input()`` on demand.
+
+    Once a job's explicit ``inputs`` run out, each ``input()`` call returns
+    ``value`` until ``limit`` values have been returned in total; the call after
+    that fails as if no inputs were left. This lets a cell with an unknown
+    number of prompts run once instead of being retried with longer input lists.
+    """
+
+    value: str
+    limit: int
+
+
+@dataclass(frozen=True)
+class CellJob:
+    """A single cell execution request.
+
+    ``inputs`` supplies the values returned by ``input()``; ``None`` makes
+    ``input()`` read from ``sys.stdin`` unless ``default_inputs`` is set, in
+    which case the cell is answered from the :class:`DefaultInputs` alone.
+    ``max_output_bytes`` caps the UTF-8 size
+    of captured output (``None`` leaves it unbounded). ``collect_metrics`` asks
+    the executor to attach :class:`ExecutionMetrics` to the result, and
+    ``summarise_namespace`` the type name of every public global the cell left
+    behind.
+    """
+
+    source: str
+    filename: str
+    inputs: tuple[str, ...] | None = None
+    collect_metrics: bool = False
+    max_output_bytes: int | None = None
+    summarise_namespace: bool = False
+    default_inputs: DefaultInputs | None = None
+
+
+@dataclass(frozen=True)
+class CellError:
+    """Structured description of a failed cell.
+
+    ``exception`` holds the original exception for in-process runs; it is
+    always ``None`` for results that crossed a process boundary.
+    """
+
+    phase: ExecutionPhase
+    type_name: str
+    message: str
+    traceback: str = ""
+    exception: BaseException | None = field(default=None, compare=False, repr=False)
+
+
+@dataclass(frozen=True)
+class ExecutionMetrics:
+    """Cost of one cell execution.
+
+    ``peak_memory_bytes`` is the tracemalloc peak during the cell, or ``None``
+    when memory could not be traced (another cell or tool was already tracing).
+    """
+
+    wall_seconds: float
+    cpu_seconds: float
+    peak_memory_bytes: int | None
+    input_calls: int
+    stdout_bytes: int
+
+
+@dataclass(frozen=True)
+class CellExecutionResult:
+    """Captured stdout and outcome of a cell execution.
+
+    ``used_stdin`` records that ``input()`` read from ``sys.stdin`` because the
+    job supplied no inputs. ``inputs_consumed`` counts the values ``input()``
+    returned, whether explicit, default or read from stdin.
+    """
+
+    stdout: str
+    error: CellError | None = None
+    timed_out: bool = False
+    metrics: ExecutionMetrics | None = None
+    namespace_summary: dict[str, str] | None = None
+    used_stdin: bool = False
+    inputs_consumed: int = 0
+
+    @property
+    def ok(self) -> bool:
+        """Return whether the cell compiled and ran without raising."""
+        return self.error is None
+
+
+class CellExecutor(Protocol):
+    """Backend capable of executing :class:`CellJob` instances."""
+
+    def run(self, job: CellJob) -> CellExecutionResult:
+        """Execute one job and return its result."""
+        ...
+
+    def map(self, jobs: Sequence[CellJob]) -> list[CellExecutionResult]:
+        """Execute every job and return results in job order."""
+        ...
+
+
+class _CellTimeout(BaseException):
+    """Raised inside a worker when a cell exceeds its limits.
+
+    Derives from ``BaseException`` so student ``except Exception`` blocks
+    cannot swallow it.
+    """
+
+
+class _OutputLimitExceeded(BaseException):
+    """Raised inside a cell when its captured output passes the byte cap.
+
+    Derives from ``BaseException`` for the same reason as :class:`_CellTimeout`.
+    """
+
+
+class _OutputBuffer(StringIO):
+    """``StringIO`` that counts UTF-8 bytes written and stops at a cap.
+
+    The write that crosses ``limit`` is cut at the cap and raises
+    :class:`_OutputLimitExceeded`; every later write raises again, so a cell
+    that swallows the error still cannot grow the buffer.
+    """
+
+    def __init__(self, limit: int | None = None) -> None:
+        super().__init__()
+        self.limit = limit
+        self.size = 0
+        self.exceeded = False
+
+    def write(self, s: str) -> int:
+        size = len(s) if s.isascii() else len(s.encode("utf-8", "surrogatepass"))
+        if self.limit is None or self.size + size <= self.limit:
+            self.size += size
+            return super().write(s)
+        if not self.exceeded:
+            self.exceeded = True
+            room = self.limit - self.size
+            kept = s.encode("utf-8", "surrogatepass")[:room].decode("utf-8", "ignore")
+            self.size += len(kept.encode("utf-8", "surrogatepass"))
+            super().write(kept)
+        raise _OutputLimitExceeded(f"Cell output exceeded {self.limit} bytes")
+
+
+def _cell_error(exc: BaseException, phase: ExecutionPhase) -> CellError:
+    return CellError(
+        phase=phase,
+        type_name=type(exc).__name__,
+        message=str(exc),
+        traceback="".join(traceback.format_exception(exc)),
+        exception=exc,
+    )
+
+
+class _CellIO:
+    """Per-execution ``print``/``input`` bound to one output buffer.
+
+    :meth:`builtins` returns a ``__builtins__`` mapping for the cell's
+    namespace, so concurrent cells never share stdout or input state. Output
+    written to ``sys.stdout`` directly reaches the same buffer through
+    :func:`_route_stdout`.
+    """
+
+    def __init__(
+        self,
+        buffer: _OutputBuffer,
+        inputs: tuple[str, ...] | None,
+        defaults: DefaultInputs | None = None,
+    ) -> None:
+        self.buffer = buffer
+        self.input_calls = 0
+        self.inputs_consumed = 0
+        self.reads_stdin = inputs is None and defaults is None
+        self._remaining = iter(inputs or ())
+        self._defaults = defaults
+
+    def print(
+        self,
+        *values: object,
+        sep: str | None = " ",
+        end: str | None = "\n",
+        file: Any = None,
+        flush: bool = False,
+    ) -> None:
+        target = self.buffer if file is None or file is sys.stdout else file
+        builtins.print(*values, sep=sep, end=end, file=target, flush=flush)
+
+    def input(self, prompt: object = "") -> str:
+        self.input_calls += 1
+        # Write prompt to stdout to match real input() behavior
+        self.buffer.write(str(prompt))
+        if self.reads_stdin:
+            line = sys.stdin.readline()
+            if not line:
+                raise EOFError("EOF when reading a line")
+            self.inputs_consumed += 1
+            return line.rstrip("\n")
+        value = next(self._remaining, None)
+        defaults = self._defaults
+        if value is None and defaults is not None and self.inputs_consumed < defaults.limit:
+            value = defaults.value
+        if value is None:
+            raise RuntimeError(MISSING_INPUT_ERROR_MESSAGE)
+        self.inputs_consumed += 1
+        return value
+
+    def builtins(self) -> dict[str, Any]:
+        namespace_builtins = dict(vars(builtins))
+        namespace_builtins["print"] = self.print
+        namespace_builtins["input"] = self.input
+        return namespace_builtins
+
+
+class _StdoutRouter:
+    """``sys.stdout`` stand-in that sends writes to the calling thread's cell buffer.
+
+    Threads that are not executing a cell write through to the stream the
+    router replaced.
+    """
+
+    def __init__(self, stream: Any) -> None:
+        self.stream = stream
+
+    def _target(self) -> Any:
+        buffer: _OutputBuffer | None = getattr(_thread_output, "buffer", None)
+        return self.stream if buffer is None else buffer
+
+    def write(self, s: str) -> int:
+        return self._target().write(s)
+
+    def flush(self) -> None:
+        self._target().flush()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.stream, name)
+
+
+_thread_output = threading.local()
+_router_lock = threading.Lock()
+_router_users = 0
+
+
+@contextlib.contextmanager
+def _route_stdout(buffer: _OutputBuffer) -> Generator[None, None, None]:
+    """Send this thread's ``sys.stdout`` writes to *buffer* while the block runs.
+
+    The router is installed by the first concurrent execution and removed by
+    the last, unless something else has replaced ``sys.stdout`` in between.
+    """
+    global _router_users
+    with _router_lock:
+        if not isinstance(sys.stdout, _StdoutRouter):
+            sys.stdout = _StdoutRouter(sys.stdout)
+        router = sys.stdout
+        _router_users += 1
+    previous: _OutputBuffer | None = getattr(_thread_output, "buffer", None)
+    _thread_output.buffer = buffer
+    try:
+        yield
+    finally:
+        _thread_output.buffer = previous
+        with _router_lock:
+            _router_users -= 1
+            if _router_users == 0 and sys.stdout is router:
+                sys.stdout = router.stream
+
+
+class _MetricsProbe:
+    """Measure wall time, CPU time and (when available) peak traced memory."""
+
+    def __init__(self) -> None:
+        # tracemalloc is process-wide, so only one cell at a time may own it.
+        self._tracing = not tracemalloc.is_tracing() and _TRACE_LOCK.acquire(blocking=False)
+        if self._tracing:
+            tracemalloc.start()
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.thread_time()
+
+    def finish(self, cell_io: _CellIO) -> ExecutionMetrics:
+        wall_seconds = time.perf_counter() - self._wall_start
+        cpu_seconds = time.thread_time() - self._cpu_start
+        peak_memory_bytes: int | None = None
+        if self._tracing:
+            peak_memory_bytes = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            _TRACE_LOCK.release()
+            self._tracing = False
+        return ExecutionMetrics(
+            wall_seconds=wall_seconds,
+            cpu_seconds=cpu_seconds,
+            peak_memory_bytes=peak_memory_bytes,
+            input_calls=cell_io.input_calls,
+            stdout_bytes=cell_io.buffer.size,
+        )
+
+
+def execute_job(job: CellJob, *, stdout: _OutputBuffer | None = None) -> CellExecutionResult:
+    """Compile and execute *job* in the current process with a fresh namespace.
+
+    ``print`` and ``input`` are bound per execution through the namespace's
+    ``__builtins__``, so this is safe to call from several threads at once.
+    Output is written to *stdout* when given, so callers that interrupt the
+    cell can still report what it printed before stopping.
+    """
+    try:
+        compiled = get_code_cache().compile(job.source, job.filename)
+    except SyntaxError as exc:
+        return CellExecutionResult(stdout="", error=_cell_error(exc, "compile"))
+
+    buffer = _OutputBuffer(job.max_output_bytes) if stdout is None else stdout
+    cell_io = _CellIO(buffer, job.inputs, job.default_inputs)
+    namespace: dict[str, Any] = {
+        "__name__": "__student__",
+        "__file__": job.filename,
+        "__builtins__": cell_io.builtins(),
+    }
+    probe = _MetricsProbe() if job.collect_metrics else None
+    error: CellError | None = None
+    try:
+        with _route_stdout(buffer):
+            exec(compiled, namespace, namespace)
+    except _OutputLimitExceeded:
+        pass
+    except Exception as exc:  # noqa: BLE001 - student errors become structured results
+        error = _cell_error(exc, "execute")
+    finally:
+        metrics = None if probe is None else probe.finish(cell_io)
+    if buffer.exceeded:
+        # Reported even when the cell caught the overflow and carried on.
+        error = CellError(
+            phase="execute",
+            type_name=OUTPUT_LIMIT_ERROR_TYPE,
+            message=f"Cell output exceeded {buffer.limit} bytes",
+        )
+    summary = _summarise_namespace(namespace) if job.summarise_namespace else None
+    return CellExecutionResult(
+        stdout=cell_io.buffer.getvalue(),
+        error=error,
+        metrics=metrics,
+        namespace_summary=summary,
+        used_stdin=cell_io.reads_stdin and cell_io.input_calls > 0,
+        inputs_consumed=cell_io.inputs_consumed,
+    )
+
+
+def _summarise_namespace(namespace: dict[str, Any]) -> dict[str, str]:
+    return {
+        name: type(value).__name__ for name, value in namespace.items() if not name.startswith("_")
+    }
+
+
+class InProcessExecutor:
+    """Execute cells directly in the calling process."""
+
+    def run(self, job: CellJob) -> CellExecutionResult:
+        return execute_job(job)
+
+    def map(self, jobs: Sequence[CellJob]) -> list[CellExecutionResult]:
+        return [execute_job(job) for job in jobs]
+
+
+class ThreadedExecutor:
+    """Execute cells concurrently on a thread pool in the calling process.
+
+    Cheap parallelism for I/O-light cells: each execution has isolated
+    ``print``/``input``, but there are no time limits and CPU-bound cells are
+    still serialised by the GIL.
+    """
+
+    def __init__(self, *, max_workers: int | None = None) -> None:
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="pytutor-cell",
+        )
+
+    def run(self, job: CellJob) -> CellExecutionResult:
+        return execute_job(job)
+
+    def map(self, jobs: Sequence[CellJob]) -> list[CellExecutionResult]:
+        if len(jobs) <= 1:
+            return [execute_job(job) for job in jobs]
+        return list(self._pool.map(execute_job, jobs))
+
+    def shutdown(self) -> None:
+        """Stop the worker threads."""
+        self._pool.shutdown(wait=True, cancel_futures=True)
+
+
+# -- worker side -------------------------------------------------------------
+
+
+def _raise_cell_timeout(signum: int, _frame: FrameType | None) -> None:
+    if signum == getattr(signal, "SIGXCPU", None):
+        raise _CellTimeout("Cell exceeded its CPU time limit")
+    raise _CellTimeout("Cell exceeded its time limit")
+
+
+def _initialise_worker() -> None:
+    """Prepare a pool worker: route limit signals to :class:`_CellTimeout`."""
+    if hasattr(signal, "SIGALRM"):
+        signal.signal(signal.SIGALRM, _raise_cell_timeout)
+    if hasattr(signal, "SIGXCPU"):
+        signal.signal(signal.SIGXCPU, _raise_cell_timeout)
+
+
+def _warm_worker() -> int:
+    return os.getpid()
+
+
+@contextlib.contextmanager
+def _worker_limits(limits: ExecutionLimits) -> Generator[None, None, None]:
+    restore_cpu = _apply_cpu_limit(limits.cpu_seconds)
+    if limits.wall_seconds is not None and hasattr(signal, "setitimer"):
+        signal.setitimer(signal.ITIMER_REAL, limits.wall_seconds)
+    try:
+        yield
+    finally:
+        if hasattr(signal, "setitimer"):
+            signal.setitimer(signal.ITIMER_REAL, 0)
+        restore_cpu()
+
+
+def _apply_cpu_limit(cpu_seconds: int | None) -> Callable[[], None]:
+    """Lower the soft RLIMIT_CPU to *cpu_seconds* beyond the worker's usage so far."""
+    try:
+        import resource
+    except ImportError:  # pragma: no cover - non-POSIX platforms
+        return lambda: None
+    if cpu_seconds is None:
+        return lambda: None
+
+    soft, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    new_soft = int(usage.ru_utime + usage.ru_stime) + cpu_seconds + 1
+    if hard != resource.RLIM_INFINITY:
+        new_soft = min(new_soft, hard)
+    resource.setrlimit(resource.RLIMIT_CPU, (new_soft, hard))
+
+    def restore() -> None:
+        resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+    return restore
+
+
+def _run_job_in_worker(job: CellJob, limits: ExecutionLimits) -> CellExecutionResult:
+    buffer = _OutputBuffer(job.max_output_bytes)
+    try:
+        with _worker_limits(limits):
+            result = execute_job(job, stdout=buffer)
+    except _CellTimeout as exc:
+        return CellExecutionResult(
+            stdout=buffer.getvalue(),
+            error=CellError(phase="execute", type_name="TimeoutError", message=str(exc)),
+            timed_out=True,
+        )
+    except BaseException as exc:  # noqa: BLE001 - SystemExit must not escape the worker
+        error = replace(_cell_error(exc, "execute"), exception=None)
+        return CellExecutionResult(stdout=buffer.getvalue(), error=error)
+    if result.error is not None:
+        return replace(result, error=replace(result.error, exception=None))
+    return result
+
+
+# -- parent side -------------------------------------------------------------
+
+
+def _mp_context() -> Any:
+    import multiprocessing
+
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+class PooledExecutor:
+    """Execute cells in a pool of pre-warmed, resource-limited worker processes.
+
+    Workers are started through ``forkserver`` (``spawn`` where unavailable) with
+    the grading runtime preloaded, so each cell pays only for its own execution.
+    A cell that exceeds ``limits`` is reported as a timed-out result; a worker
+    that stops responding altogether is killed and the pool is rebuilt.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: int | None = None,
+        limits: ExecutionLimits | None = None,
+        preload: Sequence[str] = _DEFAULT_PRELOAD,
+        prewarm: bool = True,
+    ) -> None:
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.limits = limits or ExecutionLimits()
+        self._context = _mp_context()
+        if self._context.get_start_method() == "forkserver":
+            self._context.set_forkserver_preload(list(preload))
+        self._lock = threading.Lock()
+        self._pool = self._new_pool()
+        if prewarm:
+            self.warm_up()
+
+    def _new_pool(self) -> _ProcessPoolExecutor:
+        from concurrent.futures import ProcessPoolExecutor
+
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=self._context,
+            initializer=_initialise_worker,
+        )
+
+    def warm_up(self) -> None:
+        """Start every worker now rather than on first use."""
+        futures = [self._pool.submit(_warm_worker) for _ in range(self.max_workers)]
+        for future in futures:
+            future.result()
+
+    def run(self, job: CellJob) -> CellExecutionResult:
+        return self.map([job])[0]
+
+    def map(self, jobs: Sequence[CellJob]) -> list[CellExecutionResult]:
+        futures = [self._submit(job) for job in jobs]
+        return [self._collect(jobs, futures, index) for index in range(len(jobs))]
+
+    def shutdown(self) -> None:
+        """Stop all workers."""
+        with self._lock:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _submit(self, job: CellJob) -> Future[CellExecutionResult]:
+        with self._lock:
+            try:
+                return self._pool.submit(_run_job_in_worker, job, self.limits)
+            except BrokenExecutor as exc:
+                # A job submitted moments earlier may already have crashed the
+                # pool; let _collect restart it rather than failing the batch.
+                future: Future[CellExecutionResult] = Future()
+                future.set_exception(exc)
+                return future
+
+    def _parent_timeout(self) -> float | None:
+        # Workers enforce the limit themselves; the parent only steps in when a
+        # worker ignores its own alarm (for example while blocked in C code).
+        if self.limits.wall_seconds is None:
+            return None
+        return self.limits.wall_seconds + _PARENT_GRACE_SECONDS
+
+    def _collect(
+        self,
+        jobs: Sequence[CellJob],
+        futures: list[Future[CellExecutionResult]],
+        index: int,
+    ) -> CellExecutionResult:
+        try:
+            return futures[index].result(timeout=self._parent_timeout())
+        except _FutureTimeoutError:
+            self._restart()
+            self._resubmit(jobs, futures, start=index + 1)
+            return _stopped_result()
+        except BrokenExecutor:
+            # Every job in flight when a worker dies sees the broken pool, so
+            # rerun this job on its own before blaming it for the crash.
+            self._restart()
+            result = self._run_alone(jobs[index])
+            self._resubmit(jobs, futures, start=index + 1)
+            return result
+
+    def _run_alone(self, job: CellJob) -> CellExecutionResult:
+        try:
+            return self._submit(job).result(timeout=self._parent_timeout())
+        except _FutureTimeoutError:
+            self._restart()
+            return _stopped_result()
+        except BrokenExecutor:
+            self._restart()
+            return _failed_result("WorkerCrashed", "Cell crashed its worker process", False)
+
+    def _restart(self) -> None:
+        """Kill the current workers and start a fresh pool."""
+        with self._lock:
+            old_pool = self._pool
+            # ProcessPoolExecutor has no public API for killing a hung worker.
+            processes: dict[int, Any] = getattr(old_pool, "_processes", None) or {}
+            for process in list(processes.values()):
+                process.kill()
+            # Waiting is cheap once the workers are dead, and lets the old pool
+            # release its pipes before the new pool allocates its own.
+            old_pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = self._new_pool()
+
+    def _resubmit(
+        self,
+        jobs: Sequence[CellJob],
+        futures: list[Future[CellExecutionResult]],
+        *,
+        start: int,
+    ) -> None:
+        """Resubmit jobs from *start* onwards that the old pool did not finish."""
+        for position in range(start, len(jobs)):
+            if not futures[position].done() or _is_broken(futures[position]):
+                futures[position] = self._submit(jobs[position])
+
+
+def _is_broken(future: Future[CellExecutionResult]) -> bool:
+    return future.cancelled() or isinstance(future.exception(), BrokenExecutor)
+
+
+def _stopped_result() -> CellExecutionResult:
+    return _failed_result("TimeoutError", "Cell stopped responding and was stopped", True)
+
+
+def _failed_result(type_name: str, message: str, timed_out: bool) -> CellExecutionResult:
+    return CellExecutionResult(
+        stdout="",
+        error=CellError(phase="execute", type_name=type_name, message=message),
+        timed_out=timed_out,
+    )
+
+
+# -- backend selection -------------------------------------------------------
+
+_IN_PROCESS_EXECUTOR = InProcessExecutor()
+_shared_pool: PooledExecutor | None = None
+_shared_threads: ThreadedExecutor | None = None
+_executor_override: CellExecutor | None = None
+_selection_lock = threading.Lock()
+
+
+def _configured_limits() -> ExecutionLimits:
+    raw_timeout = os.environ.get(CELL_TIMEOUT_ENV_VAR, "").strip()
+    if raw_timeout == "":
+        return ExecutionLimits()
+    try:
+        wall_seconds = float(raw_timeout)
+    except ValueError as exc:
+        raise RuntimeError(
+            f"{CELL_TIMEOUT_ENV_VAR} must be a number of seconds, not {raw_timeout!r}"
+        ) from exc
+    return ExecutionLimits(wall_seconds=wall_seconds if wall_seconds > 0 else None)
+
+
+def configured_output_limit() -> int | None:
+    """Return the output cap for graded cells from ``PYTUTOR_OUTPUT_LIMIT``.
+
+    The value is a number of bytes; unset uses :data:`DEFAULT_OUTPUT_LIMIT_BYTES`
+    and ``0`` disables the cap.
+    """
+    raw_limit = os.environ.get(OUTPUT_LIMIT_ENV_VAR, "").strip()
+    if raw_limit == "":
+        return DEFAULT_OUTPUT_LIMIT_BYTES
+    try:
+        limit = int(raw_limit)
+    except ValueError as exc:
+        raise RuntimeError(
+            f"{OUTPUT_LIMIT_ENV_VAR} must be a whole number of bytes, not {raw_limit!r}"
+        ) from exc
+    return limit if limit > 0 else None
+
+
+def _shutdown_shared_executors() -> None:
+    global _shared_pool, _shared_threads
+    if _shared_pool is not None:
+        _shared_pool.shutdown()
+        _shared_pool = None
+    if _shared_threads is not None:
+        _shared_threads.shutdown()
+        _shared_threads = None
+
+
+def get_default_executor() -> CellExecutor:
+    """Return the executor used when callers do not pass one explicitly.
+
+    An executor installed with :func:`use_executor` wins; otherwise
+    ``PYTUTOR_EXECUTION_BACKEND`` selects a shared :class:`ThreadedExecutor`
+    (``thread``) or :class:`PooledExecutor` (``pool``); unset or ``inprocess``
+    selects in-process execution.
+    """
+    global _shared_pool, _shared_threads
+    with _selection_lock:
+        if _executor_override is not None:
+            return _executor_override
+        backend = os.environ.get(EXECUTION_BACKEND_ENV_VAR, "").strip().lower()
+        if backend in {"", "inprocess"}:
+            return _IN_PROCESS_EXECUTOR
+        if backend == "thread":
+            if _shared_threads is None:
+                _shared_threads = ThreadedExecutor()
+                atexit.register(_shutdown_shared_executors)
+            return _shared_threads
+        if backend != "pool":
+            raise RuntimeError(
+                f"{EXECUTION_BACKEND_ENV_VAR} must be 'inprocess', 'thread' or 'pool', "
+                f"not {backend!r}"
+            )
+        if _shared_pool is None:
+            _shared_pool = PooledExecutor(limits=_configured_limits())
+            atexit.register(_shutdown_shared_executors)
+        return _shared_pool
+
+
+@contextlib.contextmanager
+def use_executor(executor: CellExecutor) -> Generator[CellExecutor, None, None]:
+    """Temporarily make *executor* the default for grader helpers."""
+    global _executor_override
+    with _selection_lock:
+        previous = _executor_override
+        _executor_override = executor
+    try:
+        yield executor
+    finally:
+        with _selection_lock:
+            _executor_override = previous
@@ -0,0 +1,229 @@
+"""Compiled code-object cache for tagged notebook cells.
+
+Grading executes the same tagged source many times (once per input case, once
+per test), so compiled code objects are cached in memory keyed by
+``(sha256(source), filename, python cache tag)``. An optional on-disk store
+keeps marshalled code objects between processes, in the same spirit as
+``__pycache__``, so repeated autograding runs and student self-checks can skip
+parsing and compiling entirely.
+
+The persistent store is enabled by pointing ``PYTUTOR_CODE_CACHE_DIR`` at a
+writable directory, or by passing ``cache_dir`` to :class:`CodeCache`. The
+directory is scanned once per process to count its entries; after that the
+count is tracked on every store, and the directory is only scanned again when
+it crosses ``max_disk_entries``. Eviction then trims it to 7/8 of the limit so
+the next scan is many writes away.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import marshal
+import os
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from importlib.util import MAGIC_NUMBER
+from pathlib import Path
+from types import CodeType
+
+CODE_CACHE_DIR_ENV_VAR = "PYTUTOR_CODE_CACHE_DIR"
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_DISK_ENTRIES = 4096
+
+_CACHE_SUFFIX = ".codeobj"
+# Eviction trims the disk store to this fraction of its limit.
+_DISK_TRIM_DIVISOR = 8
+
+__all__ = [
+    "CODE_CACHE_DIR_ENV_VAR",
+    "CodeCache",
+    "CodeCacheStats",
+    "get_code_cache",
+    "reset_code_cache",
+]
+
+
+@dataclass
+class CodeCacheStats:
+    """Counters describing how a :class:`CodeCache` has been used."""
+
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+def _python_tag() -> str:
+    return sys.implementation.cache_tag or f"py{sys.version_info[0]}{sys.version_info[1]}"
+
+
+def _cache_key(source: str, filename: str) -> tuple[str, str, str]:
+    digest = hashlib.sha256(source.encode("utf-8")).hexdigest()
+    return digest, filename, _python_tag()
+
+
+class CodeCache:
+    """Bounded LRU cache of compiled code objects with an optional disk store."""
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        cache_dir: Path | None = None,
+        max_disk_entries: int = DEFAULT_MAX_DISK_ENTRIES,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        self.max_disk_entries = max_disk_entries
+        self.stats = CodeCacheStats()
+        self._entries: OrderedDict[tuple[str, str, str], CodeType] = OrderedDict()
+        self._disk_entries: int | None = None
+        self._lock = threading.Lock()
+
+    def compile(self, source: str, filename: str) -> CodeType:
+        """Return a compiled ``exec`` code object for *source*.
+
+        Raises:
+            SyntaxError: When *source* does not compile. Failures are not cached.
+        """
+        key = _cache_key(source, filename)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return cached
+
+        code = self._load_from_disk(key)
+        if code is not None:
+            with self._lock:
+                self.stats.disk_hits += 1
+        else:
+            code = compile(source, filename, "exec")
+            with self._lock:
+                self.stats.misses += 1
+            self._store_on_disk(key, code)
+
+        self._remember(key, code)
+        return code
+
+    def clear(self) -> None:
+        """Drop in-memory entries and reset counters; the disk store is kept."""
+        with self._lock:
+            self._entries.clear()
+            self.stats = CodeCacheStats()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remember(self, key: tuple[str, str, str], code: CodeType) -> None:
+        with self._lock:
+            self._entries[key] = code
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def _disk_path(self, key: tuple[str, str, str]) -> Path | None:
+        if self.cache_dir is None:
+            return None
+        digest, filename, python_tag = key
+        filename_digest = hashlib.sha256(filename.encode("utf-8")).hexdigest()[:16]
+        return self.cache_dir / f"{digest}-{filename_digest}.{python_tag}{_CACHE_SUFFIX}"
+
+    def _load_from_disk(self, key: tuple[str, str, str]) -> CodeType | None:
+        path = self._disk_path(key)
+        if path is None:
+            return None
+        try:
+            payload = path.read_bytes()
+        except OSError:
+            return None
+        if not payload.startswith(MAGIC_NUMBER):
+            return None
+        try:
+            code = marshal.loads(payload[len(MAGIC_NUMBER) :])
+        except (EOFError, ValueError, TypeError):
+            return None
+        if not isinstance(code, CodeType) or code.co_filename != key[1]:
+            return None
+        # Touch the entry so disk eviction stays least-recently-used.
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        return code
+
+    def _store_on_disk(self, key: tuple[str, str, str], code: CodeType) -> None:
+        path = self._disk_path(key)
+        if path is None:
+            return
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            added = not path.exists()
+            tmp_path.write_bytes(MAGIC_NUMBER + marshal.dumps(code))
+            os.replace(tmp_path, path)
+        except OSError:
+            # A read-only or full cache directory must never break grading.
+            tmp_path.unlink(missing_ok=True)
+            return
+        self._track_disk_store(added=added)
+
+    def _track_disk_store(self, *, added: bool) -> None:
+        with self._lock:
+            if self._disk_entries is not None:
+                self._disk_entries += int(added)
+                if self._disk_entries <= self.max_disk_entries:
+                    return
+        entries = self._scan_disk_entries()
+        if entries is None:
+            return
+        kept = len(entries)
+        if kept > self.max_disk_entries:
+            kept = self.max_disk_entries - self.max_disk_entries // _DISK_TRIM_DIVISOR
+            entries.sort(key=lambda item: item[0])
+            for _, entry in entries[: len(entries) - kept]:
+                entry.unlink(missing_ok=True)
+        with self._lock:
+            self._disk_entries = kept
+
+    def _scan_disk_entries(self) -> list[tuple[int, Path]] | None:
+        if self.cache_dir is None:
+            return None
+        try:
+            return [
+                (entry.stat().st_mtime_ns, entry)
+                for entry in self.cache_dir.iterdir()
+                if entry.name.endswith(_CACHE_SUFFIX)
+            ]
+        except OSError:
+            return None
+
+
+_code_cache: CodeCache | None = None
+_code_cache_lock = threading.Lock()
+
+
+def get_code_cache() -> CodeCache:
+    """Return the shared process-wide code cache.
+
+    The persistent store is enabled when ``PYTUTOR_CODE_CACHE_DIR`` is set the
+    first time the cache is requested.
+    """
+    global _code_cache
+    with _code_cache_lock:
+        if _code_cache is None:
+            raw_dir = os.environ.get(CODE_CACHE_DIR_ENV_VAR, "").strip()
+            _code_cache = CodeCache(cache_dir=Path(raw_dir).expanduser() if raw_dir else None)
+        return _code_cache
+
+
+def reset_code_cache(cache: CodeCache | None = None) -> None:
+    """Replace the shared code cache, or drop it so the next call rebuilds it."""
+    global _code_cache
+    with _code_cache_lock:
+        _code_cache = cache
@@ -0,0 +1,152 @@
+"""Per-execution cost metrics for graded notebook cells.
+
+When a metrics sink is active, every tagged-cell execution run by
+:mod:`exercise_runtime_support.notebook_grader` records a
+:class:`MetricsRecord` (wall time, CPU time, tracemalloc peak, ``input()``
+calls and stdout size) keyed by ``(exercise_key, tag, variant)``. Collection is
+off by default and costs nothing until a sink is installed.
+
+Sinks:
+
+- :class:`InMemoryMetricsSink` keeps records in a list. The autograde plugin's
+  ``--autograde-metrics`` option uses one to attach each test's records to the
+  ``extra`` field of its result.
+- :class:`JsonlMetricsSink` appends one JSON object per line to a file. Setting
+  ``PYTUTOR_METRICS_FILE`` installs one for the whole process.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import threading
+from collections.abc import Generator
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Protocol
+
+from exercise_runtime_support.cell_executor import ExecutionMetrics
+
+METRICS_FILE_ENV_VAR = "PYTUTOR_METRICS_FILE"
+
+__all__ = [
+    "METRICS_FILE_ENV_VAR",
+    "InMemoryMetricsSink",
+    "JsonlMetricsSink",
+    "MetricsRecord",
+    "MetricsSink",
+    "get_metrics_sink",
+    "use_metrics_sink",
+]
+
+
+@dataclass(frozen=True)
+class MetricsRecord:
+    """Metrics for one execution of a tagged cell."""
+
+    exercise_key: str
+    tag: str
+    variant: str
+    wall_seconds: float
+    cpu_seconds: float
+    peak_memory_bytes: int | None
+    input_calls: int
+    stdout_bytes: int
+
+    @classmethod
+    def from_metrics(
+        cls,
+        metrics: ExecutionMetrics,
+        *,
+        exercise_key: str,
+        tag: str,
+        variant: str,
+    ) -> MetricsRecord:
+        return cls(exercise_key=exercise_key, tag=tag, variant=variant, **asdict(metrics))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serialisable mapping of the record."""
+        return asdict(self)
+
+
+class MetricsSink(Protocol):
+    """Destination for :class:`MetricsRecord` values."""
+
+    def record(self, record: MetricsRecord) -> None:
+        """Store one record."""
+        ...
+
+
+class InMemoryMetricsSink:
+    """Collect records in memory."""
+
+    def __init__(self) -> None:
+        self.records: list[MetricsRecord] = []
+        self._lock = threading.Lock()
+
+    def record(self, record: MetricsRecord) -> None:
+        with self._lock:
+            self.records.append(record)
+
+    def drain(self) -> list[MetricsRecord]:
+        """Return the collected records and start a new collection."""
+        with self._lock:
+            records, self.records = self.records, []
+        return records
+
+
+class JsonlMetricsSink:
+    """Append records to a JSON Lines file.
+
+    Each record is written with a single append, so several grading processes
+    can share one file.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+
+    def record(self, record: MetricsRecord) -> None:
+        line = json.dumps(record.to_dict(), sort_keys=True) + "\n"
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as handle:
+                handle.write(line)
+
+
+_sink_override: MetricsSink | None = None
+_env_sinks: dict[str, JsonlMetricsSink] = {}
+_sink_lock = threading.Lock()
+
+
+def get_metrics_sink() -> MetricsSink | None:
+    """Return the active metrics sink, or ``None`` when metrics are disabled.
+
+    A sink installed with :func:`use_metrics_sink` wins; otherwise
+    ``PYTUTOR_METRICS_FILE`` selects a :class:`JsonlMetricsSink`.
+    """
+    with _sink_lock:
+        if _sink_override is not None:
+            return _sink_override
+        raw_path = os.environ.get(METRICS_FILE_ENV_VAR, "").strip()
+        if raw_path == "":
+            return None
+        sink = _env_sinks.get(raw_path)
+        if sink is None:
+            sink = _env_sinks[raw_path] = JsonlMetricsSink(Path(raw_path).expanduser())
+        return sink
+
+
+@contextlib.contextmanager
+def use_metrics_sink(sink: MetricsSink) -> Generator[MetricsSink, None, None]:
+    """Temporarily route execution metrics to *sink*."""
+    global _sink_override
+    with _sink_lock:
+        previous = _sink_override
+        _sink_override = sink
+    try:
+        yield sink
+    finally:
+        with _sink_lock:
+            _sink_override = previous
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import os
-from collections.abc import MutableMapping
+from collections.abc import Generator, MutableMapping
+from contextlib import contextmanager
+from contextvars import ContextVar
 from pathlib import Path
 from typing import Literal
 
@@ -11,6 +13,8 @@ Variant = Literal["student", "solution"]
 
 ACTIVE_VARIANT_ENV_VAR = "PYTUTOR_ACTIVE_VARIANT"
 
+_pinned_variant: ContextVar[Variant | None] = ContextVar("pinned_variant", default=None)
+
 
 def validate_variant(variant: str) -> Variant:
     """Return a validated notebook variant."""
@@ -22,7 +26,14 @@ def validate_variant(variant: str) -> Variant:
 
 
 def get_active_variant(*, default: Variant = "solution") -> Variant:
-    """Return the active notebook variant from the environment."""
+    """Return the active notebook variant.
+
+    A variant pinned with :func:`pin_variant` wins; otherwise it is read from
+    the environment.
+    """
+    pinned = _pinned_variant.get()
+    if pinned is not None:
+        return pinned
     raw_variant = os.environ.get(ACTIVE_VARIANT_ENV_VAR)
     if raw_variant is None:
         return default
@@ -32,6 +43,21 @@ def get_active_variant(*, default: Variant = "solution") -> Variant:
     return validate_variant(stripped_variant)
 
 
+@contextmanager
+def pin_variant(variant: Variant) -> Generator[None, None, None]:
+    """Make :func:`get_active_variant` return *variant* within this context.
+
+    The pin lives in a context variable, so it is seen by work run with a copy
+    of the current context (see :func:`contextvars.copy_context`) and never
+    touches the process-wide environment.
+    """
+    token = _pinned_variant.set(variant)
+    try:
+        yield
+    finally:
+        _pinned_variant.reset(token)
+
+
 def configure_variant_environment(
     env: MutableMapping[str, str],
     variant: Variant,
@@ -1,16 +1,30 @@
 """Shared exercise catalogue for runtime support modules.
 
 The catalogue is always built from ``exercise_metadata.registry`` so source and
-packaged runtimes share the same metadata-backed resolution path.
+packaged runtimes share the same metadata-backed resolution path. Packaged
+template repositories ship a precompiled copy (see
+``exercise_metadata.compiled_catalogue``) that is used while it still matches the
+exercises on disk.
+
+:class:`ExerciseCatalogue` indexes the entries by key, by
+``(construct, exercise_id)``, by construct and by exercise type, so lookups and
+:meth:`ExerciseCatalogue.select` queries cost O(1) or O(result) however large the
+exercise library grows.
 """
 
 from __future__ import annotations
 
+import bisect
+import fnmatch
+from collections.abc import Iterable, Iterator, Mapping
 from dataclasses import dataclass
 from functools import lru_cache
 from typing import Any
 
 import exercise_metadata.registry as metadata_registry
+from exercise_metadata import compiled_catalogue
+
+_PATTERN_SPECIAL_CHARS = "*?["
 
 
 @dataclass(frozen=True)
@@ -41,24 +55,160 @@ def _to_runtime_entry(entry: Any) -> ExerciseCatalogueEntry:
     )
 
 
-def _build_metadata_catalogue() -> tuple[ExerciseCatalogueEntry, ...]:
-    """Load the runtime catalogue from the metadata registry."""
-    return tuple(_to_runtime_entry(entry) for entry in metadata_registry.build_exercise_catalogue())
+def _literal_prefix(pattern: str) -> str:
+    """Return the part of a glob pattern before its first wildcard."""
+    for index, char in enumerate(pattern):
+        if char in _PATTERN_SPECIAL_CHARS:
+            return pattern[:index]
+    return pattern
+
+
+def _group(
+    entries: Iterable[ExerciseCatalogueEntry],
+    attribute: str,
+) -> dict[str, tuple[ExerciseCatalogueEntry, ...]]:
+    groups: dict[str, list[ExerciseCatalogueEntry]] = {}
+    for entry in entries:
+        groups.setdefault(getattr(entry, attribute), []).append(entry)
+    return {name: tuple(members) for name, members in groups.items()}
+
+
+class ExerciseCatalogue:
+    """Indexed, ordered collection of :class:`ExerciseCatalogueEntry` values.
+
+    Iteration follows catalogue order (``exercise_id`` then construct), and every
+    query returns entries in that order.
+    """
+
+    def __init__(self, entries: Iterable[ExerciseCatalogueEntry]) -> None:
+        self._entries = tuple(entries)
+        self._positions = {entry.exercise_key: index for index, entry in enumerate(self._entries)}
+        self._by_key = {entry.exercise_key: entry for entry in self._entries}
+        self._by_construct_id = {
+            (entry.construct, entry.exercise_id): entry for entry in self._entries
+        }
+        self._by_id: dict[int, ExerciseCatalogueEntry] = {}
+        for entry in self._entries:
+            self._by_id.setdefault(entry.exercise_id, entry)
+        self._by_construct = _group(self._entries, "construct")
+        self._by_type = _group(self._entries, "exercise_type")
+        self._sorted_keys = sorted(self._by_key)
+
+    @classmethod
+    def from_metadata(cls, entries: Iterable[Mapping[str, Any]]) -> ExerciseCatalogue:
+        """Build a catalogue from ``exercise_metadata`` catalogue dictionaries."""
+        return cls(_to_runtime_entry(entry) for entry in entries)
+
+    def __iter__(self) -> Iterator[ExerciseCatalogueEntry]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, exercise_key: object) -> bool:
+        return exercise_key in self._by_key
+
+    @property
+    def exercise_keys(self) -> tuple[str, ...]:
+        """Return every exercise key in catalogue order."""
+        return tuple(entry.exercise_key for entry in self._entries)
+
+    def get(self, exercise_key: str) -> ExerciseCatalogueEntry | None:
+        """Return the entry for *exercise_key*, or ``None`` when it is unknown."""
+        return self._by_key.get(exercise_key)
+
+    def entry(self, exercise_key: str) -> ExerciseCatalogueEntry:
+        """Return the entry for *exercise_key*, raising ``ValueError`` when it is unknown."""
+        entry = self._by_key.get(exercise_key)
+        if entry is None:
+            available = ", ".join(self.exercise_keys)
+            raise ValueError(f"Unknown exercise key '{exercise_key}'. Available: {available}")
+        return entry
+
+    def key_for_exercise_id(self, exercise_id: int, *, construct: str | None = None) -> str:
+        """Return the exercise key for a numeric identifier, optionally within *construct*."""
+        if construct is None:
+            entry = self._by_id.get(exercise_id)
+        else:
+            entry = self._by_construct_id.get((construct, exercise_id))
+        if entry is None:
+            raise ValueError(f"Unknown exercise_id {exercise_id!r}")
+        return entry.exercise_key
+
+    def select(
+        self,
+        *,
+        constructs: Iterable[str] | None = None,
+        exercise_types: Iterable[str] | None = None,
+        key_pattern: str | None = None,
+    ) -> tuple[ExerciseCatalogueEntry, ...]:
+        """Return the entries matching every given filter, in catalogue order.
+
+        Args:
+            constructs: Keep entries whose construct is one of these.
+            exercise_types: Keep entries whose exercise type is one of these.
+            key_pattern: Keep entries whose key matches this glob pattern
+                (case-sensitive).
+
+        Candidates come from the narrowest index for the filters given; the
+        remaining filters are applied to those candidates only.
+        """
+        construct_set = None if constructs is None else frozenset(constructs)
+        type_set = None if exercise_types is None else frozenset(exercise_types)
+
+        candidate_groups: list[list[ExerciseCatalogueEntry]] = []
+        if construct_set is not None:
+            candidate_groups.append(self._union(self._by_construct, construct_set))
+        if type_set is not None:
+            candidate_groups.append(self._union(self._by_type, type_set))
+        if key_pattern is not None and _literal_prefix(key_pattern):
+            candidate_groups.append(self._with_key_prefix(_literal_prefix(key_pattern)))
+        candidates = min(candidate_groups, key=len) if candidate_groups else list(self._entries)
+
+        matches = [
+            entry
+            for entry in candidates
+            if (construct_set is None or entry.construct in construct_set)
+            and (type_set is None or entry.exercise_type in type_set)
+            and (key_pattern is None or fnmatch.fnmatchcase(entry.exercise_key, key_pattern))
+        ]
+        matches.sort(key=lambda entry: self._positions[entry.exercise_key])
+        return tuple(matches)
+
+    @staticmethod
+    def _union(
+        index: dict[str, tuple[ExerciseCatalogueEntry, ...]],
+        names: frozenset[str],
+    ) -> list[ExerciseCatalogueEntry]:
+        return [entry for name in names for entry in index.get(name, ())]
+
+    def _with_key_prefix(self, prefix: str) -> list[ExerciseCatalogueEntry]:
+        start = bisect.bisect_left(self._sorted_keys, prefix)
+        matches: list[ExerciseCatalogueEntry] = []
+        for exercise_key in self._sorted_keys[start:]:
+            if not exercise_key.startswith(prefix):
+                break
+            matches.append(self._by_key[exercise_key])
+        return matches
+
+
+def _build_metadata_catalogue() -> ExerciseCatalogue:
+    """Load the runtime catalogue, preferring an up-to-date compiled copy."""
+    entries = compiled_catalogue.load_compiled_catalogue()
+    if entries is None:
+        entries = metadata_registry.build_exercise_catalogue()
+    return ExerciseCatalogue.from_metadata(entries)
 
 
 @lru_cache(maxsize=1)
-def get_exercise_catalogue() -> tuple[ExerciseCatalogueEntry, ...]:
+def get_exercise_catalogue() -> ExerciseCatalogue:
     """Return the shared exercise catalogue."""
     return _build_metadata_catalogue()
 
 
 def get_catalogue_entry(exercise_key: str) -> ExerciseCatalogueEntry:
     """Return a single catalogue entry by exercise key."""
-    for entry in get_exercise_catalogue():
-        if entry.exercise_key == exercise_key:
-            return entry
-    available = ", ".join(item.exercise_key for item in get_exercise_catalogue())
-    raise ValueError(f"Unknown exercise key '{exercise_key}'. Available: {available}")
+    return get_exercise_catalogue().entry(exercise_key)
 
 
 def get_catalogue_key_for_exercise_id(exercise_id: int, *, construct: str | None = None) -> str:
@@ -70,7 +220,4 @@ def get_catalogue_key_for_exercise_id(exercise_id: int, *, construct: str | None
             construct.  Required when the same ``exercise_id`` exists in
             multiple constructs.
     """
-    for entry in get_exercise_catalogue():
-        if entry.exercise_id == exercise_id and (construct is None or entry.construct == construct):
-            return entry.exercise_key
-    raise ValueError(f"Unknown exercise_id {exercise_id!r}")
+    return get_exercise_catalogue().key_for_exercise_id(exercise_id, construct=construct)
@@ -3,20 +3,9 @@
 # pyright: reportImportCycles=false
 from __future__ import annotations
 
+from importlib import import_module
 from typing import TYPE_CHECKING, Any
 
-from . import expectations as _expectations
-from .expectations import expected_output_lines, expected_output_text, expected_print_call_count
-from .paths import resolve_exercise_notebook_path, resolve_notebook_path
-from .runtime import (
-    RuntimeCache,
-    exec_tagged_code,
-    extract_tagged_code,
-    get_explanation_cell,
-    run_cell_and_capture_output,
-    run_cell_with_input,
-)
-
 if TYPE_CHECKING:
     from .api import (
         ExerciseCheckResult,
@@ -25,7 +14,51 @@ if TYPE_CHECKING:
         run_detailed_ex002_check,
         run_notebook_check,
     )
-    from .expectations import EX002_CHECKS, Ex002CheckDefinition
+    from .expectations import (
+        EX002_CHECKS,
+        Ex002CheckDefinition,
+        expected_output_lines,
+        expected_output_text,
+        expected_print_call_count,
+    )
+    from .paths import resolve_exercise_notebook_path, resolve_notebook_path
+    from .runtime import (
+        RuntimeCache,
+        exec_tagged_code,
+        extract_tagged_code,
+        get_explanation_cell,
+        run_cell_and_capture_output,
+        run_cell_with_default_inputs,
+        run_cell_with_input,
+        run_cell_with_input_cases,
+        run_notebook_once,
+    )
+
+# Submodules load on first attribute access, so importing one helper module
+# (for example ``exercise_framework.paths``) does not pull in the grading runtime.
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "EX002_CHECKS": ".expectations",
+    "Ex002CheckDefinition": ".expectations",
+    "ExerciseCheckResult": ".api",
+    "NotebookCheckResult": ".api",
+    "RuntimeCache": ".runtime",
+    "exec_tagged_code": ".runtime",
+    "expected_output_lines": ".expectations",
+    "expected_output_text": ".expectations",
+    "expected_print_call_count": ".expectations",
+    "extract_tagged_code": ".runtime",
+    "get_explanation_cell": ".runtime",
+    "resolve_exercise_notebook_path": ".paths",
+    "resolve_notebook_path": ".paths",
+    "run_all_checks": ".api",
+    "run_cell_and_capture_output": ".runtime",
+    "run_cell_with_default_inputs": ".runtime",
+    "run_cell_with_input": ".runtime",
+    "run_cell_with_input_cases": ".runtime",
+    "run_detailed_ex002_check": ".api",
+    "run_notebook_check": ".api",
+    "run_notebook_once": ".runtime",
+}
 
 __all__ = [
     "EX002_CHECKS",
@@ -43,30 +76,22 @@ __all__ = [
     "resolve_notebook_path",
     "run_all_checks",
     "run_cell_and_capture_output",
+    "run_cell_with_default_inputs",
     "run_cell_with_input",
+    "run_cell_with_input_cases",
     "run_detailed_ex002_check",
     "run_notebook_check",
+    "run_notebook_once",
 ]
 
 
 def __getattr__(name: str) -> Any:
-    if name in {"EX002_CHECKS", "Ex002CheckDefinition"}:
-        value = getattr(_expectations, name)
-        globals()[name] = value
-        return value
-    if name in {
-        "ExerciseCheckResult",
-        "NotebookCheckResult",
-        "run_all_checks",
-        "run_detailed_ex002_check",
-        "run_notebook_check",
-    }:
-        from . import api as _api
-
-        value = getattr(_api, name)
-        globals()[name] = value
-        return value
-    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
 
 def __dir__() -> list[str]:
@@ -5,13 +5,12 @@ This module provides structured, renderer-agnostic access to notebook checks.
 
 from __future__ import annotations
 
-import ast
 from collections.abc import Callable
 from dataclasses import dataclass
 from functools import partial
 
 from exercise_runtime_support.exercise_catalogue import (
-    get_catalogue_entry,
+    ExerciseCatalogueEntry,
     get_exercise_catalogue,
 )
 from exercise_runtime_support.exercise_framework.expectations import get_ex002_checks
@@ -20,8 +19,6 @@ from exercise_runtime_support.support_matrix import SupportRole, has_support_rol
 
 from . import runtime
 
-_MAX_SMOKE_INPUTS = 10
-
 
 @dataclass(frozen=True)
 class NotebookCheckResult:
@@ -74,70 +71,38 @@ def _check_ex002_summary() -> list[str]:
     return [issue for result in results for issue in result.issues]
 
 
-def _count_direct_input_calls(code: str) -> int:
-    """Return the number of direct ``input()`` calls in *code*."""
-    try:
-        tree = ast.parse(code)
-    except SyntaxError:
-        return 0
-    return sum(
-        1
-        for node in ast.walk(tree)
-        if isinstance(node, ast.Call)
-        and (
-            (isinstance(node.func, ast.Name) and node.func.id == "input")
-            or (
-                isinstance(node.func, ast.Attribute)
-                and node.func.attr == "input"
-                and isinstance(node.func.value, ast.Name)
-                and node.func.value.id == "builtins"
-            )
-        )
-    )
-
-
 def _check_notebook_can_execute_first_exercise(exercise_key: str) -> list[str]:
     """Run the first exercise of *exercise_key* and ensure it executes cleanly.
 
     Some exercises (e.g. user-input modify tasks) call ``input()`` in their
-    first exercise, so we provide mocked input values rather than letting the
-    check fail on a closed stdin under the active variant.
+    first exercise, so placeholder values are supplied on demand rather than
+    letting the check fail on a closed stdin under the active variant.
     """
-    input_count = _count_direct_input_calls(
-        runtime.extract_tagged_code(exercise_key, tag="exercise1")
-    )
-    if input_count == 0:
-        runtime.run_cell_and_capture_output(exercise_key, tag="exercise1")
-        return []
-
-    required = max(input_count, 1)
-    while True:
-        try:
-            runtime.run_cell_with_input(exercise_key, tag="exercise1", inputs=["2"] * required)
-            return []
-        except RuntimeError as exc:  # input() called more times than provided
-            if str(exc) != "Test expected more input values" or required >= _MAX_SMOKE_INPUTS:
-                raise
-            required += 1
+    runtime.run_cell_with_default_inputs(exercise_key, tag="exercise1")
+    return []
+
+
+def _check_definition_for(entry: ExerciseCatalogueEntry) -> NotebookCheckDefinition | None:
+    """Return the notebook check for a catalogue entry, if the framework supports it."""
+    if has_support_role(entry.exercise_id, SupportRole.FRAMEWORK_DETAILED):
+        runner: Callable[[], list[str]] = _check_ex002_summary
+    elif has_support_role(entry.exercise_id, SupportRole.FRAMEWORK_SMOKE):
+        runner = partial(
+            _check_notebook_can_execute_first_exercise,
+            entry.exercise_key,
+        )
+    else:
+        return None
+    return NotebookCheckDefinition(entry.display_label, runner)
 
 
 def _get_supported_check_definitions() -> dict[str, NotebookCheckDefinition]:
     """Return supported checks keyed by exercise key in catalogue order."""
     definitions: dict[str, NotebookCheckDefinition] = {}
     for entry in get_exercise_catalogue():
-        if has_support_role(entry.exercise_id, SupportRole.FRAMEWORK_DETAILED):
-            runner: Callable[[], list[str]] = _check_ex002_summary
-        elif has_support_role(entry.exercise_id, SupportRole.FRAMEWORK_SMOKE):
-            runner = partial(
-                _check_notebook_can_execute_first_exercise,
-                entry.exercise_key,
-            )
-        else:
-            continue
-        definitions[entry.exercise_key] = NotebookCheckDefinition(
-            entry.display_label,
-            runner,
-        )
+        definition = _check_definition_for(entry)
+        if definition is not None:
+            definitions[entry.exercise_key] = definition
     return definitions
 
 
@@ -149,11 +114,9 @@ def run_all_checks() -> list[NotebookCheckResult]:
 
 def run_notebook_check(exercise_key: str) -> list[NotebookCheckResult]:
     """Run a single notebook-level check for an exercise key and return structured results."""
-    checks = _get_supported_check_definitions()
-    catalogue_entry = get_catalogue_entry(exercise_key)
-    check = checks.get(catalogue_entry.exercise_key)
+    check = _check_definition_for(get_exercise_catalogue().entry(exercise_key))
     if check is None:
-        available = ", ".join(sorted(checks))
+        available = ", ".join(sorted(_get_supported_check_definitions()))
         raise ValueError(f"Unknown exercise key '{exercise_key}'. Available: {available}")
 
     return _run_definitions([check])
@@ -0,0 +1,253 @@
+"""Facts about a piece of student code, collected in one AST traversal.
+
+Construct checks ask many small questions of the same cell: does it call
+``print``, does it use ``/``, does it contain the constant ``25``. Walking the
+tree once per question makes every extra rule another full traversal.
+:class:`CodeFacts` walks the tree once and indexes what those questions need,
+so each check becomes a set or dictionary lookup.
+
+:func:`code_facts` memoises facts per ``sha256`` of the source, and
+:func:`facts_for_tree` memoises them per parsed tree, so checks that share a
+cell also share its facts.
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import threading
+import weakref
+from collections import Counter, OrderedDict
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+DEFAULT_MAX_ENTRIES = 256
+
+Loop = ast.For | ast.AsyncFor | ast.While
+Branch = ast.If | ast.IfExp | ast.Match
+
+__all__ = [
+    "DEFAULT_MAX_ENTRIES",
+    "Branch",
+    "CodeFacts",
+    "Loop",
+    "call_name",
+    "code_facts",
+    "facts_for_tree",
+]
+
+
+def call_name(node: ast.Call) -> str | None:
+    """Return ``name`` for ``name(...)`` and ``a.b`` for ``a.b(...)`` calls, else ``None``."""
+    parts: list[str] = []
+    func = node.func
+    while isinstance(func, ast.Attribute):
+        parts.append(func.attr)
+        func = func.value
+    if not isinstance(func, ast.Name):
+        return None
+    parts.append(func.id)
+    return ".".join(reversed(parts))
+
+
+@dataclass(frozen=True)
+class CodeFacts:
+    """Index of the constructs used by one module's source.
+
+    ``call_counts`` counts calls by :func:`call_name`. ``binop_operators`` and
+    ``augassign_operators`` hold the operator types of ``a + b`` and ``a += b``
+    expressions. ``constants`` groups literal values by their exact type, so
+    ``True`` is never mistaken for ``1``. ``assigned_names`` holds every plain
+    name bound by an assignment, and ``input_assigned_names`` those assigned
+    directly from ``input()``. ``names`` holds every plain name the code
+    reads or writes, and ``formatted_names`` those interpolated directly into
+    an f-string, as in ``f"{name}"``. ``loops`` and ``branches`` keep the
+    matching nodes in traversal order, and ``node_types`` holds every node type
+    seen.
+    """
+
+    call_counts: Mapping[str, int]
+    binop_operators: frozenset[type[ast.operator]]
+    augassign_operators: frozenset[type[ast.operator]]
+    constants: Mapping[type, frozenset[object]]
+    assigned_names: frozenset[str]
+    input_assigned_names: frozenset[str]
+    names: frozenset[str]
+    formatted_names: frozenset[str]
+    loops: tuple[Loop, ...]
+    branches: tuple[Branch, ...]
+    node_types: frozenset[type[ast.AST]]
+
+    @classmethod
+    def from_tree(cls, tree: ast.AST) -> CodeFacts:
+        """Collect the facts for *tree* in a single walk."""
+        collector = _FactCollector()
+        for node in ast.walk(tree):
+            node_type = type(node)
+            collector.node_types.add(node_type)
+            handler = _HANDLERS.get(node_type)
+            if handler is not None:
+                handler(collector, node)
+        return cls(
+            call_counts=dict(collector.calls),
+            binop_operators=frozenset(collector.binops),
+            augassign_operators=frozenset(collector.augassigns),
+            constants={kind: frozenset(values) for kind, values in collector.constants.items()},
+            assigned_names=frozenset(collector.assigned),
+            input_assigned_names=frozenset(collector.from_input),
+            names=frozenset(collector.names),
+            formatted_names=frozenset(collector.formatted),
+            loops=tuple(collector.loops),
+            branches=tuple(collector.branches),
+            node_types=frozenset(collector.node_types),
+        )
+
+    def call_count(self, name: str) -> int:
+        """Return how many times *name* is called."""
+        return self.call_counts.get(name, 0)
+
+    def has_call(self, name: str) -> bool:
+        """Return whether *name* is called anywhere."""
+        return name in self.call_counts
+
+    def uses_operator(self, operator_type: type[ast.operator], *, augmented: bool = True) -> bool:
+        """Return whether a binary operation (or, with *augmented*, ``op=``) uses the operator."""
+        if operator_type in self.binop_operators:
+            return True
+        return augmented and operator_type in self.augassign_operators
+
+    def has_constant(self, value: object) -> bool:
+        """Return whether a literal equal to *value*, of exactly its type, appears."""
+        return value in self.constants.get(type(value), frozenset())
+
+
+class _FactCollector:
+    """Mutable accumulators filled by the node handlers during one walk."""
+
+    def __init__(self) -> None:
+        self.calls: Counter[str] = Counter()
+        self.binops: set[type[ast.operator]] = set()
+        self.augassigns: set[type[ast.operator]] = set()
+        self.constants: dict[type, set[object]] = {}
+        self.assigned: set[str] = set()
+        self.from_input: set[str] = set()
+        self.names: set[str] = set()
+        self.formatted: set[str] = set()
+        self.loops: list[Loop] = []
+        self.branches: list[Branch] = []
+        self.node_types: set[type[ast.AST]] = set()
+
+    def call(self, node: ast.Call) -> None:
+        name = call_name(node)
+        if name is not None:
+            self.calls[name] += 1
+
+    def binop(self, node: ast.BinOp) -> None:
+        self.binops.add(type(node.op))
+
+    def constant(self, node: ast.Constant) -> None:
+        self.constants.setdefault(type(node.value), set()).add(node.value)
+
+    def assign(self, node: ast.Assign) -> None:
+        for target in node.targets:
+            self.assigned.update(_bound_names(target))
+        if isinstance(node.value, ast.Call) and call_name(node.value) == "input":
+            self.from_input.update(
+                target.id for target in node.targets if isinstance(target, ast.Name)
+            )
+
+    def augassign(self, node: ast.AugAssign) -> None:
+        self.augassigns.add(type(node.op))
+        self.assigned.update(_bound_names(node.target))
+
+    def target(self, node: ast.AnnAssign | ast.NamedExpr) -> None:
+        self.assigned.update(_bound_names(node.target))
+
+    def name(self, node: ast.Name) -> None:
+        self.names.add(node.id)
+
+    def joined_str(self, node: ast.JoinedStr) -> None:
+        self.formatted.update(
+            value.value.id
+            for value in node.values
+            if isinstance(value, ast.FormattedValue) and isinstance(value.value, ast.Name)
+        )
+
+    def loop(self, node: Loop) -> None:
+        self.loops.append(node)
+
+    def branch(self, node: Branch) -> None:
+        self.branches.append(node)
+
+
+# Exact node type -> handler; ast.walk visits each node once, so a dict lookup
+# replaces a chain of isinstance checks per node.
+_HANDLERS: dict[type[ast.AST], Callable[[_FactCollector, Any], None]] = {
+    ast.Call: _FactCollector.call,
+    ast.BinOp: _FactCollector.binop,
+    ast.Constant: _FactCollector.constant,
+    ast.Assign: _FactCollector.assign,
+    ast.AugAssign: _FactCollector.augassign,
+    ast.AnnAssign: _FactCollector.target,
+    ast.NamedExpr: _FactCollector.target,
+    ast.Name: _FactCollector.name,
+    ast.JoinedStr: _FactCollector.joined_str,
+    ast.For: _FactCollector.loop,
+    ast.AsyncFor: _FactCollector.loop,
+    ast.While: _FactCollector.loop,
+    ast.If: _FactCollector.branch,
+    ast.IfExp: _FactCollector.branch,
+    ast.Match: _FactCollector.branch,
+}
+
+
+def _bound_names(target: ast.expr) -> set[str]:
+    if isinstance(target, ast.Name):
+        return {target.id}
+    if isinstance(target, ast.Tuple | ast.List):
+        return {name for element in target.elts for name in _bound_names(element)}
+    if isinstance(target, ast.Starred):
+        return _bound_names(target.value)
+    return set()
+
+
+_by_source: OrderedDict[str, CodeFacts | None] = OrderedDict()
+_by_tree: weakref.WeakKeyDictionary[ast.AST, CodeFacts] = weakref.WeakKeyDictionary()
+_lock = threading.Lock()
+
+
+def facts_for_tree(tree: ast.AST) -> CodeFacts:
+    """Return the facts for an already parsed *tree*, collecting them once per tree.
+
+    Entries are held weakly, so they go away with the tree.
+    """
+    with _lock:
+        cached = _by_tree.get(tree)
+    if cached is not None:
+        return cached
+    facts = CodeFacts.from_tree(tree)
+    with _lock:
+        _by_tree[tree] = facts
+    return facts
+
+
+def code_facts(source: str) -> CodeFacts | None:
+    """Return the facts for *source*, or ``None`` when it does not parse.
+
+    Results are kept in a bounded LRU keyed by the source's ``sha256`` digest.
+    """
+    digest = hashlib.sha256(source.encode("utf-8")).hexdigest()
+    with _lock:
+        if digest in _by_source:
+            _by_source.move_to_end(digest)
+            return _by_source[digest]
+    try:
+        facts: CodeFacts | None = facts_for_tree(ast.parse(source))
+    except SyntaxError:
+        facts = None
+    with _lock:
+        _by_source[digest] = facts
+        while len(_by_source) > DEFAULT_MAX_ENTRIES:
+            _by_source.popitem(last=False)
+    return facts
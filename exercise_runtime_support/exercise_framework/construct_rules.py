@@ -0,0 +1,284 @@
+"""Declarative construct rules, compiled into one program per exercise.
+
+Expectations modules describe what each part of a notebook must (or must not)
+use as data::
+
+    RULES = {
+        5: (CallRule("input"), OperatorRule(ast.Mult)),
+        8: (OperatorRule(ast.FloorDiv, forbidden=True),),
+    }
+
+:func:`compile_rules` turns that mapping into a :class:`RuleProgram`. Running
+the program parses each part once and collects its :class:`CodeFacts` in a
+single AST walk; every rule is then a lookup against those facts, so checking
+a notebook costs one traversal per part however many rules it has; callers that
+have already parsed a part pass the tree to :meth:`RuleProgram.issues_for_tree`
+instead. Issues come back as :class:`ConstructIssue` records whose ``message`` is ready to show to
+students.
+"""
+
+from __future__ import annotations
+
+import ast
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Final
+
+from exercise_runtime_support.execution_variant import Variant
+
+from . import runtime
+from .code_facts import CodeFacts, code_facts, facts_for_tree
+
+_OPERATOR_TOKENS: Final[dict[type[ast.operator], str]] = {
+    ast.Add: "+",
+    ast.Sub: "-",
+    ast.Mult: "*",
+    ast.Div: "/",
+    ast.FloorDiv: "//",
+    ast.Mod: "%",
+    ast.Pow: "**",
+}
+
+__all__ = [
+    "CallRule",
+    "ConstantRule",
+    "ConstructIssue",
+    "ConstructRule",
+    "FormattedNameRule",
+    "NameRule",
+    "NodeRule",
+    "OperatorRule",
+    "RuleProgram",
+    "compile_rules",
+]
+
+
+@dataclass(frozen=True)
+class CallRule:
+    """Require a call to *name*; exactly *count* calls when given, none when *forbidden*."""
+
+    name: str
+    count: int | None = None
+    forbidden: bool = False
+    message: str | None = None
+
+    def holds(self, facts: CodeFacts) -> bool:
+        """Return whether *facts* satisfy the rule."""
+        calls = facts.call_count(self.name)
+        if self.forbidden:
+            return calls == 0
+        return calls > 0 if self.count is None else calls == self.count
+
+    def describe(self) -> str:
+        """Return the default student-facing message."""
+        if self.forbidden:
+            return f"do not call {self.name}()."
+        if self.count is None:
+            return f"use {self.name}()."
+        return f"call {self.name}() exactly {self.count} time(s)."
+
+
+@dataclass(frozen=True)
+class OperatorRule:
+    """Require (or, when *forbidden*, disallow) an arithmetic operator.
+
+    With *augmented*, ``a op= b`` counts as a use of ``op``.
+    """
+
+    operator: type[ast.operator]
+    forbidden: bool = False
+    augmented: bool = True
+    message: str | None = None
+
+    def holds(self, facts: CodeFacts) -> bool:
+        """Return whether *facts* satisfy the rule."""
+        return facts.uses_operator(self.operator, augmented=self.augmented) != self.forbidden
+
+    def describe(self) -> str:
+        """Return the default student-facing message."""
+        token = _OPERATOR_TOKENS.get(self.operator, self.operator.__name__)
+        return f"do not use {token}." if self.forbidden else f"use the {token} operator."
+
+
+@dataclass(frozen=True)
+class ConstantRule:
+    """Require (or, when *forbidden*, disallow) a literal of exactly *value*'s type."""
+
+    value: object
+    forbidden: bool = False
+    message: str | None = None
+
+    def holds(self, facts: CodeFacts) -> bool:
+        """Return whether *facts* satisfy the rule."""
+        return facts.has_constant(self.value) != self.forbidden
+
+    def describe(self) -> str:
+        """Return the default student-facing message."""
+        return f"do not use {self.value!r}." if self.forbidden else f"include {self.value!r}."
+
+
+@dataclass(frozen=True)
+class NodeRule:
+    """Require (or, when *forbidden*, disallow) a syntax node type such as ``ast.JoinedStr``."""
+
+    node_type: type[ast.AST]
+    forbidden: bool = False
+    message: str | None = None
+
+    def holds(self, facts: CodeFacts) -> bool:
+        """Return whether *facts* satisfy the rule."""
+        return (self.node_type in facts.node_types) != self.forbidden
+
+    def describe(self) -> str:
+        """Return the default student-facing message."""
+        name = self.node_type.__name__
+        return f"do not use {name}." if self.forbidden else f"use {name}."
+
+
+@dataclass(frozen=True)
+class NameRule:
+    """Require (or, when *forbidden*, disallow) any use of the variable *name*."""
+
+    name: str
+    forbidden: bool = False
+    message: str | None = None
+
+    def holds(self, facts: CodeFacts) -> bool:
+        """Return whether *facts* satisfy the rule."""
+        return (self.name in facts.names) != self.forbidden
+
+    def describe(self) -> str:
+        """Return the default student-facing message."""
+        return f"do not use {self.name}." if self.forbidden else f"use {self.name}."
+
+
+@dataclass(frozen=True)
+class FormattedNameRule:
+    """Require every variable in *names* to be interpolated into an f-string."""
+
+    names: tuple[str, ...]
+    message: str | None = None
+
+    def holds(self, facts: CodeFacts) -> bool:
+        """Return whether *facts* satisfy the rule."""
+        return facts.formatted_names.issuperset(self.names)
+
+    def describe(self) -> str:
+        """Return the default student-facing message."""
+        return f"interpolate variable(s) in the f-string: {', '.join(sorted(self.names))}."
+
+
+ConstructRule = CallRule | OperatorRule | ConstantRule | NodeRule | NameRule | FormattedNameRule
+
+
+@dataclass(frozen=True)
+class ConstructIssue:
+    """A rule one exercise part does not satisfy."""
+
+    exercise_no: int
+    rule: ConstructRule | None
+    message: str
+
+
+@dataclass(frozen=True)
+class _CompiledRule:
+    rule: ConstructRule
+    message: str
+
+
+class RuleProgram:
+    """Compiled rule set for one exercise; see :func:`compile_rules`."""
+
+    def __init__(self, rules: Mapping[int, tuple[_CompiledRule, ...]]) -> None:
+        self._rules = rules
+
+    @property
+    def exercise_numbers(self) -> tuple[int, ...]:
+        """Exercise numbers that have at least one rule, in ascending order."""
+        return tuple(self._rules)
+
+    def issues_for(self, exercise_no: int, code: str) -> list[ConstructIssue]:
+        """Return the issues for one part's *code*, in rule order."""
+        compiled = self._rules.get(exercise_no, ())
+        if not compiled:
+            return []
+        facts = code_facts(code)
+        if facts is None:
+            return [
+                ConstructIssue(
+                    exercise_no, None, f"Exercise {exercise_no}: code could not be parsed."
+                )
+            ]
+        return self._issues(exercise_no, compiled, facts)
+
+    def issues_for_tree(self, exercise_no: int, tree: ast.AST) -> list[ConstructIssue]:
+        """Return the issues for one part that the caller has already parsed, in rule order."""
+        compiled = self._rules.get(exercise_no, ())
+        if not compiled:
+            return []
+        return self._issues(exercise_no, compiled, facts_for_tree(tree))
+
+    @staticmethod
+    def _issues(
+        exercise_no: int, compiled: tuple[_CompiledRule, ...], facts: CodeFacts
+    ) -> list[ConstructIssue]:
+        return [
+            ConstructIssue(exercise_no, entry.rule, entry.message)
+            for entry in compiled
+            if not entry.rule.holds(facts)
+        ]
+
+    def run(self, sources: Mapping[int, str]) -> list[ConstructIssue]:
+        """Return the issues for every part in *sources*, keyed by exercise number."""
+        issues: list[ConstructIssue] = []
+        for exercise_no in self._rules:
+            code = sources.get(exercise_no)
+            if code is not None:
+                issues.extend(self.issues_for(exercise_no, code))
+        return issues
+
+    def check_notebook(
+        self,
+        notebook_path: str | Path,
+        *,
+        variant: Variant | None = None,
+        cache: runtime.RuntimeCache | None = None,
+    ) -> list[ConstructIssue]:
+        """Return the issues for every ruled ``exerciseN`` cell of a notebook.
+
+        Raises:
+            NotebookGradingError: If a ruled exercise has no tagged cell.
+        """
+        sources = {
+            exercise_no: runtime.extract_tagged_code(
+                notebook_path,
+                tag=f"exercise{exercise_no}",
+                variant=variant,
+                cache=cache,
+            )
+            for exercise_no in self._rules
+        }
+        return self.run(sources)
+
+
+def compile_rules(rules: Mapping[int, Iterable[ConstructRule]]) -> RuleProgram:
+    """Compile per-exercise *rules* into a :class:`RuleProgram`.
+
+    Messages are resolved once here: each issue reads ``"Exercise N: ..."``
+    using the rule's ``message`` or its default description.
+    """
+    compiled: dict[int, tuple[_CompiledRule, ...]] = {}
+    for exercise_no in sorted(rules):
+        entries = _compile_part(exercise_no, tuple(rules[exercise_no]))
+        if entries:
+            compiled[exercise_no] = entries
+    return RuleProgram(compiled)
+
+
+def _compile_part(exercise_no: int, rules: Sequence[ConstructRule]) -> tuple[_CompiledRule, ...]:
+    unique = dict.fromkeys(rules)
+    return tuple(
+        _CompiledRule(rule, f"Exercise {exercise_no}: {rule.message or rule.describe()}")
+        for rule in unique
+    )
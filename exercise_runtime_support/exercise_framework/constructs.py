@@ -1,4 +1,8 @@
-"""AST-first construct checks for exercise code."""
+"""AST-first construct checks for exercise code.
+
+Each check reads the shared :func:`~.code_facts.code_facts` index, so asking
+several questions of one cell parses and walks it once.
+"""
 
 from __future__ import annotations
 
@@ -9,6 +13,8 @@ import token
 import tokenize
 from typing import Final
 
+from .code_facts import code_facts
+
 _OPERATOR_NODES: Final[dict[str, type[ast.operator]]] = {
     "*": ast.Mult,
     "/": ast.Div,
@@ -16,58 +22,12 @@ _OPERATOR_NODES: Final[dict[str, type[ast.operator]]] = {
 }
 
 
-def _parse_code(code: str) -> ast.AST | None:
-    """Return an AST for code, or None when parsing fails."""
-    try:
-        return ast.parse(code)
-    except SyntaxError:
-        return None
-
-
-def _has_print_call(tree: ast.AST) -> bool:
-    for node in ast.walk(tree):
-        if (
-            isinstance(node, ast.Call)
-            and isinstance(node.func, ast.Name)
-            and node.func.id == "print"
-        ):
-            return True
-    return False
-
-
-def _has_operator(tree: ast.AST, operator_type: type[ast.operator]) -> bool:
-    for node in ast.walk(tree):
-        if isinstance(node, ast.BinOp) and isinstance(node.op, operator_type):
-            return True
-        if isinstance(node, ast.AugAssign) and isinstance(node.op, operator_type):
-            return True
-    return False
-
-
-def _has_string_constant(tree: ast.AST, value: str) -> bool:
-    """Return True when the AST contains a string constant matching *value*."""
-    return any(isinstance(node, ast.Constant) and node.value == value for node in ast.walk(tree))
-
-
-def _has_int_constant(tree: ast.AST, value: int) -> bool:
-    """Return True when the AST contains an integer constant matching *value*."""
-    for node in ast.walk(tree):
-        if (
-            isinstance(node, ast.Constant)
-            and isinstance(node.value, int)
-            and not isinstance(node.value, bool)
-            and node.value == value
-        ):
-            return True
-    return False
-
-
 def check_has_print_statement(code: str) -> bool:
     """Return True when the code contains a print call, using AST-first checks."""
-    tree = _parse_code(code)
-    if tree is None:
+    facts = code_facts(code)
+    if facts is None:
         return re.search(r"\bprint\s*\(", code) is not None
-    return _has_print_call(tree)
+    return facts.has_call("print")
 
 
 def check_uses_operator(code: str, operator: str) -> bool:
@@ -76,8 +36,8 @@ def check_uses_operator(code: str, operator: str) -> bool:
     if operator_type is None:
         raise ValueError(f"Unsupported operator: {operator}")
 
-    tree = _parse_code(code)
-    if tree is None:
+    facts = code_facts(code)
+    if facts is None:
         allowed_tokens = {operator, f"{operator}="}
         try:
             for tok in tokenize.generate_tokens(io.StringIO(code).readline):
@@ -88,7 +48,7 @@ def check_uses_operator(code: str, operator: str) -> bool:
         except (tokenize.TokenError, IndentationError):
             return False
         return False
-    return _has_operator(tree, operator_type)
+    return facts.uses_operator(operator_type)
 
 
 def check_has_string_constant(code: str, value: str) -> bool:
@@ -97,11 +57,11 @@ def check_has_string_constant(code: str, value: str) -> bool:
     Useful for verify exercises: confirm that a new string value (e.g. a
     changed message or comparison target) is present in the student's code.
     """
-    tree = _parse_code(code)
-    if tree is None:
+    facts = code_facts(code)
+    if facts is None:
         # Fallback: crude quoted-string search when AST parsing fails.
         return f'"{value}"' in code or f"'{value}'" in code
-    return _has_string_constant(tree, value)
+    return facts.has_constant(value)
 
 
 def check_has_int_constant(code: str, value: int) -> bool:
@@ -110,8 +70,8 @@ def check_has_int_constant(code: str, value: int) -> bool:
     Useful for verify exercises: confirm that a new numeric threshold
     (e.g. changed from 30 to 25) is present in the student's code.
     """
-    tree = _parse_code(code)
-    if tree is None:
+    facts = code_facts(code)
+    if facts is None:
         # Fallback: tokenise when AST parsing fails.
         try:
             for tok in tokenize.generate_tokens(io.StringIO(code).readline):
@@ -120,4 +80,4 @@ def check_has_int_constant(code: str, value: int) -> bool:
         except (tokenize.TokenError, IndentationError):
             return False
         return False
-    return _has_int_constant(tree, value)
+    return facts.has_constant(value)
@@ -0,0 +1,211 @@
+"""Which entered values, calls and operators flow into each expression of a cell.
+
+Debug and modify exercises check more than the printed text: the printed
+result must come from the student's ``input()`` values through the required
+casts and operators. :class:`DataflowGraph` answers that from a def-use graph
+built once per cell:
+
+* every assignment is a *definition* of the names it binds;
+* each name a definition reads is linked to the latest definition of that name
+  on an earlier line, so the graph is acyclic;
+* a definition's :class:`Flow` is its own calls, operators and ``input()``
+  sources joined with the flows of the definitions it reads.
+
+Definitions are visited once in line order and each flow is computed once, so
+building the graph is linear in the size of the cell. Queries such as
+:attr:`DataflowGraph.print_flows` then only look up names in that index.
+:func:`dataflow_for_tree` memoises the graph per parsed tree.
+
+Resolution follows source lines rather than control flow, matching how the
+checks read straight-line sequence exercises: a branch or loop body counts as
+if it ran in order.
+"""
+
+from __future__ import annotations
+
+import ast
+import bisect
+import functools
+import itertools
+import threading
+import weakref
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+
+from .code_facts import call_name
+
+__all__ = [
+    "DataflowGraph",
+    "Flow",
+    "dataflow_for_tree",
+]
+
+
+@dataclass(frozen=True)
+class Flow:
+    """What reaches an expression.
+
+    ``input_names`` are the names bound directly from ``input()`` whose values
+    reach it; ``call_names`` and ``op_types`` are the calls and binary or
+    augmented operators applied on the way.
+    """
+
+    input_names: frozenset[str] = frozenset()
+    call_names: frozenset[str] = frozenset()
+    op_types: frozenset[type[ast.operator]] = frozenset()
+
+    def __or__(self, other: Flow) -> Flow:
+        return Flow(
+            self.input_names | other.input_names,
+            self.call_names | other.call_names,
+            self.op_types | other.op_types,
+        )
+
+
+_EMPTY = Flow()
+
+
+@dataclass(frozen=True)
+class _Definition:
+    name: str
+    line: int
+    flow: Flow
+
+
+class DataflowGraph:
+    """Def-use graph of one parsed cell; see the module docstring."""
+
+    def __init__(self, tree: ast.AST) -> None:
+        self._lines: dict[str, list[int]] = {}
+        self._definitions: dict[str, list[_Definition]] = {}
+        self._prints: list[ast.Call] = []
+        input_names: set[str] = set()
+
+        statements = sorted(_definition_statements(tree, self._prints), key=_position)
+        for line, group in itertools.groupby(statements, key=_line):
+            # Statements on one line only see definitions from earlier lines.
+            resolved = [(statement, self._statement_flow(statement, line)) for statement in group]
+            for statement, flow in resolved:
+                from_input = _input_targets(statement)
+                input_names.update(from_input)
+                for name in _defined_names(statement):
+                    own = flow
+                    if name in from_input:
+                        own = flow | Flow(input_names=frozenset({name}))
+                    self._lines.setdefault(name, []).append(line)
+                    self._definitions.setdefault(name, []).append(_Definition(name, line, own))
+
+        self.input_names: frozenset[str] = frozenset(input_names)
+
+    def flow_into(self, expr: ast.AST, *, before_line: int) -> Flow:
+        """Return what flows into *expr* when it is evaluated on *before_line*."""
+        direct, used = _expression_details(expr)
+        flow = direct
+        for name in used:
+            definition = self._latest_definition(name, before_line)
+            if definition is not None:
+                flow |= definition.flow
+        return flow
+
+    @functools.cached_property
+    def print_flows(self) -> tuple[Flow, ...]:
+        """Flow into each positional argument of every ``print()`` call, in source order."""
+        return tuple(
+            self.flow_into(arg, before_line=call.lineno)
+            for call in sorted(self._prints, key=_position)
+            for arg in call.args
+        )
+
+    def _latest_definition(self, name: str, before_line: int) -> _Definition | None:
+        lines = self._lines.get(name)
+        if not lines:
+            return None
+        index = bisect.bisect_left(lines, before_line)
+        return self._definitions[name][index - 1] if index else None
+
+    def _statement_flow(self, statement: _DefinitionStatement, line: int) -> Flow:
+        flow = self.flow_into(statement.value, before_line=line) if statement.value else _EMPTY
+        if isinstance(statement, ast.AugAssign):
+            flow |= Flow(op_types=frozenset({type(statement.op)}))
+            flow |= self.flow_into(statement.target, before_line=line)
+        return flow
+
+
+_DefinitionStatement = ast.Assign | ast.AugAssign | ast.AnnAssign
+
+
+def _definition_statements(tree: ast.AST, prints: list[ast.Call]) -> Iterator[_DefinitionStatement]:
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Assign | ast.AugAssign | ast.AnnAssign):
+            yield node
+        elif isinstance(node, ast.Call) and call_name(node) == "print":
+            prints.append(node)
+
+
+def _position(node: ast.stmt | ast.expr) -> tuple[int, int]:
+    return node.lineno, node.col_offset
+
+
+def _line(node: ast.stmt) -> int:
+    return node.lineno
+
+
+def _defined_names(statement: _DefinitionStatement) -> tuple[str, ...]:
+    targets: Iterable[ast.expr] = (
+        statement.targets if isinstance(statement, ast.Assign) else (statement.target,)
+    )
+    names: list[str] = []
+    for target in targets:
+        names.extend(_target_names(target))
+    return tuple(names)
+
+
+def _target_names(target: ast.expr) -> Iterator[str]:
+    if isinstance(target, ast.Name):
+        yield target.id
+    elif isinstance(target, ast.Tuple | ast.List):
+        for element in target.elts:
+            yield from _target_names(element)
+    elif isinstance(target, ast.Starred):
+        yield from _target_names(target.value)
+
+
+def _input_targets(statement: _DefinitionStatement) -> frozenset[str]:
+    """Return the plain names assigned directly from ``input()``."""
+    if not isinstance(statement, ast.Assign):
+        return frozenset()
+    if not isinstance(statement.value, ast.Call) or call_name(statement.value) != "input":
+        return frozenset()
+    return frozenset(target.id for target in statement.targets if isinstance(target, ast.Name))
+
+
+def _expression_details(expr: ast.AST) -> tuple[Flow, set[str]]:
+    calls: set[str] = set()
+    ops: set[type[ast.operator]] = set()
+    used: set[str] = set()
+    for node in ast.walk(expr):
+        if isinstance(node, ast.Name):
+            used.add(node.id)
+        elif isinstance(node, ast.Call):
+            name = call_name(node)
+            if name is not None:
+                calls.add(name)
+        elif isinstance(node, ast.BinOp):
+            ops.add(type(node.op))
+    return Flow(call_names=frozenset(calls), op_types=frozenset(ops)), used
+
+
+_graphs: weakref.WeakKeyDictionary[ast.AST, DataflowGraph] = weakref.WeakKeyDictionary()
+_lock = threading.Lock()
+
+
+def dataflow_for_tree(tree: ast.AST) -> DataflowGraph:
+    """Return the :class:`DataflowGraph` for *tree*, building it once per tree."""
+    with _lock:
+        cached = _graphs.get(tree)
+    if cached is not None:
+        return cached
+    graph = DataflowGraph(tree)
+    with _lock:
+        _graphs[tree] = graph
+    return graph
@@ -1,41 +1,173 @@
 """Execution helpers for exercise notebook cells.
 
 This module wraps notebook grader helpers and adds optional execution artefact caching
-for repeated checks within a single run.
+for repeated checks. :class:`RuntimeCache` is a bounded LRU keyed on the exercise key
+(or notebook ``Path``) and variant, and drops entries when the notebook changes on disk,
+so long-lived processes such as a Jupyter kernel can keep one without serving stale
+output. A ``RuntimeCache(whole_notebook=True)`` runs every ``exerciseN`` cell of a
+notebook in one batch on first use, so later output checks against the notebook's
+non-interactive cells are dictionary lookups.
 """
 
 from __future__ import annotations
 
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable, Sequence
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
 
 from exercise_runtime_support import notebook_grader
-from exercise_runtime_support.execution_variant import Variant
+from exercise_runtime_support.execution_variant import Variant, get_active_variant
 from exercise_runtime_support.exercise_framework.paths import (
     resolve_notebook_path as resolve_framework_notebook_path,
 )
 
+DEFAULT_RUNTIME_CACHE_ENTRIES = 1024
+
 __all__ = [
+    "DEFAULT_RUNTIME_CACHE_ENTRIES",
     "RuntimeCache",
+    "RuntimeCacheStats",
     "exec_tagged_code",
     "extract_tagged_code",
     "get_explanation_cell",
     "run_cell_and_capture_output",
+    "run_cell_with_default_inputs",
     "run_cell_with_input",
+    "run_cell_with_input_cases",
+    "run_notebook_once",
 ]
 
+NotebookRef = tuple[str | Path, Variant]
+"""Cheap notebook identity: the exercise key (or explicit ``Path``) plus variant."""
+
+Fingerprint = tuple[int, int]
+
+
+@dataclass
+class RuntimeCacheStats:
+    """Counters describing how a :class:`RuntimeCache` has been used."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
 
 class RuntimeCache:
-    """In-memory cache for extracted code and captured outputs."""
+    """Bounded LRU cache for extracted code, captured outputs and cell outcomes.
+
+    Entries are keyed on a :data:`NotebookRef` rather than a resolved path, so a
+    hit never touches exercise metadata. Each notebook is resolved once per
+    cache, and every lookup compares the notebook's ``(st_mtime_ns, st_size)``
+    with the value recorded when the entry was stored: an edited notebook
+    invalidates its entries instead of serving stale output.
+
+    With ``whole_notebook=True``, the first :func:`run_cell_and_capture_output`
+    call for an ``exerciseN`` tag runs the whole notebook through
+    :func:`run_notebook_once` and serves every later tag from the cache.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = DEFAULT_RUNTIME_CACHE_ENTRIES,
+        whole_notebook: bool = False,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.whole_notebook = whole_notebook
+        self.stats = RuntimeCacheStats()
+        self._entries: OrderedDict[tuple[NotebookRef, Hashable], tuple[Fingerprint, object]] = (
+            OrderedDict()
+        )
+        self._paths: dict[NotebookRef, Path] = {}
+        self._lock = threading.Lock()
+
+    def notebook_ref(self, notebook_path: str | Path, variant: Variant | None) -> NotebookRef:
+        """Return the cache identity of a notebook without resolving it."""
+        selected_variant = get_active_variant() if variant is None else variant
+        identity = sys.intern(notebook_path) if isinstance(notebook_path, str) else notebook_path
+        return identity, selected_variant
+
+    def fingerprint(self, ref: NotebookRef) -> Fingerprint | None:
+        """Return the notebook's current ``(st_mtime_ns, st_size)``, or ``None`` if missing.
+
+        A notebook pinned to live sources (see
+        :func:`~exercise_runtime_support.notebook_grader.use_live_sources`) reports
+        its pinned fingerprint instead.
+        """
+        path = self._paths.get(ref)
+        if path is None:
+            path = resolve_framework_notebook_path(ref[0], variant=ref[1])
+            with self._lock:
+                self._paths[ref] = path
+        pinned = notebook_grader.get_notebook_index().pinned(path)
+        if pinned is not None:
+            return pinned.fingerprint
+        try:
+            stat_result = path.stat()
+        except OSError:
+            return None
+        return stat_result.st_mtime_ns, stat_result.st_size
+
+    def lookup(self, ref: NotebookRef, fingerprint: Fingerprint | None, key: Hashable) -> Any:
+        """Return the value stored under *key* for a notebook, or ``None`` on a miss."""
+        entry_key = (ref, key)
+        with self._lock:
+            entry = self._entries.get(entry_key)
+            if entry is not None and fingerprint is not None and entry[0] == fingerprint:
+                self._entries.move_to_end(entry_key)
+                self.stats.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[entry_key]
+                self.stats.invalidations += 1
+            self.stats.misses += 1
+            return None
+
+    def store(
+        self,
+        ref: NotebookRef,
+        fingerprint: Fingerprint | None,
+        key: Hashable,
+        value: object,
+    ) -> None:
+        """Store *value* under *key*, valid while the notebook keeps *fingerprint*."""
+        if fingerprint is None:
+            return
+        entry_key = (ref, key)
+        with self._lock:
+            self._entries[entry_key] = (fingerprint, value)
+            self._entries.move_to_end(entry_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
 
-    def __init__(self) -> None:
-        self.code_by_tag: dict[tuple[str, str], str] = {}
-        self.output_by_tag: dict[tuple[str, str], str] = {}
-        self.input_output_by_tag: dict[tuple[str, str, tuple[str, ...]], str] = {}
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._paths.clear()
+            self.stats = RuntimeCacheStats()
 
+    def __len__(self) -> int:
+        return len(self._entries)
 
-def _path_key(notebook_path: str | Path) -> str:
-    return str(Path(notebook_path))
+
+def _fresh_error(error: BaseException) -> BaseException:
+    """Return a new instance of a cached *error* so each cache hit raises its own object.
+
+    ``__init__`` is bypassed because subclasses such as ``OutputLimitExceeded``
+    take keyword-only arguments that are not part of ``args``.
+    """
+    fresh = type(error).__new__(type(error), *error.args)
+    fresh.__dict__.update(vars(error))
+    return fresh
 
 
 def extract_tagged_code(
@@ -46,13 +178,17 @@ def extract_tagged_code(
     variant: Variant | None = None,
 ) -> str:
     """Extract tagged code, using cache when provided."""
-    key = (_path_key(resolve_framework_notebook_path(notebook_path, variant=variant)), tag)
-    if cache is not None and key in cache.code_by_tag:
-        return cache.code_by_tag[key]
+    if cache is None:
+        return notebook_grader.extract_tagged_code(notebook_path, tag=tag, variant=variant)
+
+    ref = cache.notebook_ref(notebook_path, variant)
+    fingerprint = cache.fingerprint(ref)
+    cached = cache.lookup(ref, fingerprint, ("code", tag))
+    if cached is not None:
+        return cast(str, cached)
 
     code = notebook_grader.extract_tagged_code(notebook_path, tag=tag, variant=variant)
-    if cache is not None:
-        cache.code_by_tag[key] = code
+    cache.store(ref, fingerprint, ("code", tag), code)
     return code
 
 
@@ -80,17 +216,35 @@ def run_cell_and_capture_output(
     variant: Variant | None = None,
 ) -> str:
     """Run a tagged cell and capture stdout, with optional caching."""
-    key = (_path_key(resolve_framework_notebook_path(notebook_path, variant=variant)), tag)
-    if cache is not None and key in cache.output_by_tag:
-        return cache.output_by_tag[key]
+    if cache is None:
+        return notebook_grader.run_cell_and_capture_output(
+            notebook_path,
+            tag=tag,
+            variant=variant,
+        )
+
+    ref = cache.notebook_ref(notebook_path, variant)
+    fingerprint = cache.fingerprint(ref)
+    if (
+        cache.whole_notebook
+        and notebook_grader.EXERCISE_TAG_PATTERN.fullmatch(tag)
+        and cache.lookup(ref, fingerprint, ("walked",)) is None
+    ):
+        run_notebook_once(notebook_path, cache=cache, variant=variant)
+        fingerprint = cache.fingerprint(ref)
+
+    cached = cache.lookup(ref, fingerprint, ("output", tag))
+    if isinstance(cached, notebook_grader.TaggedCellOutcome) and cached.error is not None:
+        raise _fresh_error(cached.error) from cached.error
+    if cached is not None:
+        return cast(str, cached)
 
     output = notebook_grader.run_cell_and_capture_output(
         notebook_path,
         tag=tag,
         variant=variant,
     )
-    if cache is not None:
-        cache.output_by_tag[key] = output
+    cache.store(ref, fingerprint, ("output", tag), output)
     return output
 
 
@@ -103,13 +257,20 @@ def run_cell_with_input(
     variant: Variant | None = None,
 ) -> str:
     """Run a tagged cell with mocked input, with optional caching."""
-    key = (
-        _path_key(resolve_framework_notebook_path(notebook_path, variant=variant)),
-        tag,
-        tuple(inputs),
-    )
-    if cache is not None and key in cache.input_output_by_tag:
-        return cache.input_output_by_tag[key]
+    if cache is None:
+        return notebook_grader.run_cell_with_input(
+            notebook_path,
+            tag=tag,
+            inputs=inputs,
+            variant=variant,
+        )
+
+    ref = cache.notebook_ref(notebook_path, variant)
+    fingerprint = cache.fingerprint(ref)
+    key = ("input", tag, tuple(inputs))
+    cached = cache.lookup(ref, fingerprint, key)
+    if cached is not None:
+        return cast(str, cached)
 
     output = notebook_grader.run_cell_with_input(
         notebook_path,
@@ -117,11 +278,119 @@ def run_cell_with_input(
         inputs=inputs,
         variant=variant,
     )
-    if cache is not None:
-        cache.input_output_by_tag[key] = output
+    cache.store(ref, fingerprint, key, output)
     return output
 
 
+def run_cell_with_default_inputs(  # noqa: PLR0913
+    notebook_path: str | Path,
+    *,
+    tag: str,
+    default_input: str = notebook_grader.DEFAULT_INPUT_VALUE,
+    max_inputs: int = notebook_grader.MAX_DEFAULT_INPUTS,
+    cache: RuntimeCache | None = None,
+    variant: Variant | None = None,
+) -> notebook_grader.DefaultInputOutput:
+    """Run a tagged cell once with placeholder inputs, with optional caching."""
+    if cache is None:
+        return notebook_grader.run_cell_with_default_inputs(
+            notebook_path,
+            tag=tag,
+            default_input=default_input,
+            max_inputs=max_inputs,
+            variant=variant,
+        )
+
+    ref = cache.notebook_ref(notebook_path, variant)
+    fingerprint = cache.fingerprint(ref)
+    key = ("default_inputs", tag, default_input, max_inputs)
+    cached = cache.lookup(ref, fingerprint, key)
+    if cached is not None:
+        return cast(notebook_grader.DefaultInputOutput, cached)
+
+    result = notebook_grader.run_cell_with_default_inputs(
+        notebook_path,
+        tag=tag,
+        default_input=default_input,
+        max_inputs=max_inputs,
+        variant=variant,
+    )
+    cache.store(ref, fingerprint, key, result)
+    return result
+
+
+def run_cell_with_input_cases(
+    notebook_path: str | Path,
+    *,
+    tag: str,
+    cases: Sequence[Sequence[str]],
+    cache: RuntimeCache | None = None,
+    variant: Variant | None = None,
+) -> list[str]:
+    """Run a tagged cell once per input vector, with optional caching.
+
+    Cached cases are served from ``cache``; the rest run as one batch so the cell
+    is extracted and compiled once. Outputs are returned in case order.
+    """
+    keys = [("input", tag, tuple(inputs)) for inputs in cases]
+    outputs: dict[tuple[str, str, tuple[str, ...]], str] = {}
+    ref: NotebookRef | None = None
+    fingerprint: Fingerprint | None = None
+    if cache is not None:
+        ref = cache.notebook_ref(notebook_path, variant)
+        fingerprint = cache.fingerprint(ref)
+        for key in dict.fromkeys(keys):
+            cached = cache.lookup(ref, fingerprint, key)
+            if cached is not None:
+                outputs[key] = cast(str, cached)
+
+    pending = list(dict.fromkeys(key for key in keys if key not in outputs))
+    if pending:
+        fresh = notebook_grader.run_cell_with_input_cases(
+            notebook_path,
+            tag=tag,
+            cases=[list(inputs) for _, _, inputs in pending],
+            variant=variant,
+        )
+        outputs.update(zip(pending, fresh, strict=True))
+        if cache is not None and ref is not None:
+            for key, output in zip(pending, fresh, strict=True):
+                cache.store(ref, fingerprint, key, output)
+
+    return [outputs[key] for key in keys]
+
+
+def run_notebook_once(
+    notebook_path: str | Path,
+    *,
+    cache: RuntimeCache | None = None,
+    variant: Variant | None = None,
+) -> dict[str, notebook_grader.TaggedCellOutcome]:
+    """Run every ``exerciseN`` cell of a notebook in one batch.
+
+    Each cell runs in isolation. Outcomes of cells that do not call ``input()``
+    are memoised in ``cache``, so later :func:`run_cell_and_capture_output`
+    calls for them return the recorded output (or re-raise the recorded error)
+    without executing the cell again.
+    """
+    if cache is None:
+        return notebook_grader.run_tagged_cells(notebook_path, variant=variant)
+
+    ref = cache.notebook_ref(notebook_path, variant)
+    fingerprint = cache.fingerprint(ref)
+    outcomes = notebook_grader.run_tagged_cells(notebook_path, variant=variant)
+    cache.store(ref, fingerprint, ("walked",), True)
+    for tag, outcome in outcomes.items():
+        if outcome.needs_input:
+            continue
+        cache.store(ref, fingerprint, ("outcome", tag), outcome)
+        # Failing cells are stored in the output slot too, so a single lookup
+        # either returns the output or re-raises the recorded error.
+        output: object = outcome.output if outcome.error is None else outcome
+        cache.store(ref, fingerprint, ("output", tag), output)
+    return outcomes
+
+
 def get_explanation_cell(
     notebook_path: str | Path,
     *,
@@ -8,6 +8,7 @@ from importlib.util import module_from_spec, spec_from_file_location
 from pathlib import Path
 from types import ModuleType
 
+from exercise_metadata.resolver import resolve_exercise_entry
 from exercise_runtime_support.exercise_catalogue import get_catalogue_entry
 
 _REPO_ROOT = Path(__file__).resolve().parents[1]
@@ -16,8 +17,12 @@ _REPO_ROOT = Path(__file__).resolve().parents[1]
 def resolve_exercise_tests_dir(exercise_key: str) -> Path:
     """Return the canonical tests directory for an exercise key."""
 
-    entry = get_catalogue_entry(exercise_key)
-    source_dir = _REPO_ROOT / "exercises" / entry.construct / exercise_key / "tests"
+    try:
+        source_dir = resolve_exercise_entry(exercise_key, _REPO_ROOT / "exercises").tests_dir
+    except LookupError:
+        # Unknown keys still fail through the catalogue with its usual error.
+        entry = get_catalogue_entry(exercise_key)
+        source_dir = _REPO_ROOT / "exercises" / entry.construct / exercise_key / "tests"
     if source_dir.is_dir():
         return source_dir
 
@@ -2,16 +2,38 @@ from __future__ import annotations
 
 import builtins
 import contextlib
+import hashlib
 import json
-from collections.abc import Sequence
-from io import StringIO
+import re
+import threading
+from collections.abc import Generator, Mapping, Sequence
+from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import Any, TypedDict, cast
 
-from exercise_runtime_support.execution_variant import Variant
+from exercise_runtime_support.cell_executor import (
+    MISSING_INPUT_ERROR_MESSAGE,
+    OUTPUT_LIMIT_ERROR_TYPE,
+    CellError,
+    CellExecutionResult,
+    CellExecutor,
+    CellJob,
+    DefaultInputs,
+    configured_output_limit,
+    get_default_executor,
+)
+from exercise_runtime_support.code_cache import get_code_cache
+from exercise_runtime_support.execution_metrics import (
+    MetricsRecord,
+    MetricsSink,
+    get_metrics_sink,
+)
+from exercise_runtime_support.execution_variant import Variant, get_active_variant
 from exercise_runtime_support.exercise_framework.paths import (
     resolve_notebook_path as resolve_framework_notebook_path,
 )
+from exercise_runtime_support.notebook_reader import load_notebook
+from exercise_runtime_support.result_cache import get_result_cache
 
 
 class NotebookCell(TypedDict, total=False):
@@ -29,20 +51,293 @@ class NotebookGradingError(RuntimeError):
     pass
 
 
-def _read_notebook(
+class CellTimeoutError(NotebookGradingError):
+    """Raised when a tagged cell exceeds the execution backend's limits."""
+
+
+class OutputLimitExceeded(NotebookGradingError):
+    """Raised when a tagged cell prints more than the output cap allows.
+
+    ``output`` holds what the cell printed up to the cap.
+    """
+
+    def __init__(self, message: str, *, output: str, limit_bytes: int | None) -> None:
+        super().__init__(message)
+        self.output = output
+        self.limit_bytes = limit_bytes
+
+
+_OUTPUT_PREVIEW_CHARS = 500
+EXERCISE_TAG_PATTERN = re.compile(r"exercise\d+")
+DEFAULT_INPUT_VALUE = "2"
+MAX_DEFAULT_INPUTS = 10
+
+
+@dataclass(frozen=True)
+class TaggedCellOutcome:
+    """Result of one tagged cell from a :func:`run_tagged_cells` batch.
+
+    ``error`` is the grading error the cell raised, or ``None`` when it ran
+    cleanly. ``namespace`` maps each public global the cell defined to its type
+    name. ``needs_input`` marks cells that called ``input()``: their output
+    depends on the inputs supplied, so it is not a reusable result.
+    """
+
+    tag: str
+    output: str
+    error: NotebookGradingError | None
+    namespace: dict[str, str]
+    needs_input: bool = False
+
+
+@dataclass(frozen=True)
+class DefaultInputOutput:
+    """Output of a cell run by :func:`run_cell_with_default_inputs`.
+
+    ``inputs_consumed`` is how many placeholder answers the cell asked for.
+    """
+
+    output: str
+    inputs_consumed: int
+
+
+@dataclass(frozen=True)
+class ParsedNotebook:
+    """Pre-indexed view of a notebook on disk.
+
+    ``fingerprint`` is ``(st_mtime_ns, st_size)`` at parse time. ``code_by_tag``
+    holds the source of every tagged code cell in notebook order, and
+    ``cell_by_tag`` holds the raw source of the first cell (of any type) that
+    carries each tag, which is what explanation lookups need. ``code_ids_by_tag``
+    runs parallel to ``code_by_tag`` with each cell's id (``""`` when it has none).
+    """
+
+    path: Path
+    fingerprint: tuple[int, int]
+    has_cells: bool
+    code_by_tag: dict[str, tuple[str, ...]]
+    cell_by_tag: dict[str, object]
+    code_ids_by_tag: dict[str, tuple[str, ...]]
+
+
+class NotebookIndex:
+    """Process-wide cache of parsed notebooks keyed by resolved path.
+
+    Each notebook is parsed once and reused until its ``(st_mtime_ns, st_size)``
+    fingerprint changes on disk, so repeated grader calls against the same
+    notebook cost a ``stat()`` rather than a full JSON parse and cell scan.
+    A notebook pinned with :meth:`pin` is served from memory without touching
+    the disk at all.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[Path, ParsedNotebook] = {}
+        self._pinned: dict[Path, ParsedNotebook] = {}
+        self._lock = threading.Lock()
+        self.parse_count = 0
+
+    def get(self, path: Path) -> ParsedNotebook:
+        """Return the parsed notebook for *path*, re-parsing when it has changed."""
+        pinned = self.pinned(path)
+        if pinned is not None:
+            return pinned
+        resolved = path.resolve()
+        fingerprint = _stat_fingerprint(resolved)
+        with self._lock:
+            cached = self._entries.get(resolved)
+        if cached is not None and cached.fingerprint == fingerprint:
+            return cached
+
+        parsed = _parse_notebook(resolved, fingerprint)
+        with self._lock:
+            self._entries[resolved] = parsed
+            self.parse_count += 1
+        return parsed
+
+    def pinned(self, path: Path) -> ParsedNotebook | None:
+        """Return the pinned notebook for *path*, or ``None`` when it is not pinned."""
+        with self._lock:
+            if not self._pinned:
+                return None
+            pinned = self._pinned.get(path)
+        return pinned if pinned is not None else self._pinned.get(path.resolve())
+
+    def pin(self, path: Path, live_sources: Mapping[str, str]) -> ParsedNotebook:
+        """Serve *path* from memory, replacing code cell sources by cell id.
+
+        The notebook is parsed from disk for its tags and cell order; each code
+        cell whose id appears in *live_sources* takes that source instead. When
+        the last parse already has a live source for every tagged code cell, it
+        is reused as is, even if the file has since been saved, because nothing
+        on disk would be graded. If any source changed, the pinned fingerprint
+        keeps the file's ``st_mtime_ns`` but swaps its size for a negative digest
+        of the live sources, so fingerprint-keyed caches never confuse the two.
+        """
+        resolved = path.resolve()
+        with self._lock:
+            self._pinned.pop(resolved, None)
+            cached = self._entries.get(resolved)
+        if cached is None or not _covers_tagged_cells(cached, live_sources):
+            cached = self.get(resolved)
+        parsed = _with_live_sources(cached, live_sources)
+        with self._lock:
+            self._pinned[resolved] = parsed
+        return parsed
+
+    def unpin(self, path: Path, *, restore: ParsedNotebook | None = None) -> None:
+        """Stop serving *path* from memory, or go back to the *restore* pin."""
+        resolved = path.resolve()
+        with self._lock:
+            if restore is None:
+                self._pinned.pop(resolved, None)
+            else:
+                self._pinned[resolved] = restore
+
+    def invalidate(self, path: Path) -> None:
+        """Drop any cached entry for *path*."""
+        with self._lock:
+            self._entries.pop(path.resolve(), None)
+
+    def clear(self) -> None:
+        """Drop every cached notebook and pin, and reset the parse counter."""
+        with self._lock:
+            self._entries.clear()
+            self._pinned.clear()
+            self.parse_count = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_NOTEBOOK_INDEX = NotebookIndex()
+
+
+def get_notebook_index() -> NotebookIndex:
+    """Return the shared process-wide notebook index."""
+    return _NOTEBOOK_INDEX
+
+
+@contextlib.contextmanager
+def use_live_sources(
     notebook_path: str | Path,
+    live_sources: Mapping[str, str],
     *,
     variant: Variant | None = None,
-) -> dict[str, Any]:
+) -> Generator[ParsedNotebook, None, None]:
+    """Grade *notebook_path* against in-memory cell sources for the duration of the block.
+
+    *live_sources* maps cell ids to source text, for example the code a Jupyter
+    kernel last executed for each cell. Tags still come from the saved notebook;
+    code cells without a live source keep their saved source.
+    """
     path = resolve_framework_notebook_path(notebook_path, variant=variant)
-    if not path.exists():
-        raise NotebookGradingError(f"Notebook not found: {path}")
+    previous = _NOTEBOOK_INDEX.pinned(path)
+    try:
+        yield _NOTEBOOK_INDEX.pin(path, live_sources)
+    finally:
+        _NOTEBOOK_INDEX.unpin(path, restore=previous)
+
+
+def _covers_tagged_cells(parsed: ParsedNotebook, live_sources: Mapping[str, str]) -> bool:
+    return all(
+        cell_id in live_sources
+        for cell_ids in parsed.code_ids_by_tag.values()
+        for cell_id in cell_ids
+    )
+
+
+def _with_live_sources(parsed: ParsedNotebook, live_sources: Mapping[str, str]) -> ParsedNotebook:
+    code_by_tag: dict[str, tuple[str, ...]] = {}
+    digest = hashlib.sha256()
+    changed = False
+    for tag, sources in parsed.code_by_tag.items():
+        cell_ids = parsed.code_ids_by_tag.get(tag, ())
+        merged = tuple(
+            live_sources.get(cell_id, source) if cell_id else source
+            for cell_id, source in zip(cell_ids, sources, strict=True)
+        )
+        changed = changed or merged != sources
+        code_by_tag[tag] = merged
+        for source in merged:
+            digest.update(source.encode("utf-8"))
+            digest.update(b"\0")
+    if not changed:
+        return parsed
+    live_size = -(int(digest.hexdigest()[:15], 16) + 1)
+    return replace(
+        parsed,
+        fingerprint=(parsed.fingerprint[0], live_size),
+        code_by_tag=code_by_tag,
+    )
+
+
+def _stat_fingerprint(path: Path) -> tuple[int, int]:
+    try:
+        stat_result = path.stat()
+    except FileNotFoundError as exc:
+        raise NotebookGradingError(f"Notebook not found: {path}") from exc
+    return stat_result.st_mtime_ns, stat_result.st_size
 
+
+def _parse_notebook(path: Path, fingerprint: tuple[int, int]) -> ParsedNotebook:
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        nb = load_notebook(path)
+    except FileNotFoundError as exc:
+        raise NotebookGradingError(f"Notebook not found: {path}") from exc
     except json.JSONDecodeError as exc:
         raise NotebookGradingError(f"Invalid JSON in notebook: {path}") from exc
 
+    cells = cast(dict[str, Any], nb).get("cells") if isinstance(nb, dict) else None
+    has_cells = isinstance(cells, list)
+    code_by_tag: dict[str, list[str]] = {}
+    code_ids_by_tag: dict[str, list[str]] = {}
+    cell_by_tag: dict[str, object] = {}
+    for cell in cast(Sequence[object], cells) if has_cells else ():
+        if not isinstance(cell, dict):
+            continue
+        cell_dict = cast(dict[str, Any], cell)
+        tags = _cell_tags(cell_dict)
+        for tag in tags:
+            cell_by_tag.setdefault(tag, cell_dict.get("source", []))
+        if cell_dict.get("cell_type") != "code":
+            continue
+        source = _cell_source_text(cell_dict)
+        cell_id = _cell_id(cell_dict)
+        for tag in tags:
+            code_by_tag.setdefault(tag, []).append(source)
+            code_ids_by_tag.setdefault(tag, []).append(cell_id)
+
+    return ParsedNotebook(
+        path=path,
+        fingerprint=fingerprint,
+        has_cells=has_cells,
+        code_by_tag={tag: tuple(sources) for tag, sources in code_by_tag.items()},
+        cell_by_tag=cell_by_tag,
+        code_ids_by_tag={tag: tuple(ids) for tag, ids in code_ids_by_tag.items()},
+    )
+
+
+def _cell_id(cell: dict[str, Any]) -> str:
+    """Return the nbformat cell id, or the editor-written ``metadata.id``, or ``""``."""
+    cell_id = cell.get("id")
+    if isinstance(cell_id, str) and cell_id:
+        return cell_id
+    metadata = cell.get("metadata")
+    if isinstance(metadata, dict):
+        metadata_id = cast(dict[str, Any], metadata).get("id")
+        if isinstance(metadata_id, str):
+            return metadata_id
+    return ""
+
+
+def _load_indexed_notebook(
+    notebook_path: str | Path,
+    *,
+    variant: Variant | None = None,
+) -> ParsedNotebook:
+    path = resolve_framework_notebook_path(notebook_path, variant=variant)
+    return _NOTEBOOK_INDEX.get(path)
+
 
 def _cell_tags(cell: NotebookCell | dict[str, Any]) -> set[str]:
     """Return a set of string tags found in a cell's metadata.
@@ -101,12 +396,15 @@ def extract_tagged_code(
     We keep this pure-stdlib (no nbformat/nbclient dependency) to reduce classroom friction.
     """
 
-    nb = _read_notebook(notebook_path, variant=variant)
-    cells = nb.get("cells")
-    if not isinstance(cells, list):
+    parsed = _load_indexed_notebook(notebook_path, variant=variant)
+    return _joined_tagged_code(parsed, notebook_path, tag=tag)
+
+
+def _joined_tagged_code(parsed: ParsedNotebook, notebook_path: str | Path, *, tag: str) -> str:
+    if not parsed.has_cells:
         raise NotebookGradingError("Notebook has no 'cells' list")
 
-    tagged_sources = _collect_tagged_sources(cast(Sequence[object], cells), tag)
+    tagged_sources = parsed.code_by_tag.get(tag, ())
 
     if not tagged_sources:
         raise NotebookGradingError(
@@ -116,24 +414,6 @@ def extract_tagged_code(
     return "\n\n".join(tagged_sources).strip() + "\n"
 
 
-def _collect_tagged_sources(cells: Sequence[object], tag: str) -> list[str]:
-    """Collect source text from code cells tagged with the given tag."""
-    tagged_sources: list[str] = []
-
-    for cell in cells:
-        if not isinstance(cell, dict):
-            continue
-        cell_dict = cast(dict[str, Any], cell)
-        if cell_dict.get("cell_type") != "code":
-            continue
-        if tag not in _cell_tags(cell_dict):
-            continue
-
-        tagged_sources.append(_cell_source_text(cell_dict))
-
-    return tagged_sources
-
-
 def exec_tagged_code(
     notebook_path: str | Path,
     *,
@@ -154,7 +434,7 @@ def exec_tagged_code(
     }
 
     try:
-        compiled = compile(code, filename, "exec")
+        compiled = get_code_cache().compile(code, filename)
     except SyntaxError as exc:  # Provide clearer error for notebook authors
         raise NotebookGradingError(
             f"Failed to compile code tagged {tag!r} in {filename}: {exc}"
@@ -170,11 +450,236 @@ def exec_tagged_code(
     return ns
 
 
+def _run_tagged_cell(
+    notebook_path: str | Path,
+    *,
+    tag: str,
+    inputs: list[str] | None,
+    variant: Variant | None,
+    executor: CellExecutor | None,
+) -> str:
+    [output] = _run_tagged_cell_cases(
+        notebook_path,
+        tag=tag,
+        cases=[None if inputs is None else tuple(inputs)],
+        variant=variant,
+        executor=executor,
+    )
+    return output
+
+
+def _run_tagged_cell_cases(
+    notebook_path: str | Path,
+    *,
+    tag: str,
+    cases: Sequence[tuple[str, ...] | None],
+    variant: Variant | None,
+    executor: CellExecutor | None,
+) -> list[str]:
+    """Run one tagged cell once per case, extracting and compiling it only once."""
+    results = _execute_tagged_cell_cases(
+        notebook_path,
+        tag=tag,
+        cases=cases,
+        variant=variant,
+        executor=executor,
+    )
+    return [result.stdout.rstrip("\n") for result in results]
+
+
+def _execute_tagged_cell_cases(  # noqa: PLR0913
+    notebook_path: str | Path,
+    *,
+    tag: str,
+    cases: Sequence[tuple[str, ...] | None],
+    variant: Variant | None,
+    executor: CellExecutor | None,
+    default_inputs: DefaultInputs | None = None,
+) -> list[CellExecutionResult]:
+    """Run every case of one tagged cell and raise for the first that failed."""
+    code = extract_tagged_code(notebook_path, tag=tag, variant=variant)
+    filename = str(resolve_framework_notebook_path(notebook_path, variant=variant))
+    try:
+        # Warm the code cache so every case (and every pool worker fed from the
+        # same disk store) reuses one compiled code object.
+        get_code_cache().compile(code, filename)
+    except SyntaxError as exc:
+        raise NotebookGradingError(
+            f"Failed to compile code tagged {tag!r} in {filename}: {exc}"
+        ) from exc
+
+    sink = get_metrics_sink()
+    output_limit = configured_output_limit()
+    jobs = [
+        CellJob(
+            source=code,
+            filename=filename,
+            inputs=inputs,
+            collect_metrics=sink is not None,
+            max_output_bytes=output_limit,
+            default_inputs=default_inputs,
+        )
+        for inputs in cases
+    ]
+    results = _execute_jobs(jobs, executor)
+    if sink is not None:
+        _record_metrics(sink, results, notebook_path=notebook_path, tag=tag, variant=variant)
+    for result in results:
+        _raise_for_cell_error(result, tag=tag, filename=filename, output_limit=output_limit)
+    return results
+
+
+def run_tagged_cells(
+    notebook_path: str | Path,
+    *,
+    tags: Sequence[str] | None = None,
+    variant: Variant | None = None,
+    executor: CellExecutor | None = None,
+) -> dict[str, TaggedCellOutcome]:
+    """Run several tagged cells of one notebook as a single batch.
+
+    The notebook is loaded once and every tag runs in its own fresh namespace,
+    as :func:`run_cell_and_capture_output` would run it, except that ``input()``
+    has no values to return. Student errors are recorded on each outcome rather
+    than raised. When ``tags`` is omitted, every ``exerciseN`` code cell runs, in
+    notebook order.
+    """
+    path = resolve_framework_notebook_path(notebook_path, variant=variant)
+    parsed = _NOTEBOOK_INDEX.get(path)
+    if tags is None:
+        tags = [tag for tag in parsed.code_by_tag if EXERCISE_TAG_PATTERN.fullmatch(tag)]
+    filename = str(path)
+    sink = get_metrics_sink()
+    output_limit = configured_output_limit()
+    jobs = [
+        CellJob(
+            source=_joined_tagged_code(parsed, notebook_path, tag=tag),
+            filename=filename,
+            inputs=(),
+            collect_metrics=sink is not None,
+            max_output_bytes=output_limit,
+            summarise_namespace=True,
+        )
+        for tag in tags
+    ]
+    results = _execute_jobs(jobs, executor)
+
+    outcomes: dict[str, TaggedCellOutcome] = {}
+    for tag, result in zip(tags, results, strict=True):
+        if sink is not None:
+            _record_metrics(sink, [result], notebook_path=notebook_path, tag=tag, variant=variant)
+        error: NotebookGradingError | None = None
+        try:
+            _raise_for_cell_error(result, tag=tag, filename=filename, output_limit=output_limit)
+        except NotebookGradingError as exc:
+            error = exc
+        outcomes[tag] = TaggedCellOutcome(
+            tag=tag,
+            output=result.stdout.rstrip("\n"),
+            error=error,
+            namespace=result.namespace_summary or {},
+            needs_input=(
+                result.error is not None and result.error.message == MISSING_INPUT_ERROR_MESSAGE
+            ),
+        )
+    return outcomes
+
+
+def _execute_jobs(
+    jobs: Sequence[CellJob],
+    executor: CellExecutor | None,
+) -> list[CellExecutionResult]:
+    """Run *jobs* in one batch, serving any the persistent result cache already holds."""
+    runner = executor or get_default_executor()
+    cache = get_result_cache()
+    if cache is None:
+        return runner.map(jobs)
+
+    results = [cache.get(job) for job in jobs]
+    pending = [index for index, result in enumerate(results) if result is None]
+    if pending:
+        fresh = runner.map([jobs[index] for index in pending])
+        for index, result in zip(pending, fresh, strict=True):
+            cache.put(jobs[index], result)
+            results[index] = result
+    return cast(list[CellExecutionResult], results)
+
+
+def _record_metrics(
+    sink: MetricsSink,
+    results: Sequence[CellExecutionResult],
+    *,
+    notebook_path: str | Path,
+    tag: str,
+    variant: Variant | None,
+) -> None:
+    if isinstance(notebook_path, str):
+        exercise_key = notebook_path
+    else:
+        # Canonical layout: exercises/<construct>/<exercise_key>/notebooks/<variant>.ipynb
+        path = Path(notebook_path)
+        exercise_key = path.parent.parent.name if path.parent.name == "notebooks" else path.stem
+    selected_variant = get_active_variant() if variant is None else variant
+    for result in results:
+        if result.metrics is not None:
+            sink.record(
+                MetricsRecord.from_metrics(
+                    result.metrics,
+                    exercise_key=exercise_key,
+                    tag=tag,
+                    variant=selected_variant,
+                )
+            )
+
+
+def _raise_for_cell_error(
+    result: CellExecutionResult,
+    *,
+    tag: str,
+    filename: str,
+    output_limit: int | None,
+) -> None:
+    """Translate a failed :class:`CellExecutionResult` into a grading error."""
+    error = result.error
+    if error is None:
+        return
+    if error.type_name == OUTPUT_LIMIT_ERROR_TYPE:
+        preview = result.stdout[:_OUTPUT_PREVIEW_CHARS]
+        raise OutputLimitExceeded(
+            f"Output limit exceeded for code tagged {tag!r} in {filename}: the cell printed "
+            f"more than {output_limit} bytes and was stopped. Output began:\n{preview}",
+            output=result.stdout,
+            limit_bytes=output_limit,
+        )
+    cause = error.exception or _rebuild_exception(error)
+    if result.timed_out:
+        raise CellTimeoutError(
+            f"Execution timed out for code tagged {tag!r} in {filename}: {error.message}"
+        ) from cause
+    if error.phase == "compile":
+        raise NotebookGradingError(
+            f"Failed to compile code tagged {tag!r} in {filename}: {cause}"
+        ) from cause
+    raise NotebookGradingError(
+        f"Execution failed for code tagged {tag!r} in {filename}: {cause}"
+    ) from cause
+
+
+def _rebuild_exception(error: CellError) -> BaseException:
+    """Recreate a builtin exception from a result that crossed a process boundary."""
+    exception_type = getattr(builtins, error.type_name, None)
+    if isinstance(exception_type, type) and issubclass(exception_type, Exception):
+        with contextlib.suppress(Exception):
+            return exception_type(error.message)
+    return RuntimeError(f"{error.type_name}: {error.message}")
+
+
 def run_cell_and_capture_output(
     notebook_path: str | Path,
     *,
     tag: str,
     variant: Variant | None = None,
+    executor: CellExecutor | None = None,
 ) -> str:
     """Execute a tagged cell and capture its print output.
 
@@ -184,6 +689,7 @@ def run_cell_and_capture_output(
     Args:
         notebook_path: Exercise key or explicit notebook file path
         tag: Cell metadata tag to execute (e.g., "exercise1")
+        executor: Execution backend; defaults to :func:`get_default_executor`
 
     Returns:
         The captured stdout output as a string, with the trailing newline
@@ -196,9 +702,13 @@ def run_cell_and_capture_output(
         ... )
         >>> assert output == "Hello Python!"
     """
-    with contextlib.redirect_stdout(StringIO()) as buffer:
-        exec_tagged_code(notebook_path, tag=tag, variant=variant)
-        return buffer.getvalue().rstrip("\n")
+    return _run_tagged_cell(
+        notebook_path,
+        tag=tag,
+        inputs=None,
+        variant=variant,
+        executor=executor,
+    )
 
 
 def run_cell_with_input(
@@ -207,6 +717,7 @@ def run_cell_with_input(
     tag: str,
     inputs: list[str],
     variant: Variant | None = None,
+    executor: CellExecutor | None = None,
 ) -> str:
     """Execute a tagged cell with mocked input() and capture stdout.
 
@@ -217,6 +728,7 @@ def run_cell_with_input(
         notebook_path: Exercise key or explicit notebook file path
         tag: Cell metadata tag to execute (e.g., "exercise1")
         inputs: List of strings to provide as input() values
+        executor: Execution backend; defaults to :func:`get_default_executor`
 
     Returns:
         The captured stdout output as a string, with the trailing newline
@@ -233,26 +745,100 @@ def run_cell_with_input(
         ... )
         >>> assert "Alice" in output
     """
-    original_input = builtins.input
-    iterator = iter(inputs)
+    return _run_tagged_cell(
+        notebook_path,
+        tag=tag,
+        inputs=inputs,
+        variant=variant,
+        executor=executor,
+    )
 
-    def fake_input(prompt: str = "") -> str:
-        # Write prompt to stdout to match real input() behavior
-        if prompt:
-            print(prompt, end="")
-        try:
-            return next(iterator)
-        except StopIteration as exc:
-            raise RuntimeError("Test expected more input values") from exc
 
-    builtins.input = fake_input
+def run_cell_with_input_cases(
+    notebook_path: str | Path,
+    *,
+    tag: str,
+    cases: Sequence[Sequence[str]],
+    variant: Variant | None = None,
+    executor: CellExecutor | None = None,
+) -> list[str]:
+    """Execute a tagged cell once per input vector and capture each output.
+
+    The notebook is read and the cell compiled once; every case then runs in a
+    fresh namespace. With a pooled executor the cases run in parallel.
 
-    try:
-        with contextlib.redirect_stdout(StringIO()) as buffer:
-            exec_tagged_code(notebook_path, tag=tag, variant=variant)
-            return buffer.getvalue().rstrip("\n")
-    finally:
-        builtins.input = original_input
+    Args:
+        notebook_path: Exercise key or explicit notebook file path
+        tag: Cell metadata tag to execute (e.g., "exercise1")
+        cases: One list of input() values per run
+        executor: Execution backend; defaults to :func:`get_default_executor`
+
+    Returns:
+        The captured stdout of each case, in case order, with the trailing
+        newline stripped as in :func:`run_cell_with_input`.
+
+    Raises:
+        NotebookGradingError: For the first case (in case order) that fails
+
+    Example:
+        >>> outputs = run_cell_with_input_cases(
+        ...     "ex007_sequence_debug_casting",
+        ...     tag="exercise3",
+        ...     cases=[["14"], ["9"]],
+        ... )
+        >>> assert outputs[0].endswith("15")
+    """
+    return _run_tagged_cell_cases(
+        notebook_path,
+        tag=tag,
+        cases=[tuple(inputs) for inputs in cases],
+        variant=variant,
+        executor=executor,
+    )
+
+
+def run_cell_with_default_inputs(  # noqa: PLR0913
+    notebook_path: str | Path,
+    *,
+    tag: str,
+    default_input: str = DEFAULT_INPUT_VALUE,
+    max_inputs: int = MAX_DEFAULT_INPUTS,
+    variant: Variant | None = None,
+    executor: CellExecutor | None = None,
+) -> DefaultInputOutput:
+    """Execute a tagged cell once, answering every ``input()`` with a placeholder.
+
+    Used to check that a cell runs when the number of prompts is unknown: each
+    ``input()`` call returns *default_input*, up to *max_inputs* calls, so the
+    cell executes exactly once however many prompts it makes.
+
+    Args:
+        notebook_path: Exercise key or explicit notebook file path
+        tag: Cell metadata tag to execute (e.g., "exercise1")
+        default_input: Value returned by every ``input()`` call
+        max_inputs: Most ``input()`` calls answered before the cell fails
+        executor: Execution backend; defaults to :func:`get_default_executor`
+
+    Returns:
+        The captured stdout, with the trailing newline stripped, and the
+        number of inputs the cell consumed.
+
+    Raises:
+        NotebookGradingError: If the cell fails, including when it calls
+            ``input()`` more than *max_inputs* times
+    """
+    [result] = _execute_tagged_cell_cases(
+        notebook_path,
+        tag=tag,
+        cases=[()],
+        variant=variant,
+        executor=executor,
+        default_inputs=DefaultInputs(default_input, max_inputs),
+    )
+    return DefaultInputOutput(
+        output=result.stdout.rstrip("\n"),
+        inputs_consumed=result.inputs_consumed,
+    )
 
 
 def get_explanation_cell(
@@ -283,16 +869,9 @@ def get_explanation_cell(
         ... )
         >>> assert len(explanation.strip()) > 10, "Explanation must have content"
     """
-    nb = _read_notebook(notebook_path, variant=variant)
-    cells = cast(Sequence[object], nb.get("cells", []))
-
-    for cell in cells:
-        if not isinstance(cell, dict):
-            continue
-        cell_dict = cast(dict[str, Any], cell)
-        if tag not in _cell_tags(cell_dict):
-            continue
-        return _format_cell_source(cell_dict.get("source", []))
+    parsed = _load_indexed_notebook(notebook_path, variant=variant)
+    if tag in parsed.cell_by_tag:
+        return _format_cell_source(parsed.cell_by_tag[tag])
 
     raise AssertionError(f"No cell with tag {tag!r} found in {notebook_path}")
 
@@ -0,0 +1,225 @@
+"""Incremental notebook reader that skips cell outputs.
+
+Notebooks that students have run many times carry large ``outputs`` arrays
+(thousands of printed lines, base64 images) and ``attachments``, none of which
+grading needs. :func:`load_notebook` memory-maps the file, walks the notebook
+and cell structure with a byte scanner to find the skipped cell members, and
+hands only the remaining bytes to :func:`json.loads`. Skipped values are never
+copied or decoded, so memory and parse time scale with the code in the notebook
+rather than with its outputs. Files smaller than ``scan_threshold`` bytes are
+cheap to parse outright and go straight to :func:`json.loads`.
+
+The reader is a drop-in replacement for ``json.loads(path.read_text(...))``: it
+raises ``FileNotFoundError`` and ``json.JSONDecodeError`` in the same cases, and
+falls back to the standard parser whenever the document is not a well-formed
+notebook object so error messages stay exactly as before.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import re
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any, cast
+
+SKIPPED_CELL_KEYS: frozenset[str] = frozenset({"outputs", "attachments"})
+DEFAULT_SCAN_THRESHOLD_BYTES = 256 * 1024
+
+__all__ = ["DEFAULT_SCAN_THRESHOLD_BYTES", "SKIPPED_CELL_KEYS", "load_notebook"]
+
+# Possessive quantifiers keep the scanner linear and free of backtracking state
+# on multi-megabyte output strings.
+_WHITESPACE = re.compile(rb"[ \t\n\r]*+")
+_STRING = re.compile(rb'"[^"\\]*+(?:\\.[^"\\]*+)*+"', re.DOTALL)
+_SCALAR = re.compile(rb"[^,:\[\]{}\s]++")
+# Everything up to the next bracket outside a string: plain bytes and whole strings.
+_BETWEEN_BRACKETS = re.compile(rb'(?:[^"\[\]{}]++|"[^"\\]*+(?:\\.[^"\\]*+)*+")*+', re.DOTALL)
+
+_OPEN_OBJECT = ord("{")
+_CLOSE_OBJECT = ord("}")
+_OPEN_ARRAY = ord("[")
+_CLOSE_ARRAY = ord("]")
+_QUOTE = ord('"')
+_COMMA = ord(",")
+_COLON = ord(":")
+_BACKSLASH = ord("\\")
+
+_Buffer = bytes | mmap.mmap
+
+
+class _ScanError(Exception):
+    """Raised when the scanner meets JSON it does not handle."""
+
+
+def load_notebook(
+    path: Path,
+    *,
+    skip_cell_keys: Iterable[str] = SKIPPED_CELL_KEYS,
+    scan_threshold: int = DEFAULT_SCAN_THRESHOLD_BYTES,
+) -> object:
+    """Return the notebook JSON at *path* without the cell members in *skip_cell_keys*.
+
+    Files of at least *scan_threshold* bytes are scanned so skipped members are
+    never decoded; smaller files are parsed in full and the members dropped.
+
+    Raises:
+        FileNotFoundError: When *path* does not exist.
+        json.JSONDecodeError: When the file is not valid JSON.
+    """
+    skipped = frozenset(skip_cell_keys)
+    with path.open("rb") as handle:
+        if os.fstat(handle.fileno()).st_size < scan_threshold:
+            document: object = json.loads(handle.read().decode("utf-8"))
+            _strip_cell_keys(document, skipped)
+            return document
+        try:
+            buffer: _Buffer = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            # Empty files cannot be mapped, and some filesystems do not support it.
+            buffer = handle.read()
+        try:
+            kept = _SkippedMemberScanner(buffer, skipped).kept_bytes()
+            document = json.loads(kept)
+        except (_ScanError, json.JSONDecodeError, UnicodeDecodeError):
+            # Let the standard parser report the error exactly as before (or
+            # parse valid JSON that is not shaped like a notebook).
+            document = json.loads(path.read_text(encoding="utf-8"))
+        finally:
+            if isinstance(buffer, mmap.mmap):
+                buffer.close()
+
+    _strip_cell_keys(document, skipped)
+    return document
+
+
+def _strip_cell_keys(document: object, skipped: frozenset[str]) -> None:
+    if not isinstance(document, dict):
+        return
+    cells = cast(dict[str, Any], document).get("cells")
+    for cell in cast(list[object], cells) if isinstance(cells, list) else ():
+        if isinstance(cell, dict):
+            for key in skipped:
+                cast(dict[str, Any], cell).pop(key, None)
+
+
+class _SkippedMemberScanner:
+    """Find skipped cell members and return the document with their values nulled."""
+
+    def __init__(self, buffer: _Buffer, skipped: frozenset[str]) -> None:
+        self._buffer = buffer
+        self._skipped = frozenset(key.encode("utf-8") for key in skipped)
+        self._cuts: list[tuple[int, int]] = []
+
+    def kept_bytes(self) -> bytes:
+        start = self._skip_whitespace(0)
+        if self._byte_at(start) != _OPEN_OBJECT:
+            raise _ScanError(start)
+        end = self._object(start, self._top_level_member)
+        if self._skip_whitespace(end) != len(self._buffer):
+            raise _ScanError(end)
+
+        pieces: list[bytes] = []
+        pos = 0
+        for cut_start, cut_end in self._cuts:
+            pieces.append(self._buffer[pos:cut_start])
+            pieces.append(b"null")
+            pos = cut_end
+        pieces.append(self._buffer[pos:])
+        return b"".join(pieces)
+
+    def _top_level_member(self, key: bytes, pos: int) -> int:
+        if key == b"cells" and self._byte_at(pos) == _OPEN_ARRAY:
+            return self._array(pos, self._cell)
+        return self._value_end(pos)
+
+    def _cell(self, pos: int) -> int:
+        if self._byte_at(pos) == _OPEN_OBJECT:
+            return self._object(pos, self._cell_member)
+        return self._value_end(pos)
+
+    def _cell_member(self, key: bytes, pos: int) -> int:
+        end = self._value_end(pos)
+        if key in self._skipped:
+            self._cuts.append((pos, end))
+        return end
+
+    def _object(self, pos: int, member: Callable[[bytes, int], int]) -> int:
+        pos = self._skip_whitespace(pos + 1)
+        if self._byte_at(pos) == _CLOSE_OBJECT:
+            return pos + 1
+        while True:
+            key, pos = self._key(pos)
+            pos = self._skip_whitespace(member(key, pos))
+            byte = self._byte_at(pos)
+            if byte == _CLOSE_OBJECT:
+                return pos + 1
+            if byte != _COMMA:
+                raise _ScanError(pos)
+            pos = self._skip_whitespace(pos + 1)
+
+    def _array(self, pos: int, item: Callable[[int], int]) -> int:
+        pos = self._skip_whitespace(pos + 1)
+        if self._byte_at(pos) == _CLOSE_ARRAY:
+            return pos + 1
+        while True:
+            pos = self._skip_whitespace(item(pos))
+            byte = self._byte_at(pos)
+            if byte == _CLOSE_ARRAY:
+                return pos + 1
+            if byte != _COMMA:
+                raise _ScanError(pos)
+            pos = self._skip_whitespace(pos + 1)
+
+    def _key(self, pos: int) -> tuple[bytes, int]:
+        if self._byte_at(pos) != _QUOTE:
+            raise _ScanError(pos)
+        end = self._value_end(pos)
+        key = self._buffer[pos + 1 : end - 1]
+        if _BACKSLASH in key:
+            key = cast(str, json.loads(self._buffer[pos:end])).encode("utf-8")
+        pos = self._skip_whitespace(end)
+        if self._byte_at(pos) != _COLON:
+            raise _ScanError(pos)
+        return key, self._skip_whitespace(pos + 1)
+
+    def _value_end(self, pos: int) -> int:
+        """Return the offset just past the JSON value starting at *pos*."""
+        byte = self._byte_at(pos)
+        if byte == _QUOTE:
+            match = _STRING.match(self._buffer, pos)
+        elif byte in {_OPEN_OBJECT, _OPEN_ARRAY}:
+            return self._container_end(pos)
+        else:
+            match = _SCALAR.match(self._buffer, pos)
+        if match is None:
+            raise _ScanError(pos)
+        return match.end()
+
+    def _container_end(self, pos: int) -> int:
+        # Python only visits brackets outside strings; the runs in between,
+        # including whole strings, are matched in C and never copied.
+        depth = 0
+        while True:
+            byte = self._byte_at(pos)
+            if byte in {_OPEN_OBJECT, _OPEN_ARRAY}:
+                depth += 1
+            elif byte in {_CLOSE_OBJECT, _CLOSE_ARRAY}:
+                depth -= 1
+                if depth == 0:
+                    return pos + 1
+            else:
+                raise _ScanError(pos)  # an unterminated string
+            match = _BETWEEN_BRACKETS.match(self._buffer, pos + 1)
+            pos = pos + 1 if match is None else match.end()
+
+    def _skip_whitespace(self, pos: int) -> int:
+        match = _WHITESPACE.match(self._buffer, pos)
+        return pos if match is None else match.end()
+
+    def _byte_at(self, pos: int) -> int:
+        if pos >= len(self._buffer):
+            raise _ScanError(pos)
+        return self._buffer[pos]
@@ -0,0 +1,291 @@
+"""Persistent content-addressed cache of cell execution results.
+
+Autograding reruns execute every tagged cell of every notebook even when a push
+changed a single cell. When ``PYTUTOR_RESULT_CACHE_DIR`` points at a writable
+directory, :mod:`exercise_runtime_support.notebook_grader` looks each execution
+up here first and only runs the cells it has not seen. Entries are keyed by
+``(sha256(source), filename, inputs, default inputs, output cap, Python version,
+runtime-support version)``, so an edited cell, a different input vector, a new
+interpreter or a change to the execution runtime all miss.
+
+Only clean results are stored. Failing cells fail quickly and keep their
+original exception objects, and timeouts depend on the machine, so both always
+re-execute. Executions that read ``sys.stdin`` or collect metrics are never
+cached, and neither are cells whose output can depend on more than their source
+and inputs: cells that mention ``open``, ``eval``, ``exec`` or another name in
+``_ENVIRONMENT_NAMES``, or that import ``sys``, file-system, randomness or clock
+modules (see ``_ENVIRONMENT_MODULES``). A data file the student edits between
+pushes therefore always takes effect. The check is a best-effort syntactic scan
+that errs towards re-running: it cannot follow every indirection, so a cell that
+reaches the environment some other way may still be stored.
+
+The directory holds one small JSON file per result and is safe to persist
+between CI runs, for example with ``actions/cache``. As with the code cache's
+disk store, it is counted once per process and only rescanned for eviction when
+the tracked count crosses ``max_entries``.
+"""
+
+from __future__ import annotations
+
+import ast
+import contextlib
+import functools
+import hashlib
+import json
+import os
+import platform
+import sys
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, cast
+
+from exercise_runtime_support.cell_executor import CellExecutionResult, CellJob
+
+RESULT_CACHE_DIR_ENV_VAR = "PYTUTOR_RESULT_CACHE_DIR"
+DEFAULT_MAX_ENTRIES = 8192
+
+_CACHE_SUFFIX = ".result.json"
+# Eviction trims the store to this fraction of its limit.
+_TRIM_DIVISOR = 8
+# Names and top-level modules that let a cell read state outside its source and
+# inputs, such as data files, stdin, random numbers or the clock. Dynamic
+# evaluation and the builtins namespace are included because they can reach any
+# of those without naming them.
+_ENVIRONMENT_NAMES = frozenset(
+    {
+        "__builtins__",
+        "__import__",
+        "compile",
+        "eval",
+        "exec",
+        "globals",
+        "open",
+    }
+)
+_ENVIRONMENT_MODULES = frozenset(
+    {
+        "builtins",
+        "datetime",
+        "fileinput",
+        "glob",
+        "importlib",
+        "io",
+        "os",
+        "pathlib",
+        "random",
+        "secrets",
+        "shutil",
+        "sys",
+        "time",
+        "uuid",
+    }
+)
+
+__all__ = [
+    "RESULT_CACHE_DIR_ENV_VAR",
+    "ResultCache",
+    "ResultCacheStats",
+    "get_result_cache",
+    "reset_result_cache",
+    "runtime_support_version",
+]
+
+
+@dataclass
+class ResultCacheStats:
+    """Counters describing how a :class:`ResultCache` has been used."""
+
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+
+
+@functools.cache
+def runtime_support_version() -> str:
+    """Return a digest of every ``exercise_runtime_support`` source file.
+
+    Execution runs through several modules (the executor, the notebook index,
+    the code cache), so the whole package is versioned rather than a list that
+    could fall behind; editing any of it invalidates every stored result.
+    """
+    digest = hashlib.sha256()
+    package_dir = Path(__file__).resolve().parent
+    for path in sorted(package_dir.rglob("*.py")):
+        digest.update(path.relative_to(package_dir).as_posix().encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def _python_version() -> str:
+    return f"{sys.implementation.name}-{platform.python_version()}"
+
+
+@functools.lru_cache(maxsize=1024)
+def _depends_on_environment(source: str) -> bool:
+    """Return whether *source* may read files, stdin, random numbers or the clock."""
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return False
+    return any(_reads_environment(node) for node in ast.walk(tree))
+
+
+def _reads_environment(node: ast.AST) -> bool:
+    if isinstance(node, ast.Name):
+        # Any mention counts, so ``run = eval`` is caught as well as ``eval(...)``.
+        return node.id in _ENVIRONMENT_NAMES
+    if isinstance(node, ast.Import):
+        modules = [alias.name for alias in node.names]
+    elif isinstance(node, ast.ImportFrom) and node.module is not None:
+        modules = [node.module]
+    else:
+        return False
+    return any(module.partition(".")[0] in _ENVIRONMENT_MODULES for module in modules)
+
+
+class ResultCache:
+    """On-disk store of clean :class:`CellExecutionResult` values."""
+
+    def __init__(self, cache_dir: Path, *, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.stats = ResultCacheStats()
+        self._entries: int | None = None
+        self._lock = threading.Lock()
+
+    def key_for(self, job: CellJob) -> str | None:
+        """Return the cache key for *job*, or ``None`` when it must always run."""
+        if job.collect_metrics or _depends_on_environment(job.source):
+            return None
+        defaults = job.default_inputs
+        fields = [
+            hashlib.sha256(job.source.encode("utf-8")).hexdigest(),
+            job.filename,
+            None if job.inputs is None else list(job.inputs),
+            None if defaults is None else [defaults.value, defaults.limit],
+            job.max_output_bytes,
+            job.summarise_namespace,
+            _python_version(),
+            runtime_support_version(),
+        ]
+        encoded = json.dumps(fields, ensure_ascii=False, separators=(",", ":"))
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def get(self, job: CellJob) -> CellExecutionResult | None:
+        """Return the stored result for *job*, or ``None`` on a miss."""
+        key = self.key_for(job)
+        if key is None:
+            return None
+        result = self._load(self._path(key))
+        with self._lock:
+            if result is None:
+                self.stats.misses += 1
+            else:
+                self.stats.hits += 1
+        return result
+
+    def put(self, job: CellJob, result: CellExecutionResult) -> None:
+        """Store *result* for *job* when it is a clean, cacheable execution."""
+        key = self.key_for(job)
+        if key is None or not result.ok or result.used_stdin:
+            return
+        payload = {
+            "stdout": result.stdout,
+            "namespace_summary": result.namespace_summary,
+            "inputs_consumed": result.inputs_consumed,
+        }
+        path = self._path(key)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            added = not path.exists()
+            tmp_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError:
+            # A read-only or full cache directory must never break grading.
+            tmp_path.unlink(missing_ok=True)
+            return
+        with self._lock:
+            self.stats.stores += 1
+            if self._entries is not None:
+                self._entries += int(added)
+                if self._entries <= self.max_entries:
+                    return
+        self._evict()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{_CACHE_SUFFIX}"
+
+    def _load(self, path: Path) -> CellExecutionResult | None:
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(payload, dict):
+            return None
+        data = cast(dict[str, Any], payload)
+        stdout = data.get("stdout")
+        summary = data.get("namespace_summary")
+        inputs_consumed = data.get("inputs_consumed", 0)
+        if not isinstance(stdout, str) or not (summary is None or isinstance(summary, dict)):
+            return None
+        if not isinstance(inputs_consumed, int):
+            return None
+        # Touch the entry so eviction stays least-recently-used.
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        return CellExecutionResult(
+            stdout=stdout,
+            namespace_summary=cast(dict[str, str] | None, summary),
+            inputs_consumed=inputs_consumed,
+        )
+
+    def _evict(self) -> None:
+        try:
+            entries = [
+                (entry.stat().st_mtime_ns, entry)
+                for entry in self.cache_dir.iterdir()
+                if entry.name.endswith(_CACHE_SUFFIX)
+            ]
+        except OSError:
+            return
+        kept = len(entries)
+        if kept > self.max_entries:
+            kept = self.max_entries - self.max_entries // _TRIM_DIVISOR
+            entries.sort(key=lambda item: item[0])
+            for _, entry in entries[: len(entries) - kept]:
+                entry.unlink(missing_ok=True)
+        with self._lock:
+            self._entries = kept
+
+
+_result_caches: dict[str, ResultCache] = {}
+_result_cache_override: ResultCache | None = None
+_result_cache_lock = threading.Lock()
+
+
+def get_result_cache() -> ResultCache | None:
+    """Return the active result cache, or ``None`` when caching is disabled.
+
+    A cache installed with :func:`reset_result_cache` wins; otherwise
+    ``PYTUTOR_RESULT_CACHE_DIR`` selects the directory.
+    """
+    with _result_cache_lock:
+        if _result_cache_override is not None:
+            return _result_cache_override
+        raw_dir = os.environ.get(RESULT_CACHE_DIR_ENV_VAR, "").strip()
+        if raw_dir == "":
+            return None
+        cache = _result_caches.get(raw_dir)
+        if cache is None:
+            cache = _result_caches[raw_dir] = ResultCache(Path(raw_dir).expanduser())
+        return cache
+
+
+def reset_result_cache(cache: ResultCache | None = None) -> None:
+    """Install *cache* as the active result cache, or return to the environment setting."""
+    global _result_cache_override
+    with _result_cache_lock:
+        _result_cache_override = cache
+        _result_caches.clear()
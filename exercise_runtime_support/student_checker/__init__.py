@@ -1,11 +1,29 @@
-"""Student-facing exercise checker API."""
+"""Student-facing exercise checker API.
 
-from .api import (
-    check_exercise,
-    check_exercises,
-)
-from .models import DetailedCheckResult, ExerciseCheckResult
-from .notebook_runtime import run_notebook_checks
+Submodules load on first attribute access (PEP 562), so the notebook
+self-check cell only imports what its entry point needs:
+``run_notebook_checks`` never loads the catalogue-backed ``api`` module, and
+``check_exercise`` never loads the notebook runtime.
+"""
+
+# pyright: reportImportCycles=false
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .api import check_exercise, check_exercises
+    from .models import DetailedCheckResult, ExerciseCheckResult
+    from .notebook_runtime import run_notebook_checks
+
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "DetailedCheckResult": ".models",
+    "ExerciseCheckResult": ".models",
+    "check_exercise": ".api",
+    "check_exercises": ".api",
+    "run_notebook_checks": ".notebook_runtime",
+}
 
 __all__ = [
     "DetailedCheckResult",
@@ -14,3 +32,16 @@ __all__ = [
     "check_exercises",
     "run_notebook_checks",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
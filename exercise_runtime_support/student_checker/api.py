@@ -5,6 +5,7 @@ from __future__ import annotations
 from functools import partial
 
 from exercise_runtime_support.exercise_catalogue import (
+    ExerciseCatalogueEntry,
     get_exercise_catalogue,
 )
 
@@ -15,6 +16,8 @@ from .checks import (
 )
 from .models import NotebookCheckSpec
 from .reporting import (
+    print_check_progress,
+    print_exercise_check_progress,
     print_exercise_results,
     print_results,
     run_check,
@@ -24,38 +27,37 @@ from .reporting import (
 
 def check_exercises() -> None:
     """Run summary checks for all supported live exercises and print a table."""
-    checks = _get_checks()
-    ordered_checks = [
-        checks[entry.exercise_key]
-        for entry in get_exercise_catalogue()
-        if entry.exercise_key in checks
-    ]
-    results = run_checks(ordered_checks)
+    results = run_checks(list(_get_checks().values()), on_result=print_check_progress)
     print_results(results)
 
 
 def check_exercise(exercise_key: str) -> None:
     """Run checks for a single exercise key and print a summary table."""
-    checks = _get_checks()
-    check = checks.get(exercise_key)
-    if check is None:
-        available = ", ".join(sorted(checks))
+    entry = get_exercise_catalogue().get(exercise_key)
+    if entry is None or not has_exercise_checks(exercise_key):
+        available = ", ".join(sorted(_get_checks()))
         raise ValueError(f"Unknown exercise key '{exercise_key}'. Available: {available}")
-    run_check(check)
+    run_check(_check_spec_for(entry))
+
+
+def _check_spec_for(entry: ExerciseCatalogueEntry) -> NotebookCheckSpec:
+    return NotebookCheckSpec(
+        entry.display_label,
+        partial(check_exercise_summary, entry.exercise_key),
+        partial(_print_notebook_results, entry.exercise_key),
+    )
 
 
 def _get_checks() -> dict[str, NotebookCheckSpec]:
-    checks: dict[str, NotebookCheckSpec] = {}
-    for entry in get_exercise_catalogue():
-        if not has_exercise_checks(entry.exercise_key):
-            continue
-        checks[entry.exercise_key] = NotebookCheckSpec(
-            entry.display_label,
-            partial(check_exercise_summary, entry.exercise_key),
-            partial(_print_notebook_results, entry.exercise_key),
-        )
-    return checks
+    """Return checks for every exercise that has them, in catalogue order."""
+    return {
+        entry.exercise_key: _check_spec_for(entry)
+        for entry in get_exercise_catalogue()
+        if has_exercise_checks(entry.exercise_key)
+    }
 
 
 def _print_notebook_results(exercise_key: str) -> None:
-    print_exercise_results(run_exercise_checks(exercise_key))
+    print_exercise_results(
+        run_exercise_checks(exercise_key, on_result=print_exercise_check_progress)
+    )
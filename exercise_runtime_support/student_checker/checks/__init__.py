@@ -2,23 +2,27 @@
 
 from __future__ import annotations
 
-import os
-from collections.abc import Iterator, Sequence
+from collections.abc import Callable, Iterator, Sequence
 from contextlib import contextmanager
-from typing import Any
+from dataclasses import asdict
+from functools import partial
+from typing import Any, cast
 
 from exercise_runtime_support.execution_variant import (
-    ACTIVE_VARIANT_ENV_VAR,
     Variant,
     get_active_variant,
+    pin_variant,
 )
+from exercise_runtime_support.exercise_framework.paths import resolve_notebook_path
 from exercise_runtime_support.exercise_test_support import (
     load_exercise_test_module,
     resolve_exercise_tests_dir,
 )
 from exercise_runtime_support.notebook_grader import NotebookGradingError
 
+from ..concurrency import is_timeout_issue, iter_completed, timeout_message
 from ..models import ExerciseCheckResult
+from ..state import SelfCheckState, fingerprint
 from .base import ExerciseCheckDefinition
 
 _CHECK_CACHE: dict[str, list[Any]] = {}
@@ -26,6 +30,7 @@ _CHECK_CACHE: dict[str, list[Any]] = {}
 __all__ = [
     "ExerciseCheckDefinition",
     "check_exercise_summary",
+    "exercise_check_variant_context",
     "has_exercise_checks",
     "run_exercise_checks",
 ]
@@ -63,15 +68,130 @@ def _build_result(check: Any, issues: list[str]) -> ExerciseCheckResult:
     )
 
 
-def _run_checks(checks: list[Any]) -> list[ExerciseCheckResult]:
-    results: list[ExerciseCheckResult] = []
+def _run_check(check: Any) -> ExerciseCheckResult:
+    try:
+        issues = check.check()
+    except NotebookGradingError as exc:
+        issues = [str(exc)]
+    return _build_result(check, issues)
+
+
+def _run_checks(
+    checks: list[Any],
+    on_result: Callable[[ExerciseCheckResult], None] | None = None,
+) -> list[ExerciseCheckResult]:
+    """Run checks concurrently, streaming results, and return them by ``exercise_no``."""
+    results: dict[int, ExerciseCheckResult] = {}
+    completed = iter_completed(
+        [partial(_run_check, check) for check in checks],
+        on_timeout=lambda index, timeout: _build_result(
+            checks[index], [f"Exercise {checks[index].exercise_no}: {timeout_message(timeout)}"]
+        ),
+    )
+    for index, result in completed:
+        results[index] = result
+        if on_result is not None:
+            on_result(result)
+    order = sorted(results, key=lambda index: (results[index].exercise_no, index))
+    return [results[index] for index in order]
+
+
+def _check_name(check: Any) -> str:
+    func = check.check
+    while isinstance(func, partial):
+        func = cast(partial[Any], func).func
+    return f"{getattr(func, '__module__', '')}.{getattr(func, '__qualname__', repr(func))}"
+
+
+def _checks_fingerprint(exercise_key: str, checks: list[Any]) -> str:
+    tests_dir = resolve_exercise_tests_dir(exercise_key)
+    support_sources = [
+        (path.name, path.read_text(encoding="utf-8")) for path in sorted(tests_dir.glob("*.py"))
+    ]
+    names = [(check.exercise_no, check.title, _check_name(check)) for check in checks]
+    return fingerprint(names, support_sources)
+
+
+def _load_state(exercise_key: str, checks: list[Any]) -> SelfCheckState | None:
+    try:
+        return SelfCheckState.load(
+            resolve_notebook_path(exercise_key),
+            exercise_key=exercise_key,
+            checks_fingerprint=_checks_fingerprint(exercise_key, checks),
+        )
+    except (LookupError, OSError, NotebookGradingError):
+        # Let the checks themselves report a missing or unreadable notebook.
+        return None
+
+
+def _cached_results(rows: list[dict[str, Any]]) -> list[ExerciseCheckResult] | None:
+    try:
+        return [ExerciseCheckResult(**row) for row in rows]
+    except TypeError:
+        return None
+
+
+def _reuse_cached_parts(
+    state: SelfCheckState,
+    checks_by_part: dict[int, list[Any]],
+    source_hashes: dict[int, str],
+) -> tuple[list[ExerciseCheckResult], list[Any]]:
+    """Split checks into stored results that still apply and checks that must run."""
+    reused: list[ExerciseCheckResult] = []
+    stale: list[Any] = []
+    for exercise_no, part_checks in checks_by_part.items():
+        rows = state.cached(str(exercise_no), source_hashes[exercise_no])
+        cached = None if rows is None else _cached_results(rows)
+        if rows is None or cached is None or len(cached) != len(part_checks):
+            stale.extend(part_checks)
+            continue
+        state.record(str(exercise_no), source_hashes[exercise_no], rows)
+        reused.extend(cached)
+    return reused, stale
+
+
+def _record_fresh_parts(
+    state: SelfCheckState,
+    results: list[ExerciseCheckResult],
+    source_hashes: dict[int, str],
+) -> None:
+    results_by_part: dict[int, list[ExerciseCheckResult]] = {}
+    for result in results:
+        results_by_part.setdefault(result.exercise_no, []).append(result)
+    for exercise_no, part_results in results_by_part.items():
+        # Timeouts depend on the machine, so those parts always run again.
+        if any(is_timeout_issue(issue) for result in part_results for issue in result.issues):
+            continue
+        rows = [asdict(result) for result in part_results]
+        state.record(str(exercise_no), source_hashes[exercise_no], rows)
+
+
+def _run_checks_incrementally(
+    exercise_key: str,
+    checks: list[Any],
+    on_result: Callable[[ExerciseCheckResult], None] | None,
+) -> list[ExerciseCheckResult]:
+    """Reuse stored results for exercises whose cells are unchanged and run the rest."""
+    state = _load_state(exercise_key, checks)
+    if state is None:
+        return _run_checks(checks, on_result)
+
+    checks_by_part: dict[int, list[Any]] = {}
     for check in checks:
-        try:
-            issues = check.check()
-        except NotebookGradingError as exc:
-            issues = [str(exc)]
-        results.append(_build_result(check, issues))
-    return results
+        checks_by_part.setdefault(check.exercise_no, []).append(check)
+    source_hashes = {
+        exercise_no: state.source_hash((f"exercise{exercise_no}", f"explanation{exercise_no}"))
+        for exercise_no in checks_by_part
+    }
+
+    reused, stale = _reuse_cached_parts(state, checks_by_part, source_hashes)
+    if on_result is not None:
+        for result in reused:
+            on_result(result)
+    fresh = _run_checks(stale, on_result)
+    _record_fresh_parts(state, fresh, source_hashes)
+    state.save()
+    return sorted([*reused, *fresh], key=lambda result: result.exercise_no)
 
 
 def _summary(results: Sequence[ExerciseCheckResult]) -> list[str]:
@@ -79,20 +199,17 @@ def _summary(results: Sequence[ExerciseCheckResult]) -> list[str]:
 
 
 @contextmanager
-def _exercise_check_variant_context(
+def exercise_check_variant_context(
     *,
     default_variant: Variant = "student",
 ) -> Iterator[None]:
-    selected_variant = get_active_variant(default=default_variant)
-    original_variant = os.environ.get(ACTIVE_VARIANT_ENV_VAR)
-    os.environ[ACTIVE_VARIANT_ENV_VAR] = selected_variant
-    try:
+    """Pin the active variant for a check run so concurrent checks all see it.
+
+    The variant is resolved once and pinned in a context variable that every
+    check task inherits, so checks still running after the block exits keep it.
+    """
+    with pin_variant(get_active_variant(default=default_variant)):
         yield
-    finally:
-        if original_variant is None:
-            os.environ.pop(ACTIVE_VARIANT_ENV_VAR, None)
-        else:
-            os.environ[ACTIVE_VARIANT_ENV_VAR] = original_variant
 
 
 def check_exercise_summary(exercise_key: str) -> list[str]:
@@ -101,8 +218,23 @@ def check_exercise_summary(exercise_key: str) -> list[str]:
     return _summary(run_exercise_checks(exercise_key))
 
 
-def run_exercise_checks(exercise_key: str) -> list[ExerciseCheckResult]:
-    """Run detailed student-checker checks for a single exercise key."""
-
-    with _exercise_check_variant_context():
-        return _run_checks(_get_check_list(exercise_key))
+def run_exercise_checks(
+    exercise_key: str,
+    *,
+    on_result: Callable[[ExerciseCheckResult], None] | None = None,
+    incremental: bool = False,
+) -> list[ExerciseCheckResult]:
+    """Run detailed student-checker checks for a single exercise key.
+
+    Checks run concurrently; ``on_result`` is called with each result as it
+    completes, and the returned list is ordered by ``exercise_no``. With
+    ``incremental=True``, exercises whose cells are unchanged since the last
+    incremental run reuse the results stored next to the notebook (see
+    :mod:`exercise_runtime_support.student_checker.state`).
+    """
+
+    with exercise_check_variant_context():
+        checks = _get_check_list(exercise_key)
+        if incremental:
+            return _run_checks_incrementally(exercise_key, checks, on_result)
+        return _run_checks(checks, on_result)
@@ -0,0 +1,198 @@
+"""Run independent student checks concurrently with a per-check time limit.
+
+Checks execute notebook cells through :mod:`exercise_runtime_support.cell_executor`,
+which gives every execution its own ``print``/``input``, so several checks can
+share the checker process safely. :func:`iter_completed` runs them on a small
+thread pool and yields each outcome as soon as it is available, letting callers
+stream feedback while still assembling an ordered report.
+
+``PYTUTOR_CHECK_WORKERS`` sets the pool size (``1`` runs checks serially) and
+``PYTUTOR_CHECK_TIMEOUT`` the per-check wall-clock limit in seconds (``0``
+disables it). A timed-out check is reported through the caller's ``on_timeout``
+factory and its thread is abandoned. Python threads cannot be interrupted, so
+that is only safe when the cells behind a check run in a process that can be
+killed: both settings apply only with the ``pool`` execution backend. With the
+in-process and thread backends checks run serially in the caller's thread
+without a limit, where a kernel interrupt can still stop a runaway cell.
+
+Each task runs in a copy of the caller's context, so a variant pinned with
+:func:`~exercise_runtime_support.execution_variant.pin_variant` reaches it. A
+task that calls :func:`iter_completed` again runs the inner tasks serially
+instead of starting a nested pool.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import os
+import time
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import TypeVar
+
+from exercise_runtime_support.cell_executor import PooledExecutor, get_default_executor
+
+CHECK_WORKERS_ENV_VAR = "PYTUTOR_CHECK_WORKERS"
+CHECK_TIMEOUT_ENV_VAR = "PYTUTOR_CHECK_TIMEOUT"
+DEFAULT_CHECK_WORKERS = 4
+DEFAULT_CHECK_TIMEOUT_SECONDS = 30.0
+
+_T = TypeVar("_T")
+
+_inside_check: contextvars.ContextVar[bool] = contextvars.ContextVar("inside_check", default=False)
+
+
+def configured_check_workers() -> int:
+    """Return the check pool size from ``PYTUTOR_CHECK_WORKERS``."""
+    raw_workers = os.environ.get(CHECK_WORKERS_ENV_VAR, "").strip()
+    if raw_workers == "":
+        return DEFAULT_CHECK_WORKERS
+    try:
+        workers = int(raw_workers)
+    except ValueError as exc:
+        raise RuntimeError(
+            f"{CHECK_WORKERS_ENV_VAR} must be a whole number of workers, not {raw_workers!r}"
+        ) from exc
+    return max(workers, 1)
+
+
+def configured_check_timeout() -> float | None:
+    """Return the per-check limit from ``PYTUTOR_CHECK_TIMEOUT``, or ``None`` for no limit."""
+    raw_timeout = os.environ.get(CHECK_TIMEOUT_ENV_VAR, "").strip()
+    if raw_timeout == "":
+        return DEFAULT_CHECK_TIMEOUT_SECONDS
+    try:
+        timeout = float(raw_timeout)
+    except ValueError as exc:
+        raise RuntimeError(
+            f"{CHECK_TIMEOUT_ENV_VAR} must be a number of seconds, not {raw_timeout!r}"
+        ) from exc
+    return timeout if timeout > 0 else None
+
+
+_TIMEOUT_MESSAGE_PREFIX = "Check did not finish within"
+
+
+def _cells_can_be_stopped() -> bool:
+    """Return whether the default executor runs cells where they can be killed."""
+    return isinstance(get_default_executor(), PooledExecutor)
+
+
+def timeout_message(timeout: float) -> str:
+    """Return the issue text reported for a check that ran out of time."""
+    return f"{_TIMEOUT_MESSAGE_PREFIX} {timeout:g} seconds."
+
+
+def is_timeout_issue(issue: str) -> bool:
+    """Return whether *issue* reports a timed-out check rather than a real failure."""
+    return _TIMEOUT_MESSAGE_PREFIX in issue
+
+
+def iter_completed(
+    tasks: Sequence[Callable[[], _T]],
+    *,
+    on_timeout: Callable[[int, float], _T],
+    max_workers: int | None = None,
+    timeout: float | None = None,
+) -> Iterator[tuple[int, _T]]:
+    """Run *tasks* concurrently and yield ``(index, result)`` as each finishes.
+
+    Results arrive in completion order. A task still running *timeout* seconds
+    after it started is abandoned and ``on_timeout(index, timeout)`` supplies its
+    result instead. Exceptions raised by a task propagate to the caller.
+    ``max_workers`` and ``timeout`` default to the configured values when the
+    ``pool`` backend can stop runaway cells, and to serial execution without a
+    limit otherwise; a ``timeout`` of ``0`` disables the limit. Inside another
+    :func:`iter_completed` task, *tasks* always run serially.
+    """
+    workers, limit = _resolve_limits(max_workers, timeout)
+    if workers <= 1:
+        for index, task in enumerate(tasks):
+            yield index, task()
+        return
+    if not tasks:
+        return
+
+    started: dict[int, float] = {}
+
+    def run(index: int, task: Callable[[], _T]) -> _T:
+        _inside_check.set(True)
+        started[index] = time.monotonic()
+        return task()
+
+    pool = ThreadPoolExecutor(
+        max_workers=min(workers, len(tasks)),
+        thread_name_prefix="pytutor-check",
+    )
+    try:
+        pending = {
+            pool.submit(contextvars.copy_context().run, run, index, task): index
+            for index, task in enumerate(tasks)
+        }
+        while pending:
+            done, _ = wait(
+                pending,
+                timeout=_seconds_until_next_deadline(pending, started, limit),
+                return_when=FIRST_COMPLETED,
+            )
+            for future in done:
+                yield pending.pop(future), future.result()
+            if limit is not None:
+                yield from _expire(pending, started, limit, on_timeout)
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _resolve_limits(max_workers: int | None, timeout: float | None) -> tuple[int, float | None]:
+    if _inside_check.get():
+        return 1, None
+    stoppable = (max_workers is None or timeout is None) and _cells_can_be_stopped()
+    if max_workers is None:
+        max_workers = configured_check_workers() if stoppable else 1
+    if timeout is None:
+        return max_workers, configured_check_timeout() if stoppable else None
+    return max_workers, timeout if timeout > 0 else None
+
+
+def _seconds_until_next_deadline(
+    pending: dict[Future[_T], int],
+    started: dict[int, float],
+    limit: float | None,
+) -> float | None:
+    if limit is None:
+        return None
+    starts = [started[index] for index in pending.values() if index in started]
+    if not starts:
+        # Every pending task is still queued; look again once one could have expired.
+        return limit
+    return max(0.0, min(starts) + limit - time.monotonic())
+
+
+def _expire(
+    pending: dict[Future[_T], int],
+    started: dict[int, float],
+    limit: float,
+    on_timeout: Callable[[int, float], _T],
+) -> Iterator[tuple[int, _T]]:
+    now = time.monotonic()
+    expired = [
+        future
+        for future, index in pending.items()
+        if not future.done() and index in started and now - started[index] >= limit
+    ]
+    for future in expired:
+        index = pending.pop(future)
+        yield index, on_timeout(index, limit)
+
+
+__all__ = [
+    "CHECK_TIMEOUT_ENV_VAR",
+    "CHECK_WORKERS_ENV_VAR",
+    "DEFAULT_CHECK_TIMEOUT_SECONDS",
+    "DEFAULT_CHECK_WORKERS",
+    "configured_check_timeout",
+    "configured_check_workers",
+    "is_timeout_issue",
+    "iter_completed",
+    "timeout_message",
+]
@@ -0,0 +1,98 @@
+"""Cell sources taken from the running Jupyter kernel instead of the saved notebook.
+
+The self-check cell runs inside the student's kernel, which has already seen the
+code of every cell the student ran, including edits they have not saved yet.
+:class:`KernelSourceRecorder` hooks IPython's ``pre_run_cell`` event and keeps
+the latest source executed for each frontend cell id; Jupyter frontends send the
+notebook's cell ``id`` with every execution. The saved notebook still supplies
+the tags and cell order, and :func:`kernel_cell_sources` provides the overrides
+that :func:`exercise_runtime_support.notebook_grader.use_live_sources` applies.
+
+The recorder is installed when this module is imported, which the self-check
+cell's import of ``run_notebook_checks`` does before any grading starts. Cells
+last run before that are read from disk, so the student devcontainer loads it
+when the kernel starts with
+``%load_ext exercise_runtime_support.student_checker.kernel_sources`` to capture
+every cell. Plain Python processes, and frontends that do not send nbformat cell
+ids, always fall back to the saved notebook.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+from typing import Any
+
+__all__ = [
+    "KernelSourceRecorder",
+    "install_recorder",
+    "kernel_cell_sources",
+    "load_ipython_extension",
+]
+
+
+class KernelSourceRecorder:
+    """Latest source executed for each cell id in one IPython session."""
+
+    def __init__(self) -> None:
+        self._sources: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def record(self, info: object) -> None:
+        """``pre_run_cell`` callback: remember the cell about to run."""
+        cell_id = getattr(info, "cell_id", None)
+        raw_cell = getattr(info, "raw_cell", None)
+        if isinstance(cell_id, str) and cell_id and isinstance(raw_cell, str):
+            with self._lock:
+                self._sources[cell_id] = raw_cell
+
+    def sources(self) -> dict[str, str]:
+        """Return a snapshot of the recorded sources keyed by cell id."""
+        with self._lock:
+            return dict(self._sources)
+
+
+_recorder: KernelSourceRecorder | None = None
+_recorder_lock = threading.Lock()
+
+
+def _running_shell() -> Any | None:
+    # A kernel has always imported IPython already; checking sys.modules keeps
+    # plain Python processes from paying for the import.
+    ipython = sys.modules.get("IPython")
+    get_ipython = getattr(ipython, "get_ipython", None)
+    return None if get_ipython is None else get_ipython()
+
+
+def install_recorder(shell: Any | None = None) -> KernelSourceRecorder | None:
+    """Hook the recorder into *shell* (default: the running IPython shell) once.
+
+    Returns ``None`` outside IPython.
+    """
+    global _recorder
+    shell = _running_shell() if shell is None else shell
+    if shell is None:
+        return None
+    with _recorder_lock:
+        if _recorder is None:
+            recorder = KernelSourceRecorder()
+            shell.events.register("pre_run_cell", recorder.record)
+            _recorder = recorder
+        return _recorder
+
+
+def load_ipython_extension(ipython: Any) -> None:
+    """Install the recorder when loaded with ``%load_ext``."""
+    install_recorder(ipython)
+
+
+def kernel_cell_sources() -> dict[str, str]:
+    """Return the sources the running kernel last executed, keyed by cell id.
+
+    Empty outside IPython or before any cell has been recorded.
+    """
+    recorder = install_recorder()
+    return {} if recorder is None else recorder.sources()
+
+
+install_recorder()
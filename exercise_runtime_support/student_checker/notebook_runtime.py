@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-import ast
+import contextlib
 import json
 import re
+from dataclasses import asdict
 from pathlib import Path
 from typing import Any, TypedDict, TypeGuard, cast
 
@@ -13,19 +14,21 @@ from exercise_runtime_support.exercise_framework.reporting import render_grouped
 from exercise_runtime_support.notebook_grader import (
     NotebookCell,
     NotebookGradingError,
-    extract_tagged_code,
-    run_cell_and_capture_output,
-    run_cell_with_input,
+    get_notebook_index,
+    run_cell_with_default_inputs,
+    use_live_sources,
 )
+from exercise_runtime_support.notebook_reader import load_notebook
 
 from .checks import has_exercise_checks, run_exercise_checks
+from .kernel_sources import kernel_cell_sources
 from .models import NotebookTagCheckResult
-from .reporting import print_exercise_results
+from .reporting import print_exercise_check_progress, print_exercise_results
+from .state import SelfCheckState, fingerprint
 
 _EXERCISE_TAG_PATTERN = re.compile(r"exercise\d+")
-_DEFAULT_INPUT_VALUE = "2"
-_MISSING_INPUT_ERROR_MESSAGE = "Test expected more input values"
-_MAX_AUTOMATED_INPUTS = 10
+# Bump when the tagged-cell fallback changes what it reports, to discard stored results.
+_TAGGED_CELL_CHECKS = "tagged-cells-v1"
 
 
 class NotebookJson(TypedDict):
@@ -105,25 +108,54 @@ def _is_string_list(value: object) -> TypeGuard[list[str]]:
     return all(isinstance(item, str) for item in value)
 
 
-def run_notebook_checks(exercise_key: str) -> None:
-    """Run notebook-facing student checks for the given canonical exercise key."""
-    if has_exercise_checks(exercise_key):
-        print_exercise_results(run_exercise_checks(exercise_key))
-        return
+def run_notebook_checks(
+    exercise_key: str,
+    *,
+    full_recheck: bool = False,
+    from_kernel: bool = True,
+) -> None:
+    """Run notebook-facing student checks for the given canonical exercise key.
+
+    Exercises whose cells have not changed since the last run reuse the results
+    stored next to the notebook; pass ``full_recheck=True`` to run everything.
+    Inside a Jupyter kernel, cells are checked as the kernel last ran them, so
+    unsaved edits count; pass ``from_kernel=False`` to check the saved notebook.
+    """
+    with _kernel_sources(exercise_key, enabled=from_kernel):
+        if has_exercise_checks(exercise_key):
+            print_exercise_results(
+                run_exercise_checks(
+                    exercise_key,
+                    on_result=print_exercise_check_progress,
+                    incremental=not full_recheck,
+                )
+            )
+            return
+
+        resolved_path = resolve_notebook_path(exercise_key, variant="student")
+        tags = _collect_exercise_tags(resolved_path)
+        if not tags:
+            print(f"No exercise tags found in {resolved_path}.")
+            return
+
+        state = None if full_recheck else _load_tagged_cell_state(resolved_path, exercise_key)
+        results = _run_notebook_checks(resolved_path, tags, state=state)
+        _print_notebook_check_results(results)
 
-    resolved_path = resolve_notebook_path(exercise_key, variant="student")
-    tags = _collect_exercise_tags(resolved_path)
-    if not tags:
-        print(f"No exercise tags found in {resolved_path}.")
-        return
 
-    results = _run_notebook_checks(resolved_path, tags)
-    _print_notebook_check_results(results)
+def _kernel_sources(
+    exercise_key: str, *, enabled: bool
+) -> contextlib.AbstractContextManager[object]:
+    """Pin the student notebook to the sources the running kernel executed, if any."""
+    live_sources = kernel_cell_sources() if enabled else {}
+    if not live_sources:
+        return contextlib.nullcontext()
+    return use_live_sources(exercise_key, live_sources, variant="student")
 
 
 def _load_notebook_json(path: Path) -> NotebookJson:
     try:
-        data: object = json.loads(path.read_text(encoding="utf-8"))
+        data = load_notebook(path)
     except FileNotFoundError as exc:
         raise NotebookGradingError(f"Notebook not found: {path}") from exc
     except json.JSONDecodeError as exc:
@@ -157,6 +189,10 @@ def _extract_tags_from_cell(cell: object) -> list[str]:
 
 
 def _collect_exercise_tags(path: Path) -> list[str]:
+    pinned = get_notebook_index().pinned(path)
+    if pinned is not None:
+        # Kernel sources are pinned: the index already holds the tags.
+        return [tag for tag in pinned.cell_by_tag if _EXERCISE_TAG_PATTERN.fullmatch(tag)]
     data = _load_notebook_json(path)
     cells = data["cells"]
     tags: list[str] = []
@@ -165,80 +201,59 @@ def _collect_exercise_tags(path: Path) -> list[str]:
     return tags
 
 
-def _run_notebook_checks(path: Path, tags: list[str]) -> list[NotebookTagCheckResult]:
+def _load_tagged_cell_state(path: Path, exercise_key: str) -> SelfCheckState | None:
+    try:
+        return SelfCheckState.load(
+            path,
+            exercise_key=exercise_key,
+            checks_fingerprint=fingerprint(_TAGGED_CELL_CHECKS),
+        )
+    except NotebookGradingError:
+        return None
+
+
+def _run_notebook_checks(
+    path: Path,
+    tags: list[str],
+    *,
+    state: SelfCheckState | None = None,
+) -> list[NotebookTagCheckResult]:
     results: list[NotebookTagCheckResult] = []
     for tag in tags:
-        try:
-            _run_tagged_cell(path, tag)
-            results.append(NotebookTagCheckResult(tag=tag, passed=True, message=""))
-        except NotebookGradingError as exc:
-            results.append(NotebookTagCheckResult(tag=tag, passed=False, message=str(exc)))
+        if state is None:
+            results.append(_run_tagged_cell_check(path, tag))
+            continue
+        source_hash = state.source_hash((tag,))
+        result = _cached_tag_result(state.cached(tag, source_hash))
+        if result is None:
+            result = _run_tagged_cell_check(path, tag)
+        state.record(tag, source_hash, [asdict(result)])
+        results.append(result)
+    if state is not None:
+        state.save()
     return results
 
 
-def _run_tagged_cell(notebook_path: str | Path, tag: str) -> None:
-    input_calls = _count_input_calls(notebook_path, tag=tag)
-    if input_calls == 0:
-        run_cell_and_capture_output(notebook_path, tag=tag, variant="student")
-        return
-    _run_interactive_cell_with_backfill(notebook_path, tag=tag, input_calls=input_calls)
-
-
-def _run_interactive_cell_with_backfill(
-    notebook_path: str | Path,
-    *,
-    tag: str,
-    input_calls: int,
-) -> None:
-    required_inputs = max(input_calls, 1)
-    while True:
-        inputs = [_DEFAULT_INPUT_VALUE for _ in range(required_inputs)]
-        try:
-            run_cell_with_input(
-                notebook_path,
-                tag=tag,
-                inputs=inputs,
-                variant="student",
-            )
-            return
-        except NotebookGradingError as exc:
-            if not _is_missing_input_error(exc):
-                raise
-            if required_inputs >= _MAX_AUTOMATED_INPUTS:
-                raise
-            required_inputs = min(_MAX_AUTOMATED_INPUTS, required_inputs + 1)
-
-
-def _is_missing_input_error(exc: NotebookGradingError) -> bool:
-    cause = exc.__cause__
-    if isinstance(cause, RuntimeError):
-        return str(cause) == _MISSING_INPUT_ERROR_MESSAGE
-    return False
+def _cached_tag_result(rows: list[dict[str, Any]] | None) -> NotebookTagCheckResult | None:
+    if rows is None or len(rows) != 1:
+        return None
+    try:
+        return NotebookTagCheckResult(**rows[0])
+    except TypeError:
+        return None
 
 
-def _count_input_calls(notebook_path: str | Path, *, tag: str) -> int:
-    """Count direct `input()` calls in a tagged code cell."""
-    code = extract_tagged_code(notebook_path, tag=tag, variant="student")
+def _run_tagged_cell_check(path: Path, tag: str) -> NotebookTagCheckResult:
     try:
-        tree = ast.parse(code)
-    except SyntaxError:
-        return 0
-    return sum(1 for node in ast.walk(tree) if _is_input_call(node))
+        _run_tagged_cell(path, tag)
+    except NotebookGradingError as exc:
+        return NotebookTagCheckResult(tag=tag, passed=False, message=str(exc))
+    return NotebookTagCheckResult(tag=tag, passed=True, message="")
 
 
-def _is_input_call(node: ast.AST) -> bool:
-    """Return True when a node represents an `input()` call."""
-    if not isinstance(node, ast.Call):
-        return False
-    if isinstance(node.func, ast.Name):
-        return node.func.id == "input"
-    if isinstance(node.func, ast.Attribute):
-        return (
-            node.func.attr == "input"
-            and isinstance(node.func.value, ast.Name)
-            and node.func.value.id == "builtins"
-        )
-    return False
+def _run_tagged_cell(notebook_path: str | Path, tag: str) -> None:
+    # Interactive cells get placeholder answers on demand, so every cell runs once.
+    run_cell_with_default_inputs(notebook_path, tag=tag, variant="student")
 
 
 def _print_notebook_check_results(results: list[NotebookTagCheckResult]) -> None:
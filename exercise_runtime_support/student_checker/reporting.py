@@ -3,15 +3,19 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Iterable
+from functools import partial
 from typing import Protocol
 
 from exercise_runtime_support.exercise_framework.reporting import (
+    format_status,
     normalise_issue_text,
     render_grouped_table_with_errors,
     render_table,
 )
 from exercise_runtime_support.notebook_grader import NotebookGradingError
 
+from .checks import exercise_check_variant_context
+from .concurrency import iter_completed, timeout_message
 from .models import (
     DetailedCheckResult,
     ExerciseCheckResult,
@@ -52,12 +56,29 @@ def run_check(check: NotebookCheckSpec) -> None:
         print_results([(check.label, False, [str(exc)])])
 
 
-def run_checks(checks: list[NotebookCheckSpec]) -> list[CheckResult]:
-    """Run all notebook checks and return status rows."""
-    results: list[CheckResult] = []
-    for check in checks:
-        results.append(safe_check_result(check.label, check.summary_runner))
-    return results
+def run_checks(
+    checks: list[NotebookCheckSpec],
+    on_result: Callable[[CheckResult], None] | None = None,
+) -> list[CheckResult]:
+    """Run all notebook checks concurrently and return status rows in *checks* order.
+
+    ``on_result`` is called with each row as soon as its check completes.
+    """
+    rows: dict[int, CheckResult] = {}
+    with exercise_check_variant_context():
+        completed = iter_completed(
+            [partial(safe_check_result, check.label, check.summary_runner) for check in checks],
+            on_timeout=lambda index, timeout: (
+                checks[index].label,
+                False,
+                [timeout_message(timeout)],
+            ),
+        )
+        for index, row in completed:
+            rows[index] = row
+            if on_result is not None:
+                on_result(row)
+    return [rows[index] for index in range(len(checks))]
 
 
 def safe_check_result(label: str, runner: Callable[[], list[str]]) -> CheckResult:
@@ -74,6 +95,20 @@ def print_single_notebook_results(label: str, runner: Callable[[], list[str]]) -
     print_results([safe_check_result(label, runner)])
 
 
+def print_check_progress(result: CheckResult) -> None:
+    """Print a one-line status for a summary check as soon as it completes."""
+    label, passed, _ = result
+    print(f"{format_status(passed)}  {label}", flush=True)
+
+
+def print_exercise_check_progress(result: ExerciseCheckResult) -> None:
+    """Print a one-line status for an exercise check as soon as it completes."""
+    print(
+        f"{format_status(result.passed)}  Exercise {result.exercise_no}: {result.title}",
+        flush=True,
+    )
+
+
 def print_results(results: list[CheckResult]) -> None:
     """Print the standard notebook summary table."""
     table = render_table([(label, passed) for label, passed, _ in results])
@@ -0,0 +1,185 @@
+"""Local record of the last self-check run, used to skip unchanged exercises.
+
+Students usually fix one exercise and re-run the self-check cell. The notebook
+checker keeps a small ``.self_check_state.json`` file next to the notebook that
+records, for each part, a hash of the cells it reads and the results it last
+produced. Parts whose hash still matches reuse those results instead of
+executing again.
+
+A part's hash covers the code cells tagged ``exerciseN`` and the cell tagged
+``explanationN``, so checks must only read the cells of their own exercise
+number. Each notebook's entry also carries a fingerprint of the checks
+themselves (their names, the exercise's test-support sources and the runtime
+version). Editing any of those discards every stored result for the notebook.
+
+The file is advisory: an unreadable, malformed or unwritable state file
+behaves like an empty one and never fails a check. Set
+``PYTUTOR_SELF_CHECK_STATE=0`` to turn it off, for example in test suites that
+must not write next to the repository's notebooks.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, cast
+
+from exercise_runtime_support.notebook_grader import ParsedNotebook, get_notebook_index
+from exercise_runtime_support.result_cache import runtime_support_version
+
+SELF_CHECK_STATE_ENV_VAR = "PYTUTOR_SELF_CHECK_STATE"
+STATE_FILENAME = ".self_check_state.json"
+STATE_FORMAT = 1
+
+_DISABLED_VALUES = frozenset({"0", "false", "no", "off"})
+
+__all__ = [
+    "SELF_CHECK_STATE_ENV_VAR",
+    "STATE_FILENAME",
+    "STATE_FORMAT",
+    "SelfCheckState",
+    "fingerprint",
+    "self_check_state_enabled",
+]
+
+
+def self_check_state_enabled() -> bool:
+    """Return whether incremental self-checks may read and write state files."""
+    return os.environ.get(SELF_CHECK_STATE_ENV_VAR, "").strip().lower() not in _DISABLED_VALUES
+
+
+def fingerprint(*parts: object) -> str:
+    """Return a stable digest of *parts* plus the runtime-support version."""
+    encoded = json.dumps([*parts, runtime_support_version()], default=str, sort_keys=True)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:16]
+
+
+class SelfCheckState:
+    """Stored results for one notebook, refreshed by a single self-check run.
+
+    Results are read from the previous run with :meth:`cached` and every part
+    of the current run is passed to :meth:`record`; :meth:`save` then replaces
+    the notebook's entry, so parts that no longer exist are dropped.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        notebook: ParsedNotebook,
+        *,
+        exercise_key: str,
+        checks_fingerprint: str,
+        previous: dict[str, Any],
+    ) -> None:
+        self.path = path
+        self.notebook = notebook
+        self.exercise_key = exercise_key
+        self.checks_fingerprint = checks_fingerprint
+        self._previous = previous
+        self._current: dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(
+        cls,
+        notebook_path: Path,
+        *,
+        exercise_key: str,
+        checks_fingerprint: str,
+    ) -> SelfCheckState | None:
+        """Return the state for *notebook_path*, ignoring stale or unreadable entries.
+
+        Returns ``None`` when state files are turned off.
+
+        Raises:
+            NotebookGradingError: If the notebook itself cannot be read.
+        """
+        if not self_check_state_enabled():
+            return None
+        notebook = get_notebook_index().get(notebook_path)
+        path = notebook.path.parent / STATE_FILENAME
+        entry = _read_notebooks(path).get(notebook.path.name)
+        previous: dict[str, Any] = {}
+        if (
+            isinstance(entry, dict)
+            and cast(dict[str, Any], entry).get("exercise_key") == exercise_key
+            and cast(dict[str, Any], entry).get("fingerprint") == checks_fingerprint
+        ):
+            parts = cast(dict[str, Any], entry).get("parts")
+            if isinstance(parts, dict):
+                previous = cast(dict[str, Any], parts)
+        return cls(
+            path,
+            notebook,
+            exercise_key=exercise_key,
+            checks_fingerprint=checks_fingerprint,
+            previous=previous,
+        )
+
+    def source_hash(self, tags: Iterable[str]) -> str:
+        """Return a digest of the cells carrying *tags* in the current notebook."""
+        digest = hashlib.sha256()
+        for tag in tags:
+            digest.update(tag.encode("utf-8"))
+            for source in self.notebook.code_by_tag.get(tag, ()):
+                digest.update(b"\0")
+                digest.update(source.encode("utf-8"))
+            cell = self.notebook.cell_by_tag.get(tag)
+            digest.update(b"\1")
+            digest.update(json.dumps(cell, sort_keys=True).encode("utf-8"))
+        return digest.hexdigest()
+
+    def cached(self, part: str, source_hash: str) -> list[dict[str, Any]] | None:
+        """Return the rows stored for *part* when its sources are unchanged."""
+        stored = self._previous.get(part)
+        if not isinstance(stored, dict):
+            return None
+        stored_part = cast(dict[str, Any], stored)
+        rows = stored_part.get("results")
+        if stored_part.get("source_hash") != source_hash or not isinstance(rows, list):
+            return None
+        if not all(isinstance(row, dict) for row in cast(list[Any], rows)):
+            return None
+        return cast(list[dict[str, Any]], rows)
+
+    def record(self, part: str, source_hash: str, rows: list[dict[str, Any]]) -> None:
+        """Remember the rows produced for *part* in this run."""
+        with self._lock:
+            self._current[part] = {"source_hash": source_hash, "results": rows}
+
+    def save(self) -> None:
+        """Write this run's parts back to the state file."""
+        notebooks = _read_notebooks(self.path)
+        notebooks[self.notebook.path.name] = {
+            "exercise_key": self.exercise_key,
+            "fingerprint": self.checks_fingerprint,
+            "parts": self._current,
+        }
+        payload = {"format": STATE_FORMAT, "notebooks": notebooks}
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            tmp_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp_path, self.path)
+        except OSError:
+            # A read-only notebook directory must never break the self-check.
+            with contextlib.suppress(OSError):
+                tmp_path.unlink(missing_ok=True)
+
+
+def _read_notebooks(path: Path) -> dict[str, Any]:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(payload, dict):
+        return {}
+    data = cast(dict[str, Any], payload)
+    notebooks = data.get("notebooks")
+    if data.get("format") != STATE_FORMAT or not isinstance(notebooks, dict):
+        return {}
+    return cast(dict[str, Any], notebooks)
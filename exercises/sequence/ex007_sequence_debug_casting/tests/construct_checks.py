@@ -3,57 +3,27 @@
 from __future__ import annotations
 
 import ast
-from dataclasses import dataclass
 
-
-@dataclass(frozen=True)
-class OutputFlowAnalysis:
-    """Describe how a printed expression depends on entered values."""
-
-    input_names: frozenset[str]
-    call_names: frozenset[str]
-    op_types: frozenset[type[ast.operator]]
-
-
-@dataclass(frozen=True)
-class _ExpressionAnalysisContext:
-    before_line: int
-    assignments: dict[str, list[ast.Assign]]
-    input_names: set[str]
-    seen_names: frozenset[str]
+from exercise_runtime_support.exercise_framework.code_facts import facts_for_tree
+from exercise_runtime_support.exercise_framework.dataflow import Flow, dataflow_for_tree
 
 
 def has_call(tree: ast.AST, func_name: str) -> bool:
     """Return True when the tree contains a call to the named function."""
 
-    return any(
-        isinstance(node, ast.Call) and _call_name(node) == func_name
-        for node in ast.walk(tree)
-    )
+    return facts_for_tree(tree).has_call(func_name)
 
 
 def has_binop(tree: ast.AST, op_type: type[ast.operator]) -> bool:
     """Return True when the tree contains the requested binary operator."""
 
-    return any(
-        isinstance(node, ast.BinOp) and isinstance(node.op, op_type)
-        for node in ast.walk(tree)
-    )
+    return facts_for_tree(tree).uses_operator(op_type, augmented=False)
 
 
 def input_assigned_names(tree: ast.AST) -> set[str]:
     """Return variable names that are assigned directly from input()."""
 
-    names: set[str] = set()
-    for node in ast.walk(tree):
-        if not isinstance(node, ast.Assign):
-            continue
-        if not isinstance(node.value, ast.Call) or _call_name(node.value) != "input":
-            continue
-        for target in node.targets:
-            if isinstance(target, ast.Name):
-                names.add(target.id)
-    return names
+    return set(facts_for_tree(tree).input_assigned_names)
 
 
 def interactive_construct_issues(
@@ -99,8 +69,8 @@ def _input_count_issue(
 def _relevant_print_analyses(
     tree: ast.AST,
     input_names: set[str],
-) -> tuple[list[OutputFlowAnalysis], list[str] | None]:
-    analyses = _print_output_analyses(tree, input_names)
+) -> tuple[list[Flow], list[str] | None]:
+    analyses = dataflow_for_tree(tree).print_flows
     if not analyses:
         return [], ["Print the final answer from the calculation."]
 
@@ -114,7 +84,7 @@ def _relevant_print_analyses(
 
 
 def _construct_requirement_issues(
-    relevant_analyses: list[OutputFlowAnalysis],
+    relevant_analyses: list[Flow],
     *,
     required_calls: tuple[str, ...],
     required_ops: tuple[type[ast.operator], ...],
@@ -147,7 +117,7 @@ def _construct_requirement_issues(
 
 
 def _analysis_satisfies_requirements(
-    analysis: OutputFlowAnalysis,
+    analysis: Flow,
     *,
     required_call_set: set[str],
     required_op_set: set[type[ast.operator]],
@@ -162,7 +132,7 @@ def _analysis_satisfies_requirements(
 
 def _append_required_call_issue(
     issues: list[str],
-    relevant_analyses: list[OutputFlowAnalysis],
+    relevant_analyses: list[Flow],
     required_calls: tuple[str, ...],
     required_call_set: set[str],
 ) -> None:
@@ -178,7 +148,7 @@ def _append_required_call_issue(
 
 def _append_required_op_issue(
     issues: list[str],
-    relevant_analyses: list[OutputFlowAnalysis],
+    relevant_analyses: list[Flow],
     required_ops: tuple[type[ast.operator], ...],
     required_op_set: set[type[ast.operator]],
 ) -> None:
@@ -194,7 +164,7 @@ def _append_required_op_issue(
 
 def _append_forbidden_op_issue(
     issues: list[str],
-    relevant_analyses: list[OutputFlowAnalysis],
+    relevant_analyses: list[Flow],
     forbidden_ops: tuple[type[ast.operator], ...],
 ) -> None:
     used_forbidden_ops = [
@@ -206,144 +176,6 @@ def _append_forbidden_op_issue(
     issues.append(f"Printed result must not use {formatted_ops}.")
 
 
-def _print_output_analyses(
-    tree: ast.AST,
-    input_names: set[str],
-) -> list[OutputFlowAnalysis]:
-    assignments = _collect_assignments(tree)
-    analyses: list[OutputFlowAnalysis] = []
-
-    for node in ast.walk(tree):
-        if not isinstance(node, ast.Call) or _call_name(node) != "print":
-            continue
-        for arg in node.args:
-            analyses.append(
-                _analyse_expression(
-                    arg,
-                    before_line=getattr(node, "lineno", 10**9),
-                    assignments=assignments,
-                    input_names=input_names,
-                    seen_names=frozenset(),
-                )
-            )
-
-    return analyses
-
-
-def _collect_assignments(tree: ast.AST) -> dict[str, list[ast.Assign]]:
-    collector = _AssignmentCollector()
-    collector.visit(tree)
-    for nodes in collector.assignments.values():
-        nodes.sort(key=lambda node: getattr(node, "lineno", 0))
-    return collector.assignments
-
-
-def _analyse_expression(
-    expr: ast.AST,
-    *,
-    before_line: int,
-    assignments: dict[str, list[ast.Assign]],
-    input_names: set[str],
-    seen_names: frozenset[str],
-) -> OutputFlowAnalysis:
-    direct_input_names, call_names, op_types = _collect_direct_expression_details(
-        expr,
-        input_names=input_names,
-    )
-    transitive_input_names = set(direct_input_names)
-    context = _ExpressionAnalysisContext(
-        before_line=before_line,
-        assignments=assignments,
-        input_names=input_names,
-        seen_names=seen_names,
-    )
-    _merge_transitive_expression_details(
-        expr,
-        context=context,
-        transitive_input_names=transitive_input_names,
-        call_names=call_names,
-        op_types=op_types,
-    )
-    return OutputFlowAnalysis(
-        input_names=frozenset(transitive_input_names),
-        call_names=frozenset(call_names),
-        op_types=frozenset(op_types),
-    )
-
-
-def _collect_direct_expression_details(
-    expr: ast.AST,
-    *,
-    input_names: set[str],
-) -> tuple[set[str], set[str], set[type[ast.operator]]]:
-    direct_input_names: set[str] = set()
-    call_names: set[str] = set()
-    op_types: set[type[ast.operator]] = set()
-
-    for node in ast.walk(expr):
-        if isinstance(node, ast.Name) and node.id in input_names:
-            direct_input_names.add(node.id)
-        elif isinstance(node, ast.Call):
-            call_name = _call_name(node)
-            if call_name is not None:
-                call_names.add(call_name)
-        elif isinstance(node, ast.BinOp):
-            op_types.add(type(node.op))
-
-    return direct_input_names, call_names, op_types
-
-
-def _merge_transitive_expression_details(
-    expr: ast.AST,
-    *,
-    context: _ExpressionAnalysisContext,
-    transitive_input_names: set[str],
-    call_names: set[str],
-    op_types: set[type[ast.operator]],
-) -> None:
-    for node in ast.walk(expr):
-        if not isinstance(node, ast.Name):
-            continue
-        assignment = _latest_assignment_before_line(
-            context.assignments,
-            node.id,
-            before_line=context.before_line,
-        )
-        if assignment is None or node.id in context.seen_names:
-            continue
-        nested = _analyse_expression(
-            assignment.value,
-            before_line=getattr(assignment, "lineno", context.before_line),
-            assignments=context.assignments,
-            input_names=context.input_names,
-            seen_names=context.seen_names | {node.id},
-        )
-        transitive_input_names.update(nested.input_names)
-        call_names.update(nested.call_names)
-        op_types.update(nested.op_types)
-
-
-def _latest_assignment_before_line(
-    assignments: dict[str, list[ast.Assign]],
-    name: str,
-    *,
-    before_line: int,
-) -> ast.Assign | None:
-    candidates = assignments.get(name)
-    if not candidates:
-        return None
-    eligible = [node for node in candidates if getattr(node, "lineno", 0) < before_line]
-    if not eligible:
-        return None
-    return eligible[-1]
-
-
-def _call_name(node: ast.Call) -> str | None:
-    if isinstance(node.func, ast.Name):
-        return node.func.id
-    return None
-
-
 def _operator_token(operator_type: type[ast.operator]) -> str:
     mapping: dict[type[ast.operator], str] = {
         ast.Add: "+",
@@ -353,14 +185,3 @@ def _operator_token(operator_type: type[ast.operator]) -> str:
         ast.FloorDiv: "//",
     }
     return mapping.get(operator_type, operator_type.__name__)
-
-
-class _AssignmentCollector(ast.NodeVisitor):
-    def __init__(self) -> None:
-        self.assignments: dict[str, list[ast.Assign]] = {}
-
-    def visit_Assign(self, node: ast.Assign) -> None:
-        for target in node.targets:
-            if isinstance(target, ast.Name):
-                self.assignments.setdefault(target.id, []).append(node)
-        self.generic_visit(node)
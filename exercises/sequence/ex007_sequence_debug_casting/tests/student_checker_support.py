@@ -9,7 +9,7 @@ from exercise_runtime_support.notebook_grader import (
     NotebookGradingError,
     extract_tagged_code,
     run_cell_and_capture_output,
-    run_cell_with_input,
+    run_cell_with_input_cases,
 )
 from exercise_runtime_support.student_checker.checks.base import (
     ExerciseCheckDefinition,
@@ -39,13 +39,14 @@ def _check_static_output(exercise_no: int) -> list[str]:
 
 def _check_prompt_flow(exercise_no: int) -> list[str]:
     errors: list[str] = []
-    for case_no, case in enumerate(ex007.EX007_INPUT_CASES[exercise_no], start=1):
-        output = run_cell_with_input(
-            _EXERCISE_KEY,
-            tag=exercise_tag(exercise_no),
-            inputs=list(case["inputs"]),
-            variant=_STUDENT_VARIANT,
-        )
+    cases = ex007.EX007_INPUT_CASES[exercise_no]
+    outputs = run_cell_with_input_cases(
+        _EXERCISE_KEY,
+        tag=exercise_tag(exercise_no),
+        cases=[case["inputs"] for case in cases],
+        variant=_STUDENT_VARIANT,
+    )
+    for case_no, (case, output) in enumerate(zip(cases, outputs, strict=True), start=1):
         if output != case["expected_output"]:
             errors.append(
                 f"Exercise {exercise_no} case {case_no}: output does not match the expected prompt flow."
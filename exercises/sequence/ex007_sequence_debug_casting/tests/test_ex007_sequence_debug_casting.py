@@ -13,7 +13,7 @@ from exercise_runtime_support.exercise_framework import (
     extract_tagged_code,
     get_explanation_cell,
     run_cell_and_capture_output,
-    run_cell_with_input,
+    run_cell_with_input_cases,
 )
 
 _EX007_EXERCISE_KEY = "ex007_sequence_debug_casting"
@@ -42,15 +42,6 @@ def _run_static(exercise_no: int) -> str:
     )
 
 
-def _run_with_inputs(exercise_no: int, inputs: list[str]) -> str:
-    return run_cell_with_input(
-        _EX007_EXERCISE_KEY,
-        tag=_tag(exercise_no),
-        inputs=inputs,
-        cache=_CACHE,
-    )
-
-
 def _exercise_ast(exercise_no: int) -> ast.Module:
     code = extract_tagged_code(
         _EX007_EXERCISE_KEY,
@@ -82,8 +73,14 @@ def _assert_interactive_constructs(exercise_no: int) -> None:
 
 
 def _assert_interactive_output(exercise_no: int) -> None:
-    for case in ex007.EX007_INPUT_CASES[exercise_no]:
-        output = _run_with_inputs(exercise_no, list(case["inputs"]))
+    cases = ex007.EX007_INPUT_CASES[exercise_no]
+    outputs = run_cell_with_input_cases(
+        _EX007_EXERCISE_KEY,
+        tag=_tag(exercise_no),
+        cases=[case["inputs"] for case in cases],
+        cache=_CACHE,
+    )
+    for case, output in zip(cases, outputs, strict=True):
         expected_output = case["expected_output"]
         assert output == expected_output, (
             f"Exercise {exercise_no}: expected exact output {expected_output!r} but got {output!r}."
@@ -5,7 +5,7 @@ from __future__ import annotations
 from exercise_runtime_support.exercise_test_support import load_exercise_test_module
 from exercise_runtime_support.notebook_grader import (
     run_cell_and_capture_output,
-    run_cell_with_input,
+    run_cell_with_input_cases,
 )
 from exercise_runtime_support.student_checker.checks.base import (
     ExerciseCheckDefinition,
@@ -28,12 +28,13 @@ def _check_static_output(exercise_no: int) -> list[str]:
 
 def _check_interactive_output(exercise_no: int) -> list[str]:
     errors: list[str] = []
-    for case in ex008.EX008_INTERACTIVE_CASES[exercise_no]:
-        output = run_cell_with_input(
-            _EXERCISE_KEY,
-            tag=exercise_tag(exercise_no),
-            inputs=list(case["inputs"]),
-        )
+    cases = ex008.EX008_INTERACTIVE_CASES[exercise_no]
+    outputs = run_cell_with_input_cases(
+        _EXERCISE_KEY,
+        tag=exercise_tag(exercise_no),
+        cases=[case["inputs"] for case in cases],
+    )
+    for case, output in zip(cases, outputs, strict=True):
         if output != case["expected_output"]:
             errors.append(
                 f"Exercise {exercise_no}: expected '{case['expected_output'].strip()}'."
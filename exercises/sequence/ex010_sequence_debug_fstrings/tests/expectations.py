@@ -2,8 +2,18 @@
 
 from __future__ import annotations
 
+import ast
 from typing import Final, TypedDict
 
+from exercise_runtime_support.exercise_framework.construct_rules import (
+    CallRule,
+    ConstructRule,
+    FormattedNameRule,
+    NameRule,
+    NodeRule,
+    OperatorRule,
+)
+
 
 class Ex010InputCase(TypedDict):
     """Deterministic input/output case for an interactive exercise."""
@@ -22,6 +32,48 @@ EX010_PLACEHOLDER_PHRASES: Final[tuple[str, ...]] = (
     "...",
 )
 
+_F_STRING_RULE: Final[ConstructRule] = NodeRule(
+    ast.JoinedStr, message="use an f-string in the final output."
+)
+# Issues are reported in rule order, so each part lists its rules in the order
+# students see them.
+EX010_CONSTRUCT_RULES: Final[dict[int, tuple[ConstructRule, ...]]] = {
+    1: (_F_STRING_RULE, FormattedNameRule(("name",))),
+    2: (
+        _F_STRING_RULE,
+        NameRule("animal", forbidden=True, message="use 'pet', not 'animal'."),
+        FormattedNameRule(("pet",)),
+    ),
+    3: (_F_STRING_RULE, FormattedNameRule(("person", "hobby"))),
+    4: (_F_STRING_RULE, FormattedNameRule(("lesson",))),
+    5: (
+        _F_STRING_RULE,
+        CallRule("input", message="include one input() call."),
+        FormattedNameRule(("snack",)),
+    ),
+    6: (
+        _F_STRING_RULE,
+        FormattedNameRule(("name", "town")),
+        CallRule("input", count=2, message="include two input() calls."),
+    ),
+    7: (_F_STRING_RULE, FormattedNameRule(("goals",))),
+    8: (
+        _F_STRING_RULE,
+        FormattedNameRule(("total_tickets",)),
+        OperatorRule(ast.Add, augmented=False, message="add the ticket values with +."),
+    ),
+    9: (
+        _F_STRING_RULE,
+        FormattedNameRule(("total_pages",)),
+        OperatorRule(ast.Add, augmented=False, message="add the page values with +."),
+    ),
+    10: (
+        _F_STRING_RULE,
+        FormattedNameRule(("amount", "total_cost")),
+        OperatorRule(ast.Mult, augmented=False, message="multiply price by amount with *."),
+    ),
+}
+
 EX010_EXPECTED_STATIC_OUTPUTS: Final[dict[int, str]] = {
     1: "Welcome, Sam!",
     2: "My pet is a rabbit!",
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import ast
 
+from exercise_runtime_support.exercise_framework.construct_rules import compile_rules
 from exercise_runtime_support.exercise_test_support import load_exercise_test_module
 from exercise_runtime_support.notebook_grader import (
     NotebookGradingError,
@@ -21,14 +22,18 @@ from exercise_runtime_support.student_checker.checks.base import (
 _EXERCISE_KEY = "ex010_sequence_debug_fstrings"
 _STUDENT_VARIANT = "student"
 ex010 = load_exercise_test_module(_EXERCISE_KEY, "expectations")
+_CONSTRUCT_RULES = compile_rules(ex010.EX010_CONSTRUCT_RULES)
 
 
-def _exercise_ast(exercise_no: int) -> ast.Module:
-    code = extract_tagged_code(
+def _exercise_code(exercise_no: int) -> str:
+    return extract_tagged_code(
         _EXERCISE_KEY,
         tag=exercise_tag(exercise_no),
         variant=_STUDENT_VARIANT,
     )
+
+
+def _exercise_ast(exercise_no: int, code: str) -> ast.Module:
     try:
         return ast.parse(code)
     except SyntaxError as exc:
@@ -37,41 +42,6 @@ def _exercise_ast(exercise_no: int) -> ast.Module:
         ) from exc
 
 
-def _has_f_string(tree: ast.AST) -> bool:
-    return any(isinstance(node, ast.JoinedStr) for node in ast.walk(tree))
-
-
-def _has_call(tree: ast.AST, func_name: str) -> bool:
-    return any(
-        isinstance(node, ast.Call)
-        and isinstance(node.func, ast.Name)
-        and node.func.id == func_name
-        for node in ast.walk(tree)
-    )
-
-
-def _has_binop(tree: ast.AST, operator_type: type[ast.operator]) -> bool:
-    return any(
-        isinstance(node, ast.BinOp) and isinstance(node.op, operator_type)
-        for node in ast.walk(tree)
-    )
-
-
-def _name_ids(tree: ast.AST) -> set[str]:
-    return {node.id for node in ast.walk(tree) if isinstance(node, ast.Name)}
-
-
-def _formatted_name_ids(tree: ast.AST) -> set[str]:
-    formatted_names: set[str] = set()
-    for node in ast.walk(tree):
-        if not isinstance(node, ast.JoinedStr):
-            continue
-        for value in node.values:
-            if isinstance(value, ast.FormattedValue) and isinstance(value.value, ast.Name):
-                formatted_names.add(value.value.id)
-    return formatted_names
-
-
 def _fstring_text_fragments(tree: ast.AST) -> list[str]:
     fragments: list[str] = []
     for node in ast.walk(tree):
@@ -111,60 +81,8 @@ def _check_prompt_flow(exercise_no: int) -> list[str]:
 
 
 def _check_construct(exercise_no: int) -> list[str]:
-    tree = _exercise_ast(exercise_no)
-    names = _name_ids(tree)
-    formatted_names = _formatted_name_ids(tree)
-    issues: list[str] = []
-
-    if not _has_f_string(tree):
-        issues.append(
-            f"Exercise {exercise_no}: use an f-string in the final output.")
-
-    if exercise_no == 2 and "animal" in names:
-        issues.append("Exercise 2: use 'pet', not 'animal'.")
-
-    if exercise_no == 5 and not _has_call(tree, "input"):
-        issues.append("Exercise 5: include one input() call.")
-
-    required_formatted_names: dict[int, set[str]] = {
-        1: {"name"},
-        2: {"pet"},
-        3: {"person", "hobby"},
-        4: {"lesson"},
-        5: {"snack"},
-        6: {"name", "town"},
-        7: {"goals"},
-        8: {"total_tickets"},
-        9: {"total_pages"},
-        10: {"amount", "total_cost"},
-    }
-    missing_formatted = required_formatted_names.get(
-        exercise_no, set()) - formatted_names
-    if missing_formatted:
-        missing_list = ", ".join(sorted(missing_formatted))
-        issues.append(
-            f"Exercise {exercise_no}: interpolate variable(s) in the f-string: {missing_list}."
-        )
-
-    if exercise_no == 6:
-        input_calls = sum(
-            1
-            for node in ast.walk(tree)
-            if isinstance(node, ast.Call)
-            and isinstance(node.func, ast.Name)
-            and node.func.id == "input"
-        )
-        if input_calls != 2:
-            issues.append("Exercise 6: include two input() calls.")
-
-    if exercise_no == 8 and not _has_binop(tree, ast.Add):
-        issues.append("Exercise 8: add the ticket values with +.")
-
-    if exercise_no == 9 and not _has_binop(tree, ast.Add):
-        issues.append("Exercise 9: add the page values with +.")
-
-    if exercise_no == 10 and not _has_binop(tree, ast.Mult):
-        issues.append("Exercise 10: multiply price by amount with *.")
+    tree = _exercise_ast(exercise_no, _exercise_code(exercise_no))
+    issues = [issue.message for issue in _CONSTRUCT_RULES.issues_for_tree(exercise_no, tree)]
 
     if exercise_no == 7:
         fragments = _fstring_text_fragments(tree)
@@ -0,0 +1,205 @@
+"""Benchmark the start-up cost of the notebook self-check cell.
+
+Students notice how long the "check your answers" cell takes to print anything.
+This script measures, in fresh interpreters:
+
+- the ``-X importtime`` cost of the cell's import statement, beyond what a bare
+  interpreter already imports;
+- the time from process start until the cell prints its first line.
+
+Each measurement is compared with a budget, and the exit code is non-zero when
+either budget is exceeded, so the script can guard against import regressions.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import NamedTuple
+
+from exercise_runtime_support.execution_variant import (
+    Variant,
+    configure_variant_environment,
+    validate_variant,
+)
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+CHECK_CELL_IMPORT = "from exercise_runtime_support.student_checker import run_notebook_checks"
+DEFAULT_EXERCISE_KEY = "ex002_sequence_modify_basics"
+DEFAULT_IMPORT_BUDGET_MS = 250.0
+DEFAULT_FIRST_OUTPUT_BUDGET_MS = 5000.0
+_SLOWEST_MODULE_COUNT = 5
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+@dataclass(frozen=True)
+class ImportTiming:
+    """One ``-X importtime`` row."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass(frozen=True)
+class ImportProfile:
+    """Import timings for one statement, excluding interpreter start-up imports."""
+
+    timings: tuple[ImportTiming, ...]
+
+    @property
+    def total_ms(self) -> float:
+        """Return the summed cumulative time of the top-level imports."""
+        return sum(timing.cumulative_us for timing in self.timings if timing.depth == 0) / 1000
+
+    def slowest(self, count: int = _SLOWEST_MODULE_COUNT) -> list[ImportTiming]:
+        """Return the modules with the largest self time."""
+        return sorted(self.timings, key=lambda timing: timing.self_us, reverse=True)[:count]
+
+
+class ParsedArgs(NamedTuple):
+    """Parsed command-line arguments."""
+
+    exercise_key: str
+    variant: Variant
+    import_budget_ms: float
+    first_output_budget_ms: float
+
+
+def parse_importtime(stderr: str) -> list[ImportTiming]:
+    """Parse ``-X importtime`` output into timings, skipping unrelated lines."""
+    timings: list[ImportTiming] = []
+    for line in stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match is None:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        timings.append(
+            ImportTiming(
+                module=module,
+                self_us=int(self_us),
+                cumulative_us=int(cumulative_us),
+                depth=len(indent) // 2,
+            )
+        )
+    return timings
+
+
+def _benchmark_env(variant: Variant) -> dict[str, str]:
+    env = dict(os.environ)
+    configure_variant_environment(env, variant)
+    existing = env.get("PYTHONPATH")
+    env["PYTHONPATH"] = f"{REPO_ROOT}{os.pathsep}{existing}" if existing else str(REPO_ROOT)
+    env["PYTHONDONTWRITEBYTECODE"] = "1"
+    return env
+
+
+def _importtime(code: str, env: dict[str, str]) -> list[ImportTiming]:
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_importtime(completed.stderr)
+
+
+def measure_import_profile(
+    statement: str = CHECK_CELL_IMPORT,
+    *,
+    variant: Variant = "student",
+) -> ImportProfile:
+    """Return the import cost of *statement* in a fresh interpreter."""
+    env = _benchmark_env(variant)
+    baseline = {timing.module for timing in _importtime("pass", env)}
+    timings = [timing for timing in _importtime(statement, env) if timing.module not in baseline]
+    return ImportProfile(tuple(timings))
+
+
+def measure_time_to_first_output(
+    exercise_key: str = DEFAULT_EXERCISE_KEY,
+    *,
+    variant: Variant = "student",
+) -> float:
+    """Return milliseconds from process start until the check cell prints a line."""
+    # A full re-check measures the first run, not one served from the stored state.
+    code = f"{CHECK_CELL_IMPORT}\nrun_notebook_checks({exercise_key!r}, full_recheck=True)\n"
+    started = time.perf_counter()
+    with subprocess.Popen(
+        [sys.executable, "-u", "-c", code],
+        cwd=REPO_ROOT,
+        env=_benchmark_env(variant),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    ) as process:
+        assert process.stdout is not None
+        first_line = process.stdout.readline()
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        process.stdout.read()
+    if not first_line:
+        raise RuntimeError(f"The check cell for {exercise_key!r} printed nothing")
+    return elapsed_ms
+
+
+def parse_args(argv: Sequence[str] | None = None) -> ParsedArgs:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Measure import cost and time-to-first-output of the self-check cell.",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument("--exercise-key", default=DEFAULT_EXERCISE_KEY)
+    parser.add_argument("--variant", choices=("student", "solution"), default="student")
+    parser.add_argument(
+        "--import-budget-ms",
+        type=float,
+        default=DEFAULT_IMPORT_BUDGET_MS,
+        help="Maximum import cost of the check cell's import statement.",
+    )
+    parser.add_argument(
+        "--first-output-budget-ms",
+        type=float,
+        default=DEFAULT_FIRST_OUTPUT_BUDGET_MS,
+        help="Maximum time from process start until the check cell prints.",
+    )
+    args = parser.parse_args(argv)
+    return ParsedArgs(
+        exercise_key=args.exercise_key,
+        variant=validate_variant(args.variant),
+        import_budget_ms=args.import_budget_ms,
+        first_output_budget_ms=args.first_output_budget_ms,
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run both measurements, print a report and return 1 if a budget is exceeded."""
+    args = parse_args(argv)
+    profile = measure_import_profile(variant=args.variant)
+    first_output_ms = measure_time_to_first_output(args.exercise_key, variant=args.variant)
+
+    print(f"Import cost: {profile.total_ms:.1f} ms (budget {args.import_budget_ms:.0f} ms)")
+    for timing in profile.slowest():
+        print(f"  {timing.self_us / 1000:7.1f} ms  {timing.module}")
+    print(
+        f"Time to first output: {first_output_ms:.1f} ms "
+        f"(budget {args.first_output_budget_ms:.0f} ms)"
+    )
+
+    within_budget = (
+        profile.total_ms <= args.import_budget_ms and first_output_ms <= args.first_output_budget_ms
+    )
+    return 0 if within_budget else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,285 @@
+"""Benchmark metadata and selection APIs against synthetic exercise libraries.
+
+Generates canonical exercise trees (``exercises/<construct>/<exercise_key>/`` with
+``exercise.json``, notebooks and a tests directory) of each requested size,
+spread evenly across every construct and exercise type, in a temporary
+directory. It then times the registry, resolver, catalogue and selector APIs
+against each tree.
+
+Results are written as JSON so CI can archive them and compare runs::
+
+    python -m scripts.benchmark_exercise_library --sizes 100 1000 10000 --output bench.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from exercise_metadata import (
+    build_exercise_catalogue,
+    build_exercise_registry,
+    get_exercise_index,
+    resolve_exercise_dir,
+    resolve_notebook_path,
+)
+from exercise_runtime_support.exercise_catalogue import ExerciseCatalogue
+from scripts.template_repo_cli.core.selector import ExerciseSelector
+from scripts.template_repo_cli.utils.validation import VALID_CONSTRUCTS, VALID_TYPES
+
+DEFAULT_SIZES = (100, 1000, 10000)
+DEFAULT_REPEAT = 3
+RESULTS_FORMAT = 1
+
+CONSTRUCTS = tuple(sorted(VALID_CONSTRUCTS))
+EXERCISE_TYPES = tuple(sorted(VALID_TYPES))
+_NOTEBOOK_JSON = json.dumps(
+    {
+        "cells": [
+            {
+                "cell_type": "code",
+                "metadata": {"tags": ["exercise1"]},
+                "source": ["print('hello')\n"],
+            }
+        ],
+        "metadata": {},
+        "nbformat": 4,
+        "nbformat_minor": 5,
+    }
+)
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """Best-of-``repeat`` timing for one API at one library size."""
+
+    size: int
+    benchmark: str
+    operations: int
+    best_seconds: float
+
+    @property
+    def per_operation_us(self) -> float:
+        return self.best_seconds / self.operations * 1_000_000
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serialisable mapping of the result."""
+        return {**asdict(self), "per_operation_us": self.per_operation_us}
+
+
+class ParsedArgs(NamedTuple):
+    """Parsed command-line arguments."""
+
+    sizes: list[int]
+    repeat: int
+    output: Path | None
+
+
+def synthetic_exercise_key(index: int) -> str:
+    """Return the exercise key for the *index*-th synthetic exercise."""
+    construct = CONSTRUCTS[index % len(CONSTRUCTS)]
+    exercise_id = index // len(CONSTRUCTS) + 1
+    return f"ex{exercise_id:03d}_{construct}_synthetic_{index:05d}"
+
+
+def generate_exercise_library(exercises_root: Path, count: int) -> list[str]:
+    """Write *count* canonical synthetic exercises under *exercises_root*.
+
+    Exercises are assigned round-robin to constructs, so ``exercise_id`` values
+    stay unique within each construct, and exercise types cycle independently.
+
+    Returns:
+        The generated exercise keys, in generation order.
+    """
+    keys: list[str] = []
+    for index in range(count):
+        construct = CONSTRUCTS[index % len(CONSTRUCTS)]
+        exercise_key = synthetic_exercise_key(index)
+        exercise_dir = exercises_root / construct / exercise_key
+        (exercise_dir / "notebooks").mkdir(parents=True)
+        (exercise_dir / "tests").mkdir()
+        metadata = {
+            "schema_version": 1,
+            "exercise_key": exercise_key,
+            "exercise_id": index // len(CONSTRUCTS) + 1,
+            "slug": exercise_key,
+            "title": f"Synthetic {index}",
+            "construct": construct,
+            "exercise_type": EXERCISE_TYPES[index % len(EXERCISE_TYPES)],
+            "parts": 1,
+        }
+        (exercise_dir / "exercise.json").write_text(json.dumps(metadata), encoding="utf-8")
+        for variant in ("student", "solution"):
+            (exercise_dir / "notebooks" / f"{variant}.ipynb").write_text(
+                _NOTEBOOK_JSON, encoding="utf-8"
+            )
+        (exercise_dir / "tests" / f"test_{exercise_key}.py").write_text("", encoding="utf-8")
+        keys.append(exercise_key)
+    return keys
+
+
+def _best_of(repeat: int, action: Callable[[], object], *, setup: Callable[[], object]) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        setup()
+        started = time.perf_counter()
+        action()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def _benchmarks(
+    repo_root: Path,
+    keys: list[str],
+) -> list[tuple[str, int, Callable[[], object], Callable[[], object]]]:
+    """Return ``(name, operations, action, setup)`` for every benchmarked API."""
+    exercises_root = repo_root / "exercises"
+    index = get_exercise_index(exercises_root)
+    catalogue = ExerciseCatalogue.from_metadata(build_exercise_catalogue(exercises_root))
+    warm_selector = ExerciseSelector(repo_root)
+    warm_selector.get_all_exercise_keys()
+    pattern = f"ex001_{CONSTRUCTS[0]}_*"
+
+    def no_setup() -> None:
+        return None
+
+    def resolve_all_dirs() -> None:
+        for exercise_key in keys:
+            resolve_exercise_dir(exercise_key, exercises_root)
+
+    def resolve_all_notebooks() -> None:
+        for exercise_key in keys:
+            resolve_notebook_path(exercise_key, "student", exercises_root)
+
+    def look_up_all_entries() -> None:
+        for exercise_key in keys:
+            catalogue.entry(exercise_key)
+
+    return [
+        (
+            "build_exercise_registry.cold",
+            len(keys),
+            lambda: build_exercise_registry(exercises_root),
+            index.clear,
+        ),
+        (
+            "build_exercise_registry.warm",
+            len(keys),
+            lambda: build_exercise_registry(exercises_root),
+            no_setup,
+        ),
+        (
+            "build_exercise_catalogue",
+            len(keys),
+            lambda: build_exercise_catalogue(exercises_root),
+            no_setup,
+        ),
+        ("resolve_exercise_dir.cold", len(keys), resolve_all_dirs, index.clear),
+        ("resolve_exercise_dir.warm", len(keys), resolve_all_dirs, no_setup),
+        ("resolve_notebook_path.warm", len(keys), resolve_all_notebooks, no_setup),
+        ("ExerciseCatalogue.entry", len(keys), look_up_all_entries, no_setup),
+        (
+            "ExerciseSelector.select_by_construct.cold",
+            1,
+            lambda: ExerciseSelector(repo_root).select_by_construct([CONSTRUCTS[0]]),
+            no_setup,
+        ),
+        (
+            "ExerciseSelector.select_by_construct",
+            1,
+            lambda: warm_selector.select_by_construct([CONSTRUCTS[0]]),
+            no_setup,
+        ),
+        (
+            "ExerciseSelector.select_by_type",
+            1,
+            lambda: warm_selector.select_by_type([EXERCISE_TYPES[0]]),
+            no_setup,
+        ),
+        (
+            "ExerciseSelector.select_by_construct_and_type",
+            1,
+            lambda: warm_selector.select_by_construct_and_type(
+                [CONSTRUCTS[0]], [EXERCISE_TYPES[0]]
+            ),
+            no_setup,
+        ),
+        (
+            "ExerciseSelector.select_by_exercise_key_pattern",
+            1,
+            lambda: warm_selector.select_by_exercise_key_pattern(pattern),
+            no_setup,
+        ),
+    ]
+
+
+def run_benchmarks(sizes: Sequence[int], *, repeat: int = DEFAULT_REPEAT) -> list[BenchmarkResult]:
+    """Generate a library of each size and time every API against it."""
+    results: list[BenchmarkResult] = []
+    for size in sizes:
+        with tempfile.TemporaryDirectory(prefix="exercise_library_") as temp_dir:
+            repo_root = Path(temp_dir)
+            keys = generate_exercise_library(repo_root / "exercises", size)
+            for name, operations, action, setup in _benchmarks(repo_root, keys):
+                seconds = _best_of(repeat, action, setup=setup)
+                results.append(BenchmarkResult(size, name, operations, seconds))
+            get_exercise_index(repo_root / "exercises").clear()
+    return results
+
+
+def results_payload(results: Sequence[BenchmarkResult]) -> dict[str, Any]:
+    """Return the machine-readable report for *results*."""
+    return {
+        "format": RESULTS_FORMAT,
+        "python": platform.python_version(),
+        "platform": sys.platform,
+        "results": [result.to_dict() for result in results],
+    }
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {value!r}")
+    return number
+
+
+def parse_args(argv: Sequence[str] | None = None) -> ParsedArgs:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Time metadata and selection APIs against synthetic exercise libraries.",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument("--sizes", type=_positive_int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--repeat", type=_positive_int, default=DEFAULT_REPEAT)
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=None,
+        help="Write JSON results here instead of standard output.",
+    )
+    args = parser.parse_args(argv)
+    return ParsedArgs(sizes=args.sizes, repeat=args.repeat, output=args.output)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the benchmarks and emit JSON results."""
+    args = parse_args(argv)
+    payload = json.dumps(results_payload(run_benchmarks(args.sizes, repeat=args.repeat)), indent=2)
+    if args.output is None:
+        print(payload)
+    else:
+        args.output.write_text(payload + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -195,6 +195,7 @@ def _build_template_package(  # noqa: PLR0913
     packager.copy_exercise_files(workspace, files)
     packager.copy_construct_resources(workspace, exercises)
     packager.copy_template_base_files(workspace)
+    packager.write_compiled_catalogue(workspace)
     packager.generate_readme(workspace, template_name, exercises)
 
     if not packager.validate_package(workspace):
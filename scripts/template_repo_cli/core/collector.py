@@ -5,7 +5,7 @@ from __future__ import annotations
 from pathlib import Path
 from typing import TypedDict
 
-from exercise_metadata import resolve_exercise_dir
+from exercise_metadata import IndexedExercise, resolve_exercise_entry
 from exercise_metadata.resolver import resolve_notebook_path
 from exercise_runtime_support.pytest_collection_guard import (
     find_duplicate_exercise_test_sources,
@@ -34,14 +34,18 @@ class FileCollector:
         """
         self.repo_root: Path = repo_root
         self.exercises_dir: Path = repo_root / "exercises"
+        self._duplicate_test_sources: dict[str, list[Path]] | None = None
+
+    def _resolve_exercise(self, exercise_id: str) -> IndexedExercise:
+        """Resolve the indexed canonical locations for *exercise_id*."""
+        return resolve_exercise_entry(exercise_id, self.exercises_dir)
 
     def _resolve_exercise_dir(self, exercise_id: str) -> Path:
         """Resolve the canonical exercise directory for *exercise_id*."""
-        return resolve_exercise_dir(exercise_id, self.exercises_dir)
+        return self._resolve_exercise(exercise_id).exercise_dir
 
     def _canonical_test_path(self, exercise_id: str) -> Path:
-        exercise_dir = self._resolve_exercise_dir(exercise_id)
-        return exercise_dir / "tests" / f"test_{exercise_id}.py"
+        return self._resolve_exercise(exercise_id).tests_dir / f"test_{exercise_id}.py"
 
     def _canonical_exercise_json_path(self, exercise_id: str) -> Path:
         return self._resolve_exercise_dir(exercise_id) / "exercise.json"
@@ -63,16 +67,19 @@ class FileCollector:
             / "student.ipynb"
         )
 
-    def _raise_for_duplicate_test_sources(self, exercise_id: str) -> None:
-        candidate_paths: list[Path] = []
-        candidate_paths.extend(
-            path.relative_to(self.repo_root)
-            for path in self.exercises_dir.rglob(f"test_{exercise_id}.py")
-            if path.is_file()
-        )
+    def _find_duplicate_test_sources(self) -> dict[str, list[Path]]:
+        """Scan the exercises tree for duplicate test sources once per collector."""
+        if self._duplicate_test_sources is None:
+            candidate_paths = [
+                path.relative_to(self.repo_root)
+                for path in self.exercises_dir.rglob("test_*.py")
+                if path.is_file()
+            ]
+            self._duplicate_test_sources = find_duplicate_exercise_test_sources(candidate_paths)
+        return self._duplicate_test_sources
 
-        duplicates = find_duplicate_exercise_test_sources(candidate_paths)
-        duplicate_paths = duplicates.get(exercise_id)
+    def _raise_for_duplicate_test_sources(self, exercise_id: str) -> None:
+        duplicate_paths = self._find_duplicate_test_sources().get(exercise_id)
         if duplicate_paths:
             duplicate_list = "\n".join(str(path) for path in duplicate_paths)
             raise FileExistsError(
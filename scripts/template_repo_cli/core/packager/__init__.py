@@ -6,6 +6,10 @@ import shutil
 import tempfile
 from pathlib import Path
 
+from exercise_metadata.compiled_catalogue import (
+    COMPILED_CATALOGUE_FILENAME,
+    write_compiled_catalogue,
+)
 from scripts.template_repo_cli.core.collector import ExerciseFiles
 from scripts.template_repo_cli.utils.filesystem import safe_copy_directory, safe_copy_file
 
@@ -276,6 +280,24 @@ class TemplatePackager:
         self._copy_directory(".devcontainer", workspace)
         self._copy_directory(".github", workspace)
 
+    def write_compiled_catalogue(self, workspace: Path) -> Path:
+        """Compile the catalogue of the packaged exercises into the workspace.
+
+        The packaged runtime loads this file instead of scanning every
+        ``exercise.json`` on start-up, and falls back to the scan if the file is
+        missing or no longer matches the exercises on disk.
+
+        Args:
+            workspace: Workspace directory containing the copied exercises.
+
+        Returns:
+            Path to the written catalogue file.
+        """
+        return write_compiled_catalogue(
+            workspace / "exercise_metadata" / COMPILED_CATALOGUE_FILENAME,
+            exercises_root=workspace / "exercises",
+        )
+
     def generate_readme(self, workspace: Path, template_name: str, exercises: list[str]) -> None:
         """Generate README file.
 
@@ -404,9 +426,7 @@ class TemplatePackager:
             workspace / ".github" / "workflows" / "classroom.yml",
             workspace / "exercise_metadata" / "__init__.py",
         ]
-        required_files.extend(
-            workspace / "scripts" / script for script in self.REQUIRED_SCRIPTS
-        )
+        required_files.extend(workspace / "scripts" / script for script in self.REQUIRED_SCRIPTS)
 
         tests_dir = workspace / "tests"
         required_files.extend(
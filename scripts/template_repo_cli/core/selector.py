@@ -2,12 +2,10 @@
 
 from __future__ import annotations
 
-import fnmatch
-from collections.abc import Callable
 from pathlib import Path
 
-from exercise_metadata import RegistryEntry, build_exercise_registry
-from exercise_metadata.schema import ExerciseMetadata
+from exercise_metadata import build_exercise_catalogue
+from exercise_runtime_support.exercise_catalogue import ExerciseCatalogue
 from scripts.template_repo_cli.utils.validation import (
     validate_construct_name,
     validate_notebook_pattern,
@@ -26,14 +24,30 @@ class ExerciseSelector:
         """
         self.repo_root = repo_root
         self.exercises_dir = repo_root / "exercises"
+        self._catalogue: ExerciseCatalogue | None = None
 
-    def _get_registry(self) -> list[RegistryEntry]:
-        """Return the metadata-backed exercise registry."""
-        return build_exercise_registry(exercises_root=self.exercises_dir)
+    def _get_catalogue(self) -> ExerciseCatalogue:
+        """Return the indexed catalogue, built from registry metadata on first use."""
+        if self._catalogue is None:
+            self._catalogue = ExerciseCatalogue.from_metadata(
+                build_exercise_catalogue(exercises_root=self.exercises_dir)
+            )
+        return self._catalogue
 
-    def _all_metadata_exercise_keys(self) -> list[str]:
-        """Return every exercise key backed by registry metadata."""
-        return self._filter_metadata_exercise_keys(lambda _exercise_key, _metadata: True)
+    def _select_keys(
+        self,
+        *,
+        constructs: list[str] | None = None,
+        types: list[str] | None = None,
+        pattern: str | None = None,
+    ) -> list[str]:
+        """Return sorted exercise keys matching every given filter."""
+        entries = self._get_catalogue().select(
+            constructs=constructs,
+            exercise_types=types,
+            key_pattern=pattern,
+        )
+        return sorted(entry.exercise_key for entry in entries)
 
     def get_all_exercise_keys(self) -> list[str]:
         """Get all available exercise keys.
@@ -41,8 +55,7 @@ class ExerciseSelector:
         Returns:
             List of exercise keys.
         """
-        exercise_keys = self._all_metadata_exercise_keys()
-        return sorted(set(exercise_keys))
+        return sorted(self._get_catalogue().exercise_keys)
 
     def _validate_constructs(self, constructs: list[str]) -> None:
         """Validate construct names.
@@ -76,18 +89,6 @@ class ExerciseSelector:
             if not validate_type_name(type_name):
                 raise ValueError(f"Invalid type: {type_name}")
 
-    def _filter_metadata_exercise_keys(
-        self,
-        predicate: Callable[[str, ExerciseMetadata], bool],
-    ) -> list[str]:
-        """Return metadata-backed exercise keys selected via the registry."""
-        matches: list[str] = []
-        for entry in self._get_registry():
-            metadata = entry["metadata"]
-            if predicate(entry["exercise_key"], metadata):
-                matches.append(entry["exercise_key"])
-        return matches
-
     def select_by_construct(self, constructs: list[str]) -> list[str]:
         """Select exercises by construct.
 
@@ -102,10 +103,7 @@ class ExerciseSelector:
         """
         self._validate_constructs(constructs)
 
-        exercises = self._filter_metadata_exercise_keys(
-            lambda _exercise_key, metadata: metadata["construct"] in constructs,
-        )
-        return sorted(set(exercises))
+        return self._select_keys(constructs=constructs)
 
     def select_by_type(self, types: list[str]) -> list[str]:
         """Select exercises by type.
@@ -121,10 +119,7 @@ class ExerciseSelector:
         """
         self._validate_types(types)
 
-        exercises = self._filter_metadata_exercise_keys(
-            lambda _exercise_key, metadata: metadata["exercise_type"] in types,
-        )
-        return sorted(set(exercises))
+        return self._select_keys(types=types)
 
     def select_by_construct_and_type(self, constructs: list[str], types: list[str]) -> list[str]:
         """Select exercises by construct AND type.
@@ -139,12 +134,7 @@ class ExerciseSelector:
         self._validate_constructs(constructs)
         self._validate_types(types)
 
-        exercises = self._filter_metadata_exercise_keys(
-            lambda _exercise_key, metadata: (
-                metadata["construct"] in constructs and metadata["exercise_type"] in types
-            ),
-        )
-        return sorted(set(exercises))
+        return self._select_keys(constructs=constructs, types=types)
 
     def select_by_exercise_keys(self, exercise_keys: list[str]) -> list[str]:
         """Select specific exercise keys.
@@ -161,10 +151,10 @@ class ExerciseSelector:
         if not exercise_keys:
             raise ValueError("At least one exercise key must be specified")
 
-        available = self.get_all_exercise_keys()
+        catalogue = self._get_catalogue()
 
         for exercise_key in exercise_keys:
-            if exercise_key not in available:
+            if exercise_key not in catalogue:
                 raise ValueError(f"Exercise key not found: {exercise_key}")
 
         return sorted(exercise_keys)
@@ -184,11 +174,4 @@ class ExerciseSelector:
         if not validate_notebook_pattern(pattern):
             raise ValueError(f"Invalid pattern: {pattern}")
 
-        all_exercise_keys = self.get_all_exercise_keys()
-        matching = [
-            exercise_key
-            for exercise_key in all_exercise_keys
-            if fnmatch.fnmatch(exercise_key, pattern)
-        ]
-
-        return sorted(matching)
+        return self._select_keys(pattern=pattern)
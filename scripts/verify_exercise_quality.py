@@ -5,7 +5,8 @@ This script supports the Exercise Reviewer agent by performing fast,
 objective checks against ``exercises/<construct>/<exercise_key>/``:
 - Notebook structure: metadata.language, code-vs-tag consistency
 - Presence of expected tags (exerciseN, explanationN)
-- Basic concept progression scanning (heuristic keyword checks)
+- Basic concept progression scanning (heuristic token checks that skip strings
+  and comments, reported by cell and line)
 - Presence of required canonical exercise files under exercises/
 - Construct teaching order updated (exercises/<construct>/OrderOfTeaching.md)
 - Student checker support module, expectations module, variant overrides,
@@ -23,14 +24,17 @@ replacement for reading the exercise prompts.
 from __future__ import annotations
 
 import argparse
+import io
 import json
 import os
 import re
+import tokenize
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, TypedDict, TypeGuard, cast
 
 from exercise_metadata import load_exercise_metadata, resolve_exercise_dir
+from exercise_runtime_support.notebook_reader import load_notebook
 
 CONSTRUCT_ORDER: list[str] = [
     "sequence",
@@ -139,7 +143,7 @@ def _is_notebook_document(value: object) -> TypeGuard[NotebookDocument]:
 
 def _load_notebook(path: Path) -> NotebookDocument:
     try:
-        raw = json.loads(path.read_text(encoding="utf-8"))
+        raw = load_notebook(path)
     except FileNotFoundError as exc:
         raise SystemExit(f"Notebook not found: {path}") from exc
     except json.JSONDecodeError as exc:
@@ -488,57 +492,54 @@ def _check_notebook_structure(
     return findings
 
 
-def _progression_rules() -> dict[str, list[re.Pattern[str]]]:
-    # Patterns that indicate the presence of a construct.
-    # These are heuristic checks and intentionally conservative.
-    return {
-        "selection": [
-            re.compile(r"\bif\b"),
-            re.compile(r"\belif\b"),
-            re.compile(r"\belse\b"),
-        ],
-        "iteration": [
-            re.compile(r"\bfor\b"),
-            re.compile(r"\bwhile\b"),
-            re.compile(r"\bbreak\b"),
-            re.compile(r"\bcontinue\b"),
-            re.compile(r"\brange\s*\("),
-        ],
-        "data_types": [
-            re.compile(r"\bint\s*\("),
-            re.compile(r"\bfloat\s*\("),
-            re.compile(r"\bstr\s*\("),
-        ],
-        "lists": [
-            re.compile(r"\[[^\]]*\]"),
-            re.compile(r"\.append\s*\("),
-            re.compile(r"\blen\s*\("),
-            re.compile(r"\.sort\s*\("),
-        ],
-        "dictionaries": [
-            re.compile(r"\{[^}]*:[^}]*\}"),
-            re.compile(r"\.get\s*\("),
-            re.compile(r"\.items\s*\("),
-        ],
-        "functions": [
-            re.compile(r"^\s*def\s+", re.MULTILINE),
-            re.compile(r"\breturn\b"),
-        ],
-        "file_handling": [re.compile(r"\bopen\s*\("), re.compile(r"\bwith\s+open\b")],
-        "exceptions": [
-            re.compile(r"\btry\b"),
-            re.compile(r"\bexcept\b"),
-            re.compile(r"\braise\b"),
-        ],
-        "libraries": [
-            re.compile(r"^\s*import\b", re.MULTILINE),
-            re.compile(r"^\s*from\s+\w+\s+import\b", re.MULTILINE),
-        ],
-        "oop": [
-            re.compile(r"^\s*class\s+", re.MULTILINE),
-            re.compile(r"\bself\b\s*\."),
-        ],
-    }
+# Construct-progression rules, evaluated together by ``_scan_cell_progression``.
+# Each table maps a token to the construct it indicates; the checks are
+# heuristic and intentionally conservative. ``def`` and ``return`` are handled
+# separately so that a single ``solve()`` wrapper is allowed.
+_KEYWORD_CONSTRUCTS: dict[str, str] = {
+    "if": "selection",
+    "elif": "selection",
+    "else": "selection",
+    "for": "iteration",
+    "while": "iteration",
+    "break": "iteration",
+    "continue": "iteration",
+    "try": "exceptions",
+    "except": "exceptions",
+    "raise": "exceptions",
+    "import": "libraries",
+    "class": "oop",
+}
+_CALL_CONSTRUCTS: dict[str, str] = {
+    "range": "iteration",
+    "int": "data_types",
+    "float": "data_types",
+    "str": "data_types",
+    "len": "lists",
+    "open": "file_handling",
+}
+_METHOD_CONSTRUCTS: dict[str, str] = {
+    "append": "lists",
+    "sort": "lists",
+    "get": "dictionaries",
+    "items": "dictionaries",
+}
+_ALLOWED_FUNCTION = "solve"
+_SKIPPED_TOKEN_TYPES = frozenset(
+    {tokenize.COMMENT, tokenize.NL, tokenize.ENCODING, tokenize.ERRORTOKEN}
+)
+# Python 3.12+ splits f-strings into tokens; their contents are skipped like
+# any other string.
+_FSTRING_START: int | None = getattr(tokenize, "FSTRING_START", None)
+_FSTRING_END: int | None = getattr(tokenize, "FSTRING_END", None)
+
+
+@dataclass(frozen=True)
+class _ProgressionHit:
+    construct: str
+    token: str
+    cell: int
+    line: int
 
 
 def _index_of_construct(construct: str) -> int:
@@ -548,15 +549,102 @@ def _index_of_construct(construct: str) -> int:
         return -1
 
 
-def _scan_for_progression_violations(  # noqa: C901
+class _CellProgressionScanner:
+    """Single pass over one cell's tokens recording the first hit per construct."""
+
+    def __init__(self, cell: int) -> None:
+        self.cell = cell
+        self.hits: dict[str, _ProgressionHit] = {}
+        self._brackets: list[str] = []
+        self._indent = 0
+        self._def_indents: list[tuple[str, int]] = []
+        self._previous: list[tokenize.TokenInfo] = []
+        self._fstring_depth = 0
+
+    def feed(self, tok: tokenize.TokenInfo) -> None:
+        if tok.type == _FSTRING_START:
+            self._fstring_depth += 1
+        elif tok.type == _FSTRING_END:
+            self._fstring_depth -= 1
+        elif self._fstring_depth == 0 and tok.type not in _SKIPPED_TOKEN_TYPES:
+            self._feed_code(tok)
+
+    def _hit(self, construct: str, label: str, tok: tokenize.TokenInfo) -> None:
+        self.hits.setdefault(construct, _ProgressionHit(construct, label, self.cell, tok.start[0]))
+
+    def _feed_code(self, tok: tokenize.TokenInfo) -> None:
+        if tok.type == tokenize.INDENT:
+            self._indent += 1
+        elif tok.type == tokenize.DEDENT:
+            self._indent -= 1
+            while self._def_indents and self._def_indents[-1][1] >= self._indent:
+                self._def_indents.pop()
+        elif tok.type == tokenize.NAME:
+            self._feed_name(tok)
+        elif tok.type == tokenize.OP:
+            self._feed_op(tok)
+        self._previous = [*self._previous[-1:], tok]
+
+    def _feed_name(self, tok: tokenize.TokenInfo) -> None:
+        previous = self._previous[-1] if self._previous else None
+        if previous is not None and previous.string == "def":
+            self._def_indents.append((tok.string, self._indent))
+            if tok.string != _ALLOWED_FUNCTION:
+                self._hit("functions", "def", previous)
+        elif tok.string == "return":
+            if not any(name == _ALLOWED_FUNCTION for name, _ in self._def_indents):
+                self._hit("functions", "return", tok)
+        elif tok.string in _KEYWORD_CONSTRUCTS:
+            self._hit(_KEYWORD_CONSTRUCTS[tok.string], tok.string, tok)
+
+    def _feed_op(self, tok: tokenize.TokenInfo) -> None:
+        text = tok.string
+        if text == "(":
+            self._feed_call(tok)
+        if text in {"(", "[", "{"}:
+            self._brackets.append(text)
+            if text == "[":
+                self._hit("lists", "[...]", tok)
+        elif text in {")", "]", "}"}:
+            if self._brackets:
+                self._brackets.pop()
+        elif text == ":" and self._brackets[-1:] == ["{"]:
+            self._hit("dictionaries", "{key: value}", tok)
+        elif text == "." and self._previous and self._previous[-1].string == "self":
+            self._hit("oop", "self.", tok)
+
+    def _feed_call(self, tok: tokenize.TokenInfo) -> None:
+        if not self._previous or self._previous[-1].type != tokenize.NAME:
+            return
+        name = self._previous[-1].string
+        is_method = len(self._previous) > 1 and self._previous[-2].string == "."
+        constructs = _METHOD_CONSTRUCTS if is_method else _CALL_CONSTRUCTS
+        if name in constructs:
+            label = f".{name}()" if is_method else f"{name}()"
+            self._hit(constructs[name], label, tok)
+
+
+def _scan_cell_progression(cell: int, source: str) -> dict[str, _ProgressionHit]:
+    """Tokenise *source* once and return the first hit for each construct.
+
+    Strings and comments are ignored. Cells that stop tokenising (debug
+    exercises may contain deliberate syntax errors) keep the hits found so far.
+    """
+    scanner = _CellProgressionScanner(cell)
+    try:
+        for tok in tokenize.generate_tokens(io.StringIO(source).readline):
+            scanner.feed(tok)
+    except (tokenize.TokenError, SyntaxError):
+        pass
+    return scanner.hits
+
+
+def _scan_for_progression_violations(
     *,
-    text: str,
+    cells: list[tuple[int, str]],
     allowed_construct: str,
     path: Path,
 ) -> list[Finding]:
-    findings: list[Finding] = []
-
-    rules = _progression_rules()
     allowed_idx = _index_of_construct(allowed_construct)
     if allowed_idx < 0:
         return [
@@ -567,68 +655,38 @@ def _scan_for_progression_violations(  # noqa: C901
             )
         ]
 
-    # If we're in construct K, then constructs strictly after K are disallowed.
-    disallowed = CONSTRUCT_ORDER[allowed_idx + 1 :]
-
-    for construct in disallowed:
-        for pat in rules.get(construct, []):
-            # Special-case: allow a single top-level `def solve()` wrapper (and returns inside it)
-            if construct == "functions":
-                func_defs = list(re.finditer(r"^\s*def\s+([A-Za-z_]\w*)\s*\(", text, re.M))
-                # If there are any named functions other than `solve`, report as before
-                other_funcs = [m for m in func_defs if m.group(1) != "solve"]
-                if other_funcs:
-                    findings.append(
-                        Finding(
-                            "WARN",
-                            f"Possible progression violation: found {construct} pattern {pat.pattern!r}",
-                            path=path,
-                        )
-                    )
-                    break
-                # If pattern is the def pattern and only `solve` exists, skip warning
-                if pat.pattern == r"^\s*def\s+" and func_defs:
-                    continue
-                # If pattern is the return pattern, ensure all returns are inside solve()
-                if pat.pattern == r"\breturn\b" and func_defs:
-                    # Build solve() regions and ensure every 'return' is inside some solve() region
-                    regions: list[tuple[int, int]] = []
-                    for idx, m in enumerate(func_defs):
-                        s = m.start()
-                        e = func_defs[idx + 1].start() if idx + 1 < len(func_defs) else len(text)
-                        regions.append((s, e))
-                    return_positions = [m.start() for m in re.finditer(r"\breturn\b", text)]
-                    if return_positions and all(
-                        any(s <= pos < e for s, e in regions) for pos in return_positions
-                    ):
-                        continue
-                # otherwise fallthrough to regular warning
-
-            if pat.search(text):
-                findings.append(
-                    Finding(
-                        "WARN",
-                        f"Possible progression violation: found {construct} pattern {pat.pattern!r}",
-                        path=path,
-                    )
-                )
-                break
+    hits: dict[str, _ProgressionHit] = {}
+    for cell, source in cells:
+        for construct, hit in _scan_cell_progression(cell, source).items():
+            hits.setdefault(construct, hit)
 
-    return findings
+    # If we're in construct K, then constructs strictly after K are disallowed.
+    return [
+        Finding(
+            "WARN",
+            f"Possible progression violation: found {construct} construct {hit.token!r} "
+            f"(cell {hit.cell}, line {hit.line})",
+            path=path,
+        )
+        for construct in CONSTRUCT_ORDER[allowed_idx + 1 :]
+        if (hit := hits.get(construct)) is not None
+    ]
 
 
-def _collect_code_cell_text(nb: NotebookDocument) -> str:
-    """Collect source text from code cells that have an ``exerciseN`` tag.
+def _collect_code_cells(nb: NotebookDocument) -> list[tuple[int, str]]:
+    """Return ``(cell number, source)`` for code cells that have an ``exerciseN`` tag.
 
     Only cells tagged with ``exercise1``, ``exercise2``, etc. are included.
     Untagged infrastructure cells (scratch, self-checker) are excluded to
-    avoid false-positive progression warnings.
+    avoid false-positive progression warnings. Cell numbers count every cell
+    in the notebook from 1, and sources keep their original line breaks so
+    progression findings report real line numbers.
     """
     cells = nb.get("cells")
     if not isinstance(cells, list):
-        return ""
-    code_chunks: list[str] = []
-    for cell in cells:
+        return []
+    code_cells: list[tuple[int, str]] = []
+    for number, cell in enumerate(cells, start=1):
         if not _is_notebook_cell(cell):
             continue
         cell_type = cell.get("cell_type")
@@ -637,8 +695,9 @@ def _collect_code_cell_text(nb: NotebookDocument) -> str:
         tags = _cell_tags(cell)
         if not any(_EXERCISE_TAG_RE.match(tag) for tag in tags):
             continue
-        code_chunks.append(_cell_source_text(cell))
-    return "\n\n".join(code_chunks)
+        source = cell.get("source", "")
+        code_cells.append((number, "".join(source) if isinstance(source, list) else source))
+    return code_cells
 
 
 def _collect_notebook_tag_sets(nb: NotebookDocument) -> tuple[set[str], set[str]]:
@@ -818,14 +877,14 @@ def _collect_progression_findings(
         return []
 
     findings = _scan_for_progression_violations(
-        text=_collect_code_cell_text(nb_student),
+        cells=_collect_code_cells(nb_student),
         allowed_construct=construct,
         path=nb_path,
     )
     if nb_solution is not None:
         findings.extend(
             _scan_for_progression_violations(
-                text=_collect_code_cell_text(nb_solution),
+                cells=_collect_code_cells(nb_solution),
                 allowed_construct=construct,
                 path=nb_solution_path,
             )
@@ -6,10 +6,18 @@ metadata (task numbers, friendly names), and records captured output for the
 final report. Error handling will prioritise resilience: the hooks will guard
 against unexpected pytest objects and fall back to safe defaults so that a
 malformed test cannot abort the entire grading run.
+
+Under pytest-xdist (``pytest -n auto``) each worker collects and records its
+own results but never writes the results file. At session end a worker hands
+its results, collected metadata, notes and errors to the controller through
+``config.workeroutput``; the controller merges every worker's share in
+``pytest_testnodedown``, orders the tests as they were collected, and computes
+the scores and writes the JSON once.
 """
 
 from __future__ import annotations
 
+import contextlib
 import inspect
 import json
 import sys
@@ -19,6 +27,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, cast
 
+import pytest
+
 _pytest_fatal_types: tuple[type[BaseException], ...]
 
 try:
@@ -38,6 +48,7 @@ except ImportError:
 
 ELLIPSIS_GUARD_LENGTH = 3
 LOCATION_MIN_LENGTH = 2
+WORKER_OUTPUT_KEY = "autograde"
 
 
 def _is_fatal_control_flow_exception(error: BaseException) -> bool:
@@ -70,6 +81,10 @@ def _empty_extra() -> dict[str, Any]:
     return {}
 
 
+def _empty_collection_order() -> list[str]:
+    return []
+
+
 _autograde_state: AutogradeState | None = None
 
 
@@ -114,6 +129,9 @@ class AutogradeState:
     results_path: Path | None = None
     metadata: dict[str, AutogradeTestMetadata] = field(default_factory=_empty_metadata)
     reported_nodeids: set[str] = field(default_factory=_empty_reported_nodeids)
+    metrics_sink: Any | None = None
+    metrics_scope: contextlib.ExitStack | None = None
+    collection_order: list[str] = field(default_factory=_empty_collection_order)
 
 
 @dataclass(slots=True)
@@ -416,6 +434,15 @@ def pytest_addoption(parser: Any) -> None:
             "optional for local runs."
         ),
     )
+    group.addoption(
+        "--autograde-metrics",
+        action="store_true",
+        default=False,
+        help=(
+            "Record wall time, CPU time, peak memory, input() calls and stdout size "
+            "for each notebook cell execution in the result's 'extra' field."
+        ),
+    )
 
 
 def pytest_configure(config: Any) -> None:
@@ -445,9 +472,54 @@ def pytest_configure(config: Any) -> None:
         if warning not in state.notes:
             state.notes.append(warning)
 
+    if _option_enabled(config, "autograde_metrics") and state.metrics_scope is None:
+        _start_metrics_collection(state)
+
     _set_autograde_state(state)
 
 
+def _option_enabled(config: Any, name: str) -> bool:
+    try:
+        return bool(config.getoption(name))
+    except BaseException as error:  # pragma: no cover - defensive for unexpected config
+        if _is_fatal_control_flow_exception(error):
+            raise
+        return False
+
+
+def _start_metrics_collection(state: AutogradeState) -> None:
+    """Route notebook execution metrics into an in-memory sink for this session."""
+
+    try:
+        from exercise_runtime_support.execution_metrics import (
+            InMemoryMetricsSink,
+            use_metrics_sink,
+        )
+    except ImportError as error:
+        state.notes.append(f"Autograde metrics unavailable: {error}")
+        return
+
+    sink = InMemoryMetricsSink()
+    scope = contextlib.ExitStack()
+    scope.enter_context(use_metrics_sink(sink))
+    state.metrics_sink = sink
+    state.metrics_scope = scope
+
+
+def _drain_metrics(state: AutogradeState) -> list[dict[str, Any]]:
+    if state.metrics_sink is None:
+        return []
+    return [record.to_dict() for record in state.metrics_sink.drain()]
+
+
+def pytest_runtest_logstart(nodeid: str, location: Any) -> None:
+    """Discard metrics recorded outside the test that is about to run."""
+
+    state = _get_autograde_state()
+    if isinstance(state, AutogradeState):
+        _drain_metrics(state)
+
+
 def pytest_collection_modifyitems(config: Any, items: list[Any]) -> None:
     """Augment collected tests with autograde metadata before execution."""
 
@@ -520,6 +592,10 @@ def pytest_runtest_logreport(report: Any) -> None:
             context=context,
         )
 
+    metrics = _drain_metrics(state)
+    if metrics:
+        result.extra["metrics"] = metrics
+
     state.results.append(result)
     state.reported_nodeids.add(nodeid)
     state.total_score += result.score
@@ -637,6 +713,12 @@ def pytest_sessionfinish(session: Any, exitstatus: int) -> None:
 
     state.end_timestamp = time.time()
 
+    if _is_xdist_worker(session.config):
+        session.config.workeroutput[WORKER_OUTPUT_KEY] = _worker_payload(state)
+        _close_metrics_collection(state)
+        return
+
+    _order_results(state)
     results_payload = [_result_to_dict(res) for res in state.results]
     earned_score, max_score = _compute_final_scores(state, results_payload)
     state.max_score = max_score
@@ -647,6 +729,184 @@ def pytest_sessionfinish(session: Any, exitstatus: int) -> None:
     if state.results_path:
         _write_json_with_fallback(payload, state.results_path, state)
 
+    _close_metrics_collection(state)
+
+
+def _close_metrics_collection(state: AutogradeState) -> None:
+    if state.metrics_scope is not None:
+        state.metrics_scope.close()
+        state.metrics_scope = None
+        state.metrics_sink = None
+
+
+def _is_xdist_worker(config: Any) -> bool:
+    """Return True when running inside a pytest-xdist worker process."""
+
+    return hasattr(config, "workerinput")
+
+
+def _metadata_to_dict(metadata: AutogradeTestMetadata) -> dict[str, Any]:
+    return {
+        "name": metadata.display_name,
+        "taskno": metadata.task_number,
+        "marker_name": metadata.marker_name,
+    }
+
+
+def _worker_payload(state: AutogradeState) -> dict[str, Any]:
+    """Serialise one worker's share of the run for the xdist controller."""
+
+    return {
+        "tests": [_result_to_dict(res) for res in state.results],
+        "metadata": {
+            nodeid: _metadata_to_dict(metadata) for nodeid, metadata in state.metadata.items()
+        },
+        "notes": list(state.notes),
+        "errors": list(state.encountered_errors),
+    }
+
+
+def _optional_int(value: Any) -> int | None:
+    return value if isinstance(value, int) and not isinstance(value, bool) else None
+
+
+def _optional_float(value: Any) -> float | None:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return float(value)
+
+
+def _optional_str(value: Any) -> str | None:
+    return value if isinstance(value, str) else None
+
+
+def _result_from_dict(entry: dict[str, Any]) -> AutogradeTestResult | None:
+    """Rebuild a result serialised by :func:`_result_to_dict`, or None when malformed."""
+
+    nodeid = entry.get("nodeid")
+    status = entry.get("status")
+    if not isinstance(nodeid, str) or not isinstance(status, str):
+        return None
+    extra = entry.get("extra")
+    return AutogradeTestResult(
+        nodeid=nodeid,
+        display_name=_optional_str(entry.get("name")) or derive_display_name(nodeid, doc=None),
+        task_number=_optional_int(entry.get("taskno")),
+        status=status,
+        score=_optional_float(entry.get("score")) or 0.0,
+        message=_optional_str(entry.get("message")),
+        line_number=_optional_int(entry.get("line_no")),
+        duration=_optional_float(entry.get("duration")),
+        captured_stdout=_optional_str(entry.get("stdout")),
+        captured_stderr=_optional_str(entry.get("stderr")),
+        captured_log=_optional_str(entry.get("log")),
+        extra=cast(dict[str, Any], extra) if isinstance(extra, dict) else {},
+    )
+
+
+def _merge_worker_metadata(state: AutogradeState, raw_metadata: Any) -> None:
+    if not isinstance(raw_metadata, dict):
+        return
+    for nodeid, raw_entry in cast(dict[object, object], raw_metadata).items():
+        if not isinstance(nodeid, str) or not isinstance(raw_entry, dict):
+            continue
+        entry = cast(dict[str, Any], raw_entry)
+        state.metadata.setdefault(
+            nodeid,
+            AutogradeTestMetadata(
+                display_name=_optional_str(entry.get("name"))
+                or derive_display_name(nodeid, doc=None),
+                task_number=_optional_int(entry.get("taskno")),
+                marker_name=_optional_str(entry.get("marker_name")),
+            ),
+        )
+
+
+def _merge_messages(target: list[str], raw_messages: Any) -> None:
+    if not isinstance(raw_messages, list):
+        return
+    for message in cast(list[object], raw_messages):
+        if isinstance(message, str) and message not in target:
+            target.append(message)
+
+
+def _merge_worker_payload(state: AutogradeState, payload: Any) -> None:
+    """Fold one worker's results into the controller state.
+
+    A worker's result replaces any entry the controller recorded for the same
+    test from the replayed report, since only the worker saw the test's
+    metadata and metrics.
+    """
+
+    if not isinstance(payload, dict):
+        return
+    data = cast(dict[str, Any], payload)
+    _merge_worker_metadata(state, data.get("metadata"))
+    _merge_messages(state.notes, data.get("notes"))
+    _merge_messages(state.encountered_errors, data.get("errors"))
+
+    raw_tests = data.get("tests")
+    if not isinstance(raw_tests, list):
+        return
+    positions = {result.nodeid: index for index, result in enumerate(state.results)}
+    for raw_entry in cast(list[object], raw_tests):
+        if not isinstance(raw_entry, dict):
+            continue
+        result = _result_from_dict(cast(dict[str, Any], raw_entry))
+        if result is None:
+            continue
+        if result.nodeid in positions:
+            state.results[positions[result.nodeid]] = result
+        else:
+            positions[result.nodeid] = len(state.results)
+            state.results.append(result)
+        state.reported_nodeids.add(result.nodeid)
+
+
+def _order_results(state: AutogradeState) -> None:
+    """Sort results into collection order so the report is stable across workers."""
+
+    if not state.collection_order:
+        return
+    order = {nodeid: index for index, nodeid in enumerate(state.collection_order)}
+    unknown = len(order)
+    state.results.sort(key=lambda result: order.get(result.nodeid, unknown))
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_node_collection_finished(node: Any, ids: Sequence[str]) -> None:
+    """Remember the collection order reported by the first xdist worker."""
+
+    state = _get_autograde_state()
+    if isinstance(state, AutogradeState) and not state.collection_order:
+        state.collection_order = list(ids)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node: Any, error: Any) -> None:
+    """Merge the results a finished xdist worker sent back to the controller."""
+
+    state = _get_autograde_state()
+    if not isinstance(state, AutogradeState):
+        return
+
+    workeroutput = getattr(node, "workeroutput", None)
+    payload: Any = None
+    if isinstance(workeroutput, dict):
+        payload = cast(dict[str, Any], workeroutput).get(WORKER_OUTPUT_KEY)
+    if payload is not None:
+        _merge_worker_payload(state, payload)
+
+    gateway_id = getattr(getattr(node, "gateway", None), "id", "unknown worker")
+    if error is not None:
+        message = f"xdist worker {gateway_id} went down: {error}"
+    elif payload is None:
+        message = f"xdist worker {gateway_id} finished without sending autograde results"
+    else:
+        return
+    if message not in state.encountered_errors:
+        state.encountered_errors.append(message)
+
 
 def pytest_terminal_summary(terminalreporter: Any) -> None:
     """Emit a concise summary tailored for the GitHub Classroom autograder."""
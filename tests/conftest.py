@@ -8,6 +8,14 @@ from pathlib import Path
 
 import pytest
 
+from exercise_runtime_support.student_checker.state import SELF_CHECK_STATE_ENV_VAR
+
+
+@pytest.fixture(autouse=True)
+def _no_self_check_state(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep incremental self-checks from writing state next to repository notebooks."""
+    monkeypatch.setenv(SELF_CHECK_STATE_ENV_VAR, "0")
+
 
 @pytest.fixture
 def repo_root() -> Path:
@@ -21,6 +21,7 @@ from exercise_runtime_support.exercise_framework.api import (
     run_detailed_ex002_check,
     run_notebook_check,
 )
+from exercise_runtime_support.notebook_grader import DefaultInputOutput
 from exercise_runtime_support.support_matrix import SupportRole, has_support_role
 
 EXPECTED_EX002_DETAILED_CHECK_COUNT = 30
@@ -99,22 +100,22 @@ def test_run_notebook_check_passes_exercise_key_to_runtime_helper(
 ) -> None:
     captured_arguments: list[tuple[object, str]] = []
 
-    def fake_run_cell_and_capture_output(
+    def fake_run_cell_with_default_inputs(
         notebook_path: object,
         *,
         tag: str,
-    ) -> str:
+    ) -> DefaultInputOutput:
         captured_arguments.append((notebook_path, tag))
         assert notebook_path == "ex004_sequence_debug_syntax"
         assert isinstance(notebook_path, str)
         assert not isinstance(notebook_path, Path)
         assert not notebook_path.startswith("notebooks/")
-        return ""
+        return DefaultInputOutput(output="", inputs_consumed=0)
 
     monkeypatch.setattr(
         framework_api.runtime,
-        "run_cell_and_capture_output",
-        fake_run_cell_and_capture_output,
+        "run_cell_with_default_inputs",
+        fake_run_cell_with_default_inputs,
     )
 
     results = run_notebook_check("ex004_sequence_debug_syntax")
@@ -132,7 +133,10 @@ def test_package_surface_re_exports_expectations_symbols() -> None:
         "extract_tagged_code": framework_runtime,
         "get_explanation_cell": framework_runtime,
         "run_cell_and_capture_output": framework_runtime,
+        "run_cell_with_default_inputs": framework_runtime,
         "run_cell_with_input": framework_runtime,
+        "run_cell_with_input_cases": framework_runtime,
+        "run_notebook_once": framework_runtime,
         "expected_output_lines": framework_expectations,
         "expected_output_text": framework_expectations,
         "expected_print_call_count": framework_expectations,
@@ -162,9 +166,12 @@ def test_package_surface_re_exports_expectations_symbols() -> None:
         "resolve_notebook_path",
         "run_all_checks",
         "run_cell_and_capture_output",
+        "run_cell_with_default_inputs",
         "run_cell_with_input",
+        "run_cell_with_input_cases",
         "run_detailed_ex002_check",
         "run_notebook_check",
+        "run_notebook_once",
     ]
 
 
@@ -0,0 +1,100 @@
+"""Tests for the single-walk ``CodeFacts`` index."""
+
+from __future__ import annotations
+
+import ast
+from collections import OrderedDict
+
+import pytest
+
+from exercise_runtime_support.exercise_framework import code_facts as code_facts_module
+from exercise_runtime_support.exercise_framework.code_facts import (
+    CodeFacts,
+    code_facts,
+    facts_for_tree,
+)
+
+_SOURCE = """\
+import math
+
+name = input("Name: ")
+age, town = int(input("Age: ")), "Leeds"
+total = age * 2
+total += 1
+flag = True
+print(name, math.floor(total / 3))
+for letter in name:
+    if letter == "a":
+        print(letter)
+"""
+
+_EXPECTED_PRINT_CALLS = 2
+_EXPECTED_LOOPS = 1
+_EXPECTED_BRANCHES = 1
+
+
+def test_facts_index_calls_operators_and_names() -> None:
+    facts = code_facts(_SOURCE)
+
+    assert facts is not None
+    assert facts.call_count("print") == _EXPECTED_PRINT_CALLS
+    assert facts.has_call("math.floor")
+    assert not facts.has_call("floor")
+    assert facts.uses_operator(ast.Mult)
+    assert facts.uses_operator(ast.Div)
+    assert facts.uses_operator(ast.Add)
+    assert not facts.uses_operator(ast.Add, augmented=False)
+    assert facts.assigned_names >= {"name", "age", "town", "total", "flag"}
+    assert facts.input_assigned_names == frozenset({"name"})
+    assert len(facts.loops) == _EXPECTED_LOOPS
+    assert len(facts.branches) == _EXPECTED_BRANCHES
+
+
+def test_facts_index_names_and_f_string_interpolation() -> None:
+    facts = code_facts("pet = 'cat'\nprint(f'{pet} and {animal.upper()}', other)")
+
+    assert facts is not None
+    assert facts.names >= {"pet", "print", "animal", "other"}
+    assert facts.formatted_names == frozenset({"pet"})
+
+
+def test_constants_are_matched_by_exact_type() -> None:
+    facts = code_facts("enabled = True\nlimit = 1.0\nlabel = 'a'\n")
+
+    assert facts is not None
+    assert facts.has_constant(True)
+    assert not facts.has_constant(1)
+    assert facts.has_constant(1.0)
+    assert facts.has_constant("a")
+    assert not facts.has_constant("b")
+
+
+def test_code_facts_are_memoised_per_source() -> None:
+    assert code_facts(_SOURCE) is code_facts(_SOURCE)
+    assert code_facts("print (") is None
+
+
+def test_facts_for_tree_walks_each_tree_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    tree = ast.parse(_SOURCE)
+    builds: list[ast.AST] = []
+    original = CodeFacts.from_tree
+
+    def counting_from_tree(walked: ast.AST) -> CodeFacts:
+        builds.append(walked)
+        return original(walked)
+
+    monkeypatch.setattr(CodeFacts, "from_tree", counting_from_tree)
+
+    assert facts_for_tree(tree) is facts_for_tree(tree)
+    assert builds == [tree]
+
+
+def test_source_cache_is_bounded(monkeypatch: pytest.MonkeyPatch) -> None:
+    max_entries = 2
+    monkeypatch.setattr(code_facts_module, "DEFAULT_MAX_ENTRIES", max_entries)
+    monkeypatch.setattr(code_facts_module, "_by_source", OrderedDict[str, object]())
+
+    for value in range(max_entries + 1):
+        code_facts(f"print({value})")
+
+    assert len(code_facts_module._by_source) == max_entries  # pyright: ignore[reportPrivateUsage]
@@ -0,0 +1,125 @@
+"""Tests for declarative construct rules."""
+
+from __future__ import annotations
+
+import ast
+
+import pytest
+
+from exercise_runtime_support.exercise_framework.code_facts import CodeFacts
+from exercise_runtime_support.exercise_framework.construct_rules import (
+    CallRule,
+    ConstantRule,
+    FormattedNameRule,
+    NameRule,
+    NodeRule,
+    OperatorRule,
+    compile_rules,
+)
+
+_EX002_EXERCISE_KEY = "ex002_sequence_modify_basics"
+
+
+def test_program_reports_only_failed_rules_with_student_messages() -> None:
+    program = compile_rules(
+        {
+            1: (CallRule("print"), OperatorRule(ast.Div), ConstantRule(25)),
+            2: (
+                CallRule("input", count=2, message="ask for two values."),
+                OperatorRule(ast.FloorDiv, forbidden=True),
+                NodeRule(ast.JoinedStr),
+            ),
+        }
+    )
+
+    issues = program.run(
+        {
+            1: "print(total / 25)",
+            2: "a = input()\nprint(f'{int(a) // 2}')",
+        }
+    )
+
+    assert [issue.message for issue in issues] == [
+        "Exercise 2: ask for two values.",
+        "Exercise 2: do not use //.",
+    ]
+    assert [issue.exercise_no for issue in issues] == [2, 2]
+
+
+def test_program_walks_each_part_once_however_many_rules(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    walks: list[ast.AST] = []
+    original = CodeFacts.from_tree
+
+    def counting_from_tree(tree: ast.AST) -> CodeFacts:
+        walks.append(tree)
+        return original(tree)
+
+    monkeypatch.setattr(CodeFacts, "from_tree", counting_from_tree)
+    rules = tuple(ConstantRule(value) for value in range(20))
+    program = compile_rules({1: rules, 2: rules})
+
+    program.run({1: "x = 1 + 1000", 2: "y = 2 + 1000"})
+
+    assert len(walks) == len(program.exercise_numbers)
+
+
+def test_name_rules_check_variables_and_f_string_interpolation() -> None:
+    program = compile_rules(
+        {
+            1: (
+                NameRule("animal", forbidden=True),
+                FormattedNameRule(("town", "name")),
+                NameRule("pet"),
+            ),
+        }
+    )
+
+    issues = program.issues_for(1, "animal = 'cat'\nname = 'Sam'\nprint(f'{name} {animal}')")
+
+    assert [issue.message for issue in issues] == [
+        "Exercise 1: do not use animal.",
+        "Exercise 1: interpolate variable(s) in the f-string: name, town.",
+        "Exercise 1: use pet.",
+    ]
+
+
+def test_issues_for_tree_reuses_the_callers_parse(monkeypatch: pytest.MonkeyPatch) -> None:
+    tree = ast.parse("print(f'{total}')")
+    program = compile_rules({1: (CallRule("print"), FormattedNameRule(("total",)))})
+
+    def fail_parse(*_args: object, **_kwargs: object) -> ast.Module:
+        raise AssertionError("issues_for_tree parsed the code again")
+
+    monkeypatch.setattr(ast, "parse", fail_parse)
+
+    assert program.issues_for_tree(1, tree) == []
+    assert program.issues_for_tree(2, tree) == []
+
+
+def test_unparsable_part_is_reported_once() -> None:
+    program = compile_rules({1: (CallRule("print"), OperatorRule(ast.Mult))})
+
+    issues = program.issues_for(1, "print (")
+
+    assert [issue.message for issue in issues] == ["Exercise 1: code could not be parsed."]
+    assert issues[0].rule is None
+
+
+def test_parts_without_rules_are_skipped() -> None:
+    program = compile_rules({1: (), 3: (CallRule("print"),)})
+
+    assert program.exercise_numbers == (3,)
+    assert program.run({1: "print (", 2: "pass"}) == []
+
+
+def test_check_notebook_reads_tagged_cells() -> None:
+    program = compile_rules(
+        {
+            exercise_no: (CallRule("print"), CallRule("eval", forbidden=True))
+            for exercise_no in range(1, 11)
+        }
+    )
+
+    assert program.check_notebook(_EX002_EXERCISE_KEY, variant="solution") == []
@@ -0,0 +1,94 @@
+"""Tests for the shared input-to-output dataflow analyser."""
+
+from __future__ import annotations
+
+import ast
+
+from exercise_runtime_support.exercise_framework.dataflow import (
+    DataflowGraph,
+    Flow,
+    dataflow_for_tree,
+)
+
+_LONG_CHAIN_LENGTH = 3000
+
+
+def _print_flows(code: str) -> tuple[Flow, ...]:
+    return DataflowGraph(ast.parse(code)).print_flows
+
+
+def test_print_flow_follows_assignment_chain() -> None:
+    flows = _print_flows(
+        """
+price_text = input("Price: ")
+quantity_text = input("Quantity: ")
+price = float(price_text)
+quantity = int(quantity_text)
+total = price * quantity
+print("Total: " + str(total))
+"""
+    )
+
+    assert flows == (
+        Flow(
+            input_names=frozenset({"price_text", "quantity_text"}),
+            call_names=frozenset({"float", "int", "input", "str"}),
+            op_types=frozenset({ast.Add, ast.Mult}),
+        ),
+    )
+
+
+def test_reassigned_names_keep_earlier_flow() -> None:
+    flows = _print_flows(
+        """
+value = input()
+value = int(value)
+value += 1
+print(value)
+"""
+    )
+
+    assert flows[0].input_names == frozenset({"value"})
+    assert flows[0].call_names == frozenset({"input", "int"})
+    assert flows[0].op_types == frozenset({ast.Add})
+
+
+def test_uses_resolve_to_earlier_lines_only() -> None:
+    flows = _print_flows(
+        """
+print(total)
+total = int(input())
+a = 1; b = a * 2
+print(b)
+"""
+    )
+
+    assert flows[0] == Flow()
+    assert flows[1].op_types == frozenset({ast.Mult})
+
+
+def test_hardcoded_print_does_not_use_inputs() -> None:
+    graph = DataflowGraph(ast.parse('name = input()\nif name == "Sam":\n    print("Hi Sam")\n'))
+
+    assert graph.input_names == frozenset({"name"})
+    assert graph.print_flows == (Flow(),)
+
+
+def test_long_assignment_chains_are_resolved_without_recursion() -> None:
+    lines = ["v0 = input()"]
+    lines.extend(f"v{index} = v{index - 1} + 'x'" for index in range(1, _LONG_CHAIN_LENGTH))
+    lines.append(f"print(v{_LONG_CHAIN_LENGTH - 1})")
+
+    (flow,) = _print_flows("\n".join(lines))
+
+    assert flow.input_names == frozenset({"v0"})
+    assert flow.op_types == frozenset({ast.Add})
+
+
+def test_graph_is_memoised_per_tree() -> None:
+    tree = ast.parse("x = input()\nprint(x)\n")
+
+    graph = dataflow_for_tree(tree)
+
+    assert dataflow_for_tree(tree) is graph
+    assert graph.print_flows is graph.print_flows
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import os
 from collections.abc import Callable
 from pathlib import Path
 from typing import Protocol
@@ -15,6 +16,8 @@ EX002_EXERCISE_KEY = "ex002_sequence_modify_basics"
 EX007_EXERCISE_KEY = "ex007_sequence_debug_casting"
 EXERCISE1_TAG = "exercise1"
 EXPECTED_CALL_COUNT_FOR_DISTINCT_INPUTS = 2
+EXPECTED_LRU_HITS = 2
+REPEATED_LOOKUPS = 3
 
 
 class InputRunner(Protocol):
@@ -225,6 +228,79 @@ def test_runtime_input_cache_uses_separate_entry_for_different_inputs(
     assert get_call_count() == EXPECTED_CALL_COUNT_FOR_DISTINCT_INPUTS
 
 
+def test_runtime_default_input_cache_reuses_single_execution(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    cache = runtime.RuntimeCache()
+    calls: list[tuple[str, int]] = []
+
+    def fake_run_cell_with_default_inputs(
+        notebook_path: str | Path,
+        *,
+        tag: str,
+        default_input: str,
+        max_inputs: int,
+        variant: Variant | None = None,
+    ) -> notebook_grader.DefaultInputOutput:
+        calls.append((default_input, max_inputs))
+        return notebook_grader.DefaultInputOutput(output="Hello", inputs_consumed=1)
+
+    monkeypatch.setattr(
+        notebook_grader, "run_cell_with_default_inputs", fake_run_cell_with_default_inputs
+    )
+
+    first = runtime.run_cell_with_default_inputs(
+        EX002_EXERCISE_KEY, tag=EXERCISE1_TAG, cache=cache, variant="solution"
+    )
+    second = runtime.run_cell_with_default_inputs(
+        EX002_EXERCISE_KEY, tag=EXERCISE1_TAG, cache=cache, variant="solution"
+    )
+
+    assert first == second
+    assert calls == [(notebook_grader.DEFAULT_INPUT_VALUE, notebook_grader.MAX_DEFAULT_INPUTS)]
+
+
+def test_runtime_input_cases_run_only_uncached_cases_in_one_batch(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    cache = runtime.RuntimeCache()
+    batches: list[list[list[str]]] = []
+
+    def fake_run_cell_with_input_cases(
+        notebook_path: str | Path,
+        *,
+        tag: str,
+        cases: list[list[str]],
+        variant: Variant | None = None,
+    ) -> list[str]:
+        batches.append(cases)
+        return ["|".join(inputs) for inputs in cases]
+
+    fake_runner, _ = _make_fake_input_runner()
+    monkeypatch.setattr(notebook_grader, "run_cell_with_input", fake_runner)
+    monkeypatch.setattr(
+        notebook_grader, "run_cell_with_input_cases", fake_run_cell_with_input_cases
+    )
+    cached = runtime.run_cell_with_input(
+        EX002_EXERCISE_KEY,
+        tag=EXERCISE1_TAG,
+        inputs=["Alice"],
+        cache=cache,
+        variant="solution",
+    )
+
+    outputs = runtime.run_cell_with_input_cases(
+        EX002_EXERCISE_KEY,
+        tag=EXERCISE1_TAG,
+        cases=[["Alice"], ["Bob", "Cy"], ["Bob", "Cy"]],
+        cache=cache,
+        variant="solution",
+    )
+
+    assert outputs == [cached, "Bob|Cy", "Bob|Cy"]
+    assert batches == [[["Bob", "Cy"]]]
+
+
 def test_paths_solution_variant_resolves_migrated_exercise_key() -> None:
     repo_root = Path(__file__).resolve().parents[2]
     expected = (
@@ -235,3 +311,155 @@ def test_paths_solution_variant_resolves_migrated_exercise_key() -> None:
 
     assert resolved == expected
     assert resolved.exists()
+
+
+def _write_exercise_notebook(path: Path, sources: dict[str, str]) -> Path:
+    cells = [
+        {"cell_type": "code", "metadata": {"tags": [tag]}, "source": [source]}
+        for tag, source in sources.items()
+    ]
+    path.write_text(json.dumps({"cells": cells}), encoding="utf-8")
+    return path
+
+
+def test_run_notebook_once_matches_per_tag_execution() -> None:
+    outcomes = runtime.run_notebook_once(EX002_EXERCISE_KEY, variant="solution")
+
+    assert outcomes
+    assert all(tag.startswith("exercise") for tag in outcomes)
+    for tag, outcome in outcomes.items():
+        assert outcome.error is None
+        assert outcome.output == notebook_grader.run_cell_and_capture_output(
+            EX002_EXERCISE_KEY, tag=tag, variant="solution"
+        )
+
+
+def test_whole_notebook_cache_serves_static_cells_from_one_batch(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    notebook_path = _write_exercise_notebook(
+        tmp_path / "notebook.ipynb",
+        {
+            "exercise1": "total = 2 + 3\nprint(total)",
+            "exercise2": "raise ValueError('broken')",
+            "exercise3": "name = input('Name? ')",
+            "setup": "print('not an exercise')",
+        },
+    )
+    batches: list[str] = []
+    run_tagged_cells = notebook_grader.run_tagged_cells
+
+    def counting_run_tagged_cells(
+        notebook_path: str | Path,
+        *,
+        variant: Variant | None = None,
+    ) -> dict[str, notebook_grader.TaggedCellOutcome]:
+        batches.append(str(notebook_path))
+        return run_tagged_cells(notebook_path, variant=variant)
+
+    def unexpected_run(*_args: object, **_kwargs: object) -> str:
+        raise AssertionError("static cells should be served from the cache")
+
+    monkeypatch.setattr(notebook_grader, "run_tagged_cells", counting_run_tagged_cells)
+    monkeypatch.setattr(notebook_grader, "run_cell_and_capture_output", unexpected_run)
+    cache = runtime.RuntimeCache(whole_notebook=True)
+
+    first = runtime.run_cell_and_capture_output(notebook_path, tag="exercise1", cache=cache)
+    with pytest.raises(notebook_grader.NotebookGradingError, match="broken"):
+        runtime.run_cell_and_capture_output(notebook_path, tag="exercise2", cache=cache)
+
+    assert first == "5"
+    assert batches == [str(notebook_path)]
+    ref = cache.notebook_ref(notebook_path, None)
+    fingerprint = cache.fingerprint(ref)
+    outcome = cache.lookup(ref, fingerprint, ("outcome", "exercise1"))
+    assert outcome.namespace == {"total": "int"}
+    assert cache.lookup(ref, fingerprint, ("outcome", "exercise3")) is None
+    assert cache.lookup(ref, fingerprint, ("outcome", "setup")) is None
+
+
+def test_whole_notebook_cache_raises_a_fresh_error_per_hit(tmp_path: Path) -> None:
+    notebook_path = _write_exercise_notebook(
+        tmp_path / "notebook.ipynb",
+        {"exercise1": "raise ValueError('broken')"},
+    )
+    cache = runtime.RuntimeCache(whole_notebook=True)
+    raised: list[notebook_grader.NotebookGradingError] = []
+
+    for _ in range(REPEATED_LOOKUPS):
+        with pytest.raises(notebook_grader.NotebookGradingError, match="broken") as exc_info:
+            runtime.run_cell_and_capture_output(notebook_path, tag="exercise1", cache=cache)
+        raised.append(exc_info.value)
+
+    stored = raised[0].__cause__
+    assert isinstance(stored, notebook_grader.NotebookGradingError)
+    assert len({id(error) for error in raised}) == REPEATED_LOOKUPS
+    assert all(error.__cause__ is stored for error in raised)
+    assert stored.__context__ is None
+
+
+def test_cached_output_limit_error_keeps_its_fields() -> None:
+    stored = notebook_grader.OutputLimitExceeded("too much", output="spam", limit_bytes=4)
+
+    fresh = runtime._fresh_error(stored)  # pyright: ignore[reportPrivateUsage]
+
+    assert isinstance(fresh, notebook_grader.OutputLimitExceeded)
+    assert fresh is not stored
+    assert (str(fresh), fresh.output, fresh.limit_bytes) == ("too much", "spam", 4)
+
+
+def test_runtime_cache_hits_skip_notebook_resolution(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    cache = runtime.RuntimeCache()
+    resolutions: list[str | Path] = []
+    resolve = runtime.resolve_framework_notebook_path
+
+    def counting_resolve(notebook_path: str | Path, *, variant: Variant | None = None) -> Path:
+        resolutions.append(notebook_path)
+        return resolve(notebook_path, variant=variant)
+
+    monkeypatch.setattr(runtime, "resolve_framework_notebook_path", counting_resolve)
+
+    outputs = {
+        runtime.run_cell_and_capture_output(
+            EX002_EXERCISE_KEY, tag=EXERCISE1_TAG, cache=cache, variant="solution"
+        )
+        for _ in range(REPEATED_LOOKUPS)
+    }
+
+    assert len(outputs) == 1
+    assert resolutions == [EX002_EXERCISE_KEY]
+    assert cache.stats.misses == 1
+    assert cache.stats.hits == REPEATED_LOOKUPS - 1
+
+
+def test_runtime_cache_invalidates_entries_when_notebook_changes(tmp_path: Path) -> None:
+    notebook_path = _write_exercise_notebook(tmp_path / "notebook.ipynb", {"exercise1": "print(1)"})
+    cache = runtime.RuntimeCache()
+
+    first = runtime.run_cell_and_capture_output(notebook_path, tag="exercise1", cache=cache)
+    _write_exercise_notebook(notebook_path, {"exercise1": "print('changed')"})
+    stat_result = notebook_path.stat()
+    os.utime(notebook_path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000_000))
+    second = runtime.run_cell_and_capture_output(notebook_path, tag="exercise1", cache=cache)
+
+    assert (first, second) == ("1", "changed")
+    assert cache.stats.invalidations == 1
+
+
+def test_runtime_cache_evicts_least_recently_used_entries(tmp_path: Path) -> None:
+    notebook_path = _write_exercise_notebook(
+        tmp_path / "notebook.ipynb",
+        {f"exercise{index}": f"print({index})" for index in range(1, 4)},
+    )
+    cache = runtime.RuntimeCache(max_entries=2)
+
+    for tag in ("exercise1", "exercise2", "exercise1", "exercise3"):
+        runtime.run_cell_and_capture_output(notebook_path, tag=tag, cache=cache)
+    runtime.run_cell_and_capture_output(notebook_path, tag="exercise1", cache=cache)
+
+    assert len(cache) == cache.max_entries
+    assert cache.stats.evictions == 1
+    assert cache.stats.hits == EXPECTED_LRU_HITS
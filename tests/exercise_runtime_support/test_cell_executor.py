@@ -0,0 +1,282 @@
+"""Tests for ``exercise_runtime_support.cell_executor``."""
+
+from __future__ import annotations
+
+import builtins
+import sys
+from collections.abc import Iterator
+
+import pytest
+
+from exercise_runtime_support import cell_executor
+from exercise_runtime_support.cell_executor import (
+    CellJob,
+    DefaultInputs,
+    ExecutionLimits,
+    InProcessExecutor,
+    PooledExecutor,
+    ThreadedExecutor,
+)
+
+POOL_WALL_SECONDS = 1.0
+POOL_WORKERS = 2
+THREAD_WORKERS = 4
+THREADED_JOBS = 16
+OUTPUT_CAP = 64
+DEFAULT_INPUT_LIMIT = 3
+
+
+@pytest.fixture(scope="module")
+def pool() -> Iterator[PooledExecutor]:
+    executor = PooledExecutor(
+        max_workers=POOL_WORKERS,
+        limits=ExecutionLimits(wall_seconds=POOL_WALL_SECONDS),
+    )
+    try:
+        yield executor
+    finally:
+        executor.shutdown()
+
+
+def test_in_process_executor_captures_output_and_inputs() -> None:
+    job = CellJob("name = input('Name? ')\nprint(f'Hi {name}')\n", "<cell>", ("Ada",))
+
+    result = InProcessExecutor().run(job)
+
+    assert result.ok
+    assert result.stdout == "Name? Hi Ada\n"
+
+
+def test_in_process_executor_reports_errors_as_results() -> None:
+    executor = InProcessExecutor()
+
+    compile_result, runtime_result = executor.map(
+        [CellJob("def (\n", "<bad>"), CellJob("print('a')\nraise ValueError('bad')\n", "<err>")]
+    )
+
+    assert compile_result.error is not None
+    assert compile_result.error.phase == "compile"
+    assert compile_result.error.type_name == "SyntaxError"
+    assert runtime_result.stdout == "a\n"
+    assert runtime_result.error is not None
+    assert runtime_result.error.phase == "execute"
+    assert isinstance(runtime_result.error.exception, ValueError)
+
+
+def test_in_process_executor_reports_missing_inputs() -> None:
+    result = InProcessExecutor().run(CellJob("input()\ninput()\n", "<cell>", ("only one",)))
+
+    assert result.error is not None
+    assert result.error.message == cell_executor.MISSING_INPUT_ERROR_MESSAGE
+
+
+def test_default_inputs_answer_prompts_lazily_in_one_execution() -> None:
+    source = "while input() != 'stop':\n    print('again')\n"
+    job = CellJob(source, "<cell>", ("go",), default_inputs=DefaultInputs("stop", 5))
+
+    result = InProcessExecutor().run(job)
+
+    assert result.ok
+    assert result.stdout == "again\n"
+    assert result.inputs_consumed == len(("go", "stop"))
+    assert not result.used_stdin
+
+
+def test_default_inputs_stop_at_their_limit() -> None:
+    job = CellJob(
+        "while True:\n    input()\n",
+        "<cell>",
+        default_inputs=DefaultInputs("2", DEFAULT_INPUT_LIMIT),
+    )
+
+    result = InProcessExecutor().run(job)
+
+    assert result.error is not None
+    assert result.error.message == cell_executor.MISSING_INPUT_ERROR_MESSAGE
+    assert result.inputs_consumed == DEFAULT_INPUT_LIMIT
+
+
+def test_in_process_executor_leaves_process_builtins_untouched() -> None:
+    original_print = builtins.print
+    original_input = builtins.input
+    job = CellJob(
+        "import builtins\nprint(builtins.print is print, builtins.input is input)\n",
+        "<cell>",
+        ("unused",),
+    )
+
+    result = InProcessExecutor().run(job)
+
+    assert result.stdout == "False False\n"
+    assert builtins.print is original_print
+    assert builtins.input is original_input
+
+
+def test_threaded_executor_isolates_concurrent_io() -> None:
+    source = (
+        "import time\n"
+        "word = input('? ')\n"
+        "for _ in range(50):\n"
+        "    print(word, end='')\n"
+        "    time.sleep(0)\n"
+    )
+    jobs = [CellJob(source, f"<cell{index}>", (f"w{index}",)) for index in range(THREADED_JOBS)]
+    executor = ThreadedExecutor(max_workers=THREAD_WORKERS)
+    try:
+        results = executor.map(jobs)
+    finally:
+        executor.shutdown()
+
+    assert [result.stdout for result in results] == [
+        "? " + f"w{index}" * 50 for index in range(THREADED_JOBS)
+    ]
+
+
+def test_in_process_executor_captures_direct_stdout_writes(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    original_stdout = sys.stdout
+    job = CellJob(
+        "import sys\nsys.stdout.write('written\\n')\nprint('printed', file=sys.stdout)\n",
+        "<cell>",
+    )
+
+    result = InProcessExecutor().run(job)
+
+    assert result.stdout == "written\nprinted\n"
+    assert capsys.readouterr().out == ""
+    assert sys.stdout is original_stdout
+
+
+def test_threaded_executor_isolates_direct_stdout_writes() -> None:
+    source = (
+        "import sys, time\n"
+        "word = input()\n"
+        "for _ in range(50):\n"
+        "    sys.stdout.write(word)\n"
+        "    time.sleep(0)\n"
+    )
+    jobs = [CellJob(source, f"<cell{index}>", (f"w{index}",)) for index in range(THREADED_JOBS)]
+    executor = ThreadedExecutor(max_workers=THREAD_WORKERS)
+    try:
+        results = executor.map(jobs)
+    finally:
+        executor.shutdown()
+
+    assert [result.stdout for result in results] == [
+        f"w{index}" * 50 for index in range(THREADED_JOBS)
+    ]
+
+
+def test_pooled_executor_stops_runaway_cell_and_keeps_order(pool: PooledExecutor) -> None:
+    results = pool.map(
+        [
+            CellJob("print('first')\n", "<a>"),
+            CellJob("print('looping')\nwhile True:\n    pass\n", "<b>"),
+            CellJob("print(input() * 2)\n", "<c>", ("ab",)),
+        ]
+    )
+
+    assert [result.stdout for result in results] == ["first\n", "looping\n", "abab\n"]
+    assert results[1].timed_out
+    assert results[1].error is not None
+    assert results[1].error.type_name == "TimeoutError"
+    assert results[2].ok
+
+
+def test_pooled_executor_survives_crashing_and_exiting_cells(pool: PooledExecutor) -> None:
+    crashed, exited, after = pool.map(
+        [
+            CellJob("import os\nos._exit(3)\n", "<crash>"),
+            CellJob("import sys\nsys.exit(1)\n", "<exit>"),
+            CellJob("print('still running')\n", "<after>"),
+        ]
+    )
+
+    assert crashed.error is not None
+    assert crashed.error.type_name == "WorkerCrashed"
+    assert exited.error is not None
+    assert exited.error.type_name == "SystemExit"
+    assert exited.error.exception is None
+    assert after.stdout == "still running\n"
+
+
+def test_default_executor_is_in_process(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv(cell_executor.EXECUTION_BACKEND_ENV_VAR, raising=False)
+
+    assert isinstance(cell_executor.get_default_executor(), InProcessExecutor)
+
+
+def test_default_executor_rejects_unknown_backend(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(cell_executor.EXECUTION_BACKEND_ENV_VAR, "threads")
+
+    with pytest.raises(RuntimeError, match="must be 'inprocess', 'thread' or 'pool'"):
+        cell_executor.get_default_executor()
+
+
+def test_use_executor_overrides_default_temporarily() -> None:
+    override = InProcessExecutor()
+
+    with cell_executor.use_executor(override):
+        assert cell_executor.get_default_executor() is override
+
+    assert cell_executor.get_default_executor() is not override
+
+
+def test_cell_timeout_env_var_sets_pool_limits(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(cell_executor.CELL_TIMEOUT_ENV_VAR, "0")
+    assert cell_executor._configured_limits().wall_seconds is None  # pyright: ignore[reportPrivateUsage]
+
+    monkeypatch.setenv(cell_executor.CELL_TIMEOUT_ENV_VAR, "soon")
+    with pytest.raises(RuntimeError, match=cell_executor.CELL_TIMEOUT_ENV_VAR):
+        cell_executor._configured_limits()  # pyright: ignore[reportPrivateUsage]
+
+
+def test_output_cap_stops_runaway_printing_and_keeps_prefix() -> None:
+    job = CellJob("while True:\n    print('spam')\n", "<cell>", max_output_bytes=OUTPUT_CAP)
+
+    result = InProcessExecutor().run(job)
+
+    assert result.error is not None
+    assert result.error.type_name == cell_executor.OUTPUT_LIMIT_ERROR_TYPE
+    assert result.stdout == ("spam\n" * OUTPUT_CAP)[:OUTPUT_CAP]
+
+
+def test_output_cap_cannot_be_swallowed_by_the_cell() -> None:
+    source = "try:\n    while True:\n        print('é')\nexcept BaseException:\n    pass\nprint('done')\n"
+
+    result = InProcessExecutor().run(CellJob(source, "<cell>", max_output_bytes=OUTPUT_CAP))
+
+    assert result.error is not None
+    assert result.error.type_name == cell_executor.OUTPUT_LIMIT_ERROR_TYPE
+    assert len(result.stdout.encode("utf-8")) <= OUTPUT_CAP
+    assert result.stdout.startswith("é\n")
+    assert "done" not in result.stdout
+
+
+def test_output_cap_leaves_output_within_the_cap_alone() -> None:
+    job = CellJob("print('x' * 9)\n", "<cell>", max_output_bytes=len("x" * 9 + "\n"))
+
+    assert InProcessExecutor().run(job).ok
+
+
+def test_pooled_executor_applies_output_cap(pool: PooledExecutor) -> None:
+    result = pool.run(
+        CellJob("while True:\n    print('spam')\n", "<cell>", max_output_bytes=OUTPUT_CAP)
+    )
+
+    assert result.error is not None
+    assert result.error.type_name == cell_executor.OUTPUT_LIMIT_ERROR_TYPE
+    assert len(result.stdout) == OUTPUT_CAP
+
+
+def test_output_limit_env_var(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv(cell_executor.OUTPUT_LIMIT_ENV_VAR, raising=False)
+    assert cell_executor.configured_output_limit() == cell_executor.DEFAULT_OUTPUT_LIMIT_BYTES
+
+    monkeypatch.setenv(cell_executor.OUTPUT_LIMIT_ENV_VAR, "0")
+    assert cell_executor.configured_output_limit() is None
+
+    monkeypatch.setenv(cell_executor.OUTPUT_LIMIT_ENV_VAR, "lots")
+    with pytest.raises(RuntimeError, match=cell_executor.OUTPUT_LIMIT_ENV_VAR):
+        cell_executor.configured_output_limit()
@@ -0,0 +1,126 @@
+"""Tests for ``exercise_runtime_support.code_cache``."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from exercise_runtime_support import code_cache
+
+SMALL_CACHE_SIZE = 2
+EXPECTED_MISSES_AFTER_EVICTION = 4
+EXPECTED_VALUE = 42
+DISK_LIMIT = 16
+DISK_LIMIT_AFTER_TRIM = 14
+
+
+def test_code_cache_reuses_compiled_code_for_same_source_and_filename() -> None:
+    cache = code_cache.CodeCache()
+
+    first = cache.compile("x = 1\n", "<cell>")
+    second = cache.compile("x = 1\n", "<cell>")
+
+    assert first is second
+    assert cache.stats.misses == 1
+    assert cache.stats.hits == 1
+
+
+def test_code_cache_keys_on_filename() -> None:
+    cache = code_cache.CodeCache()
+
+    first = cache.compile("x = 1\n", "a.ipynb")
+    second = cache.compile("x = 1\n", "b.ipynb")
+
+    assert first.co_filename == "a.ipynb"
+    assert second.co_filename == "b.ipynb"
+
+
+def test_code_cache_evicts_least_recently_used_entry() -> None:
+    cache = code_cache.CodeCache(max_entries=SMALL_CACHE_SIZE)
+    first = cache.compile("a = 1\n", "<cell>")
+    cache.compile("b = 2\n", "<cell>")
+    cache.compile("a = 1\n", "<cell>")
+    cache.compile("c = 3\n", "<cell>")
+
+    assert len(cache) == SMALL_CACHE_SIZE
+    assert cache.stats.evictions == 1
+    assert cache.compile("a = 1\n", "<cell>") is first
+    cache.compile("b = 2\n", "<cell>")
+    assert cache.stats.misses == EXPECTED_MISSES_AFTER_EVICTION
+
+
+def test_code_cache_does_not_cache_syntax_errors() -> None:
+    cache = code_cache.CodeCache()
+
+    with pytest.raises(SyntaxError):
+        cache.compile("def broken(:\n", "<cell>")
+
+    assert len(cache) == 0
+
+
+def test_code_cache_disk_store_survives_new_instance(tmp_path: Path) -> None:
+    writer = code_cache.CodeCache(cache_dir=tmp_path)
+    writer.compile("value = 6 * 7\n", "<cell>")
+
+    reader = code_cache.CodeCache(cache_dir=tmp_path)
+    code = reader.compile("value = 6 * 7\n", "<cell>")
+    namespace: dict[str, object] = {}
+    exec(code, namespace)
+
+    assert namespace["value"] == EXPECTED_VALUE
+    assert reader.stats.disk_hits == 1
+    assert reader.stats.misses == 0
+
+
+def test_code_cache_ignores_corrupt_disk_entries(tmp_path: Path) -> None:
+    code_cache.CodeCache(cache_dir=tmp_path).compile("x = 1\n", "<cell>")
+    for entry in tmp_path.iterdir():
+        entry.write_bytes(b"not a code object")
+
+    reader = code_cache.CodeCache(cache_dir=tmp_path)
+    reader.compile("x = 1\n", "<cell>")
+
+    assert reader.stats.misses == 1
+
+
+def test_code_cache_caps_disk_entries(tmp_path: Path) -> None:
+    cache = code_cache.CodeCache(cache_dir=tmp_path, max_disk_entries=SMALL_CACHE_SIZE)
+    for value in range(4):
+        cache.compile(f"x = {value}\n", "<cell>")
+
+    assert len(list(tmp_path.iterdir())) == SMALL_CACHE_SIZE
+
+
+def test_code_cache_scans_disk_store_only_when_limit_is_crossed(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    scans: list[int] = []
+    original = code_cache.CodeCache._scan_disk_entries  # pyright: ignore[reportPrivateUsage]
+
+    def counting_scan(self: code_cache.CodeCache) -> list[tuple[int, Path]] | None:
+        entries = original(self)
+        scans.append(0 if entries is None else len(entries))
+        return entries
+
+    monkeypatch.setattr(code_cache.CodeCache, "_scan_disk_entries", counting_scan)
+    cache = code_cache.CodeCache(cache_dir=tmp_path, max_disk_entries=DISK_LIMIT)
+    for value in range(DISK_LIMIT + 2):
+        cache.compile(f"x = {value}\n", "<cell>")
+
+    # One scan to count the store, one when the limit is crossed.
+    assert scans == [1, DISK_LIMIT + 1]
+    assert len(list(tmp_path.iterdir())) == DISK_LIMIT_AFTER_TRIM + 1
+
+
+def test_get_code_cache_reads_cache_dir_from_environment(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    monkeypatch.setenv(code_cache.CODE_CACHE_DIR_ENV_VAR, str(tmp_path))
+    code_cache.reset_code_cache()
+    try:
+        assert code_cache.get_code_cache().cache_dir == tmp_path
+    finally:
+        code_cache.reset_code_cache()
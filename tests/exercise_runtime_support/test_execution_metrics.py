@@ -0,0 +1,95 @@
+"""Tests for ``exercise_runtime_support.execution_metrics``."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from exercise_runtime_support import execution_metrics, notebook_grader
+from exercise_runtime_support.cell_executor import CellJob, InProcessExecutor
+from exercise_runtime_support.execution_metrics import InMemoryMetricsSink, use_metrics_sink
+
+CASE_COUNT = 2
+
+
+def _write_notebook(path: Path, source: str) -> Path:
+    cell = {"cell_type": "code", "metadata": {"tags": ["exercise1"]}, "source": [source]}
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"cells": [cell]}), encoding="utf-8")
+    return path
+
+
+def test_executor_collects_metrics_only_when_requested() -> None:
+    source = "name = input('Name? ')\nprint(name * 3)\n"
+    executor = InProcessExecutor()
+
+    plain = executor.run(CellJob(source, "<cell>", ("ab",)))
+    measured = executor.run(CellJob(source, "<cell>", ("ab",), collect_metrics=True))
+
+    assert plain.metrics is None
+    assert measured.metrics is not None
+    assert measured.metrics.input_calls == 1
+    assert measured.metrics.stdout_bytes == len("Name? ababab\n")
+    assert measured.metrics.wall_seconds >= 0
+    assert measured.metrics.peak_memory_bytes is None or measured.metrics.peak_memory_bytes > 0
+
+
+def test_executor_collects_metrics_for_failing_cells() -> None:
+    job = CellJob("print('x')\nraise ValueError('bad')\n", "<cell>", collect_metrics=True)
+
+    result = InProcessExecutor().run(job)
+
+    assert result.error is not None
+    assert result.metrics is not None
+    assert result.metrics.stdout_bytes == len("x\n")
+
+
+def test_grader_records_one_metric_per_execution(tmp_path: Path) -> None:
+    notebook_path = _write_notebook(
+        tmp_path / "ex001_demo" / "notebooks" / "notebook.ipynb",
+        "print(input('? ').upper())",
+    )
+    sink = InMemoryMetricsSink()
+
+    with use_metrics_sink(sink):
+        notebook_grader.run_cell_with_input_cases(
+            notebook_path,
+            tag="exercise1",
+            cases=[["a"], ["bc"]],
+            variant="solution",
+        )
+
+    records = sink.drain()
+    assert len(records) == CASE_COUNT
+    assert {(record.exercise_key, record.tag, record.variant) for record in records} == {
+        ("ex001_demo", "exercise1", "solution")
+    }
+    assert [record.stdout_bytes for record in records] == [len("? A\n"), len("? BC\n")]
+    assert sink.records == []
+
+
+def test_metrics_file_env_var_appends_json_lines(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    notebook_path = _write_notebook(tmp_path / "notebook.ipynb", "print('hi')")
+    metrics_path = tmp_path / "metrics" / "cells.jsonl"
+    monkeypatch.setenv(execution_metrics.METRICS_FILE_ENV_VAR, str(metrics_path))
+
+    notebook_grader.run_cell_and_capture_output(notebook_path, tag="exercise1")
+    notebook_grader.run_cell_and_capture_output(notebook_path, tag="exercise1")
+
+    lines = metrics_path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == CASE_COUNT
+    record = json.loads(lines[0])
+    assert record["exercise_key"] == "notebook"
+    assert record["tag"] == "exercise1"
+    assert record["stdout_bytes"] == len("hi\n")
+
+
+def test_metrics_are_disabled_without_a_sink(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv(execution_metrics.METRICS_FILE_ENV_VAR, raising=False)
+
+    assert execution_metrics.get_metrics_sink() is None
@@ -8,6 +8,7 @@ import pytest
 
 import exercise_metadata.registry as metadata_registry
 from exercise_runtime_support import exercise_catalogue
+from exercise_runtime_support.exercise_catalogue import ExerciseCatalogue, ExerciseCatalogueEntry
 
 
 def test_get_exercise_catalogue_matches_metadata_catalogue() -> None:
@@ -66,3 +67,66 @@ def test_get_exercise_catalogue_uses_metadata_registry_only(
     assert [asdict(entry) for entry in runtime_catalogue] == expected_catalogue
 
     exercise_catalogue.get_exercise_catalogue.cache_clear()
+
+
+def _entry(exercise_id: int, construct: str, exercise_type: str) -> ExerciseCatalogueEntry:
+    exercise_key = f"ex{exercise_id:03d}_{construct}_{exercise_type}"
+    return ExerciseCatalogueEntry(
+        exercise_key=exercise_key,
+        exercise_id=exercise_id,
+        slug=exercise_key,
+        title=exercise_key,
+        display_label=f"ex{exercise_id:03d} {exercise_key}",
+        construct=construct,
+        exercise_type=exercise_type,
+        parts=1,
+    )
+
+
+SAMPLE_ENTRIES = (
+    _entry(1, "sequence", "modify"),
+    _entry(1, "selection", "debug"),
+    _entry(2, "sequence", "debug"),
+    _entry(3, "selection", "modify"),
+    _entry(12, "sequence", "make"),
+)
+
+
+def test_catalogue_indexes_keys_and_identifiers() -> None:
+    """Key and ``(construct, exercise_id)`` lookups use the indexes."""
+    catalogue = ExerciseCatalogue(SAMPLE_ENTRIES)
+
+    assert catalogue.entry("ex002_sequence_debug") == SAMPLE_ENTRIES[2]
+    assert catalogue.get("ex999_missing") is None
+    assert "ex003_selection_modify" in catalogue
+    assert catalogue.key_for_exercise_id(1) == "ex001_sequence_modify"
+    assert catalogue.key_for_exercise_id(1, construct="selection") == "ex001_selection_debug"
+    with pytest.raises(ValueError, match="Unknown exercise_id 2"):
+        catalogue.key_for_exercise_id(2, construct="selection")
+
+
+def test_catalogue_select_combines_filters_in_catalogue_order() -> None:
+    """``select`` ANDs its filters and keeps catalogue order."""
+    catalogue = ExerciseCatalogue(SAMPLE_ENTRIES)
+
+    def keys(entries: tuple[ExerciseCatalogueEntry, ...]) -> list[str]:
+        return [entry.exercise_key for entry in entries]
+
+    assert keys(catalogue.select(constructs=["sequence"])) == [
+        "ex001_sequence_modify",
+        "ex002_sequence_debug",
+        "ex012_sequence_make",
+    ]
+    assert keys(catalogue.select(constructs=["sequence"], exercise_types=["debug", "make"])) == [
+        "ex002_sequence_debug",
+        "ex012_sequence_make",
+    ]
+    assert keys(catalogue.select(key_pattern="ex00*_selection_*")) == [
+        "ex001_selection_debug",
+        "ex003_selection_modify",
+    ]
+    assert keys(catalogue.select(exercise_types=["debug"], key_pattern="*sequence*")) == [
+        "ex002_sequence_debug"
+    ]
+    assert catalogue.select(constructs=["iteration"]) == ()
+    assert catalogue.select() == SAMPLE_ENTRIES
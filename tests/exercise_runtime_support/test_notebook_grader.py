@@ -0,0 +1,260 @@
+"""Tests for ``exercise_runtime_support.notebook_grader``."""
+
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from exercise_runtime_support import cell_executor, notebook_grader
+
+EXPECTED_PARSES_AFTER_EDIT = 2
+OUTPUT_LIMIT_BYTES = 100
+
+
+def _write_notebook(path: Path, cells: list[dict[str, object]]) -> Path:
+    path.write_text(json.dumps({"cells": cells}), encoding="utf-8")
+    return path
+
+
+def _code_cell(tag: str, source: str) -> dict[str, object]:
+    return {"cell_type": "code", "metadata": {"tags": [tag]}, "source": [source]}
+
+
+def _bump_mtime(path: Path) -> None:
+    stat_result = path.stat()
+    os.utime(path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def notebook_index() -> Iterator[notebook_grader.NotebookIndex]:
+    index = notebook_grader.get_notebook_index()
+    index.clear()
+    yield index
+    index.clear()
+
+
+def test_notebook_index_parses_each_notebook_once(
+    tmp_path: Path,
+    notebook_index: notebook_grader.NotebookIndex,
+) -> None:
+    notebook_path = _write_notebook(
+        tmp_path / "notebook.ipynb",
+        [
+            _code_cell("exercise1", "print('one')"),
+            _code_cell("exercise2", "print('two')"),
+            {
+                "cell_type": "markdown",
+                "metadata": {"tags": ["explanation1"]},
+                "source": ["Because ", "reasons."],
+            },
+        ],
+    )
+
+    assert notebook_grader.extract_tagged_code(notebook_path, tag="exercise1") == "print('one')\n"
+    assert notebook_grader.run_cell_and_capture_output(notebook_path, tag="exercise2") == "two"
+    assert (
+        notebook_grader.get_explanation_cell(notebook_path, tag="explanation1")
+        == "Because reasons."
+    )
+    assert notebook_index.parse_count == 1
+
+
+def test_notebook_index_reparses_when_notebook_changes_on_disk(
+    tmp_path: Path,
+    notebook_index: notebook_grader.NotebookIndex,
+) -> None:
+    notebook_path = _write_notebook(tmp_path / "notebook.ipynb", [_code_cell("exercise1", "x = 1")])
+    assert notebook_grader.extract_tagged_code(notebook_path, tag="exercise1") == "x = 1\n"
+
+    _write_notebook(notebook_path, [_code_cell("exercise1", "x = 2")])
+    _bump_mtime(notebook_path)
+
+    assert notebook_grader.extract_tagged_code(notebook_path, tag="exercise1") == "x = 2\n"
+    assert notebook_index.parse_count == EXPECTED_PARSES_AFTER_EDIT
+
+
+def test_notebook_index_joins_multiple_tagged_cells_in_order(
+    tmp_path: Path,
+    notebook_index: notebook_grader.NotebookIndex,
+) -> None:
+    notebook_path = _write_notebook(
+        tmp_path / "notebook.ipynb",
+        [
+            _code_cell("student", "a = 1"),
+            _code_cell("other", "b = 2"),
+            _code_cell("student", "c = 3"),
+        ],
+    )
+
+    assert notebook_grader.extract_tagged_code(notebook_path) == "a = 1\n\nc = 3\n"
+
+
+def test_notebook_index_reports_missing_notebook(
+    tmp_path: Path,
+    notebook_index: notebook_grader.NotebookIndex,
+) -> None:
+    with pytest.raises(notebook_grader.NotebookGradingError, match="Notebook not found"):
+        notebook_grader.extract_tagged_code(tmp_path / "notebook.ipynb", tag="exercise1")
+
+
+def test_use_live_sources_replaces_cells_by_id_without_reading_disk(
+    tmp_path: Path,
+    notebook_index: notebook_grader.NotebookIndex,
+) -> None:
+    notebook_path = _write_notebook(
+        tmp_path / "notebook.ipynb",
+        [
+            {**_code_cell("exercise1", "print('saved 1')"), "id": "cell-1"},
+            {
+                "cell_type": "code",
+                "metadata": {"tags": ["exercise2"], "id": "cell-2"},
+                "source": "print('saved 2')",
+            },
+            _code_cell("exercise3", "print('saved 3')"),
+        ],
+    )
+    live_sources = {"cell-1": "print('live 1')", "cell-2": "print('live 2')"}
+
+    with notebook_grader.use_live_sources(notebook_path, live_sources) as pinned:
+        notebook_path.unlink()
+        outputs = [
+            notebook_grader.run_cell_and_capture_output(notebook_path, tag=tag)
+            for tag in ("exercise1", "exercise2", "exercise3")
+        ]
+
+    assert outputs == ["live 1", "live 2", "saved 3"]
+    assert pinned.fingerprint[1] < 0
+    assert notebook_index.parse_count == 1
+    assert notebook_index.pinned(notebook_path) is None
+
+
+def test_use_live_sources_reuses_parse_when_every_tagged_cell_is_live(
+    tmp_path: Path,
+    notebook_index: notebook_grader.NotebookIndex,
+) -> None:
+    notebook_path = _write_notebook(
+        tmp_path / "notebook.ipynb",
+        [{**_code_cell("exercise1", "print('saved')"), "id": "cell-1"}],
+    )
+    with notebook_grader.use_live_sources(notebook_path, {"cell-1": "print('live')"}):
+        pass
+
+    _write_notebook(
+        notebook_path, [{**_code_cell("exercise1", "print('saved again')"), "id": "cell-1"}]
+    )
+    _bump_mtime(notebook_path)
+    with notebook_grader.use_live_sources(notebook_path, {"cell-1": "print('live again')"}):
+        output = notebook_grader.run_cell_and_capture_output(notebook_path, tag="exercise1")
+
+    assert output == "live again"
+    assert notebook_index.parse_count == 1
+
+
+def test_use_live_sources_keeps_fingerprint_when_sources_match(
+    tmp_path: Path,
+    notebook_index: notebook_grader.NotebookIndex,
+) -> None:
+    notebook_path = _write_notebook(
+        tmp_path / "notebook.ipynb",
+        [{**_code_cell("exercise1", "print('same')"), "id": "cell-1"}],
+    )
+
+    with notebook_grader.use_live_sources(notebook_path, {"cell-1": "print('same')"}) as pinned:
+        assert pinned == notebook_index.get(notebook_path)
+
+    assert pinned.fingerprint == (notebook_path.stat().st_mtime_ns, notebook_path.stat().st_size)
+
+
+def test_run_cell_with_input_cases_runs_each_case_in_fresh_namespace(
+    tmp_path: Path,
+    notebook_index: notebook_grader.NotebookIndex,
+) -> None:
+    notebook_path = _write_notebook(
+        tmp_path / "notebook.ipynb",
+        [
+            _code_cell(
+                "exercise1",
+                "seen = globals().get('seen', 0) + 1\nname = input('Name? ')\nprint(name, seen)",
+            )
+        ],
+    )
+
+    outputs = notebook_grader.run_cell_with_input_cases(
+        notebook_path,
+        tag="exercise1",
+        cases=[["Ada"], ["Grace"]],
+    )
+
+    assert outputs == ["Name? Ada 1", "Name? Grace 1"]
+    assert notebook_index.parse_count == 1
+
+
+def test_run_cell_with_input_cases_reports_first_failing_case(
+    tmp_path: Path,
+    notebook_index: notebook_grader.NotebookIndex,
+) -> None:
+    notebook_path = _write_notebook(
+        tmp_path / "notebook.ipynb",
+        [_code_cell("exercise1", "print(int(input()))")],
+    )
+
+    with pytest.raises(notebook_grader.NotebookGradingError, match="invalid literal"):
+        notebook_grader.run_cell_with_input_cases(
+            notebook_path,
+            tag="exercise1",
+            cases=[["1"], ["one"], []],
+        )
+
+
+def test_run_cell_with_default_inputs_runs_interactive_cell_once(
+    tmp_path: Path,
+    notebook_index: notebook_grader.NotebookIndex,
+) -> None:
+    notebook_path = _write_notebook(
+        tmp_path / "notebook.ipynb",
+        [
+            _code_cell(
+                "exercise1",
+                "total = 0\nfor _ in range(3):\n    total += int(input())\nprint(total)",
+            )
+        ],
+    )
+
+    result = notebook_grader.run_cell_with_default_inputs(notebook_path, tag="exercise1")
+
+    assert result == notebook_grader.DefaultInputOutput(output="6", inputs_consumed=3)
+
+
+def test_run_cell_with_default_inputs_fails_past_max_inputs(
+    tmp_path: Path,
+    notebook_index: notebook_grader.NotebookIndex,
+) -> None:
+    notebook_path = _write_notebook(
+        tmp_path / "notebook.ipynb",
+        [_code_cell("exercise1", "while True:\n    input()")],
+    )
+
+    with pytest.raises(notebook_grader.NotebookGradingError, match="expected more input"):
+        notebook_grader.run_cell_with_default_inputs(notebook_path, tag="exercise1", max_inputs=2)
+
+
+def test_run_cell_and_capture_output_stops_runaway_printing(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    notebook_index: notebook_grader.NotebookIndex,
+) -> None:
+    monkeypatch.setenv(cell_executor.OUTPUT_LIMIT_ENV_VAR, str(OUTPUT_LIMIT_BYTES))
+    notebook_path = _write_notebook(
+        tmp_path / "notebook.ipynb",
+        [_code_cell("exercise1", "while True:\n    print('spam')")],
+    )
+
+    with pytest.raises(notebook_grader.OutputLimitExceeded, match="Output began:\nspam") as info:
+        notebook_grader.run_cell_and_capture_output(notebook_path, tag="exercise1")
+
+    assert info.value.limit_bytes == OUTPUT_LIMIT_BYTES
+    assert info.value.output == ("spam\n" * OUTPUT_LIMIT_BYTES)[:OUTPUT_LIMIT_BYTES]
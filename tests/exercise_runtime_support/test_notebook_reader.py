@@ -0,0 +1,98 @@
+"""Tests for ``exercise_runtime_support.notebook_reader``."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from exercise_runtime_support.notebook_reader import load_notebook
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+TRICKY_TEXT = 'line ]} "quoted" [{ \\ back\\slash é\n'
+
+
+def _bloated_notebook() -> dict[str, object]:
+    return {
+        "cells": [
+            {
+                "cell_type": "code",
+                "execution_count": 3,
+                "metadata": {"tags": ["exercise1"]},
+                "source": ["text = '[{\"}'\n", "print(text)"],
+                "outputs": [
+                    {"output_type": "stream", "name": "stdout", "text": [TRICKY_TEXT] * 50},
+                    {"output_type": "display_data", "data": {"image/png": "iVBORw0K" * 500}},
+                ],
+            },
+            {
+                "cell_type": "markdown",
+                "metadata": {"tags": ["explanation1"]},
+                "source": "See ![plot](attachment:plot.png)",
+                "attachments": {"plot.png": {"image/png": "iVBORw0K" * 500}},
+            },
+        ],
+        "metadata": {"kernelspec": {"name": "python3"}},
+        "nbformat": 4,
+        "nbformat_minor": 5,
+    }
+
+
+def _without_skipped_members(notebook: dict[str, object]) -> dict[str, object]:
+    expected = json.loads(json.dumps(notebook))
+    for cell in expected["cells"]:
+        cell.pop("outputs", None)
+        cell.pop("attachments", None)
+    return expected
+
+
+@pytest.mark.parametrize("indent", [None, 1])
+def test_load_notebook_scanner_drops_outputs_and_attachments(
+    tmp_path: Path,
+    indent: int | None,
+) -> None:
+    notebook = _bloated_notebook()
+    path = tmp_path / "notebook.ipynb"
+    path.write_text(json.dumps(notebook, indent=indent), encoding="utf-8")
+
+    loaded = load_notebook(path, scan_threshold=0)
+
+    assert loaded == _without_skipped_members(notebook)
+
+
+def test_load_notebook_small_files_match_scanner(tmp_path: Path) -> None:
+    path = tmp_path / "notebook.ipynb"
+    path.write_text(json.dumps(_bloated_notebook()), encoding="utf-8")
+
+    assert load_notebook(path) == load_notebook(path, scan_threshold=0)
+
+
+def test_load_notebook_scanner_matches_json_for_repository_notebooks() -> None:
+    notebook_paths = sorted((REPO_ROOT / "exercises").rglob("*.ipynb"))
+    assert notebook_paths
+
+    for path in notebook_paths:
+        expected = _without_skipped_members(json.loads(path.read_text(encoding="utf-8")))
+        assert load_notebook(path, scan_threshold=0) == expected, path
+
+
+@pytest.mark.parametrize(
+    "content",
+    ["", '{"cells": [', '{"cells": [{"outputs": ["unterminated]}]}', '{"cells": []} trailing'],
+)
+def test_load_notebook_reports_invalid_json_like_json_loads(tmp_path: Path, content: str) -> None:
+    path = tmp_path / "notebook.ipynb"
+    path.write_text(content, encoding="utf-8")
+
+    with pytest.raises(json.JSONDecodeError) as expected:
+        json.loads(content)
+    with pytest.raises(json.JSONDecodeError) as actual:
+        load_notebook(path, scan_threshold=0)
+
+    assert str(actual.value) == str(expected.value)
+
+
+def test_load_notebook_raises_for_missing_file(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        load_notebook(tmp_path / "missing.ipynb")
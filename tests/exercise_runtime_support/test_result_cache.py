@@ -0,0 +1,235 @@
+"""Tests for ``exercise_runtime_support.result_cache``."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+
+import pytest
+
+from exercise_runtime_support import notebook_grader, result_cache
+from exercise_runtime_support.cell_executor import CellExecutionResult, CellJob, InProcessExecutor
+from exercise_runtime_support.result_cache import ResultCache
+
+MAX_ENTRIES = 2
+SCAN_LIMIT = 16
+SCAN_LIMIT_AFTER_TRIM = 14
+
+
+class CountingExecutor(InProcessExecutor):
+    """In-process executor that records how many jobs it ran."""
+
+    def __init__(self) -> None:
+        self.jobs_run = 0
+
+    def map(self, jobs: Sequence[CellJob]) -> list[CellExecutionResult]:
+        self.jobs_run += len(jobs)
+        return super().map(jobs)
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> Iterator[ResultCache]:
+    installed = ResultCache(tmp_path / "results")
+    result_cache.reset_result_cache(installed)
+    try:
+        yield installed
+    finally:
+        result_cache.reset_result_cache()
+
+
+def _write_notebook(path: Path, sources: dict[str, str]) -> Path:
+    cells = [
+        {"cell_type": "code", "metadata": {"tags": [tag]}, "source": [source]}
+        for tag, source in sources.items()
+    ]
+    path.write_text(json.dumps({"cells": cells}), encoding="utf-8")
+    return path
+
+
+def test_grader_reexecutes_only_changed_cells(tmp_path: Path, cache: ResultCache) -> None:
+    notebook_path = _write_notebook(
+        tmp_path / "notebook.ipynb",
+        {"exercise1": "print('one')", "exercise2": "print(input('? '))"},
+    )
+    executor = CountingExecutor()
+
+    def grade() -> tuple[str, list[str]]:
+        static = notebook_grader.run_cell_and_capture_output(
+            notebook_path, tag="exercise1", executor=executor
+        )
+        interactive = notebook_grader.run_cell_with_input_cases(
+            notebook_path, tag="exercise2", cases=[["a"], ["b"]], executor=executor
+        )
+        return static, interactive
+
+    first = grade()
+    jobs_after_first_run = executor.jobs_run
+    second = grade()
+    _write_notebook(
+        tmp_path / "notebook.ipynb",
+        {"exercise1": "print('uno')", "exercise2": "print(input('? '))"},
+    )
+    third = grade()
+
+    assert first == second == ("one", ["? a", "? b"])
+    assert executor.jobs_run == jobs_after_first_run + 1
+    assert third == ("uno", ["? a", "? b"])
+
+
+def test_edited_data_file_is_not_served_from_cache(tmp_path: Path, cache: ResultCache) -> None:
+    data_path = tmp_path / "scores.txt"
+    data_path.write_text("10\n", encoding="utf-8")
+    notebook_path = _write_notebook(
+        tmp_path / "notebook.ipynb",
+        {"exercise1": f"with open({str(data_path)!r}) as handle:\n    print(handle.read())"},
+    )
+
+    first = notebook_grader.run_cell_and_capture_output(notebook_path, tag="exercise1")
+    data_path.write_text("42\n", encoding="utf-8")
+    second = notebook_grader.run_cell_and_capture_output(notebook_path, tag="exercise1")
+
+    assert (first, second) == ("10", "42")
+    assert cache.stats.stores == 0
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        "print(open('data.txt').read())\n",
+        "import random\nprint(random.randint(1, 6))\n",
+        "from datetime import date\nprint(date.today())\n",
+        "import os.path\nprint(os.path.exists('data.txt'))\n",
+        "print(eval(\"open('data.txt').read()\"))\n",
+        "exec(\"print(open('data.txt').read())\")\n",
+        "code = compile('print(1)', '<x>', 'exec')\n",
+        "read = globals()['__builtins__']\n",
+        "reader = getattr(__builtins__, 'open')\nprint(reader('data.txt').read())\n",
+        "run = eval\nprint(run('1 + 1'))\n",
+        "import sys\nprint(sys.stdin.readline())\n",
+        "from sys import stdin\nprint(stdin.read())\n",
+        "import builtins\nprint(builtins.input())\n",
+    ],
+)
+def test_cells_reading_outside_state_have_no_key(cache: ResultCache, source: str) -> None:
+    assert cache.key_for(CellJob(source, "<cell>", ())) is None
+
+
+def test_plain_cells_with_inputs_keep_their_key(cache: ResultCache) -> None:
+    job = CellJob("name = input('Name? ')\nprint(f'Hello {name}')\n", "<cell>", ("Sam",))
+
+    assert cache.key_for(job) is not None
+
+
+def test_failing_cells_are_not_cached(cache: ResultCache) -> None:
+    job = CellJob("raise ValueError('bad')\n", "<cell>", ())
+
+    cache.put(job, InProcessExecutor().run(job))
+
+    assert cache.get(job) is None
+    assert cache.stats.stores == 0
+
+
+def test_cells_that_read_stdin_are_not_cached(
+    cache: ResultCache,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    job = CellJob("print(input())\n", "<cell>")
+    monkeypatch.setattr("sys.stdin", _LineReader("typed\n"))
+
+    result = InProcessExecutor().run(job)
+    cache.put(job, result)
+
+    assert result.used_stdin
+    assert cache.get(job) is None
+
+
+def test_key_depends_on_inputs_and_runtime_version(
+    cache: ResultCache,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    job = CellJob("print(input())\n", "<cell>", ("a",))
+    base_key = cache.key_for(job)
+
+    assert cache.key_for(CellJob(job.source, job.filename, ("b",))) != base_key
+    assert cache.key_for(CellJob(job.source, job.filename, ("a",), collect_metrics=True)) is None
+    monkeypatch.setattr(result_cache, "runtime_support_version", lambda: "changed")
+    assert cache.key_for(job) != base_key
+
+
+def test_runtime_version_covers_every_package_module(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    package_dir = tmp_path / "exercise_runtime_support"
+    grader_path = package_dir / "notebook_grader.py"
+    nested_path = package_dir / "exercise_framework" / "runtime.py"
+    nested_path.parent.mkdir(parents=True)
+    for path in (package_dir / "result_cache.py", grader_path, nested_path):
+        path.write_text("VALUE = 1\n", encoding="utf-8")
+    monkeypatch.setattr(result_cache, "__file__", str(package_dir / "result_cache.py"))
+    versions: list[str] = []
+    try:
+        for path in (grader_path, nested_path):
+            result_cache.runtime_support_version.cache_clear()
+            versions.append(result_cache.runtime_support_version())
+            path.write_text("VALUE = 2\n", encoding="utf-8")
+        result_cache.runtime_support_version.cache_clear()
+        versions.append(result_cache.runtime_support_version())
+    finally:
+        result_cache.runtime_support_version.cache_clear()
+
+    assert len(set(versions)) == len(versions)
+
+
+def test_disk_store_is_bounded_and_survives_new_instances(tmp_path: Path) -> None:
+    cache_dir = tmp_path / "results"
+    cache = ResultCache(cache_dir, max_entries=MAX_ENTRIES)
+    executor = InProcessExecutor()
+    jobs = [CellJob(f"print({index})\n", "<cell>", ()) for index in range(MAX_ENTRIES + 1)]
+    for job in jobs:
+        cache.put(job, executor.run(job))
+
+    reopened = ResultCache(cache_dir, max_entries=MAX_ENTRIES)
+
+    assert len(list(cache_dir.iterdir())) == MAX_ENTRIES
+    cached = [reopened.get(job) for job in jobs]
+    assert sum(result is not None for result in cached) == MAX_ENTRIES
+
+
+def test_disk_store_is_rescanned_only_when_limit_is_crossed(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    cache = ResultCache(tmp_path / "results", max_entries=SCAN_LIMIT)
+    scans: list[int] = []
+    original = ResultCache._evict  # pyright: ignore[reportPrivateUsage]
+
+    def counting_evict(self: ResultCache) -> None:
+        scans.append(len(list(self.cache_dir.iterdir())))
+        original(self)
+
+    monkeypatch.setattr(ResultCache, "_evict", counting_evict)
+    executor = InProcessExecutor()
+    for index in range(SCAN_LIMIT + 2):
+        job = CellJob(f"print({index})\n", "<cell>", ())
+        cache.put(job, executor.run(job))
+
+    # One scan to count the store, one when the limit is crossed.
+    assert scans == [1, SCAN_LIMIT + 1]
+    assert len(list(cache.cache_dir.iterdir())) == SCAN_LIMIT_AFTER_TRIM + 1
+
+
+def test_result_cache_is_disabled_without_env_var(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv(result_cache.RESULT_CACHE_DIR_ENV_VAR, raising=False)
+    result_cache.reset_result_cache()
+
+    assert result_cache.get_result_cache() is None
+
+
+class _LineReader:
+    def __init__(self, text: str) -> None:
+        self._lines = text.splitlines(keepends=True)
+
+    def readline(self) -> str:
+        return self._lines.pop(0) if self._lines else ""
@@ -33,12 +33,20 @@ _EX003_PROMPT_FLOW_PLACEHOLDERS = {
 
 _EX002_CHECK_RESULT_COUNT = 30
 
+ex010_checks = load_exercise_test_module(
+    "ex010_sequence_debug_fstrings",
+    "student_checker_support",
+)
+_EX010_UNFORMATTED_CODE = "print('Hello ' + name + animal)\n"
+
 
 def test_check_exercises_uses_catalogue_order(monkeypatch: pytest.MonkeyPatch) -> None:
     """Summary checks follow the shared catalogue order."""
     seen_labels: list[str] = []
 
-    def fake_run_checks(check_specs: list[NotebookCheckSpec]) -> list[CheckResult]:
+    def fake_run_checks(
+        check_specs: list[NotebookCheckSpec], **_kwargs: object
+    ) -> list[CheckResult]:
         seen_labels.extend(check.label for check in check_specs)
         return []
 
@@ -140,3 +148,47 @@ def test_check_exercise_supports_generic_ex002_path(
     assert len(results) == _EX002_CHECK_RESULT_COUNT
     assert {result.title for result in results} == {"Construct", "Formatting", "Logic"}
     assert {result.exercise_no for result in results} == set(range(1, 11))
+
+
+@pytest.mark.parametrize(
+    ("exercise_no", "expected_issues"),
+    [
+        (
+            2,
+            [
+                "Exercise 2: use an f-string in the final output.",
+                "Exercise 2: use 'pet', not 'animal'.",
+                "Exercise 2: interpolate variable(s) in the f-string: pet.",
+            ],
+        ),
+        (
+            5,
+            [
+                "Exercise 5: use an f-string in the final output.",
+                "Exercise 5: include one input() call.",
+                "Exercise 5: interpolate variable(s) in the f-string: snack.",
+            ],
+        ),
+        (
+            6,
+            [
+                "Exercise 6: use an f-string in the final output.",
+                "Exercise 6: interpolate variable(s) in the f-string: name, town.",
+                "Exercise 6: include two input() calls.",
+            ],
+        ),
+    ],
+)
+def test_ex010_construct_issues_keep_their_reporting_order(
+    monkeypatch: pytest.MonkeyPatch,
+    exercise_no: int,
+    expected_issues: list[str],
+) -> None:
+    """Rule-based construct issues keep the order students have always seen."""
+
+    def fake_exercise_code(_exercise_no: int) -> str:
+        return _EX010_UNFORMATTED_CODE
+
+    monkeypatch.setattr(ex010_checks, "_exercise_code", fake_exercise_code)
+
+    assert ex010_checks._check_construct(exercise_no) == expected_issues
@@ -0,0 +1,268 @@
+"""Tests for ``exercise_runtime_support.student_checker.concurrency``."""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+
+import exercise_runtime_support.student_checker.checks as student_checks
+from exercise_runtime_support.cell_executor import InProcessExecutor, PooledExecutor, use_executor
+from exercise_runtime_support.execution_variant import get_active_variant, pin_variant
+from exercise_runtime_support.student_checker.concurrency import (
+    CHECK_TIMEOUT_ENV_VAR,
+    CHECK_WORKERS_ENV_VAR,
+    DEFAULT_CHECK_WORKERS,
+    configured_check_timeout,
+    configured_check_workers,
+    iter_completed,
+)
+from exercise_runtime_support.student_checker.models import (
+    ExerciseCheckResult,
+    NotebookCheckSpec,
+)
+from exercise_runtime_support.student_checker.reporting import CheckResult, run_checks
+
+_WAIT_SECONDS = 5.0
+_SHORT_TIMEOUT_SECONDS = 0.05
+_CONFIGURED_WORKERS = 3
+_SLOW_CHECK_SECONDS = 0.2
+
+
+@pytest.fixture
+def killable_backend() -> Iterator[None]:
+    """Install a pooled executor so checks may run concurrently with a time limit."""
+    executor = PooledExecutor(max_workers=1, prewarm=False)
+    try:
+        with use_executor(executor):
+            yield
+    finally:
+        executor.shutdown()
+
+
+def _check_threads() -> list[threading.Thread]:
+    return [
+        thread
+        for thread in threading.enumerate()
+        if thread.name.startswith("pytutor-check") and thread.is_alive()
+    ]
+
+
+def _no_timeout(index: int, _timeout: float) -> str:
+    raise AssertionError(f"task {index} should not time out")
+
+
+def test_iter_completed_yields_in_completion_order() -> None:
+    release_first = threading.Event()
+
+    def first() -> str:
+        assert release_first.wait(_WAIT_SECONDS)
+        return "first"
+
+    completed = iter_completed([first, lambda: "second"], on_timeout=_no_timeout, max_workers=2)
+
+    assert next(completed) == (1, "second")
+    release_first.set()
+    assert list(completed) == [(0, "first")]
+
+
+def test_iter_completed_reports_timed_out_tasks() -> None:
+    release = threading.Event()
+
+    def hang() -> str:
+        release.wait(_WAIT_SECONDS)
+        return "late"
+
+    try:
+        completed = list(
+            iter_completed(
+                [hang, lambda: "quick"],
+                on_timeout=lambda index, timeout: f"timeout {index} after {timeout}",
+                max_workers=2,
+                timeout=_SHORT_TIMEOUT_SECONDS,
+            )
+        )
+    finally:
+        release.set()
+
+    assert completed == [(1, "quick"), (0, f"timeout 0 after {_SHORT_TIMEOUT_SECONDS}")]
+
+
+def test_iter_completed_runs_serially_with_one_worker() -> None:
+    threads: list[str] = []
+
+    def record() -> str:
+        threads.append(threading.current_thread().name)
+        return "done"
+
+    completed = list(iter_completed([record, record], on_timeout=_no_timeout, max_workers=1))
+
+    assert completed == [(0, "done"), (1, "done")]
+    assert threads == [threading.current_thread().name] * 2
+
+
+def test_configured_limits_read_environment(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv(CHECK_WORKERS_ENV_VAR, raising=False)
+    assert configured_check_workers() == DEFAULT_CHECK_WORKERS
+
+    monkeypatch.setenv(CHECK_WORKERS_ENV_VAR, str(_CONFIGURED_WORKERS))
+    monkeypatch.setenv(CHECK_TIMEOUT_ENV_VAR, "0")
+    assert configured_check_workers() == _CONFIGURED_WORKERS
+    assert configured_check_timeout() is None
+
+    monkeypatch.setenv(CHECK_TIMEOUT_ENV_VAR, "soon")
+    with pytest.raises(RuntimeError, match=CHECK_TIMEOUT_ENV_VAR):
+        configured_check_timeout()
+
+
+@pytest.mark.usefixtures("killable_backend")
+def test_run_exercise_checks_streams_results_and_orders_by_exercise_no(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    fast_streamed = threading.Event()
+    streamed: list[ExerciseCheckResult] = []
+
+    def slow_check() -> list[str]:
+        assert fast_streamed.wait(_WAIT_SECONDS)
+        return []
+
+    def fast_check() -> list[str]:
+        return ["Exercise 2: wrong output."]
+
+    def on_result(result: ExerciseCheckResult) -> None:
+        streamed.append(result)
+        fast_streamed.set()
+
+    cache: dict[str, list[Any]] = {
+        "stream_probe": [
+            student_checks.ExerciseCheckDefinition(exercise_no=1, title="Slow", check=slow_check),
+            student_checks.ExerciseCheckDefinition(exercise_no=2, title="Fast", check=fast_check),
+        ]
+    }
+    monkeypatch.setattr(student_checks, "_CHECK_CACHE", cache)
+    monkeypatch.setenv(CHECK_WORKERS_ENV_VAR, "2")
+
+    results = student_checks.run_exercise_checks("stream_probe", on_result=on_result)
+
+    assert [result.title for result in streamed] == ["Fast", "Slow"]
+    assert [result.title for result in results] == ["Slow", "Fast"]
+
+
+@pytest.mark.usefixtures("killable_backend")
+def test_run_exercise_checks_fails_checks_that_time_out(monkeypatch: pytest.MonkeyPatch) -> None:
+    release = threading.Event()
+
+    def hanging_check() -> list[str]:
+        release.wait(_WAIT_SECONDS)
+        return []
+
+    cache: dict[str, list[Any]] = {
+        "timeout_probe": [
+            student_checks.ExerciseCheckDefinition(exercise_no=1, title="Hang", check=hanging_check)
+        ]
+    }
+    monkeypatch.setattr(student_checks, "_CHECK_CACHE", cache)
+    monkeypatch.setenv(CHECK_TIMEOUT_ENV_VAR, str(_SHORT_TIMEOUT_SECONDS))
+
+    try:
+        results = student_checks.run_exercise_checks("timeout_probe")
+    finally:
+        release.set()
+
+    assert [result.passed for result in results] == [False]
+    assert "did not finish" in results[0].issues[0]
+
+
+@pytest.mark.usefixtures("killable_backend")
+def test_run_checks_keeps_spec_order_and_streams_rows() -> None:
+    fast_streamed = threading.Event()
+    streamed: list[str] = []
+
+    def slow() -> list[str]:
+        assert fast_streamed.wait(_WAIT_SECONDS)
+        return []
+
+    def on_result(row: CheckResult) -> None:
+        streamed.append(row[0])
+        fast_streamed.set()
+
+    rows = run_checks(
+        [NotebookCheckSpec("Slow", slow), NotebookCheckSpec("Fast", lambda: ["broken"])],
+        on_result=on_result,
+    )
+
+    assert streamed == ["Fast", "Slow"]
+    assert rows == [("Slow", True, []), ("Fast", False, ["broken"])]
+
+
+def test_in_process_checks_run_serially_without_abandoning_threads(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    threads: list[str] = []
+
+    def slow_check() -> list[str]:
+        threads.append(threading.current_thread().name)
+        threading.Event().wait(_SLOW_CHECK_SECONDS)
+        return []
+
+    cache: dict[str, list[Any]] = {
+        "serial_probe": [
+            student_checks.ExerciseCheckDefinition(exercise_no=1, title="Slow", check=slow_check),
+            student_checks.ExerciseCheckDefinition(exercise_no=2, title="Slow", check=slow_check),
+        ]
+    }
+    monkeypatch.setattr(student_checks, "_CHECK_CACHE", cache)
+    monkeypatch.setenv(CHECK_WORKERS_ENV_VAR, "2")
+    monkeypatch.setenv(CHECK_TIMEOUT_ENV_VAR, str(_SHORT_TIMEOUT_SECONDS))
+
+    with use_executor(InProcessExecutor()):
+        results = student_checks.run_exercise_checks("serial_probe")
+
+    assert [result.passed for result in results] == [True, True]
+    assert threads == [threading.current_thread().name] * 2
+    assert _check_threads() == []
+
+
+def test_nested_runs_do_not_start_a_second_pool() -> None:
+    def thread_name() -> str:
+        return threading.current_thread().name
+
+    def outer() -> tuple[str, list[str]]:
+        inner = iter_completed([thread_name, thread_name], on_timeout=_no_timeout, max_workers=2)
+        return thread_name(), [name for _, name in inner]
+
+    completed = list(
+        iter_completed([outer, outer], on_timeout=_no_timeout, max_workers=2, timeout=0)
+    )
+
+    for _, (outer_thread, inner_threads) in completed:
+        assert outer_thread.startswith("pytutor-check")
+        assert inner_threads == [outer_thread] * 2
+
+
+def test_pinned_variant_reaches_tasks_that_outlive_the_pin() -> None:
+    release = threading.Event()
+    observed: list[str] = []
+
+    def late_reader() -> str:
+        release.wait(_WAIT_SECONDS)
+        observed.append(get_active_variant())
+        return "late"
+
+    with pin_variant("student"):
+        completed = list(
+            iter_completed(
+                [late_reader],
+                on_timeout=lambda index, _timeout: f"timeout {index}",
+                max_workers=2,
+                timeout=_SHORT_TIMEOUT_SECONDS,
+            )
+        )
+    release.set()
+    for thread in _check_threads():
+        thread.join(_WAIT_SECONDS)
+
+    assert completed == [(0, "timeout 0")]
+    assert observed == ["student"]
@@ -0,0 +1,173 @@
+"""Tests for ``exercise_runtime_support.student_checker.kernel_sources``."""
+
+from __future__ import annotations
+
+import importlib
+import json
+import types
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+
+from exercise_runtime_support.notebook_grader import get_notebook_index
+from exercise_runtime_support.student_checker import kernel_sources, notebook_runtime
+from exercise_runtime_support.student_checker.models import NotebookTagCheckResult
+
+_EXERCISE_KEY = "ex001_sequence_kernel_probe"
+
+
+@dataclass(frozen=True)
+class _ExecutionInfo:
+    raw_cell: str
+    cell_id: str | None
+
+
+class _FakeEvents:
+    def __init__(self) -> None:
+        self.callbacks: dict[str, list[Callable[[object], None]]] = {}
+
+    def register(self, event: str, callback: Callable[[object], None]) -> None:
+        self.callbacks.setdefault(event, []).append(callback)
+
+    def run_cell(self, source: str, cell_id: str | None) -> None:
+        for callback in self.callbacks.get("pre_run_cell", []):
+            callback(_ExecutionInfo(source, cell_id))
+
+
+class _FakeShell:
+    def __init__(self) -> None:
+        self.events = _FakeEvents()
+
+
+@pytest.fixture
+def shell(monkeypatch: pytest.MonkeyPatch) -> _FakeShell:
+    fake_shell = _FakeShell()
+
+    def fake_running_shell() -> _FakeShell:
+        return fake_shell
+
+    monkeypatch.setattr(kernel_sources, "_recorder", None)
+    monkeypatch.setattr(kernel_sources, "_running_shell", fake_running_shell)
+    return fake_shell
+
+
+def test_recorder_keeps_latest_source_per_cell_id(shell: _FakeShell) -> None:
+    kernel_sources.load_ipython_extension(shell)
+    kernel_sources.install_recorder()
+
+    shell.events.run_cell("print(1)", "cell-1")
+    shell.events.run_cell("print(2)", "cell-1")
+    shell.events.run_cell("print('no id')", None)
+
+    assert len(shell.events.callbacks["pre_run_cell"]) == 1
+    assert kernel_sources.kernel_cell_sources() == {"cell-1": "print(2)"}
+
+
+def test_importing_the_module_installs_the_recorder(monkeypatch: pytest.MonkeyPatch) -> None:
+    fake_shell = _FakeShell()
+    fake_ipython = types.ModuleType("IPython")
+
+    def get_ipython() -> _FakeShell:
+        return fake_shell
+
+    fake_ipython.__dict__["get_ipython"] = get_ipython
+    monkeypatch.setitem(kernel_sources.sys.modules, "IPython", fake_ipython)
+    monkeypatch.setattr(kernel_sources, "_recorder", None)
+    monkeypatch.setattr(kernel_sources, "_running_shell", kernel_sources._running_shell)  # pyright: ignore[reportPrivateUsage]
+
+    importlib.reload(kernel_sources)
+    fake_shell.events.run_cell("print('before the check')", "cell-1")
+
+    assert kernel_sources.kernel_cell_sources() == {"cell-1": "print('before the check')"}
+
+
+def test_outside_ipython_there_are_no_kernel_sources(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(kernel_sources, "_recorder", None)
+    monkeypatch.delitem(kernel_sources.sys.modules, "IPython", raising=False)
+
+    assert kernel_sources.kernel_cell_sources() == {}
+    assert kernel_sources.install_recorder() is None
+
+
+def _notebook_with_saved_cell(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    notebook_path = tmp_path / "student.ipynb"
+    cell = {
+        "cell_type": "code",
+        "id": "cell-1",
+        "metadata": {"tags": ["exercise1"]},
+        "source": "raise ValueError('saved')",
+    }
+    notebook_path.write_text(json.dumps({"cells": [cell]}), encoding="utf-8")
+
+    def fake_has_exercise_checks(_exercise_key: str) -> bool:
+        return False
+
+    def fake_resolve_notebook_path(_exercise_key: str, **_kwargs: object) -> Path:
+        return notebook_path
+
+    monkeypatch.setattr(notebook_runtime, "has_exercise_checks", fake_has_exercise_checks)
+    monkeypatch.setattr(notebook_runtime, "resolve_notebook_path", fake_resolve_notebook_path)
+    monkeypatch.setattr(
+        "exercise_runtime_support.notebook_grader.resolve_framework_notebook_path",
+        fake_resolve_notebook_path,
+    )
+    return notebook_path
+
+
+@pytest.mark.parametrize(("from_kernel", "passed"), [(True, True), (False, False)])
+def test_run_notebook_checks_uses_unsaved_kernel_sources(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    shell: _FakeShell,
+    from_kernel: bool,
+    passed: bool,
+) -> None:
+    notebook_path = _notebook_with_saved_cell(tmp_path, monkeypatch)
+    printed: list[list[NotebookTagCheckResult]] = []
+
+    def fake_print_results(results: list[NotebookTagCheckResult]) -> None:
+        printed.append(results)
+
+    monkeypatch.setattr(notebook_runtime, "_print_notebook_check_results", fake_print_results)
+    kernel_sources.install_recorder()
+    shell.events.run_cell("print('fixed but not saved')", "cell-1")
+
+    notebook_runtime.run_notebook_checks(_EXERCISE_KEY, from_kernel=from_kernel)
+
+    assert [result.passed for result in printed[0]] == [passed]
+    assert get_notebook_index().pinned(notebook_path) is None
+
+
+def test_repeat_checks_do_not_reparse_a_saved_notebook(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    shell: _FakeShell,
+) -> None:
+    notebook_path = _notebook_with_saved_cell(tmp_path, monkeypatch)
+    printed: list[list[NotebookTagCheckResult]] = []
+
+    def fake_print_results(results: list[NotebookTagCheckResult]) -> None:
+        printed.append(results)
+
+    def fail_load_notebook(path: Path) -> object:
+        raise AssertionError(f"read {path} from disk")
+
+    monkeypatch.setattr(notebook_runtime, "_print_notebook_check_results", fake_print_results)
+    index = get_notebook_index()
+    index.clear()
+    kernel_sources.install_recorder()
+    shell.events.run_cell("print('fixed')", "cell-1")
+    notebook_runtime.run_notebook_checks(_EXERCISE_KEY, full_recheck=True)
+
+    notebook_path.write_text(notebook_path.read_text(encoding="utf-8") + "\n", encoding="utf-8")
+    monkeypatch.setattr(notebook_runtime, "load_notebook", fail_load_notebook)
+    monkeypatch.setattr(
+        "exercise_runtime_support.notebook_grader.load_notebook", fail_load_notebook
+    )
+    notebook_runtime.run_notebook_checks(_EXERCISE_KEY, full_recheck=True)
+
+    assert [[result.passed for result in results] for results in printed] == [[True], [True]]
+    assert index.parse_count == 1
+    index.clear()
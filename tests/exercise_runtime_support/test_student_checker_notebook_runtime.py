@@ -2,106 +2,47 @@
 
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
 import pytest
 
-from exercise_runtime_support.notebook_grader import NotebookGradingError
+from exercise_runtime_support.notebook_grader import DefaultInputOutput, NotebookGradingError
 from exercise_runtime_support.student_checker import notebook_runtime
 
 
-def test_run_tagged_cell_uses_static_runner_when_no_input_calls(
+def test_run_tagged_cell_runs_each_cell_once_with_default_inputs(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    calls = {"static": 0, "interactive": 0}
+    calls: list[tuple[str, str, str]] = []
 
-    def fake_count_input_calls(notebook_path: str, *, tag: str) -> int:
-        assert notebook_path == "dummy_exercise"
-        assert tag == "exercise1"
-        return 0
-
-    def fake_run_static(notebook_path: str, *, tag: str, variant: str) -> str:
-        calls["static"] += 1
-        assert notebook_path == "dummy_exercise"
-        assert tag == "exercise1"
-        assert variant == "student"
-        return "ok\n"
-
-    def fake_run_with_input(
+    def fake_run_with_default_inputs(
         notebook_path: str,
         *,
         tag: str,
-        inputs: list[str],
         variant: str,
-    ) -> str:
-        calls["interactive"] += 1
-        assert variant == "student"
-        return ""
+    ) -> DefaultInputOutput:
+        calls.append((notebook_path, tag, variant))
+        return DefaultInputOutput(output="ok", inputs_consumed=2)
 
-    monkeypatch.setattr(notebook_runtime, "_count_input_calls", fake_count_input_calls)
-    monkeypatch.setattr(notebook_runtime, "run_cell_and_capture_output", fake_run_static)
-    monkeypatch.setattr(notebook_runtime, "run_cell_with_input", fake_run_with_input)
+    monkeypatch.setattr(
+        notebook_runtime, "run_cell_with_default_inputs", fake_run_with_default_inputs
+    )
 
     # pyright: ignore[reportPrivateUsage]
     notebook_runtime._run_tagged_cell("dummy_exercise", "exercise1")
 
-    assert calls == {"static": 1, "interactive": 0}
-
-
-def test_run_tagged_cell_uses_mocked_inputs_for_interactive_cells(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    calls = {"static": 0, "interactive": 0}
+    assert calls == [("dummy_exercise", "exercise1", "student")]
 
-    def fake_count_input_calls(notebook_path: str, *, tag: str) -> int:
-        assert notebook_path == "dummy_exercise"
-        assert tag == "exercise1"
-        return 2
 
-    def fake_run_static(notebook_path: str, *, tag: str, variant: str) -> str:
-        calls["static"] += 1
-        assert variant == "student"
-        return ""
-
-    def fake_run_with_input(
-        notebook_path: str,
-        *,
-        tag: str,
-        inputs: list[str],
-        variant: str,
-    ) -> str:
-        calls["interactive"] += 1
-        assert notebook_path == "dummy_exercise"
-        assert tag == "exercise1"
-        assert inputs == ["2", "2"]
-        assert variant == "student"
-        return "ok\n"
-
-    monkeypatch.setattr(notebook_runtime, "_count_input_calls", fake_count_input_calls)
-    monkeypatch.setattr(notebook_runtime, "run_cell_and_capture_output", fake_run_static)
-    monkeypatch.setattr(notebook_runtime, "run_cell_with_input", fake_run_with_input)
+def test_run_tagged_cell_answers_every_prompt_of_an_input_loop(tmp_path: Path) -> None:
+    notebook_path = tmp_path / "student.ipynb"
+    source = "scores = [int(input('Score? ')) for _ in range(4)]\nprint(sum(scores))"
+    cell = {"cell_type": "code", "metadata": {"tags": ["exercise1"]}, "source": source}
+    notebook_path.write_text(json.dumps({"cells": [cell]}), encoding="utf-8")
 
     # pyright: ignore[reportPrivateUsage]
-    notebook_runtime._run_tagged_cell("dummy_exercise", "exercise1")
-
-    assert calls == {"static": 0, "interactive": 1}
-
-
-def test_count_input_calls_detects_name_and_builtins_calls(monkeypatch: pytest.MonkeyPatch) -> None:
-    expected_count = 2
-    source = "first = input('A: ')\nsecond = builtins.input('B: ')\nprint(first, second)\n"
-
-    def fake_extract_tagged_code(*_args: object, **kwargs: object) -> str:
-        assert kwargs["variant"] == "student"
-        return source
-
-    monkeypatch.setattr(notebook_runtime, "extract_tagged_code", fake_extract_tagged_code)
-
-    count = notebook_runtime._count_input_calls(  # pyright: ignore[reportPrivateUsage]
-        "dummy_exercise", tag="exercise1"
-    )
-
-    assert count == expected_count
+    notebook_runtime._run_tagged_cell(notebook_path, "exercise1")
 
 
 def test_load_notebook_json_rejects_non_mapping_json(
@@ -218,7 +159,7 @@ def test_run_notebook_checks_uses_exercise_local_student_checker_support(
         assert exercise_key == "ex002_sequence_modify_basics"
         return True
 
-    def fake_run_exercise_checks(exercise_key: str) -> list[object]:
+    def fake_run_exercise_checks(exercise_key: str, **_kwargs: object) -> list[object]:
         assert exercise_key == "ex002_sequence_modify_basics"
         return sentinel_results
 
@@ -280,6 +221,7 @@ def test_run_notebook_checks_falls_back_to_tagged_execution_when_support_missing
     def fake_run_notebook_checks(
         path: Path,
         tags: list[str],
+        **_kwargs: object,
     ) -> list[object]:
         assert path == notebook_path
         assert tags == ["exercise1"]
@@ -340,101 +282,15 @@ def test_run_notebook_checks_reports_failures_for_unsolved_ex002(
     assert "Great work! All exercise cells ran without errors." not in output
 
 
-def test_run_tagged_cell_retries_when_missing_inputs(monkeypatch: pytest.MonkeyPatch) -> None:
-    attempt_lengths: list[int] = []
-
-    def fake_count_input_calls(notebook_path: str, *, tag: str) -> int:
-        return 1
-
-    def fake_run_with_input(
-        notebook_path: str,
-        *,
-        tag: str,
-        inputs: list[str],
-        variant: str,
-    ) -> str:
-        attempt_lengths.append(len(inputs))
-        assert variant == "student"
-        if len(attempt_lengths) == 1:
-            _raise_missing_input_error()
-        return "ok\n"
-
-    def fake_run_static(*_args: object, **_kwargs: object) -> str:
-        return ""
-
-    monkeypatch.setattr(notebook_runtime, "_count_input_calls", fake_count_input_calls)
-    monkeypatch.setattr(notebook_runtime, "run_cell_and_capture_output", fake_run_static)
-    monkeypatch.setattr(notebook_runtime, "run_cell_with_input", fake_run_with_input)
-
-    # pyright: ignore[reportPrivateUsage]
-    notebook_runtime._run_tagged_cell("dummy_exercise", "exercise1")
-
-    assert attempt_lengths == [1, 2]
-
-
-def test_run_tagged_cell_propagates_real_errors(monkeypatch: pytest.MonkeyPatch) -> None:
-    def fake_count_input_calls(notebook_path: str, *, tag: str) -> int:
-        return 1
-
-    def fake_run_with_input(
-        notebook_path: str,
-        *,
-        tag: str,
-        inputs: list[str],
-        variant: str,
-    ) -> str:
-        assert variant == "student"
-        raise NotebookGradingError("Execution failed")
-
-    def fake_run_static(*_args: object, **_kwargs: object) -> str:
-        return ""
-
-    monkeypatch.setattr(notebook_runtime, "_count_input_calls", fake_count_input_calls)
-    monkeypatch.setattr(notebook_runtime, "run_cell_and_capture_output", fake_run_static)
-    monkeypatch.setattr(notebook_runtime, "run_cell_with_input", fake_run_with_input)
+def test_run_tagged_cell_reports_cells_that_keep_asking_for_input(tmp_path: Path) -> None:
+    notebook_path = tmp_path / "student.ipynb"
+    cell = {
+        "cell_type": "code",
+        "metadata": {"tags": ["exercise1"]},
+        "source": "while True:\n    input()",
+    }
+    notebook_path.write_text(json.dumps({"cells": [cell]}), encoding="utf-8")
 
-    with pytest.raises(NotebookGradingError, match="Execution failed"):
+    with pytest.raises(NotebookGradingError, match="expected more input values"):
         # pyright: ignore[reportPrivateUsage]
-        notebook_runtime._run_tagged_cell("dummy_exercise", "exercise1")
-
-
-def test_run_tagged_cell_stops_after_max_attempts(monkeypatch: pytest.MonkeyPatch) -> None:
-    attempts = 0
-    limit = 2
-
-    def fake_count_input_calls(notebook_path: str, *, tag: str) -> int:
-        return 1
-
-    def fake_run_with_input(
-        notebook_path: str,
-        *,
-        tag: str,
-        inputs: list[str],
-        variant: str,
-    ) -> str:
-        nonlocal attempts
-        attempts += 1
-        assert variant == "student"
-        _raise_missing_input_error()
-        return ""
-
-    def fake_run_static(*_args: object, **_kwargs: object) -> str:
-        return ""
-
-    monkeypatch.setattr(notebook_runtime, "_count_input_calls", fake_count_input_calls)
-    monkeypatch.setattr(notebook_runtime, "run_cell_and_capture_output", fake_run_static)
-    monkeypatch.setattr(notebook_runtime, "run_cell_with_input", fake_run_with_input)
-    monkeypatch.setattr(notebook_runtime, "_MAX_AUTOMATED_INPUTS", limit)
-
-    with pytest.raises(NotebookGradingError):
-        # pyright: ignore[reportPrivateUsage]
-        notebook_runtime._run_tagged_cell("dummy_exercise", "exercise1")
-
-    assert attempts == limit
-
-
-def _raise_missing_input_error() -> None:
-    try:
-        raise RuntimeError("Test expected more input values")
-    except RuntimeError as exc:
-        raise NotebookGradingError("Execution failed for missing input") from exc
+        notebook_runtime._run_tagged_cell(notebook_path, "exercise1")
@@ -0,0 +1,190 @@
+"""Tests for incremental self-checks backed by ``student_checker.state``."""
+
+from __future__ import annotations
+
+import json
+from collections import Counter
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import exercise_runtime_support.student_checker.checks as student_checks
+from exercise_runtime_support.student_checker import notebook_runtime
+from exercise_runtime_support.student_checker.state import (
+    SELF_CHECK_STATE_ENV_VAR,
+    STATE_FILENAME,
+)
+
+_EXERCISE_KEY = "ex001_sequence_state_probe"
+
+
+def _write_notebook(path: Path, sources: dict[str, str]) -> None:
+    cells = [
+        {"cell_type": "code", "metadata": {"tags": [tag]}, "source": source}
+        for tag, source in sources.items()
+    ]
+    path.write_text(json.dumps({"cells": cells}), encoding="utf-8")
+
+
+@pytest.fixture
+def notebook(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.delenv(SELF_CHECK_STATE_ENV_VAR)
+    notebook_path = tmp_path / "notebooks" / "student.ipynb"
+    notebook_path.parent.mkdir()
+    _write_notebook(notebook_path, {"exercise1": "print(1)", "exercise2": "print(2)"})
+    tests_dir = tmp_path / "tests"
+    tests_dir.mkdir()
+    (tests_dir / "student_checker_support.py").write_text("CHECKS = []\n", encoding="utf-8")
+
+    def fake_resolve_notebook_path(_exercise_key: str) -> Path:
+        return notebook_path
+
+    def fake_resolve_exercise_tests_dir(_exercise_key: str) -> Path:
+        return tests_dir
+
+    monkeypatch.setattr(student_checks, "resolve_notebook_path", fake_resolve_notebook_path)
+    monkeypatch.setattr(
+        student_checks, "resolve_exercise_tests_dir", fake_resolve_exercise_tests_dir
+    )
+    return notebook_path
+
+
+@pytest.fixture
+def check_calls(monkeypatch: pytest.MonkeyPatch) -> Counter[int]:
+    calls: Counter[int] = Counter()
+
+    def make_check(exercise_no: int) -> student_checks.ExerciseCheckDefinition:
+        def check() -> list[str]:
+            calls[exercise_no] += 1
+            return [] if exercise_no == 1 else [f"Exercise {exercise_no}: wrong output."]
+
+        return student_checks.ExerciseCheckDefinition(
+            exercise_no=exercise_no, title="Logic", check=check
+        )
+
+    cache: dict[str, list[Any]] = {_EXERCISE_KEY: [make_check(1), make_check(2)]}
+    monkeypatch.setattr(student_checks, "_CHECK_CACHE", cache)
+    return calls
+
+
+def test_incremental_run_reuses_results_for_unchanged_exercises(
+    notebook: Path,
+    check_calls: Counter[int],
+) -> None:
+    first = student_checks.run_exercise_checks(_EXERCISE_KEY, incremental=True)
+    second = student_checks.run_exercise_checks(_EXERCISE_KEY, incremental=True)
+
+    assert check_calls == Counter({1: 1, 2: 1})
+    assert second == first
+    assert (notebook.parent / STATE_FILENAME).is_file()
+
+
+def test_incremental_run_reruns_only_edited_exercise(
+    notebook: Path,
+    check_calls: Counter[int],
+) -> None:
+    student_checks.run_exercise_checks(_EXERCISE_KEY, incremental=True)
+    _write_notebook(notebook, {"exercise1": "print(1)", "exercise2": "print('fixed')"})
+
+    results = student_checks.run_exercise_checks(_EXERCISE_KEY, incremental=True)
+
+    assert check_calls == Counter({1: 1, 2: 2})
+    assert [result.exercise_no for result in results] == [1, 2]
+
+
+def test_non_incremental_run_ignores_stored_results(
+    notebook: Path,
+    check_calls: Counter[int],
+) -> None:
+    student_checks.run_exercise_checks(_EXERCISE_KEY, incremental=True)
+    student_checks.run_exercise_checks(_EXERCISE_KEY)
+
+    assert check_calls == Counter({1: 2, 2: 2})
+    assert (notebook.parent / STATE_FILENAME).is_file()
+
+
+def test_changed_check_support_discards_stored_results(
+    notebook: Path,
+    check_calls: Counter[int],
+) -> None:
+    student_checks.run_exercise_checks(_EXERCISE_KEY, incremental=True)
+    support = notebook.parent.parent / "tests" / "student_checker_support.py"
+    support.write_text("CHECKS = []  # edited\n", encoding="utf-8")
+
+    student_checks.run_exercise_checks(_EXERCISE_KEY, incremental=True)
+
+    assert check_calls == Counter({1: 2, 2: 2})
+
+
+def test_state_file_can_be_turned_off(
+    notebook: Path,
+    check_calls: Counter[int],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv(SELF_CHECK_STATE_ENV_VAR, "0")
+
+    student_checks.run_exercise_checks(_EXERCISE_KEY, incremental=True)
+    student_checks.run_exercise_checks(_EXERCISE_KEY, incremental=True)
+
+    assert check_calls == Counter({1: 2, 2: 2})
+    assert not (notebook.parent / STATE_FILENAME).exists()
+
+
+def test_malformed_state_file_is_ignored(notebook: Path, check_calls: Counter[int]) -> None:
+    (notebook.parent / STATE_FILENAME).write_text("not json", encoding="utf-8")
+
+    results = student_checks.run_exercise_checks(_EXERCISE_KEY, incremental=True)
+
+    assert [result.passed for result in results] == [True, False]
+    assert check_calls == Counter({1: 1, 2: 1})
+
+
+def test_tagged_cell_fallback_reuses_unchanged_cells(
+    notebook: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    executed: list[str] = []
+
+    def fake_run_tagged_cell(_path: Path, tag: str) -> None:
+        executed.append(tag)
+
+    monkeypatch.setattr(notebook_runtime, "_run_tagged_cell", fake_run_tagged_cell)
+    tags = ["exercise1", "exercise2"]
+
+    for _ in range(2):
+        state = notebook_runtime._load_tagged_cell_state(  # pyright: ignore[reportPrivateUsage]
+            notebook, _EXERCISE_KEY
+        )
+        notebook_runtime._run_notebook_checks(  # pyright: ignore[reportPrivateUsage]
+            notebook, tags, state=state
+        )
+
+    assert executed == tags
+
+
+@pytest.mark.parametrize(("full_recheck", "incremental"), [(False, True), (True, False)])
+def test_run_notebook_checks_forwards_full_recheck(
+    monkeypatch: pytest.MonkeyPatch,
+    full_recheck: bool,
+    incremental: bool,
+) -> None:
+    captured: dict[str, object] = {}
+
+    def fake_run_exercise_checks(_exercise_key: str, **kwargs: object) -> list[object]:
+        captured.update(kwargs)
+        return []
+
+    def fake_has_exercise_checks(_exercise_key: str) -> bool:
+        return True
+
+    def fake_print_exercise_results(_results: list[object]) -> None:
+        return None
+
+    monkeypatch.setattr(notebook_runtime, "has_exercise_checks", fake_has_exercise_checks)
+    monkeypatch.setattr(notebook_runtime, "run_exercise_checks", fake_run_exercise_checks)
+    monkeypatch.setattr(notebook_runtime, "print_exercise_results", fake_print_exercise_results)
+
+    notebook_runtime.run_notebook_checks(_EXERCISE_KEY, full_recheck=full_recheck)
+
+    assert captured["incremental"] is incremental
@@ -12,6 +12,7 @@ from typing import TYPE_CHECKING, TypeAlias
 
 import pytest
 
+from exercise_metadata.compiled_catalogue import load_compiled_catalogue
 from scripts.template_repo_cli.core.collector import ExerciseFiles
 
 if TYPE_CHECKING:
@@ -320,7 +321,9 @@ class TestPackageIntegrity:
         template_packager.generate_readme(temp_dir, "Test", ["ex002_sequence_modify_basics"])
 
         watchdog_path = temp_dir / "scripts" / "jupyter_watchdog.py"
-        assert watchdog_path.exists(), "jupyter_watchdog.py must be copied into the template workspace"
+        assert watchdog_path.exists(), (
+            "jupyter_watchdog.py must be copied into the template workspace"
+        )
 
         watchdog_path.unlink()
         assert not template_packager.validate_package(temp_dir)
@@ -651,6 +654,7 @@ class TestPackageIntegrity:
             f"stderr:\n{default_discovery_result.stderr}"
         )
 
+
 class TestPackageCleanup:
     """Tests for cleanup on error."""
 
@@ -687,6 +691,30 @@ class TestPackageOptions:
         ).exists()
 
 
+class TestCompiledCatalogue:
+    """Tests for the precompiled catalogue written into packaged workspaces."""
+
+    def test_write_compiled_catalogue_lists_only_packaged_exercises(
+        self,
+        template_packager: TemplatePackager,
+        temp_dir: Path,
+        build_exercise_file_map: ExerciseFileMapBuilder,
+    ) -> None:
+        """The compiled catalogue matches the packaged exercises and keeps the package valid."""
+        exercise_key = "ex002_sequence_modify_basics"
+        template_packager.copy_exercise_files(temp_dir, build_exercise_file_map(exercise_key))
+        template_packager.copy_template_base_files(temp_dir)
+        template_packager.generate_readme(temp_dir, "Test", [exercise_key])
+
+        catalogue_path = template_packager.write_compiled_catalogue(temp_dir)
+
+        compiled = load_compiled_catalogue(catalogue_path, temp_dir / "exercises")
+        assert compiled is not None
+        assert [entry["exercise_key"] for entry in compiled] == [exercise_key]
+        assert catalogue_path.parent == temp_dir / "exercise_metadata"
+        assert template_packager.validate_package(temp_dir)
+
+
 class TestPackageMultipleExercises:
     """Tests for packaging multiple exercises."""
 
@@ -534,3 +534,223 @@ def test_plugin_extracts_line_numbers(
         score=0.0,
     )
     assert entry["line_no"] == EXPECTED_ASSERT_LINE
+
+
+def test_plugin_attaches_cell_metrics_when_enabled(
+    pytester: pytest.Pytester, run_with_results: RunWithResults
+) -> None:
+    _write_test_module(
+        pytester,
+        """\
+        import json
+        from pathlib import Path
+
+        from exercise_runtime_support import notebook_grader
+
+
+        def test_cell(tmp_path: Path) -> None:
+            cell = {"cell_type": "code", "metadata": {"tags": ["exercise1"]}, "source": ["print(input())"]}
+            notebook = tmp_path / "notebook.ipynb"
+            notebook.write_text(json.dumps({"cells": [cell]}), encoding="utf-8")
+            assert notebook_grader.run_cell_with_input(notebook, tag="exercise1", inputs=["hi"]) == "hi"
+        """,
+    )
+
+    result, payload, _ = run_with_results(args=["--autograde-metrics"])
+
+    result.assert_outcomes(passed=1)
+    entry = expect_single_test_entry(payload, status="pass", score=1.0)
+    metrics = entry.get("extra", {})["metrics"]
+    assert [(record["tag"], record["input_calls"]) for record in metrics] == [("exercise1", 1)]
+    assert metrics[0]["stdout_bytes"] == len("hi\n")
+
+
+def test_plugin_omits_cell_metrics_by_default(
+    pytester: pytest.Pytester, run_with_results: RunWithResults
+) -> None:
+    _write_test_module(
+        pytester,
+        """\
+        def test_example() -> None:
+            assert True
+        """,
+    )
+
+    _, payload, _ = run_with_results()
+
+    entry = expect_single_test_entry(payload, status="pass", score=1.0)
+    assert "metrics" not in entry.get("extra", {})
+
+
+_XDIST_WORKER_CONFTEST = """\
+import json
+from pathlib import Path
+
+import pytest
+
+pytest_plugins = ["autograde_plugin"]
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    config.workerinput = {"workerid": "gw0"}
+    config.workeroutput = {}
+
+
+def pytest_unconfigure(config):
+    Path("workeroutput.json").write_text(json.dumps(config.workeroutput), encoding="utf-8")
+"""
+
+_XDIST_CONTROLLER_CONFTEST = """\
+import pytest
+
+pytest_plugins = ["autograde_plugin"]
+
+WORKER_OUTPUTS = {worker_outputs!r}
+COLLECTION_ORDER = {collection_order!r}
+
+
+class FakeGateway:
+    def __init__(self, gateway_id):
+        self.id = gateway_id
+
+
+class FakeNode:
+    def __init__(self, gateway_id, workeroutput):
+        self.gateway = FakeGateway(gateway_id)
+        if workeroutput is not None:
+            self.workeroutput = workeroutput
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_sessionfinish(session):
+    hook = session.config.hook
+    hook.pytest_xdist_node_collection_finished(node=FakeNode("gw0", None), ids=COLLECTION_ORDER)
+    for gateway_id, workeroutput in WORKER_OUTPUTS.items():
+        error = None if workeroutput is not None else "worker crashed"
+        hook.pytest_testnodedown(node=FakeNode(gateway_id, workeroutput), error=error)
+"""
+
+_FIRST_NODEID = "test_remote.py::test_first"
+_SECOND_NODEID = "test_remote.py::test_second"
+_SECOND_TASK_NUMBER = 2
+
+
+def _worker_output(nodeid: str, *, taskno: int, status: str) -> dict[str, Any]:
+    name = nodeid.rsplit("::", 1)[-1]
+    return {
+        "autograde": {
+            "tests": [
+                {
+                    "nodeid": nodeid,
+                    "name": name,
+                    "taskno": taskno,
+                    "status": status,
+                    "score": 1.0 if status == "pass" else 0.0,
+                    "message": None,
+                    "line_no": None,
+                    "duration": 0.01,
+                }
+            ],
+            "metadata": {nodeid: {"name": name, "taskno": taskno, "marker_name": None}},
+            "notes": [],
+            "errors": [],
+        }
+    }
+
+
+def _make_controller_conftest(
+    pytester: pytest.Pytester,
+    worker_outputs: dict[str, dict[str, Any] | None],
+    collection_order: list[str],
+) -> None:
+    pytester.makeconftest(
+        _XDIST_CONTROLLER_CONFTEST.format(
+            worker_outputs=worker_outputs, collection_order=collection_order
+        )
+    )
+
+
+def test_plugin_xdist_worker_hands_results_to_controller(pytester: pytest.Pytester) -> None:
+    pytester.makeconftest(_XDIST_WORKER_CONFTEST)
+    _write_test_module(
+        pytester,
+        """\
+        import pytest
+
+        @pytest.mark.task(taskno=7)
+        def test_marked() -> None:
+            assert True
+        """,
+    )
+
+    result = pytester.runpytest(f"--autograde-results-path={RESULTS_FILENAME}")
+
+    result.assert_outcomes(passed=1)
+    assert not (pytester.path / RESULTS_FILENAME).exists()
+    workeroutput = _assert_dict(
+        json.loads((pytester.path / "workeroutput.json").read_text(encoding="utf-8")),
+        context="workeroutput",
+    )
+    share = _assert_dict(workeroutput["autograde"], context="worker share")
+    (entry,) = [_assert_autograde_test_entry(test) for test in share["tests"]]
+    assert entry["status"] == "pass"
+    assert entry["taskno"] == TASK_NUMBER
+    assert share["metadata"] == {
+        entry["nodeid"]: {"name": entry["name"], "taskno": TASK_NUMBER, "marker_name": None}
+    }
+
+
+def test_plugin_xdist_controller_merges_worker_results(
+    pytester: pytest.Pytester, run_with_results: RunWithResults
+) -> None:
+    _make_controller_conftest(
+        pytester,
+        {
+            "gw0": _worker_output(_SECOND_NODEID, taskno=_SECOND_TASK_NUMBER, status="pass"),
+            "gw1": _worker_output(_FIRST_NODEID, taskno=1, status="fail"),
+        },
+        [_FIRST_NODEID, _SECOND_NODEID],
+    )
+
+    _, payload, _ = run_with_results()
+
+    assert [(test["nodeid"], test["taskno"]) for test in payload["tests"]] == [
+        (_FIRST_NODEID, 1),
+        (_SECOND_NODEID, _SECOND_TASK_NUMBER),
+    ]
+    assert payload["status"] == "fail"
+    assert payload["score"] == 1.0
+    assert payload["max_score"] == TWO_TEST_MAX_SCORE
+
+
+def test_plugin_xdist_controller_records_crashed_worker(
+    pytester: pytest.Pytester, run_with_results: RunWithResults
+) -> None:
+    _make_controller_conftest(
+        pytester,
+        {"gw0": _worker_output(_FIRST_NODEID, taskno=1, status="pass"), "gw1": None},
+        [_FIRST_NODEID, _SECOND_NODEID],
+    )
+
+    _, payload, _ = run_with_results()
+
+    assert [test["nodeid"] for test in payload["tests"]] == [_FIRST_NODEID]
+    assert payload.get("errors") == ["xdist worker gw1 went down: worker crashed"]
+    assert payload["status"] == "error"
+
+
+def test_plugin_xdist_controller_records_worker_without_results(
+    pytester: pytest.Pytester, run_with_results: RunWithResults
+) -> None:
+    _make_controller_conftest(
+        pytester,
+        {"gw0": _worker_output(_FIRST_NODEID, taskno=1, status="pass"), "gw1": {"workerid": "gw1"}},
+        [_FIRST_NODEID, _SECOND_NODEID],
+    )
+
+    _, payload, _ = run_with_results()
+
+    assert [test["nodeid"] for test in payload["tests"]] == [_FIRST_NODEID]
+    assert payload.get("errors") == ["xdist worker gw1 finished without sending autograde results"]
+    assert payload["status"] == "error"
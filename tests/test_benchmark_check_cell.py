@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+from scripts.benchmark_check_cell import (
+    CHECK_CELL_IMPORT,
+    REPO_ROOT,
+    main,
+    parse_args,
+    parse_importtime,
+)
+
+GENEROUS_BUDGET_MS = "60000"
+SAMPLE_SELF_US = 120
+SAMPLE_CUMULATIVE_US = 450
+
+# Modules the self-check cell must not import before it needs them.
+LAZILY_LOADED_MODULES = (
+    "multiprocessing",
+    "exercise_runtime_support.student_checker.api",
+    "exercise_runtime_support.exercise_framework.api",
+    "exercise_runtime_support.exercise_framework.expectations",
+    "exercise_runtime_support.exercise_framework.runtime",
+)
+
+
+def test_parse_importtime_reads_rows_and_depth() -> None:
+    stderr = (
+        "import time: self [us] | cumulative | imported package\n"
+        f"import time:        30 |         30 |   json.scanner\n"
+        f"import time:       {SAMPLE_SELF_US} |        {SAMPLE_CUMULATIVE_US} | json\n"
+        "unrelated warning\n"
+    )
+
+    timings = parse_importtime(stderr)
+
+    assert [(timing.module, timing.depth) for timing in timings] == [
+        ("json.scanner", 1),
+        ("json", 0),
+    ]
+    assert timings[1].self_us == SAMPLE_SELF_US
+    assert timings[1].cumulative_us == SAMPLE_CUMULATIVE_US
+
+
+def test_check_cell_import_defers_unneeded_modules() -> None:
+    probe = (
+        f"import sys\n{CHECK_CELL_IMPORT}\n"
+        f"print('\\n'.join(name for name in {LAZILY_LOADED_MODULES!r} if name in sys.modules))\n"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", probe],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert completed.stdout.split() == []
+
+
+def test_parse_args_uses_student_variant_by_default() -> None:
+    args = parse_args([])
+
+    assert args.variant == "student"
+    assert args.exercise_key == "ex002_sequence_modify_basics"
+
+
+def test_main_reports_budget_result(capsys: pytest.CaptureFixture[str]) -> None:
+    within = main(
+        ["--import-budget-ms", GENEROUS_BUDGET_MS, "--first-output-budget-ms", GENEROUS_BUDGET_MS]
+    )
+    exceeded = main(["--import-budget-ms", "0"])
+
+    output = capsys.readouterr().out
+    assert within == 0
+    assert exceeded == 1
+    assert "Import cost:" in output
+    assert "Time to first output:" in output
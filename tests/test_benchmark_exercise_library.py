@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from exercise_metadata import build_exercise_registry
+from scripts.benchmark_exercise_library import (
+    CONSTRUCTS,
+    EXERCISE_TYPES,
+    generate_exercise_library,
+    main,
+    run_benchmarks,
+)
+
+SMALL_LIBRARY_SIZE = 30
+
+
+def test_generated_library_is_a_valid_canonical_tree(tmp_path: Path) -> None:
+    exercises_root = tmp_path / "exercises"
+
+    keys = generate_exercise_library(exercises_root, SMALL_LIBRARY_SIZE)
+    registry = build_exercise_registry(exercises_root)
+
+    assert sorted(entry["exercise_key"] for entry in registry) == sorted(keys)
+    assert {entry["metadata"]["construct"] for entry in registry} == set(CONSTRUCTS)
+    assert {entry["metadata"]["exercise_type"] for entry in registry} == set(EXERCISE_TYPES)
+
+
+def test_every_size_runs_the_same_benchmarks() -> None:
+    results = run_benchmarks([SMALL_LIBRARY_SIZE, SMALL_LIBRARY_SIZE * 2], repeat=1)
+
+    names_by_size: dict[int, list[str]] = {}
+    for result in results:
+        names_by_size.setdefault(result.size, []).append(result.benchmark)
+        assert result.best_seconds >= 0
+
+    assert names_by_size[SMALL_LIBRARY_SIZE] == names_by_size[SMALL_LIBRARY_SIZE * 2]
+
+
+def test_main_writes_machine_readable_results(
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    output = tmp_path / "results.json"
+
+    exit_code = main(["--sizes", str(SMALL_LIBRARY_SIZE), "--repeat", "1", "--output", str(output)])
+
+    payload = json.loads(output.read_text(encoding="utf-8"))
+    assert exit_code == 0
+    assert capsys.readouterr().out == ""
+    assert {result["size"] for result in payload["results"]} == {SMALL_LIBRARY_SIZE}
+    assert "build_exercise_registry.cold" in {result["benchmark"] for result in payload["results"]}
@@ -0,0 +1,95 @@
+"""Tests for ``exercise_metadata.compiled_catalogue``."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from pathlib import Path
+
+import pytest
+
+from exercise_metadata import compiled_catalogue
+from exercise_metadata.compiled_catalogue import load_compiled_catalogue, write_compiled_catalogue
+from exercise_metadata.registry import build_exercise_catalogue
+from exercise_runtime_support import exercise_catalogue
+from tests.exercise_metadata_helpers import make_exercise_json
+
+
+def _metadata(exercise_key: str, exercise_id: int, title: str = "Demo") -> dict[str, int | str]:
+    return {
+        "schema_version": 1,
+        "exercise_key": exercise_key,
+        "exercise_id": exercise_id,
+        "slug": exercise_key,
+        "title": title,
+        "construct": "sequence",
+        "exercise_type": "modify",
+        "parts": 1,
+    }
+
+
+@pytest.fixture
+def exercises_root(tmp_path: Path) -> Path:
+    root = tmp_path / "exercises"
+    for exercise_id in (1, 2):
+        exercise_key = f"ex00{exercise_id}_sequence_demo"
+        make_exercise_json(root / "sequence" / exercise_key, _metadata(exercise_key, exercise_id))
+    return root
+
+
+def test_compiled_catalogue_round_trips(exercises_root: Path, tmp_path: Path) -> None:
+    path = write_compiled_catalogue(tmp_path / "compiled.json", exercises_root)
+
+    assert load_compiled_catalogue(path, exercises_root) == build_exercise_catalogue(exercises_root)
+
+
+def test_edited_exercise_json_makes_catalogue_stale(exercises_root: Path, tmp_path: Path) -> None:
+    path = write_compiled_catalogue(tmp_path / "compiled.json", exercises_root)
+
+    exercise_key = "ex001_sequence_demo"
+    make_exercise_json(
+        exercises_root / "sequence" / exercise_key, _metadata(exercise_key, 1, "Renamed")
+    )
+
+    assert load_compiled_catalogue(path, exercises_root) is None
+
+
+def test_new_exercise_makes_catalogue_stale(exercises_root: Path, tmp_path: Path) -> None:
+    path = write_compiled_catalogue(tmp_path / "compiled.json", exercises_root)
+
+    exercise_key = "ex003_sequence_demo"
+    make_exercise_json(exercises_root / "sequence" / exercise_key, _metadata(exercise_key, 3))
+
+    assert load_compiled_catalogue(path, exercises_root) is None
+
+
+@pytest.mark.parametrize("content", [None, "not json", '{"format": 999, "exercises": []}'])
+def test_missing_or_malformed_catalogue_is_ignored(
+    exercises_root: Path,
+    tmp_path: Path,
+    content: str | None,
+) -> None:
+    path = tmp_path / "compiled.json"
+    if content is not None:
+        path.write_text(content, encoding="utf-8")
+
+    assert load_compiled_catalogue(path, exercises_root) is None
+
+
+def test_runtime_catalogue_prefers_compiled_copy(
+    exercises_root: Path,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    path = write_compiled_catalogue(tmp_path / "compiled.json", exercises_root)
+    monkeypatch.setattr(compiled_catalogue, "_EXERCISES_ROOT", exercises_root)
+    monkeypatch.setattr(compiled_catalogue, "default_compiled_catalogue_path", lambda: path)
+    exercise_catalogue.get_exercise_catalogue.cache_clear()
+
+    try:
+        runtime_catalogue = exercise_catalogue.get_exercise_catalogue()
+    finally:
+        exercise_catalogue.get_exercise_catalogue.cache_clear()
+
+    assert [asdict(entry) for entry in runtime_catalogue] == build_exercise_catalogue(
+        exercises_root
+    )
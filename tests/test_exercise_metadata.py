@@ -12,14 +12,18 @@ Contract under test:
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import ClassVar, cast
 
 import pytest
 
 from exercise_metadata import (
+    ExerciseIndex,
+    get_exercise_index,
     load_exercise_metadata,
     resolve_exercise_dir,
+    resolve_exercise_entry,
     resolve_notebook_path,
 )
 from exercise_runtime_support.execution_variant import Variant
@@ -218,6 +222,87 @@ class TestResolveNotebookPath:
             )
 
 
+# ---------------------------------------------------------------------------
+# Resolver tests - ExerciseIndex
+# ---------------------------------------------------------------------------
+
+
+def _bump_mtime(path: Path) -> None:
+    """Move *path*'s mtime forward so coarse filesystem clocks still register a change."""
+    stat_result = path.stat()
+    later = stat_result.st_mtime_ns + 1_000_000_000
+    os.utime(path, ns=(stat_result.st_atime_ns, later))
+
+
+class TestExerciseIndex:
+    """Tests for the memoised resolver index."""
+
+    _KEY: ClassVar[str] = "ex998_sequence_indexed"
+    _DATA: ClassVar[dict[str, int | str]] = {
+        "schema_version": 1,
+        "exercise_key": "ex998_sequence_indexed",
+        "exercise_id": 998,
+        "slug": "ex998_sequence_indexed",
+        "title": "Indexed",
+        "construct": "sequence",
+        "exercise_type": "modify",
+        "parts": 1,
+    }
+
+    def _index(self, exercises_root: Path) -> ExerciseIndex:
+        index = get_exercise_index(exercises_root)
+        index.clear()
+        return index
+
+    def test_repeated_resolution_lists_construct_once(self, tmp_path: Path) -> None:
+        """Warm lookups are answered from the index without re-listing."""
+        (tmp_path / "sequence" / self._KEY / "notebooks").mkdir(parents=True)
+        index = self._index(tmp_path)
+
+        first = resolve_exercise_entry(self._KEY, exercises_root=tmp_path)
+        second = resolve_exercise_entry(self._KEY, exercises_root=tmp_path)
+
+        assert first == second
+        assert first.tests_dir == tmp_path / "sequence" / self._KEY / "tests"
+        assert first.notebook_path("student").name == "student.ipynb"
+        assert index.scan_count == 1
+
+    def test_new_exercise_directory_invalidates_listing(self, tmp_path: Path) -> None:
+        """Adding an exercise changes the construct mtime and is picked up."""
+        construct_dir = tmp_path / "sequence"
+        (construct_dir / "ex997_sequence_existing").mkdir(parents=True)
+        self._index(tmp_path)
+        resolve_exercise_dir("ex997_sequence_existing", exercises_root=tmp_path)
+
+        (construct_dir / self._KEY).mkdir()
+        _bump_mtime(construct_dir)
+
+        assert resolve_exercise_dir(self._KEY, exercises_root=tmp_path) == construct_dir / self._KEY
+
+    def test_metadata_is_reloaded_when_exercise_json_changes(self, tmp_path: Path) -> None:
+        """Memoised metadata follows edits to exercise.json."""
+        exercise_dir = tmp_path / "sequence" / self._KEY
+        json_path = make_exercise_json(exercise_dir, self._DATA)
+        index = self._index(tmp_path)
+        exercise = resolve_exercise_entry(self._KEY, exercises_root=tmp_path)
+
+        assert index.metadata(exercise)["title"] == "Indexed"
+        make_exercise_json(exercise_dir, {**self._DATA, "title": "Renamed"})
+        _bump_mtime(json_path)
+
+        assert index.metadata(exercise)["title"] == "Renamed"
+
+    def test_metadata_copies_are_independent(self, tmp_path: Path) -> None:
+        """Callers cannot mutate the memoised metadata."""
+        make_exercise_json(tmp_path / "sequence" / self._KEY, self._DATA)
+        index = self._index(tmp_path)
+        exercise = resolve_exercise_entry(self._KEY, exercises_root=tmp_path)
+
+        index.metadata(exercise)["title"] = "Mutated"
+
+        assert index.metadata(exercise)["title"] == "Indexed"
+
+
 # ---------------------------------------------------------------------------
 # Loader tests - load_exercise_metadata
 # ---------------------------------------------------------------------------
@@ -1102,10 +1102,15 @@ class TestGateIRuntimeSelfCheck:
 # ═══════════════════════════════════════════════════════════════════════════════
 
 
+def _collected_code_text(nb: verify_exercise_quality.NotebookDocument) -> str:
+    cells = verify_exercise_quality._collect_code_cells(nb)
+    return "\n".join(source for _, source in cells)
+
+
 class TestSection1ProgressionScanFiltering:
-    """Tests for filtering _collect_code_cell_text to exerciseN tagged cells only."""
+    """Tests for filtering _collect_code_cells to exerciseN tagged cells only."""
 
-    def test_collect_code_cell_text_excludes_untagged_cells(
+    def test_collect_code_cells_excludes_untagged_cells(
         self,
         tmp_path: Path,
     ) -> None:
@@ -1135,13 +1140,13 @@ class TestSection1ProgressionScanFiltering:
         _write_notebook_cells(nb_path, cells)
         nb = verify_exercise_quality._load_notebook(nb_path)
 
-        result = verify_exercise_quality._collect_code_cell_text(nb)
+        result = _collected_code_text(nb)
 
         assert "print('Hello')" in result
         assert "x = 42" not in result
         assert "import os" not in result
 
-    def test_collect_code_cell_text_includes_all_exerciseN_cells(
+    def test_collect_code_cells_includes_all_exerciseN_cells(
         self,
         tmp_path: Path,
     ) -> None:
@@ -1172,14 +1177,14 @@ class TestSection1ProgressionScanFiltering:
         _write_notebook_cells(nb_path, cells)
         nb = verify_exercise_quality._load_notebook(nb_path)
 
-        result = verify_exercise_quality._collect_code_cell_text(nb)
+        result = _collected_code_text(nb)
 
         assert "print('one')" in result
         assert "print('two')" in result
         assert "print('three')" in result
         assert "x = 0" not in result
 
-    def test_collect_code_cell_text_excludes_explanationN_cells(
+    def test_collect_code_cells_excludes_explanationN_cells(
         self,
         tmp_path: Path,
     ) -> None:
@@ -1200,7 +1205,7 @@ class TestSection1ProgressionScanFiltering:
         _write_notebook_cells(nb_path, cells)
         nb = verify_exercise_quality._load_notebook(nb_path)
 
-        result = verify_exercise_quality._collect_code_cell_text(nb)
+        result = _collected_code_text(nb)
 
         assert "What happened?" not in result
         assert "print('Hello')" in result
@@ -1266,7 +1271,7 @@ class TestSection1ProgressionScanFiltering:
         assert len(findings) > 0
         assert any("progression violation" in f.message for f in findings)
 
-    def test_collect_code_cell_text_excludes_mixed_untagged_and_tagged(
+    def test_collect_code_cells_excludes_mixed_untagged_and_tagged(
         self,
         tmp_path: Path,
     ) -> None:
@@ -1293,13 +1298,76 @@ class TestSection1ProgressionScanFiltering:
         _write_notebook_cells(nb_path, cells)
         nb = verify_exercise_quality._load_notebook(nb_path)
 
-        result = verify_exercise_quality._collect_code_cell_text(nb)
+        result = _collected_code_text(nb)
 
         assert "print('safe code')" in result
         assert "bad_func" not in result
         assert "import sys" not in result
 
 
+def _progression_messages(source: str, construct: str = "sequence") -> list[str]:
+    findings = verify_exercise_quality._scan_for_progression_violations(
+        cells=[(2, source)],
+        allowed_construct=construct,
+        path=Path("student.ipynb"),
+    )
+    return [finding.message for finding in findings]
+
+
+class TestProgressionTokenScanner:
+    """The progression scanner reads tokens, not raw text."""
+
+    def test_strings_and_comments_are_ignored(self) -> None:
+        source = (
+            "# for each item, if it is long, import it\n"
+            'message = "while you wait, try again or return later"\n'
+            'print(f"{message:>20}")\n'
+        )
+
+        assert _progression_messages(source) == []
+
+    def test_findings_report_cell_and_line(self) -> None:
+        messages = _progression_messages("name = 'Sam'\nfor letter in name:\n    print(letter)\n")
+
+        assert messages == [
+            "Possible progression violation: found iteration construct 'for' (cell 2, line 2)"
+        ]
+
+    def test_all_rules_are_evaluated_in_one_scan(self) -> None:
+        source = "total = int(input())\nitems = [total]\nif total:\n    items.append(total)\n"
+
+        messages = _progression_messages(source)
+
+        assert [message.split(" construct ")[0].rsplit(" ", 1)[1] for message in messages] == [
+            "selection",
+            "data_types",
+            "lists",
+        ]
+
+    def test_solve_wrapper_and_its_returns_are_allowed(self) -> None:
+        source = "def solve():\n    value = 1\n    return value\n\nprint(solve())\n"
+
+        assert _progression_messages(source) == []
+
+    def test_other_functions_and_stray_returns_are_reported(self) -> None:
+        other = _progression_messages("def helper():\n    pass\n")
+        stray = _progression_messages("def solve():\n    pass\nreturn 1\n")
+
+        assert other == [
+            "Possible progression violation: found functions construct 'def' (cell 2, line 1)"
+        ]
+        assert stray == [
+            "Possible progression violation: found functions construct 'return' (cell 2, line 3)"
+        ]
+
+    def test_cells_with_syntax_errors_are_still_scanned(self) -> None:
+        source = "for item in items\n    print(item\n"
+
+        assert _progression_messages(source) == [
+            "Possible progression violation: found iteration construct 'for' (cell 2, line 1)"
+        ]
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # Section 2 — --skip-empty-checks flag
 # ═══════════════════════════════════════════════════════════════════════════════